@@ -7,12 +7,105 @@ per alignment using 5 alleles and 8 seconds per alignment using 6 alleles). The
 SelectHybridReads.py
 
 Use:
-    Command line: python3 AlignReads.py 'HLA-X' [samfile.sam]
+    Command line: python3 AlignReads.py 'HLA-X' ['HLA-Y' ...] [samfile.sam/samfile.sam.gz/bamfile.bam] --allele-fasta alleles.fasta
+                  [--alleles NAME NAME ...] [--workers N] [--threads N] [--aligner clustal/profile/builtin]
+                  [--allele-alignment allele_alignment.fa] [--band N] [--cigar-projection] [--reference reference.fa]
+                  [--cache alignment_cache.db] [--cache-size N] [--max-unpaired N] [--resume] [--fast-path]
+                  [--binary-output] [--codec none/zlib/bz2/lzma] [--delta-rows] [--report report.json]
+                  [--report-interval N]
+
+    The alleles (5 or 6) are taken by name (--alleles) from a fasta file, e.g. the IMGT/HLA hla_gen.fasta. Without
+    --alleles all sequences in the fasta file are used, the fasta file then has to contain only the 5 or 6 alleles
+    of the sample. The fasta file is indexed once (allele name and position
+    in the file), the index is stored next to the fasta file. The allele alignment of an allele set is also stored
+    there after it is created once with Clustal Omega, so it is not created again for other samples with the
+    same alleles. Example for the example sam file (sample IHWG9321):
+        python3 AlignReads.py HLA-A sam_file.sam --allele-fasta alleles.fasta
+                  --alleles A*02:01:01:01 B*44:02:01:01 B*49:01:01:02 C*05:01:01:02 C*07:01:01:01
+
+    Multiple loci (e.g. HLA-A HLA-B HLA-C) can be given at once, the sam file is then read and each read pair is
+    aligned only once. The read pairs are written to the output file of their locus: the locus is taken from the
+    sam reference name (e.g. 'HLA-A', 'HLA-A*02:01' or 'A_reference'), otherwise from the alleles (first part of
+    the allele name, e.g. 'A' for 'A*02:01:01:01') that share the most k-mers with the reads.
+
+    The sam file is read as a stream, a read pair is aligned as soon as both reads are found. Reads of which the
+    mate is not found yet are kept in memory up to --max-unpaired reads, more are written to sorted files in the
+    scratch directory and paired by read name at the end (e.g. for coordinate sorted sam files). Compressed sam
+    files (gzip or BGZF) and bam files are read directly, without decompressing them to disk first.
+
+    Multiple read pairs can be aligned at the same time (--workers), Clustal Omega reads its input from a pipe and
+    writes the alignment to a pipe, so no files are shared between the alignments. The number of threads per Clustal Omega process can be set with --threads, by default the available
+    CPUs are divided over the workers.
+
+    With '--aligner profile' the alleles are aligned only once per sample, each read pair is then aligned against
+    this fixed allele alignment (profile). The allele rows are identical for all read pairs, apart from gap columns
+    that are inserted for read insertions.
+
+    With '--aligner builtin' no external program is used per read pair. Each read is placed directly into the fixed
+    allele alignment with a banded dynamic programming alignment (NumPy). The allele alignment can be given with
+    --allele-alignment (fasta format), otherwise it is created once with Clustal Omega. The same allele alignment
+    can also be used as profile for '--aligner profile'.
+
+    With --cigar-projection the reads are placed into the allele alignment with their position and CIGAR string
+    from the sam file. The sam reference is mapped once onto the allele alignment columns, it is either one of
+    the alleles (same name) or given with --reference (fasta format). Only read pairs of which the placement is
+    ambiguous (e.g. soft clipped reads or insertions that do not fit the alignment) are aligned with the aligner.
+
+    With --fast-path read pairs of which both reads (after the quality check of SelectHybridReads.py) exactly match
+    one or more alleles are classified without alignment, as non hybrid read or zero read. These read pairs are
+    written to prefiltered_reads_HLA-X.txt, SelectHybridReads.py adds them to its output files. The allele
+    alignment is used to check that the matching alleles share the same read position.
+
+    With --resume an interrupted run is continued: the read pairs that are already in the output file are not
+    aligned again and an incomplete last read pair (e.g. after a crash) is removed from the output file.
+
+    With --cache the alignments are stored in an on-disk cache (sqlite database). Identical read pairs (e.g. PCR
+    duplicates, or a sample that is run again) aligned against the same alleles with the same aligner settings are
+    then taken from the cache instead of being aligned again. The least recently used alignments are removed when
+    the cache holds more than --cache-size alignments.
+
+    With --binary-output the alignments are written in the binary format of MsaOutputFormat.py
+    (msa_output_samfile_reads_HLA-X.msa) instead of the text format. The allele names are stored once per block
+    and the blocks are compressed (--codec). SelectHybridReads.py reads both formats, MsaOutputFormat.py converts
+    between them. With --delta-rows the allele rows are stored only once, each read pair then contains the
+    aligned span of its reads and the gap columns that were inserted into the allele rows for the reads.
+
+    With --report a JSON report is written with the wall time, CPU time and memory use (RSS of the process at the
+    end of the stage) per stage (e.g. reading the sam file, creating the clustal input, clustal omega, parsing the
+    clustal output and writing the output) and the percentiles of the time per aligner call. The CPU time of
+    clustal omega and the peak memory use are only known for the whole process and reported once for the run.
+    During the run a snapshot of the report is written every --report-interval seconds.
 
 """
 
-from sys import argv
+from sys import argv, stderr
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+import argparse
+import gzip
+import hashlib
+import heapq
+import io
+import json
+import math
 import os
+import re
+import resource
+import shlex
+import shutil
+import sqlite3
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+import zlib
+
+import numpy as np
+
+from MsaOutputFormat import MsaReader, MsaWriter
+from SelectHybridReads import MINIMUM_Q_SCORE, QUALITY_OFFSET, MIN_READ_LENGTH, N_QUANTITY, OutputWriters
 
 class ParseInput:
     """
@@ -26,27 +119,25 @@ class ParseInput:
     def get_sequences(input_file):
         """
         Parses the input from the samfile. Only pair end reads are selected (flagstat 0 and 16). Unmapped reads
-        (flagstat 4) are ignored. Also the quality values are taken into account. 
+        (flagstat 4) are ignored. Also the quality values are taken into account. The reference name, position and
+        CIGAR string are kept to place the reads into the allele alignment without alignment (CIGAR projection).
         
         Args:
             input_file (str): all lines from input samfile
         Returns:
-            paired_read_dict (dict): contains read name, forward and reverse reads and quality values
+            paired_read_dict (dict): contains read name, forward and reverse reads and quality values, reference
+            name, position and CIGAR string ([read_seq, read_quality, reference_name, position, cigar] per read)
         """
         sam_file_data = input_file.split('\n')
         # Collect read names, sequences and quality scores
         read_dict = {}
-        for line in sam_file_data[2:-1]: # 2:-1
-            line = line.split('\t')
-            read_name = line[0]
-            read_seq = line[9]
-            read_quality = line[10]
-            flagstat = int(line[1])
-            if flagstat != 4 and flagstat == 0 or flagstat == 16:  # 4: unmapped read, 0: forward read, 16: reverse read
+        for line in sam_file_data:
+            read_name, read_data = ParseInput.get_sam_read(line)
+            if read_name != None:
                 if read_name in read_dict.keys():
-                    read_dict[read_name] += [[read_seq, read_quality]]
+                    read_dict[read_name] += [read_data]
                 if read_name not in read_dict.keys():
-                    read_dict[read_name] = [[read_seq, read_quality]]
+                    read_dict[read_name] = [read_data]
 
 
         # Only select paired-end reads (single reads are ignored)
@@ -57,218 +148,2399 @@ class ParseInput:
 
         return paired_read_dict
 
-class PerformMSA():
+    @staticmethod
+    def get_sam_read(line):
+        """
+        Parses one line of a samfile. Header lines (starting with '@'), empty lines and reads that are not
+        forward or reverse reads (flagstat 0 and 16) give no read.
+
+        Args:
+            line (str): line from the samfile
+        Returns:
+            read_name (str): read name, None if the line contains no selected read
+            read_data (list): [read_seq, read_quality, reference_name, position, cigar], None if no selected read
+        """
+        line = line.rstrip('\r\n')
+        if line == '' or line.startswith('@'):
+            return None, None
+
+        line = line.split('\t')
+        flagstat = int(line[1])
+        if flagstat != 4 and flagstat == 0 or flagstat == 16:  # 4: unmapped read, 0: forward read, 16: reverse read
+            return line[0], [line[9], line[10], line[2], int(line[3]), line[5]]
+
+        return None, None
+
+    @staticmethod
+    def get_sam_header(line):
+        """
+        Parses a header line of a samfile, e.g. '@SQ\tSN:REF\tLN:4184'. The number of header lines is not fixed.
+
+        Args:
+            line (str): header line from the samfile
+        Returns:
+            record_type (str): header record type, e.g. 'HD' or 'SQ'
+            tags (dict): tag names and values, comment lines ('@CO') have the comment as 'CO' tag
+        """
+        line = line.rstrip('\r\n')
+        record_type = line[1:3]
+        if record_type == 'CO':
+            return record_type, {'CO': line[4:]}
+
+        tags = {}
+        for field in line[3:].replace(' ', '\t').split('\t'):
+            if ':' in field:
+                tag, value = field.split(':', 1)
+                tags[tag] = value
+
+        return record_type, tags
+
+    @staticmethod
+    def get_fasta_sequences(input_file):
+        """
+        Parses a fasta file, for example an allele alignment. The sequence name is the first word of the header
+        line, sequences may be spread over multiple lines.
+
+        Args:
+            input_file (str): all lines from the fasta file
+        Returns:
+            fasta_list (list): list of lists with sequence names and sequences
+        """
+        fasta_list = []
+        for line in input_file.split('\n'):
+            line = line.strip()
+            if line.startswith('>'):
+                fasta_list += [[line[1:].split()[0], '']]
+            elif line != '':
+                if len(fasta_list) == 0:
+                    raise ValueError ('Fasta file does not start with a header line!')
+                fasta_list[-1][1] += line
+
+        return fasta_list
+
+class AlleleIndex():
     """
-    This class performs the multiple sequence aignment using clustal Omega. In order to do so, first an
-    input file with the correct content is created. The clustal output is also parsed and all data is
-    collected in the msa output file.
+    This class takes allele sequences by name from a fasta file, e.g. the IMGT/HLA hla_gen.fasta. The fasta file is
+    indexed once: the allele name, the position of the sequence in the file and its size (in bytes) are stored in
+    an index file next to the fasta file, so an allele is read directly without reading the whole file. In IMGT/HLA
+    fasta files ('>HLA:HLA00001 A*01:01:01:01 3503 bp') the allele name is the second word of the header line,
+    otherwise the first word. Allele alignments created for a set of alleles are stored in a cache directory next
+    to the fasta file. The index is created again if the fasta file changed.
 
     Args:
-        -
+        fasta_file (str): name of the allele fasta file
+        index_file (str): name of the index file, default is the fasta file name + '.idx'
+        cache_dir (str): directory for the allele alignments, default is the fasta file name + '.cache'
     """
+
+    def __init__(self, fasta_file, index_file = None, cache_dir = None):
+        self.fasta_file = fasta_file
+        self.index_file = index_file
+        if index_file == None:
+            self.index_file = fasta_file + '.idx'
+        self.cache_dir = cache_dir
+        if cache_dir == None:
+            self.cache_dir = fasta_file + '.cache'
+
+        file_status = os.stat(fasta_file)
+        self.fasta_version = '{0}\t{1}'.format(file_status.st_size, file_status.st_mtime_ns)
+        self.index = self.read_index()
+        if self.index == None:
+            self.index = self.create_index()
+            self.write_index()
+        self.allele_names = list(self.index.keys())
+
     @staticmethod
-    def create_input_for_clustal(read1_seq, read2_seq, allele1, allele2, allele3, allele4, allele5, allele6 = None):
+    def get_allele_name(header_line):
         """
-        Creates the input file suitable for clustal omega (fasta format). Both reads and the given alleles are 
-        written into the file.
-               
+        Takes the allele name from a fasta header line.
+
         Args:
-            read1_seq (str): sequence read 1
-            read2_seq (str): sequence read 2
-            allele1 (str): contains allele name and sequence
-            allele2 (str): contains with allele name and sequence
-            allele3 (str): contains with allele name and sequence
-            allele4 (str): contains with allele name and sequence
-            allele5 (str): contains with allele name and sequence
+            header_line (str): fasta header line, starting with '>'
         Returns:
+            allele_name (str): allele name
+        """
+        words = header_line[1:].split()
+        if len(words) > 1 and words[0].startswith('HLA:'):
+            return words[1]
+
+        return words[0]
+
+    def create_index(self):
+        """
+        Reads the fasta file once and stores the position and size of each sequence.
+
+        Args:
             -
+        Returns:
+            index (dict): allele name and (position, size) of its sequence in the fasta file
         """
+        index = {}
+        allele_name = None
+        pos = 0
+        with open(self.fasta_file, 'rb') as file_object:
+            for line in file_object:
+                if line.startswith(b'>'):
+                    if allele_name != None:
+                        index[allele_name] = (seq_start, pos - seq_start)
+                    allele_name = AlleleIndex.get_allele_name(line.decode())
+                    if allele_name in index:
+                        raise ValueError ('Allele {0} occurs more than once in the allele fasta file!'.format(allele_name))
+                    seq_start = pos + len(line)
+                pos += len(line)
+        if allele_name != None:
+            index[allele_name] = (seq_start, pos - seq_start)
 
-        if allele6 == None:
-            with open('align_read.fa', 'w') as db_file:
-                db_file.write('>Read1\n' + read1_seq + '\n>Read2\n' + read2_seq + '\n'+ allele1 + allele2 + allele3 + allele4 + allele5)
-        
-        if allele6 != None:
-            with open('align_read.fa', 'w') as db_file:
-                db_file.write('>Read1\n' + read1_seq + '\n>Read2\n' + read2_seq + '\n'+ allele1 + allele2 + allele3 + allele4 + allele5 + allele6)
-   
-    @staticmethod
-    def use_clustal():
+        return index
+
+    def read_index(self):
+        """
+        Reads the index file, if it belongs to the current fasta file.
+
+        Args:
+            -
+        Returns:
+            index (dict): allele name and (position, size) of its sequence, None if there is no valid index file
+        """
+        if os.path.isfile(self.index_file) == False:
+            return None
+
+        with open(self.index_file) as file_object:
+            if file_object.readline() != '#\t' + self.fasta_version + '\n':
+                return None
+            index = {}
+            for line in file_object:
+                allele_name, seq_start, seq_size = line.rstrip('\n').split('\t')
+                index[allele_name] = (int(seq_start), int(seq_size))
+
+        return index
+
+    def write_index(self):
         """
-        Performs the actual alignment with clustal omega per read pair. The output is in standard alignment format.
+        Writes the index file. If the index file can not be written (e.g. the directory of the fasta file is
+        read-only), a warning is given and the index is only kept in memory, so it is created again in the next run.
 
         Args:
             -
         Returns:
             -
         """
-        # Clusalo MSA with read and all alleles
-        os.system('clustalo --infile align_read.fa --force --outfile align_read_output.fa --verbose --outfmt clustal --resno --threads 40 --seqtype dna --output-order tree-order')
-    
-    @staticmethod
-    def create_output():
+        try:
+            with open(self.index_file + '.tmp', 'w') as db_file:
+                db_file.write('#\t' + self.fasta_version + '\n')
+                for allele_name, (seq_start, seq_size) in self.index.items():
+                    db_file.write('{0}\t{1}\t{2}\n'.format(allele_name, seq_start, seq_size))
+            os.replace(self.index_file + '.tmp', self.index_file)
+        except OSError as error:
+            print ('Warning: the allele index could not be written to', self.index_file, '(' + str(error) + '), the allele fasta file is indexed again in the next run', file=stderr)
+
+    def get_alleles(self, allele_names):
+        """
+        Reads the sequences of the given alleles.
+
+        Args:
+            allele_names (list): allele names
+        Returns:
+            alleles (list): contains allele names and sequences (fasta format)
+        """
+        alleles = []
+        with open(self.fasta_file, 'rb') as file_object:
+            for allele_name in allele_names:
+                if allele_name not in self.index:
+                    raise ValueError ('Allele {0} is not in the allele fasta file!'.format(allele_name))
+                seq_start, seq_size = self.index[allele_name]
+                file_object.seek(seq_start)
+                seq = b''.join(file_object.read(seq_size).split()).decode()
+                alleles += ['>' + allele_name + '\n' + seq + '\n']
+
+        return alleles
+
+    def get_allele_alignment(self, alleles, threads = 40):
+        """
+        Gives the allele alignment (profile) of a set of alleles. It is created with clustal omega the first time
+        and stored in the cache directory, named after a hash of the alleles.
+
+        Args:
+            alleles (list): contains allele names and sequences (fasta format)
+            threads (int): number of threads used by clustal omega
+        Returns:
+            profile_file_name (str): name of the file with the allele alignment (fasta format)
+        """
+        profile_file_name = os.path.join(self.cache_dir, hashlib.sha256(''.join(alleles).encode()).hexdigest() + '.fa')
+        if os.path.isfile(profile_file_name) == False:
+            allele_profile = PerformMSA.create_allele_profile(alleles, threads)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(profile_file_name + '.tmp', 'w') as db_file:
+                db_file.write(allele_profile)
+            os.replace(profile_file_name + '.tmp', profile_file_name)
+
+        return profile_file_name
+
+class SamReader():
+    """
+    This class reads the read pairs from a samfile as a stream, without reading the whole file into memory. A read
+    pair is given as soon as both reads are found. Only max_unpaired reads of which the mate is not found yet
+    are kept in memory, older unpaired reads are written to sorted files (runs) in a scratch directory. At the end
+    of the samfile the runs are merged and sorted by read name, so mates that are far apart in the samfile (e.g.
+    coordinate sorted) are paired as well. Read names with a single read are ignored, as are reads of which the
+    read name already gave a read pair.
+
+    Args:
+        samfile (str): name of the samfile
+        max_unpaired (int): maximum number of unpaired reads in memory
+        scratch_dir (str): directory in which the scratch directory for the runs is created, default is the temp directory
+    """
+
+    def __init__(self, samfile, max_unpaired = 100000, scratch_dir = None):
+        if max_unpaired < 1:
+            raise ValueError ('The maximum number of unpaired reads must be at least 1!')
+        self.samfile = samfile
+        self.max_unpaired = max_unpaired
+        self.scratch_dir = scratch_dir
+        self.header = []
+
+    def __iter__(self):
+        """
+        Reads the samfile and yields the read pairs.
+
+        Args:
+            -
+        Yields:
+            read_name (str): read name
+            read_data (list): [read_seq, read_quality, reference_name, position, cigar] for read 1 and read 2
         """
-        Parses the output from clustal omega. The sequences of the alignments are merged together per
-        read/ allele.
+        unpaired = OrderedDict()   # read name and (read number, read data) of the reads without mate (yet)
+        spilled = []
+        run_files = []
+        run_dir = None
+        try:
+            for read_number, read_name, read_data in self.read_reads():
+                if read_name in unpaired:
+                    yield read_name, [unpaired.pop(read_name)[1], read_data]
+                    continue
+                unpaired[read_name] = (read_number, read_data)
+                if len(unpaired) > self.max_unpaired:
+                    read_name, (read_number, read_data) = unpaired.popitem(last=False)
+                    spilled += [(read_name, read_number, read_data)]
+                    if len(spilled) >= self.max_unpaired:
+                        if run_dir == None:
+                            run_dir = tempfile.mkdtemp(prefix='sam_runs_', dir=self.scratch_dir)
+                        run_files += [SamReader.write_run(spilled, run_dir, len(run_files))]
+                        spilled = []
+
+            # Pair the unpaired reads by read name
+            spilled += [(read_name, read_number, read_data) for read_name, (read_number, read_data) in unpaired.items()]
+            unpaired.clear()
+            spilled.sort(key=lambda read: read[:2])
+            runs = [SamReader.read_run(run_file) for run_file in run_files] + [iter(spilled)]
+            read_name = None
+            reads = []
+            for read in heapq.merge(*runs, key=lambda read: read[:2]):
+                if read[0] != read_name:
+                    if len(reads) == 2:
+                        yield read_name, reads
+                    read_name = read[0]
+                    reads = []
+                reads += [read[2]]
+            if len(reads) == 2:
+                yield read_name, reads
+        finally:
+            if run_dir != None:
+                shutil.rmtree(run_dir, ignore_errors=True)
+
+    def read_reads(self):
+        """
+        Reads the selected reads from the samfile, a gzip or BGZF compressed samfile or a bam file. The format is
+        recognised by the first bytes of the file. The header is stored in self.header.
 
         Args:
             -
+        Yields:
+            read_number (int): number of the record in the file
+            read_name (str): read name
+            read_data (list): [read_seq, read_quality, reference_name, position, cigar]
+        """
+        header = []
+        with open(self.samfile, 'rb') as file_object:
+            magic = file_object.read(4)
+            file_object.seek(0)
+            if magic[:2] == b'\x1f\x8b' and BgzfReader.is_bgzf(file_object) == True:
+                stream = io.BufferedReader(BgzfReader(file_object))
+                if stream.peek(4)[:4] == b'BAM\x01':
+                    bam_reader = BamReader(stream)
+                    for read_number, (read_name, read_data) in enumerate(bam_reader):
+                        if read_name != None:
+                            yield read_number, read_name, read_data
+                    self.header = bam_reader.header
+                    return
+            elif magic[:2] == b'\x1f\x8b':
+                stream = gzip.GzipFile(fileobj=file_object)
+            else:
+                stream = file_object
+
+            for read_number, line in enumerate(io.TextIOWrapper(stream)):
+                if line.startswith('@'):
+                    header += [ParseInput.get_sam_header(line)]
+                    continue
+                read_name, read_data = ParseInput.get_sam_read(line)
+                if read_name != None:
+                    yield read_number, read_name, read_data
+        self.header = header
+
+    @staticmethod
+    def write_run(spilled, run_dir, run_number):
+        """
+        Writes unpaired reads sorted by read name (and position in the samfile) to a run file.
+
+        Args:
+            spilled (list): read name, read number and read data per unpaired read
+            run_dir (str): directory for the run files
+            run_number (int): number of the run, used in the file name
         Returns:
-            seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment 
+            run_file (str): name of the run file
         """
-        seq_dict = {}
-        temp_seq_dict = {}
-        max_id_length_list = []
-    
-        temp_seq_dict = {}
-        with open('align_read_output.fa') as file_object:
-           input_file = file_object.read()
-           # make dict with id and sequence in separated strings
-           # and a list with the character lengths of the id's 
-           sequence_data = input_file.split('\n')
-           for line in sequence_data[3:-2]:
-               line = line.split('\t')
-               if len(line) > 1:   # Ignore \n lines  
-                   id_and_seq = line[0]
-                   id_and_seq = id_and_seq.split(' ')
-                   id = id_and_seq[0]
-                   max_id_length_list += [len(id)]
-                   seq = id_and_seq[-1]
-                   if id in temp_seq_dict.keys():
-                       temp_seq_dict[id] += [seq]
-                   if id not in temp_seq_dict.keys():
-                       temp_seq_dict[id] = [seq]
-    
-        max_id_length = max(max_id_length_list)
-
-       # Make dict with id and sequence in one string 
-       # Add spaces to id's (if needed) to make them al the same length
-        for key, values in temp_seq_dict.items():
-            seq_string = ''
-            if len(key) != max_id_length:
-                key_length_dif = max_id_length - len(key)
-                add = ' '*key_length_dif
-                key += add
-            for value in values:
-                seq_string += value
-            seq_dict[key] = [seq_string]
+        run_file = os.path.join(run_dir, 'run_{0}.txt'.format(run_number))
+        with open(run_file, 'w') as file_object:
+            for read_name, read_number, read_data in sorted(spilled, key=lambda read: read[:2]):
+                file_object.write('\t'.join([read_name, str(read_number)] + [str(value) for value in read_data]) + '\n')
 
-        seq_list = sorted(seq_dict.items())
+        return run_file
 
-        return seq_list
-    
     @staticmethod
-    def write_output(output_file_name, seq_list, read_name, read1, read2, qv_read1, qv_read2):
+    def read_run(run_file):
         """
-        Writes the read information and alignment output into output file. This is done after
-        the alignment of each read pair. '$$$' is used as separator between the read pairs.
+        Reads the unpaired reads from a run file.
 
         Args:
-           output_file_name (str): name of output file
-           seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment 
-           read_name (str): read name
-           read1 (str): sequence read 1
-           read2 (str): sequence read 2
-           qv_read1 (str): quality values read 1
-           qv_read2 (str): quality values read 2
+            run_file (str): name of the run file
+        Yields:
+            read (tuple): read name, read number and read data
+        """
+        with open(run_file) as file_object:
+            for line in file_object:
+                read_name, read_number, read_seq, read_quality, reference_name, position, cigar = line.rstrip('\n').split('\t')
+                yield read_name, int(read_number), [read_seq, read_quality, reference_name, int(position), cigar]
+
+class BgzfReader(io.RawIOBase):
+    """
+    This class decompresses a BGZF file (blocked gzip, used for bam files and compressed sam files) block by
+    block, so the file is read once and sequentially. Each block is a gzip member of at most 64 kb with its
+    compressed size in the 'BC' extra field.
+
+    Args:
+        file_object (file): binary file object of the BGZF file
+    """
+
+    def __init__(self, file_object):
+        self.file_object = file_object
+        self.block = b''
+        self.block_pos = 0
+
+    @staticmethod
+    def is_bgzf(file_object):
+        """
+        Checks whether a gzip file is a BGZF file, by the 'BC' extra field of the first block. The file position
+        is not changed.
+
+        Args:
+            file_object (file): binary file object of the gzip file
         Returns:
+            is_bgzf (bool): True if the file is a BGZF file
+        """
+        start = file_object.tell()
+        header = file_object.read(18)
+        file_object.seek(start)
+
+        return len(header) == 18 and header[3] & 4 == 4 and header[12:14] == b'BC'
+
+    def readable(self):
+        return True
+
+    def read_block(self):
+        """
+        Reads and decompresses the next block.
+
+        Args:
             -
+        Returns:
+            block (bytes): decompressed data of the block, empty at the end of the file
         """
+        header = self.file_object.read(12)
+        if len(header) == 0:
+            return b''
+        if len(header) < 12 or header[:2] != b'\x1f\x8b':
+            raise ValueError ('BGZF file is truncated or corrupt!')
+        extra_length = struct.unpack('<H', header[10:12])[0]
+        extra = self.file_object.read(extra_length)
+        block_size = None
+        pos = 0
+        while pos + 4 <= len(extra):
+            subfield_length = struct.unpack('<H', extra[pos + 2:pos + 4])[0]
+            if extra[pos:pos + 2] == b'BC':
+                block_size = struct.unpack('<H', extra[pos + 4:pos + 6])[0] + 1
+            pos += 4 + subfield_length
+        if block_size == None:
+            raise ValueError ('Gzip block without BGZF block size!')
 
-        with open(output_file_name, 'a') as db_file:
-            db_file.write(read_name + '\t' + read1 + '\t' + qv_read1 + '\n')
-            db_file.write(read_name + '\t' + read2 + '\t' + qv_read2 + '\n')
+        data = self.file_object.read(block_size - 12 - extra_length)
+        crc, data_size = struct.unpack('<II', data[-8:])
+        block = zlib.decompress(data[:-8], -15)
+        if len(block) != data_size or zlib.crc32(block) != crc:
+            raise ValueError ('BGZF block is corrupt!')
 
-            # For 5 alleles
-            if len(seq_list) == 7: 
-                for name, sequence in seq_list[5:7]:
-                    db_file.write(name + '\t' + sequence[0] + '\n')
-          
-            # For 6 alleles
-            if len(seq_list) == 8: 
-                for name, sequence in seq_list[6:8]:
-                    db_file.write(name + '\t' + sequence[0] + '\n')
+        return block
 
-            for name, sequence in seq_list[:-2]:
-                db_file.write(name + '\t' + sequence[0] + '\n')
-            db_file.write('$$$\n')
+    def readinto(self, buffer):
+        """
+        Reads decompressed data into a buffer, used by io.BufferedReader.
 
-def main():
+        Args:
+            buffer (bytearray): buffer to fill
+        Returns:
+            size (int): number of bytes read, 0 at the end of the file
+        """
+        while self.block_pos >= len(self.block):
+            self.block = self.read_block()
+            self.block_pos = 0
+            if len(self.block) == 0:
+                if self.file_object.read(1) == b'':
+                    return 0
+                self.file_object.seek(-1, 1)
+        size = min(len(buffer), len(self.block) - self.block_pos)
+        buffer[:size] = self.block[self.block_pos:self.block_pos + size]
+        self.block_pos += size
+
+        return size
+
+class BamReader():
     """
-    This is the main function of the script which calls the methods. The number of alleles can be 5 or 6.
+    This class decodes the records of a bam file into the same read data as a samfile line. The header text is
+    parsed like the header of a samfile.
+
+    Args:
+        stream (file): binary file object with the decompressed bam data, e.g. io.BufferedReader(BgzfReader(...))
+    """
+    cigar_operations = 'MIDNSHP=X'
+    # two nucleotides per byte, '=ACMGRSVTWYHKDBN' encoded as 0-15
+    nucleotide_pairs = [first + second for first in '=ACMGRSVTWYHKDBN' for second in '=ACMGRSVTWYHKDBN']
+
+    def __init__(self, stream):
+        self.stream = stream
+        if self.read_bytes(4) != b'BAM\x01':
+            raise ValueError ('File is not a bam file!')
+
+        text_length = struct.unpack('<i', self.read_bytes(4))[0]
+        header_text = self.read_bytes(text_length).decode().rstrip('\x00')
+        self.header = [ParseInput.get_sam_header(line) for line in header_text.split('\n') if line.startswith('@')]
+
+        self.reference_names = []
+        reference_count = struct.unpack('<i', self.read_bytes(4))[0]
+        for i in range(reference_count):
+            name_length = struct.unpack('<i', self.read_bytes(4))[0]
+            self.reference_names += [self.read_bytes(name_length)[:-1].decode()]
+            self.read_bytes(4)   # reference length
+
+    def read_bytes(self, size):
+        """
+        Reads an exact number of bytes from the bam data.
+
+        Args:
+            size (int): number of bytes
+        Returns:
+            data (bytes): the bytes read
+        """
+        data = self.stream.read(size)
+        if len(data) != size:
+            raise ValueError ('Bam file is truncated!')
+
+        return data
+
+    def __iter__(self):
+        """
+        Decodes the bam records. Only forward and reverse reads (flagstat 0 and 16) are selected, like in a samfile.
+
+        Args:
+            -
+        Yields:
+            read_name (str): read name, None if the record is not selected
+            read_data (list): [read_seq, read_quality, reference_name, position, cigar], None if not selected
+        """
+        while True:
+            block_size = self.stream.read(4)
+            if len(block_size) == 0:
+                return
+            if len(block_size) != 4:
+                raise ValueError ('Bam file is truncated!')
+            record = self.read_bytes(struct.unpack('<i', block_size)[0])
+            yield BamReader.decode_record(record, self.reference_names)
+
+    @staticmethod
+    def decode_record(record, reference_names):
+        """
+        Decodes one bam record (without the block size).
+
+        Args:
+            record (bytes): bam record
+            reference_names (list): reference names in the order of the bam header
+        Returns:
+            read_name (str): read name, None if the record is not a forward or reverse read (flagstat 0 and 16)
+            read_data (list): [read_seq, read_quality, reference_name, position, cigar], None if not selected
+        """
+        reference_id, position, name_length, mapq, bin_number, cigar_length, flagstat, seq_length = struct.unpack('<iiBBHHHi', record[:20])
+        if flagstat != 0 and flagstat != 16:   # 4: unmapped read, 0: forward read, 16: reverse read
+            return None, None
+
+        pos = 32
+        read_name = record[pos:pos + name_length - 1].decode()
+        pos += name_length
+        cigar = ''
+        for operation in struct.unpack('<{0}I'.format(cigar_length), record[pos:pos + 4 * cigar_length]):
+            cigar += str(operation >> 4) + BamReader.cigar_operations[operation & 15]
+        pos += 4 * cigar_length
+        read_seq = ''.join([BamReader.nucleotide_pairs[byte] for byte in record[pos:pos + (seq_length + 1) // 2]])[:seq_length]
+        pos += (seq_length + 1) // 2
+        read_quality = record[pos:pos + seq_length]
+        if seq_length > 0 and read_quality[0] == 255:
+            read_quality = '*'
+        else:
+            read_quality = bytes([value + 33 for value in read_quality]).decode()
+
+        reference_name = '*'
+        if reference_id >= 0:
+            reference_name = reference_names[reference_id]
+        if cigar == '':
+            cigar = '*'
+
+        return read_name, [read_seq, read_quality, reference_name, position + 1, cigar]
+
+class PerformMSA():
+    """
+    This class performs the multiple sequence aignment using clustal Omega. In order to do so, first the
+    input with the correct content is created and given to clustal omega through a pipe. The clustal output
+    is also parsed and all data is collected in the msa output file.
 
     Args:
-       -
-    Returns:
         -
     """
+    # width of the number of read pairs in the header, it is filled in at the end of the run
+    read_pair_count_width = 12
+
+    @staticmethod
+    def create_input_for_clustal(read1_seq, read2_seq, alleles = None):
+        """
+        Creates the input suitable for clustal omega (fasta format). Both reads and the given alleles are 
+        in the input, without alleles the reads are aligned against the allele profile.
+               
+        Args:
+            read1_seq (str): sequence read 1
+            read2_seq (str): sequence read 2
+            alleles (list): contains allele names and sequences (fasta format), default is None (only the reads)
+        Returns:
+            clustal_input (str): reads and alleles in fasta format
+        """
+        clustal_input = '>Read1\n' + read1_seq + '\n>Read2\n' + read2_seq + '\n'
+        if alleles != None:
+            clustal_input += ''.join(alleles)
+
+        return clustal_input
+
+    @staticmethod
+    def create_allele_profile(alleles, threads = 40):
+        """
+        Aligns the alleles once per sample with clustal omega. The resulting allele alignment (profile) is used
+        to align all read pairs against.
+
+        Args:
+            alleles (list): contains allele names and sequences (fasta format), 5 or 6 alleles
+            threads (int): number of threads used by clustal omega
+        Returns:
+            allele_profile (str): the allele alignment (fasta format)
+        """
+        clustal_process = subprocess.run(PerformMSA.get_profile_command(threads).split(), input=''.join(alleles), stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        if clustal_process.returncode != 0 or clustal_process.stdout.startswith('>') == False:
+            raise RuntimeError ('Clustal omega could not align the alleles!\n' + clustal_process.stderr)
+
+        return clustal_process.stdout
+
+    @staticmethod
+    def get_profile_command(threads = 40):
+        """
+        Creates the clustal omega command line for the alignment of the alleles (profile). The alleles are read
+        from stdin, the alignment is written to stdout.
+
+        Args:
+            threads (int): number of threads used by clustal omega
+        Returns:
+            clustal_command (str): clustal omega command line
+        """
+        clustal_command = 'clustalo --infile - --outfmt fa --threads {0} --seqtype dna'.format(threads)
 
-    data_type = argv[1] # 'HLA-A', 'HLA-B' or 'HLA-C'
-    samfile = argv[2]
+        return clustal_command
 
-    output_file_name = 'msa_output_samfile_reads_{0}.txt'.format(data_type)
+    @staticmethod
+    def get_clustal_command(threads = 40, profile = None):
+        """
+        Creates the clustal omega command line for the alignment of one read pair. If a profile is given, the
+        reads are aligned against the allele alignment in the profile (the allele columns are kept fixed). The
+        input is read from stdin, the alignment is written to stdout (fasta format).
 
-    # Parse sam file
-    with open(samfile) as file_object:
-	    input_file = file_object.read()
-    paired_read_dict = ParseInput.get_sequences(input_file)
+        Args:
+            threads (int): number of threads used by clustal omega
+            profile (str): name of the file with the allele alignment, default is None (no profile)
+        Returns:
+            clustal_command (str): clustal omega command line
+        """
+        clustal_command = 'clustalo --infile - --outfmt fa --threads {0} --seqtype dna --output-order tree-order'.format(threads)
+        if profile != None:
+            clustal_command += ' --profile1 {0}'.format(shlex.quote(profile))
 
-    # Create output file including header
-    if os.path.isfile(output_file_name) == False:
-        with open(output_file_name, 'w') as db_file:
-            db_file.write('Sequences aligned with Clustal Omega version 1.2.4 \n') 
-            db_file.write('Command line used: clustalo --infile align_read.fa --force --outfile align_read_output.fa --verbose --outfmt clustal --resno --threads 80 --seqtype dna --output-order tree-order\n')
-            db_file.write('Reads from sam file: ' + samfile + '\n') 
-            db_file.write(str(len(paired_read_dict)) + ' paired-end reads in total\n$$$\n')
+        return clustal_command
+   
+    @staticmethod
+    def use_clustal(clustal_input, threads = 40, profile = None):
+        """
+        Performs the actual alignment with clustal omega per read pair. The input is given through a pipe and
+        the output (fasta format) is read from a pipe, no files are used.
 
-    allele6 = None
+        Args:
+            clustal_input (str): reads and alleles in fasta format
+            threads (int): number of threads used by clustal omega
+            profile (str): name of the file with the allele alignment, default is None (no profile)
+        Returns:
+            clustal_output (str): the alignment in fasta format
+        """
+        # Clusalo MSA with read and all alleles (or read against the allele profile)
+        clustal_command = shlex.split(PerformMSA.get_clustal_command(threads, profile))
+        clustal_process = subprocess.run(clustal_command, input=clustal_input, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        if clustal_process.returncode != 0:
+            raise RuntimeError ('Clustal omega could not align the read pair!\n' + clustal_process.stderr)
 
-    # Example, 5 alleles, sample 9045
-  #  allele1 = '>A*02:16\nCAGAAGCAGAGGGGTCAGGGCGAAGTCCCAGGGCCCCAGGCGTGGCTCTCAGGGTCTCAGGCCCCGAAGGCGGTGTATGGATTGGGGAGTCCCAGCCTTGGGGATTCCCCAACTCCGCAGTTTCTTTTCTCCCTCTCCCAACCTATGTAGGGTCCTTCTTCCTGGATACTCACGACGCGGACCCAGTTCTCACTCCCATTGGGTGTCGGGTTTCCAGAGAAGCCAATCAGTGTCGTCGCGGTCGCGGTTCTAAAGTCCGCACGCACCCACCGGGACTCAGATTCTCCCCAGACGCCGAGGATGGCCGTCATGGCGCCCCGAACCCTCGTCCTGCTACTCTCGGGGGCTCTGGCCCTGACCCAGACCTGGGCGGGTGAGTGCGGGGTCGGGAGGGAAACGGCCTCTGTGGGGAGAAGCAACGGGCCCGCCTGGCGGGGGCGCAGGACCCGGGAAGCCGCGCCGGGAGGAGGGTCGGGCGGGTCTCAGCCACTCCTCGTCCCCAGGCTCTCACTCCATGAGGTATTTCTTCACATCCGTGTCCCGGCCCGGCCGCGGGGAGCCCCGCTTCATCGCAGTGGGCTACGTGGACGACACGCAGTTCGTGCGGTTCGACAGCGACGCCGCGAGCCAGAGGATGGAGCCGCGGGCGCCGTGGATAGAGCAGGAGGGTCCGGAGTATTGGGACGGGGAGACACGGAAAGTGAAGGCCCACTCACAGACTCACCGAGTGGACCTGGGGACCCTGCGCGGCTACTACAACCAGAGCGAGGCCGGTGAGTGACCCCGGCCCGGGGCGCAGGTCACGACCTCTCATCCCCCACGGACGGGCCAGGTCGCCCACAGTCTCCGGGTCCGAGATCCGCCCCGAAGCCGCGGGACCCCGAGACCCTTGCCCCGGGAGAGGCCCAGGCGCCTTTACCCGGTTTCATTTTCAGTTTAGGCCAAAAATCCCCCCAGGTTGGTCGGGGCGGGGCGGGGCTCGGGGGACCGGGCTGACCGCGGGGTCCGGGCCAGGTTCTCACACCGTCCAGAGGATGTATGGCTGCGACGTGGGGTCGGACTGGCGCTTCCTCCGCGGGTACCACCAGTACGCCTACGACGGCAAGGATTACATCGCCCTGAAAGAGGACCTGCGCTCTTGGACCGCGGCGGACATGGCAGCTCAGACCACCAAGCACAAGTGGGAGGCGGCCCATGTGGCGGAGCAGTTGAGAGCCTACCTGGAGGGCGAGTGCGTGGAGTGGCTCCGCAGATACCTGGAGAACGGGAAGGAGACGCTGCAGCGCACGGGTACCAGGGGCCACGGGGCGCCTCCCTGATCGCCTGTAGATCTCCCGGGCTGGCCTCCCACAAGGAGGGGAGACAATTGGGACCAACACTAGAATATCGCCCTCCCTCTGGTCCTGAGGGAGAGGAATCCTCCTGGGTTTCCAGATCCTGTACCAGAGAGTGACTCTGAGGTTCCGCCCTGCTCTCTGACACAATTAAGGGATAAAATCTCTGAAGGAATGACGGGAAGACGATCCCTCGAATACTGATGAGTGGTTCCCTTTGACACACACAGGCAGCAGCCTTGGGCCCGTGACTTTTCCTCTCAGGCCTTGTTCTCTGCTTCACACTCAATGTGTGTGGGGGTCTGAGTCCAGCACTTCTGAGTCCTTCAGCCTCCACTCAGGTCAGGACCAGAAGTCGCTGTTCCCTCTTCAGGGACTAGAATTTTCCACGGAATAGGAGATTATCCCAGGTGCCTGTGTCCAGGCTGGTGTCTGGGTTCTGTGCTCCCTTCCCCATCCCAGGTGTCCTGTCCATTCTCAAGATAGCCACATGTGTGCTGGAGGAGTGTCCCATGACAGATGCAAAATGCCTGAATGATCTGACTCTTCCTGACAGACGCCCCCAAAACGCATATGACTCACCACGCTGTCTCTGACCATGAAGCCACCCTGAGGTGCTGGGCCCTGAGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGGGAGGACCAGACCCAGGACACGGAGCTCGTGGAGACCAGGCCTGCAGGGGATGGAACCTTCCAGAAGTGGGCGGCTGTGGTGGTGCCTTCTGGACAGGAGCAGAGATACACCTGCCATGTGCAGCATGAGGGTTTGCCCAAGCCCCTCACCCTGAGATGGGGTAAGGAGGGAGACGGGGGTGTCATGTCTTTTAGGGAAAGCAGGAGCCTCTCTGACCTTTAGCAGGGTCAGGGCCCCTCACCTTCCCCTCTTTTCCCAGAGCCGTCTTCCCAGCCCACCATCCCCATCGTGGGCATCATTGCTGGCCTGGTTCTCTTTGGAGCTGTGATCACTGGAGCTGTGGTCGCTGCTGTGATGTGGAGGAGGAAGAGCTCAGGTGGGGAAGGGGTGAAGGGTGGGTCTGAGATTTCTTGTCTCACTGAGGGTTCCAAGACCCAGGTAGAAGTGTGCCCTGCCTCGTTACTGGGAAGCACCACCCACAATTATGGGCCTACCCAGCCTGGGCCCTGTGTGCCAGCACTTACTCTTTTGTAAAGCACCTGTTAAAATGAAGGACAGATTTATCACCTTGATTACAGCGGTGATGGGACCTGATCCCAGCAGTCACAAGTCACAGGGGAAGGTCCCTGAGGACCTTCAGGAGGGCGGTTGGTCCAGGACCCACACCTGCTTTCTTCATGTTTCCTGATCCCGCCCTGGGTCTGCAGTCACACATTTCTGGAAACTTCTCTGAGGTCCAAGACTTGGAGGTTCCTCTAGGACCTTAAGGCCCTGACTCCTTTCTGGTATCTCACAGGACATTTTCTTCCCACAGATAGAAAAGGAGGGAGCTACTCTCAGGCTGCAAGTAAGTATGAAGGAGGCTGATGCCTGAGGTCCTTGGGATATTGTGTTTGGGAGCCCATGGGGGAGCTCACCCACCCCACAATTCCTCCTCTAGCCACATCTTCTGTGGGATCTGACCAGGTTCTGTTTTTGTTCTACCCCAGGCAGTGACAGTGCCCAGGGCTCTGATGTGTCTCTCACAGCTTGTAAAGGTGAGAGCCTGGAGGGCCTGATGTGTGTTGGGTGTTGGGCGGAACAGTGGACACAGCTGTGCTATGGGGTTTCTTTCCATTGGATGTATTGAGCATGCGATGGGCTGTTTAAAGTGTGACCCCTCACTGTGACAGATACGAATTTGTTCATGAATATTTTTTTCTATAGTGTGAGACAGCTGCCTTGTGTGGGACTGAGAGGCAAGAGTTGTTCCTGCCCTTCCCTTTGTGACTTGAAGAACCCTGACTTTGTTTCTGCAAAGGCACCTGCATGTGTCTGTGTTCGTGTAGGCATAATGTGAGGAGGTGGGGAGACCACCCCACCCCCATGTCCACCATGACCCTCTTCCCACGCTGACCTGTGCTCCCTCCCCAATCATCTTTCCTGTTCCAGAGAGGTGGGGCTGAGGTGTCTCCATCTCTGTCTCAACTTCATGGTGCACTGAGCTGTAACTTCTTCCTTCCCTATTAAAA\n'
-  #  allele2 = '>A*03:01:01:01\nCAGGAGCAGAGGGGTCAGGGCGAAGTCCCAGGGCCCCAGGCGTGGCTCTCAGAGTCTCAGGCCCCGAAGGCGGTGTATGGATTGGGGAGTCCCAGCCTTGGGGATTCCCCAACTCCGCAGTTTCTTTTCTCCCTCTCCCAACCTACGTAGGGTCCTTCATCCTGGATACTCACGACGCGGACCCAGTTCTCACTCCCATTGGGTGTCGGGTTTCCAGAGAAGCCAATCAGTGTCGTCGCGGTCGCTGTTCTAAAGCCCGCACGCACCCACCGGGACTCAGATTCTCCCCAGACGCCGAGGATGGCCGTCATGGCGCCCCGAACCCTCCTCCTGCTACTCTCGGGGGCCCTGGCCCTGACCCAGACCTGGGCGGGTGAGTGCGGGGTCGGGAGGGAAACCGCCTCTGCGGGGAGAAGCAAGGGGCCCTCCTGGCGGGGGCGCAGGACCGGGGGAGCCGCGCCGGGACGAGGGTCGGGCAGGTCTCAGCCACTGCTCGCCCCCAGGCTCCCACTCCATGAGGTATTTCTTCACATCCGTGTCCCGGCCCGGCCGCGGGGAGCCCCGCTTCATCGCCGTGGGCTACGTGGACGACACGCAGTTCGTGCGGTTCGACAGCGACGCCGCGAGCCAGAGGATGGAGCCGCGGGCGCCGTGGATAGAGCAGGAGGGGCCGGAGTATTGGGACCAGGAGACACGGAATGTGAAGGCCCAGTCACAGACTGACCGAGTGGACCTGGGGACCCTGCGCGGCTACTACAACCAGAGCGAGGCCGGTGAGTGACCCCGGCCGGGGGCGCAGGTCAGGACCCCTCATCCCCCACGGACGGGCCAGGTCGCCCACAGTCTCCGGGTCCGAGATCCACCCCGAAGCCGCGGGACCCCGAGACCCTTGCCCCGGGAGAGGCCCAGGCGCCTTTACCCGGTTTCATTTTCAGTTTAGGCCAAAAATCCCCCCGGGTTGGTCGGGGCTGGGCGGGGCTCGGGGGACTGGGCTGACCGCGGGGTCGGGGCCAGGTTCTCACACCATCCAGATAATGTATGGCTGCGACGTGGGGTCGGACGGGCGCTTCCTCCGCGGGTACCGGCAGGACGCCTACGACGGCAAGGATTACATCGCCCTGAACGAGGACCTGCGCTCTTGGACCGCGGCGGACATGGCGGCTCAGATCACCAAGCGCAAGTGGGAGGCGGCCCATGAGGCGGAGCAGTTGAGAGCCTACCTGGATGGCACGTGCGTGGAGTGGCTCCGCAGATACCTGGAGAACGGGAAGGAGACGCTGCAGCGCACGGGTACCAGGGGCCACGGGGCGCCTCCCTGATCGCCTGTAGATCTCCCGGGCTGGCCTCCCACAAGGAGGGGAGACAATTGGGACCAACACTAGAATATCACCCTCCCTCTGGTCCTGAGGGAGAGGAATCCTCCTGGGTTCCAGATCCTGTACCAGAGAGTGACTCTGAGGTTCCGCCCTGCTCTCTGACACAATTAAGGGATAAAATCTCTGAAGGAGTGACGGGAAGACGATCCCTCGAATACTGATGAGTGGTTCCCTTTGACACCGGCAGCAGCCTTGGGCCCGTGACTTTTCCTCTCAGGCCTTGTTCTCTGCTTCACACTCAATGTGTGTGGGGGTCTGAGTCCAGCACTTCTGAGTCCCTCAGCCTCCACTCAGGTCAGGACCAGAAGTCGCTGTTCCCTTCTCAGGGAATAGAAGATTATCCCAGGTGCCTGTGTCCAGGCTGGTGTCTGGGTTCTGTGCTCTCTTCCCCATCCCGGGTGTCCTGTCCATTCTCAAGATGGCCACATGCGTGCTGGTGGAGTGTCCCATGACAGATGCAAAATGCCTGAATTTTCTGACTCTTCCCGTCAGACCCCCCCAAGACACATATGACCCACCACCCCATCTCTGACCATGAGGCCACCCTGAGGTGCTGGGCCCTGGGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGGGAGGACCAGACCCAGGACACGGAGCTCGTGGAGACCAGGCCTGCAGGGGATGGAACCTTCCAGAAGTGGGCGGCTGTGGTGGTGCCTTCTGGAGAGGAGCAGAGATACACCTGCCATGTGCAGCATGAGGGTCTGCCCAAGCCCCTCACCCTGAGATGGGGTAAGGAGGGAGATGGGGGTGTCATGTCTCTTAGGGAAAGCAGGAGCCTCTCTGGAGACCTTTAGCAGGGTCAGGGCCCCTCACCTTCCCCTCTTTTCCCAGAGCTGTCTTCCCAGCCCACCATCCCCATCGTGGGCATCATTGCTGGCCTGGTTCTCCTTGGAGCTGTGATCACTGGAGCTGTGGTCGCTGCCGTGATGTGGAGGAGGAAGAGCTCAGGTGGAGAAGGGGTGAAGGGTGGGGTCTGAGATTTCTTGTCTCACTGAGGGTTCCAAGCCCCAGCTAGAAATGTGCCCTGTCTCATTACTGGGAAGCACCGTCCACAATCATGGGCCTACCCAGTCTGGGCCCTGTGTGCCAGCACTTACTCTTTTGTAAAGCACCTGTTAAAATGAAGGACAGATTTATCACCTTGATTACGGCGGTGATGGGACCTGATCCCAGCAGTCACAAGTCACAGGGGAAGGTCCCTGAGGACAGACCTCAGGAGGGCTATTGGTCCAGGACCCACACCTGCTTTCTTCATGTTTCCTGATCCCGCCCTGGGTCTGCAGTCACACATTTCTGGAAACTTCTCTGGGGTCCAAGACTAGGAGGTTCCTCTAGGACCTTAAGGCCCTGGCTCCTTTCTGGTATCTCACAGGACATTTTCTTCTCACAGATAGAAAAGGAGGGAGTTACACTCAGGCTGCAAGTAAGTATGAAGGAGGCTGATGCCTGAGGTCCTTGGGATATTGTGTTTGGGAGCCCATGGGGGAGCCCACCCACCTCACAATTCCTCCTCTAGCCACATCTTCTGTGGGATCTGACCAGGTTCTGTTTTTGTTCTACCCCAGGCAGTGACAGTGCCCAGGGCTCTGATGTGTCCCTCACAGCTTGTAAAGGTGAGAGCTTGGAGGACCTAATGTGTGTTGGGTGTTGGGCGGAACAGTGGACACAGCTGTGCTATGGGGTTTCTTTGCATTGGATGTATTGAGCATGCGATGGGCTGTTTAAGGTGTGACCCCTCACTGTGATGGATATGAATTTGTTCATGAATATTTTTTTCTATAGTGTGAGACAGCTGCCTTGTGTGGGACTGAGAGGCAAGAGTTGTTCCTGCCCTTCCCTTTGTGACTTGAAGAACCCTGACTTTGTTTCTGCAAAGGCACCTGCATGTGTCTGTGTTCGTGTAGGCATAATGTGAGGAGGTGGGGAGACCACCCCACCCCCATGTCCACCATGACCCTCTTCCCACGCTGACCTGTGCTCCCTCCCCAATCATCTTTCCTGTTCCAGAGAGGTGGGGCTGAGGTGTCTCCATCTCTGTCTCAACTTCATGGTGCACTGAGCTGTAACTTCTTCCTTCCCTATTAAAA\n'
-  #  allele3 = '>B*51:01:01:01\nGATCAGGACGAAGTCCCAGGCCCCGGGCGGGGCTCTCAGGGTCTCAGGCTCCGAGAGCCTTGTCTGCATTGGGGAGGCGCAGCGTTGGGGATTCCCCACTCCCACGAGTTTCACTTCTTCTCCCAACCTATGTCGGGTCCTTCTTCCAGGATACTCGTGACGCGTCCCCATTTCCCACTCCCATTGGGTGTCGGATATCTAGAGAAGCCAATCAGTGTCGCCGGGGTCCCAGTTCTAAAGTCCCCACGCACCCACCCGGACTCAGAATCTCCTCAGACGCCGAGATGCGGGTCACGGCGCCCCGAACCGTCCTCCTGCTGCTCTGGGGGGCAGTGGCCCTGACCGAGACCTGGGCCGGTGAGTGCGGGGTCGGGAGGGAAATGGCCTCTGTGGGGAGGAGCGAGGGGACCGCAGGCGGGGGCGCAGGACCTGAGGAGCCGCGCCGGGAGGAGGGTCGGGCGGGTCTCAGCCCCTCCTCGCCCCCAGGCTCCCACTCCATGAGGTATTTCTACACCGCCATGTCCCGGCCCGGCCGCGGGGAGCCCCGCTTCATTGCAGTGGGCTACGTGGACGACACCCAGTTCGTGAGGTTCGACAGCGACGCCGCGAGTCCGAGGACGGAGCCCCGGGCGCCATGGATAGAGCAGGAGGGGCCGGAGTATTGGGACCGGAACACACAGATCTTCAAGACCAACACACAGACTTACCGAGAGAACCTGCGGATCGCGCTCCGCTACTACAACCAGAGCGAGGCCGGTGAGTGACCCCGGCCCGGGGCGCAGGTCACGACTCCCCATCCCCCACGTACGGCCCGGGTCGCCCCGAGTCTCCGGGTCCGAGATCCGCCTCCCTGAGGCCGCGGGACCCGCCCAGACCCTCGACCGGCGAGAGCCCCAGGCGCGTTTACCCGGTTTCATTTTCAGTTGAGGCCAAAATCCCCGCGGGTTGGTCGGGGCGGGGCGGGGCTCGGGGGACGGTGCTGACCGCGGGGCCGGGGCCAGGGTCTCACACTTGGCAGACGATGTATGGCTGCGACGTGGGGCCGGACGGGCGCCTCCTCCGCGGGCATAACCAGTACGCCTACGACGGCAAAGATTACATCGCCCTGAACGAGGACCTGAGCTCCTGGACCGCGGCGGACACCGCGGCTCAGATCACCCAGCGCAAGTGGGAGGCGGCCCGTGAGGCGGAGCAGCTGAGAGCCTACCTGGAGGGCCTGTGCGTGGAGTGGCTCCGCAGACACCTGGAGAACGGGAAGGAGACGCTGCAGCGCGCGGGTACCAGGGGCAGTGGGGAGCCTTCCCCATCTCCTATAGGTCGCCGGGGATGGCCTCCCACGAGAAGAGGAGGAAAATGGGATCAGCGCTAGAATGTCGCCCTCCCTTGAATGGAGAATGGCATGAGTTTTCCTGAGTTTCCTCTGAGGGCCCCCTCTTCTCTCTAGGACAATTAAGGGATGACGTCTCTGAGGAAATGGAGGGGAAGACAGTCCCTAGAATACTGATCAGGGGTCCCCTTTGACCCCTGCAGCAGCCTTGGGAACCGTGACTTTTCCTCTCAGGCCTTGTTCTCTGCCTCACACTCAGTGTGTTTGGGGCTCTGATTCCAGCACTTCTGAGTCACTTTACCTCCACTCAGATCAGGAGCAGAAGTCCCTGTTCCCCGCTCAGAGACTCGAACTTTCCAATGAATAGGAGATTATCCCAGGTGCCTGCGTCCAGGCTGGTGTCTGGGTTCTGTGCCCCTTCCCCACACCAGGTGTCCTGTCCATTCTCAGGCTGGTCACATGGGTGGTCCTAGGGTGTCCCATGAGAGATGCAAAGCGCCTGAATTTTCTGACTCTTCCCATCAGACCCCCCAAAGACACACGTGACCCACCACCCCGTCTCTGACCATGAGGCCACCCTGAGGTGCTGGGCCCTGGGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGCGAGGACCAAACTCAGGACACTGAGCTTGTGGAGACCAGACCAGCAGGAGATAGAACCTTCCAGAAGTGGGCAGCTGTGGTGGTGCCTTCTGGAGAAGAGCAGAGATACACATGCCATGTACAGCATGAGGGGCTGCCGAAGCCCCTCACCCTGAGATGGGGTAAGGAGGGGGATGAGGGGTCATATCTCTTCTCAGGGAAAGCAGGAGCCCTTCTGGAGCCCTTCAGCAGGGTCAGGGCCCCTCGTCTTCCCCTCCTTTCCCAGAGCCATCTTCCCAGTCCACCATCCCCATCGTGGGCATTGTTGCTGGCCTGGCTGTCCTAGCAGTTGTGGTCATCGGAGCTGTGGTCGCTACTGTGATGTGTAGGAGGAAGAGCTCAGGTAGGGAAGGGGTGAGGGGTGGGGTCTGGGTTTTCTTGTCCCACTGGGGGTTTCAAGCCCCAGGTAGAAGTGTTCCCTGCCTCATTACTGGGAAGCAGCATCCACACAGGGGCTAACGCAGCCTGGGACCCTGTGTGCCAGCACTTACTCTTTTGTGCAGCACATGTGACAATGAAGGACGGATGTATCACCTTGATGGTTGTGGTGTTGGGGTCCTGATTTCAGCATTCATGAGTCAGGGGAAGGTCCCTGCTAAGGACAGACCTTAGGAGGGCAGTTGGTCCAGGACCCACACTTGCTTTCCTCGTGTTTCCTGATCCTGCCTTGGGTCTGTAGTCATACTTCTGGAAATTCCTTTTGGGTCCAAGACGAGGAGGTTCCTCTAAGATCTCATGGCCCTGCTTCCTCCCAGTCCCCTCACAGGACATTTTCTTCCCACAGGTGGAAAAGGAGGGAGCTACTCTCAGGCTGCGTGTAAGTGGTGGGGGTGGGAGTGTGGAGGAGCTCACCCACCCCATAATTCCTCCTGTCCCACGTCTCCTGCGGGCTCTGACCAGGTCCTGTTTTTGTTCTACTCCAGCCAGCGACAGTGCCCAGGGCTCTGATGTGTCTCTCACAGCTTGAAAAGGTGAGATTCTTGGGGTCTAGAGTGGGCGGGGGGGGCGGGGAGGGGGCAGAGGGGAAAGGCCTGGGTAATGGAGATTCTTTGATTGGGATGTTTCGCGTGTGTCGTGGGCTGTTCAGAGTGTCATCACTTACCATGACTAACCAGAATTTGTTCATGACTGTTGTTTTCTGTAGCCTGAGACAGCTGTCTTGTGAGGGACTGAGATGCAGGATTTCTTCACTCCTCCCCTTTGTGACTTCAAGAGCCTCTGGCATCTCTTTCTGCAAAGGCACCTGAATGTGTCTGCGTTCCTGTTAGCATAATGTGAGGAGGTGGAGAGACAGCCCACCCTTGTGTCCACTGTGACCCCTGTTCCCATGCTGACCTGTGTTTCCTCCCCAGTCATCTTTCTTGTTCCAGAGAGGTGGGGCTGGATGTCTCCATCTCTGTCTCAACTTTATGTGCACTGAGCTGCAACTTCTTACTTCCCTACTGAAAATAAGAATCTGAATATACATTTGTTTTCTCAAATATTTGCTATGAGAGGTTGATGGATTAATTAAATAAGTCAATTCCTGGAATGTGAGAGAGCAAATAAAGACCTGAGAACCTTCCAGAATCTGCATGTTCGCTGTGCTGAGTCTATTGCAGGTGGGGTGTGGAGAAGGCTGTGGGGGGCCGAGTGTGGACAGGGCCTGTGCCCAGTTGTTGTTGAGCCCATCATGGGCTTTATGTGGTTAGTCCTCAGCTGGGTCACCTTCACTGCCCCATTGTCCTTGTCCCTTCAGCGGAAACTTGTCCAGTGGGAGCTGTGACCACAGAGGCTCACACATCGCCCAGGGTGGCCCCTGCACACGGGGGTCTCTGTGCATTCTGAGACAAATTTTCAGAGCCATTCACCTCCTGCCCTGCTTCTAGAGCTCCTTTTCTGCTCTGCTCTCCTGCCCTCTCTCCCTGCCCTGGTTCTAGTGATCTTGGTGCTGAATCCAATCCCAACTCATGAATCTGTAAAGCAGAGTCTAATTTAGAGTTACATTTGTCTGTGAAATTGGACCCATCATCAAGGACTGTTCTTTCCTGAAGAGAGAACCTGATTGTGTGCTGCAGTGTGCTGGGGCAGGGGGTGCGG\n'
-  #  allele4 = '>C*07:04:01:01\nTTATTTTGCTGGATGTAGTTTAATATTACCTGAGGTGAGGTAAGGTAAGGCAAAGGGTGGGAGGCAGGGAGTCCAGTTCAGGGACGGGGATTCCAGGAGGAGAAGTGAAGGGGAAGGGGCTGGGCGCAGCCTTGGGGTCTCTCCCTGGTTTCCACAGACAGATCCTTGTCCAGGACTCAGGCACACAGTGTGACAAAGATGCTTGGTGTAGGAGAAGAGGGATCAGGACGAAGTCCCAGGTCCCGGGCGGGGCTCTCAGGGTCTCAGGCTCCAAGGGCCGTGTCTGCACTGGGGAGGCGCCGCGTTGAGGATTCTCCACTCCCCTGAGTTTCACTTCTCCCAACCTGCGTCGGGTCCTTCTTCCTGAATACTCATGACGCGTCCCCAATTCCCACTCCCATTGGGTGTCGGGTTCTAGAGAAGCCAATCAGCGTCTCCGCAGTCCCGGTTCTAAAGTCCCCAGTCACCCACCCGGACTCACATTCTCCCCAGAGGCCGAGATGCGGGTCATGGCGCCCCGAGCCCTCCTCCTGCTGCTCTCGGGAGGCCTGGCCCTGACCGAGACCTGGGCCTGTGAGTGCGGGGTTGGGAGGGAAGCGGCCTCTGCGGAGAGGAGCGAGGGGCCCTCCCGGCGAGGGCGCAGGACCCGGGGAGCCGCGCAGGGAGGTGGGTCGGGCGGGTCTCAGCCCCTCCTCGCCCCCAGGCTCCCACTCCATGAGGTATTTCGACACCGCCGTGTCCCGGCCCGGCCGCGGAGAGCCCCGCTTCATCTCAGTGGGCTACGTGGACGACACGCAGTTCGTGCGGTTCGACAGCGACGCCGCGAGTCCGAGAGGGGAGCCCCGGGCGCCGTGGGTGGAGCAGGAGGGGCCGGAGTATTGGGACCGGGAGACACAGAAGTACAAGCGCCAGGCACAGGCTGACCGAGTGAGCCTGCGGAACCTGCGCGGCTACTACAACCAGAGCGAGGACGGTGAGTGACCCCGGCCCGGGGCGCAGGTCACGACCCCTCCCCATCCCCCACGGACGGCCCGGGTCGCCCCGAGTCTCCCCGTCTGAGATCCACCCCAAGGTGGATCTGCGGAACCCGCCCAGACCCTCGACCGGAGAGAGCCCCAGTCGCCTTTACCCGGTTTCATTTTCGGTTTAGGCCAAAATCCCCGCGGGTTGGTCGGGGCGGGGCGGGGCTCGGGGGACTGGGCTGACCGCGGGGGCGGGGCCAGGGTCTCACACCTTCCAGAGGATGTATGGCTGCGACCTGGGGCCCGACGGGCGCCTCCTCCGCGGGTATGACCAGTTCGCCTACGACGGCAAGGATTACATCGCCCTGAACGAGGACCTGCGCTCCTGGACCGCCGCGGACACCGCGGCTCAGATCACCCAGCGCAAGTTGGAGGCGGCCCGTGCGGCGGAGCAGGACAGAGCCTACCTGGAGGGCACGTGCGTGGAGTGGCTCCGCAGATACCTGGAGAACGGGAAGAAGACGCTGCAGCGCGCGGGTACCAGGGGCAGTGGGGAGCCTTCCCCATCTCCTATAGATCTCCCGGGATGGCCTCCCACGAGGAGGGGAGGAAAATGGGATCAGCACTGGAATATCGCCCTCCCTTGAATGGAGAATGGCATGAGTTTTCCTGAGTTTCCTCTGAGGGCCCCCTCTGCTCTCTAGGACAATTAAGGGATGAAGTCTCTGAGGAAATGGAGGGGAAGACAGTCCCTGGAATACTGATCAGGGGTCTCCTTTGACCACTTTGACCACTGCAGCAGCTGTGGTCAGGCTGCTGACCTTTCTCTCAGGCCTTGTTCTCTGCCTCACACTCAATGTGTCTGAAGGTTTGATTCCAGCTTTTCTGAGTCCTGCAGCCTCCACTCAGGTCAGGACCAGAAGTCGCTGTTCCTCCCTCAGAGACTAGAACTTTCCAATGAATAGGAGATTATCCCAGGTGCCTGTGTCCAGGCTGGCGTCTGGGTTCTGTGCCGCCTTCCCCACCCCAGGTGTCCTGTCCATTCTCAGGATGGTCACATGGGCGCTGCTGGAGTGTCCCAAGAGAGATGCAAAGTGTCTGAATTTTCTGACTCTTCCCGTCAGAACCCCCAAAGACACACGTGACCCACCACCCCCTCTCTGACCATGAGGCCACCCTGAGGTGCTGGGCCCTGGGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGGGAGGACCAGACCCAGGACACCGAGCTTGTGGAGACCAGGCCAGCAGGAGATGGAACCTTCCAGAAGTGGGCAGCTGTGGTGGTGCCTTCTGGACAAGAGCAGAGATACACGTGCCATATGCAGCACGAGGGGCTGCAAGAGCCCCTCACCCTGAGCTGGGGTAAGGAGGGGAATGGGGGGTCACATCTCTTATCAGAGAAAGCAGAAGTCCTTCTGGAGCCCTTCAGCCGGGTCAGGGCTGAGGCTTGGGGGTCAGGGCCCCTCACCTTCTCCTCCTTTCCCAGAGCCATCTTCCCAGCCCACCATCCCCATCATGGGCATCGTTGCTGGCCTGGCTGTCCTGGTTGTCCTAGCTGTCCTTGGAGCTGTGGTCACCGCTATGATGTGTAGGAGGAAGAGCTCAGGTAGGGAAGGGGTGAAGAGCGGGGTCTGGGTTTTCTTGTCCCACTGGGAGTTTCAAGCCCCAGGTAGAAGTGTGCCCCGCCTTGTTACTGGAAGCACCATCCACACATGGGCCATCCCAGCCTGGGACCCTGTGTGCCAGCACTTACTCTTTTGTGAAGCACATGTGACAATGAAGGACGGATGTATCACCTTGATGATTATGGTGTTGGGGTCCTGATTCCAGCATTCATGAGTCAGGGGAAGGTCCCTGCTAAGGACAGACCTTAGGAGGGCAGTTGGTCCAGAACCCACAGCTGCTTTCCCCATGTTTCCTGATCCTGCCCTGGGTCTGCAGTCGTAGTTCTGGAAACTTCTCTTGGGTCCAAGACTAGGAGGTTCCCCTAAGATCACATGGCCCTGCCTCCTCCCAGTCCCCTCATAGGGCATTTTCTTCCCACAGGTGGAAAAGGAGGGAGCTGCTCTCAGGCTGCGTGTAAGTGATGGCGGCGGGCGTGTGGAGGAGCTCACCTACTCCATAATTCCTCTTGTCCCACATCTCCTGCGGGCTCTGACCAGGTCTTTTTTTTTGTTCTACCCCAGGCAGCAACAGTGCCCAGGGCTCTGATGAGTCTCTCATCACTTGTAAAGGTGAGATTCTGGGGAGCTGAAGTGGTCGGGGGTGGGGCAGAGGGAAAAGGCCTGGGTAATGGGGATTCTTTGATTGGGACGTTTCGAGTGTGTGGTGGGCCGTTCAGAGTGTCATCACTTACCATGACTGACCTGAATTTGTTCATGACTATTGTGTTCTGTAGCCTGAGACAGCTGCCTGTGTGGGACTGAGATGCAGGATTTCTTCACACCTCTCCTTTGTGACTTCAAGAGCCTCTGGCATCTCTTTCTGCAAAGGCATCTGAATGTGTCTGCGTTCCTGTTAGCATAATGTGAGGAGGTGGAGAGACAGCCCACCCCCGTGTCCACCGTGACCCCTGTCCCCACACTGACCTGTGTTCCCTCCCCGATCATCTTTCCTGTTCCAGAGAGGTGGGGCTGGATGTCTCCATCTCTGTCTCAAATTCATGGTGCACTGAGCTGCAACTTCTTACTTCCCTAATGAAGTTAAGAACCTGAATATAAATTTGTGTTCTCAAATATTTGCTATGAAGCGTTGATGGATTAATTAAATAAGTCAATTCCTAGAAGTTGAGAGAGCAAATAAAGACCTGAGAACCTTCCAGAATTTGCATGTTCGCTGTGCTGAGTCTGTTGCAGGTGGGGGTGGGGAAGGCTGTGAGGAGCCGAGTGTGGACGGGGCCTGTGCCTAGTTGCTGTTCAGTTCTTCATGGGCTTTATGTGGTCAGTCCTCAGCTGGGTCACCTTCACTGCTCCATTGTCCTTGTCCCTTCAGTGGAAACTTGTCCAGCGGAAGCTGTGACCACAGAGGCTCACCCATCGCCCAGGGCAGCCCCTGCACACGGGAGTCCCTGTGCTTTCTGAGACAAATTTTCAGACCCATTCAGCTCCTGCCCTCCTTCTAGGGCTCCTCTTCTGCTTTGGTCTCCTGCCCTCTCTCCCTTCCCTGATTCCAGTGATCTTCGTGCTGACTCCAATCCCAACTCATGAATCTAAAGCAGAGCCTAATTTAGATTTGTATTTGTTTGTAAAATTGGGTCCATAGTCTAGAATTGTTCCTTCCTGAAGAGAGAAACCTGATCGTGTGCTGCAGTGTGCAGGG\n'
-  #  allele5 = '>C*15:02:01:01\nTTATTTTGCTGGATGTAGTTTAATATTACCTGAGGTAAGGTAAGGCAAAGAGTGGGAGGCAGGGAGTCCAGTTCAGGGACGGGGATTCCAGGAGAAGTGAAGGGGAAGGGGCTGGGCGCAGCCTGGGGGTCTCTCCCTGGTTTCCACAGACAGATCCTTGGCCAGGACTCAGGCACACAGTGTGACAAAGATGCATGGTGTAGGAGAAGAGGGATCAGGACGAAGTCCCAGGTCCCGGGCGGGGCTCTCAGGGTCTCAGGCTCCAAGGGCCGTGTCTGCACTGGGGAGGCGCCGCGTTGAGGATTCTCCACTCCCCTGAGTTTCACTTCTTCTCCCAACCTGCGACGGGTCCTTCTTCCTGAATACTCATGACGCGTCCCCAATTCCCACTCCCATTGGGTGTCGGGTTCTAGAGAAGCCAATCAGCGTCTCCGCAGTCCCGGTTCTAAAGTCCCCAGTCACCCACCCGGACTCGGATTCTCCCCAGACGCCGAGATGCGGGTCATGGCGCCCCGAACCCTCCTCCTGCTGCTCTCGGGAGCCCTGGCCCTGACCGAGACCTGGGCCTGTGAGTGCGGGGTTGGGAGGGAAACGGCCTCTGCGGAGAGGAGCGAGGGGCCCGCCCGGCGAGGGCGCAGGACCCGGGGAGCCGCGCAGGGAGGAGGGTCGGGCGGGTCTCAGCCCCTCCTCGCCCCCAGGCTCCCACTCCATGAGGTATTTCTACACCGCTGTGTCCCGGCCCGGCCGCGGAGAGCCCCACTTCATCGCAGTGGGCTACGTGGACGACACGCAGTTCGTGCGGTTCGACAGCGACGCCGCGAGTCCAAGAGGGGAGCCGCGGGCGCCGTGGGTGGAGCAGGAGGGGCCGGAGTATTGGGACCGGGAGACACAGAACTACAAGCGCCAGGCACAGACTGACCGAGTGAACCTGCGGAAACTGCGCGGCTACTACAACCAGAGCGAGGCCGGTGAGTGACCCCGGCCCGGGGCGCAGGTCACGACCCCTCCCCATCCCCCACGGACGGCCCGGGTCGCCCCGAGTCTCCCGGTCTGAGATCCACCCCGAGGCTGCGGAACCCGCCCAGACCCTCGACCGGAGAGAGCCCCAGTCACCTTTACCCGGTTTCATTTTCAGTTTAGGCCAAAATCCCCGCGGGTTGGTCGGGGCTGGGGCGGGGCTCGGGGGACGGGGCTGACCACGGGGGCGGGGCCAGGGTCTCACATCATCCAGAGGATGTATGGCTGCGACCTGGGGCCCGACGGGCGCCTCCTCCGCGGGCATGACCAGTTAGCCTACGACGGCAAGGATTACATCGCCCTGAACGAGGACCTGCGCTCCTGGACCGCCGCGGACACGGCGGCTCAGATCACCCAGCGCAAGTGGGAGGCGGCCCGTGAGGCGGAGCAGCTGAGAGCCTACCTGGAGGGCACGTGCGTGGAGTGGCTCCGCAGATACCTGGAGAACGGGAAGGAGACGCTGCAGCGCGCGGGTACCAGGGGCAGTGGGGAGCCTTCCCTATCTCCTGTAGATCTCCCGGGATGGCCTTCCACGAGGAGGGGAGGAAAATGGGATCAGCGCTAGAATATCGCCCTCCCTTGAATGGAGAATGGGATGAGTTTTCCTGAGTTTCCTCTGAGGGCCCCCTCTGCTCTCTAGGACAATTAAGGGATGAAGTCCTTGAGGAAATGGAGGGGAAGACAGTCCCTGGAATACTGATCAGGGGTCCCCTTTGACCACTTTGACCACTGCAGCAGCTGTGGTCAGGCTGCTGACCTTTCTCTCAGGCCTTGTTCTCTGCCTCACGCTCAATGTGTTTGAAGGTTTGATTCCAGCTTTTCTGAGTCCTTCGGCCTCCACTCAGGTCAGGACCAGAAGTCGCTGTTCCTCCCTCAGAGACTAGAACTTTCCAATGAATAGGAGATTATCCCAGGTGCCTGTGTCCAGGCTGGCGTCTGGGTTCTGTGCCCCCTTCCCCACCCCAGGTGTCCTGTCCATTCTCAGGATGGTCACATGGGCGCTGTTGGAGTGTCGCAAGAGAGATACAAAGTGTCTGAATTTTCTGACTCTTCCCGTCAGAACACCCAAAGACACACGTGACCCACCATCCCGTCTCTGACCATGAGGCCACCCTGAGGTGCTGGGCCCTGGGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGCGAGGACCAAACTCAGGACACCGAGCTTGTGGAGACCAGGCCAGCAGGAGATGGAACCTTCCAGAAGTGGGCAGCTGTGGTGGTGCCTTCTGGAGAAGAGCAGAGATACACGTGCCATGTGCAGCACGAGGGGCTGCCGGAGCCCCTCACCCTGAGATGGGGTAAGGAGGGGGATGAGGGGTCATGTGTCTTCTCAGGGAAAGCAGAAGTCCTGGAGCCCTTCAGCTGGGTCAGGGCTGAGGCTTGGGGGTCAGGGCCCCTCACCTTCCCCTCCTTTCCCAGAGCCATCTTCCCAGCCCACCATCCCCATCGTGGGCATCGTTGCTGGCCTGGCTGTCCTGGCTGTCCTAGCTGTCCTAGGAGCTGTGATGGCTGTTGTGATGTGTAGGAGGAAGAGCTCAGGTAGGGAAGGGGTGAGGAGTGGGGTCTGGGTTTTCTTGTCCCACTGGGAGTTTCAAGCCCCAGGTAGAAGTGTGCCCCACCTCGTTACTGGAAGCACCATCCACACATGGGCCATCCCAGCCTGGGACCCTGTGTGCCAGCACTTACTCTGTTGTGAAGCACATGACAATGAAGGACAGATGTATCACCTTGATGATTATGGTGTTGGGGTCCTTGATTCCAGCATTCATGAGTCAGGGGAAGGTCCCTGCTAAGGACAGACCTTAGGAGGGCAGTTGCTCCAGAACCCACAGCTGCTTTCCCCGTGTTTCCTGATCCTGCCCTGGGTCTGCAGTCATAGTTCTGGAAACTTCTCTTGGGTCCAAGACTAGGAGGTTCCCCTAAGATCGCATGGCCCTGCCTCCTCCCTGTCCCCTCACAGGGCATTTTCTTCCCACAGGTGGAAAAGGAGGGAGCTGCTCTCAGGCTGCGTGTAAGTGATGGCGGTGGGCGTGTGGAGGAGCTTACCCACCCCATAATTCCTCTTGTCCCACATCTCCTGCGGGCTCTGACCAGGTCTTTTTTTTTGTTCTACCCCAGCCAGCAACAGTGCCCAGGGCTCTGATGAGTCTCTCATCGCTTGTAAAGGTGAGATTCTGGGGAGCTGAAGTGGTCGGGGGTGGGGCAGAGGGAAAAGGCCTAGGTAATGGGGATCCTTTGATTGGGACGTTTCGAATGTGTGGTGAGCTGTTCAGAGTGTCATCACTTACCATGACTGACCTGAATTTGTTCATGACTATTGTGTTCTGTAGCCTGAGACAGCTGCCTGTGTGGGACTGAGATGCAGGATTTCTTCACACCTCTCCTTTGTGACTTCAAGAGCCTCTGGCATCTCTTTCTGCAAAGGCATCTGAATGTGTCTGCGTTCCTGTTAGCATAATGTGAGGAGGTGGAGAGACAGCCCACCCCCGTGTCCACCGTGACCCCTGTCCCCACACTGACCTGTGTTCCCTCCCCGATCATCTTTCCTGTTCCAGAGAAGTGGGCTGGATGTCTCCATCTCTGTCTCAACTTTACGTGTACTGAGCTGCAACTTCTTACTTCCCTACTGAAAATAAGAATCTGAATATAAATTTGTTTTCTCAAATATTTGCTATGAGAGGTTGATGGATTAATTAAATAAGTCAATTCCTGGAAGTTGAGAGAGCAAATAAAGACCTGAGAACCTTCCAGAATCCGCATGTTCGCTGTGCTGAGTCTGTTGCAGGTGGGGGTGGGGAAGGCTGTGAGGAGACGAGTGTGGACGGGGCCTGTGCCTAGTTGCTGTTCAGTTCTTCATGGGCTTTATGTGGTCAGTCCTCAGCTGGGTCACCTTCACTGCTCCATTGTCCTTGTCCCTTCAGTGGAAACTTGTCCAGCGGGAGCTGTGACCACAGAGGCTCACACATCGCCCAGGGCAGCCCCTGCACACGGGAGTCCCTGTGCTTTCTGAGACAAATTTTCAGACCCAGTCAGCTCCTGCCCTCCTTCTAGGGCTCCTCTTCTGCTTTGGTCTCCTGCCCTCTCTCCCTTCCCTGATTCCAGTGATCTTCGTGCTGACTCCAATCCCAACTCATGAATCTAAAGCAGAGCCTAATTTAGATTTATATTTGTTTGTAAAATTGGGTCCATAGTCTAGAATTGTTCCTTCCTGAAGAGAGAAACCTGATTGTGTGCTGCAGTGTGCGGGG\n'
+        return clustal_process.stdout
     
-    # Example, 6 alleles, sample 9228
-  #  allele1 = '>A*03:01:01:01\nCAGGAGCAGAGGGGTCAGGGCGAAGTCCCAGGGCCCCAGGCGTGGCTCTCAGAGTCTCAGGCCCCGAAGGCGGTGTATGGATTGGGGAGTCCCAGCCTTGGGGATTCCCCAACTCCGCAGTTTCTTTTCTCCCTCTCCCAACCTACGTAGGGTCCTTCATCCTGGATACTCACGACGCGGACCCAGTTCTCACTCCCATTGGGTGTCGGGTTTCCAGAGAAGCCAATCAGTGTCGTCGCGGTCGCTGTTCTAAAGCCCGCACGCACCCACCGGGACTCAGATTCTCCCCAGACGCCGAGGATGGCCGTCATGGCGCCCCGAACCCTCCTCCTGCTACTCTCGGGGGCCCTGGCCCTGACCCAGACCTGGGCGGGTGAGTGCGGGGTCGGGAGGGAAACCGCCTCTGCGGGGAGAAGCAAGGGGCCCTCCTGGCGGGGGCGCAGGACCGGGGGAGCCGCGCCGGGACGAGGGTCGGGCAGGTCTCAGCCACTGCTCGCCCCCAGGCTCCCACTCCATGAGGTATTTCTTCACATCCGTGTCCCGGCCCGGCCGCGGGGAGCCCCGCTTCATCGCCGTGGGCTACGTGGACGACACGCAGTTCGTGCGGTTCGACAGCGACGCCGCGAGCCAGAGGATGGAGCCGCGGGCGCCGTGGATAGAGCAGGAGGGGCCGGAGTATTGGGACCAGGAGACACGGAATGTGAAGGCCCAGTCACAGACTGACCGAGTGGACCTGGGGACCCTGCGCGGCTACTACAACCAGAGCGAGGCCGGTGAGTGACCCCGGCCGGGGGCGCAGGTCAGGACCCCTCATCCCCCACGGACGGGCCAGGTCGCCCACAGTCTCCGGGTCCGAGATCCACCCCGAAGCCGCGGGACCCCGAGACCCTTGCCCCGGGAGAGGCCCAGGCGCCTTTACCCGGTTTCATTTTCAGTTTAGGCCAAAAATCCCCCCGGGTTGGTCGGGGCTGGGCGGGGCTCGGGGGACTGGGCTGACCGCGGGGTCGGGGCCAGGTTCTCACACCATCCAGATAATGTATGGCTGCGACGTGGGGTCGGACGGGCGCTTCCTCCGCGGGTACCGGCAGGACGCCTACGACGGCAAGGATTACATCGCCCTGAACGAGGACCTGCGCTCTTGGACCGCGGCGGACATGGCGGCTCAGATCACCAAGCGCAAGTGGGAGGCGGCCCATGAGGCGGAGCAGTTGAGAGCCTACCTGGATGGCACGTGCGTGGAGTGGCTCCGCAGATACCTGGAGAACGGGAAGGAGACGCTGCAGCGCACGGGTACCAGGGGCCACGGGGCGCCTCCCTGATCGCCTGTAGATCTCCCGGGCTGGCCTCCCACAAGGAGGGGAGACAATTGGGACCAACACTAGAATATCACCCTCCCTCTGGTCCTGAGGGAGAGGAATCCTCCTGGGTTCCAGATCCTGTACCAGAGAGTGACTCTGAGGTTCCGCCCTGCTCTCTGACACAATTAAGGGATAAAATCTCTGAAGGAGTGACGGGAAGACGATCCCTCGAATACTGATGAGTGGTTCCCTTTGACACCGGCAGCAGCCTTGGGCCCGTGACTTTTCCTCTCAGGCCTTGTTCTCTGCTTCACACTCAATGTGTGTGGGGGTCTGAGTCCAGCACTTCTGAGTCCCTCAGCCTCCACTCAGGTCAGGACCAGAAGTCGCTGTTCCCTTCTCAGGGAATAGAAGATTATCCCAGGTGCCTGTGTCCAGGCTGGTGTCTGGGTTCTGTGCTCTCTTCCCCATCCCGGGTGTCCTGTCCATTCTCAAGATGGCCACATGCGTGCTGGTGGAGTGTCCCATGACAGATGCAAAATGCCTGAATTTTCTGACTCTTCCCGTCAGACCCCCCCAAGACACATATGACCCACCACCCCATCTCTGACCATGAGGCCACCCTGAGGTGCTGGGCCCTGGGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGGGAGGACCAGACCCAGGACACGGAGCTCGTGGAGACCAGGCCTGCAGGGGATGGAACCTTCCAGAAGTGGGCGGCTGTGGTGGTGCCTTCTGGAGAGGAGCAGAGATACACCTGCCATGTGCAGCATGAGGGTCTGCCCAAGCCCCTCACCCTGAGATGGGGTAAGGAGGGAGATGGGGGTGTCATGTCTCTTAGGGAAAGCAGGAGCCTCTCTGGAGACCTTTAGCAGGGTCAGGGCCCCTCACCTTCCCCTCTTTTCCCAGAGCTGTCTTCCCAGCCCACCATCCCCATCGTGGGCATCATTGCTGGCCTGGTTCTCCTTGGAGCTGTGATCACTGGAGCTGTGGTCGCTGCCGTGATGTGGAGGAGGAAGAGCTCAGGTGGAGAAGGGGTGAAGGGTGGGGTCTGAGATTTCTTGTCTCACTGAGGGTTCCAAGCCCCAGCTAGAAATGTGCCCTGTCTCATTACTGGGAAGCACCGTCCACAATCATGGGCCTACCCAGTCTGGGCCCTGTGTGCCAGCACTTACTCTTTTGTAAAGCACCTGTTAAAATGAAGGACAGATTTATCACCTTGATTACGGCGGTGATGGGACCTGATCCCAGCAGTCACAAGTCACAGGGGAAGGTCCCTGAGGACAGACCTCAGGAGGGCTATTGGTCCAGGACCCACACCTGCTTTCTTCATGTTTCCTGATCCCGCCCTGGGTCTGCAGTCACACATTTCTGGAAACTTCTCTGGGGTCCAAGACTAGGAGGTTCCTCTAGGACCTTAAGGCCCTGGCTCCTTTCTGGTATCTCACAGGACATTTTCTTCTCACAGATAGAAAAGGAGGGAGTTACACTCAGGCTGCAAGTAAGTATGAAGGAGGCTGATGCCTGAGGTCCTTGGGATATTGTGTTTGGGAGCCCATGGGGGAGCCCACCCACCTCACAATTCCTCCTCTAGCCACATCTTCTGTGGGATCTGACCAGGTTCTGTTTTTGTTCTACCCCAGGCAGTGACAGTGCCCAGGGCTCTGATGTGTCCCTCACAGCTTGTAAAGGTGAGAGCTTGGAGGACCTAATGTGTGTTGGGTGTTGGGCGGAACAGTGGACACAGCTGTGCTATGGGGTTTCTTTGCATTGGATGTATTGAGCATGCGATGGGCTGTTTAAGGTGTGACCCCTCACTGTGATGGATATGAATTTGTTCATGAATATTTTTTTCTATAGTGTGAGACAGCTGCCTTGTGTGGGACTGAGAGGCAAGAGTTGTTCCTGCCCTTCCCTTTGTGACTTGAAGAACCCTGACTTTGTTTCTGCAAAGGCACCTGCATGTGTCTGTGTTCGTGTAGGCATAATGTGAGGAGGTGGGGAGACCACCCCACCCCCATGTCCACCATGACCCTCTTCCCACGCTGACCTGTGCTCCCTCCCCAATCATCTTTCCTGTTCCAGAGAGGTGGGGCTGAGGTGTCTCCATCTCTGTCTCAACTTCATGGTGCACTGAGCTGTAACTTCTTCCTTCCCTATTAAAA\n'
-  #  allele2 = '>A*30:03\nCAGGAGCAGAGGGGTCAGGGCGAAGTCCCAGGGCCCCAGGCGTGGCTCTCAGGGTCTCAGGCCCCGAAGGCGGTGTATGGATTGGGGAGTCACAGCCTTGGGGATTCCCCAACTCCGCAGTTTCTTTTCTCCCTCTCCCAACCTACGTAGGGTCCTTCATCCTGGATACTCACGACGCGGACCCAGTTCTCACTCCCATTGGGTGTCGGGTTTCCAGAGAAGCCAATCAGTGTCGTCGCGGTCGCTGTTCTAAAGCCCGCACGCACCCACCGGGACTCAGATTCTCCCCAGACGCCGAGGATGGCCGTCATGGCGCCCCGAACCCTCCTCCTGCTACTCTCGGGGGCCCTGGCCCTGACCCAGACCTGGGCGGGTGAGTGCGGGGTCGGGAGGGAAACCGCCTCTGCGGGGAGAAGCAAGGGGCCCTCCTGGCGGGGGCGCAGGACCGGGGGAGCCGCGCCGGGAGGAGGGTCGGTCAGGTCTCAGCCACTGCTCGCCCCCAGGCTCCCACTCCATGAGGTATTTCTCCACATCCGTGTCCCGGCCCGGCAGTGGAGAGCCCCGCTTCATCGCAGTGGGCTACGTGGACGACACGCAGTTCGTGCGGTTCGACAGCGACGCCGCGAGCCAGAGGATGGAGCCGCGGGCGCCGTGGATAGAGCAGGAGGGGCCGGAGTATTGGGACCAGGAGACACGGAATGTGAAGGCCCACTCACAGACTGACCGAGAGAACCTGGGGACCCTGCGCGGCTACTACAACCAGAGCGAGGCCGGTGAGTGACCCCGCCCGGGGGCGCAGGTCACGACCCCTCATCCCCCACGGACGGGCCAGGTCGCCCACAGTCTCCGGGTCCGAGATCCACCCCGAAGCCGCGGGACCCCGAGACCCTTGACCCGGGAGAGGCCCAGGCGCCTTTACCCGGTTTCATTTTCAGTTTAGGCCAAAAATTCCCCCGGGTTGGTCGGGGCTGGGCGGGGCTCGGGGGACTGGGCTGACCGCGGGGTCGGGGCCAGGTTCTCACACCATCCAGATAATGTATGGCTGCGACGTGGGGTCGGACGGGCGCTTCCTCCGCGGGTATGAACAGCACGCCTACGACGGCAAGGATTACATCGCCCTGAACGAGGACCTGCGCTCTTGGACCGCGGCGGACATGGCGGCTCAGATCACCCAGCGCAAGTGGGAGGCGGCCCGTCGGGCGGAGCAGTTGAGAGCCTACCTGGAGGGCACGTGCGTGGAGTGGCTCCGCAGATACCTGGAGAACGGGAAGGAGACGCTGCAGCGCACGGGTACCAGGGGCCACGGGGCGCCTTCCTGATCGCCTGTAGATCTCCCGGGCTGGCCTCCCACAAGGAGGGGAGACAATTGGGACCAACACTAGAATATCACCCTCCCTCTGGTCCTGAGGGAGAGGAATCCTCCTGGGTTTCCAGATCCTGTACCAGAGAGTGACTCTGAGGTTCCGCCCTGCTCTCTGACTCAATTAAGGGATAAAATCTCTGAAGGAGTGACGGGAAGACGATCCCTCGAATACTGATGAGTGGTTCCCTTTGACACCGGCAGCAGCCTTGGGCCCGTGACTTTTCCTCTCAGGCCTTGTTCTCTGCTTCACACTCAATGTGTGTGGGGGTCTGAGTCCAGCACTTCTGAGTCCCTCAGCCTCCACTCAGGTCAGGACCAGAAGTCGCTGTTCCCTTCTCAGGGAATAGAAGATTATCCCAGGTGCCTGTGTCCAGGCTGGTGTCTGGGTTCTGTGCTCTCTTCCCCATCCCGGGTGTCCTGTCCATTCTCAAGATGGCCACATGCGTGCTGGTGGAGTGTCCCATGACAGATGCAAAATGCCTGAATTTTCTGACTCTTCCCGTCAGACCCCCCCAAGACACATATGACCCACCACCCCATCTCTGACCATGAGGCCACCCTGAGGTGCTGGGCCCTGGGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGGGAGGACCAGACCCAGGACACGGAGCTCGTGGAGACCAGGCCTGCAGGGGATGGAACCTTCCAGAAGTGGGCGGCTGTGGTGGTGCCTTCTGGAGAGGAGCAGAGATACACCTGCCATGTGCAGCATGAGGGTCTGCCCAAGCCCCTCACCCTGAGATGGGGTAAGGAGGGAGATGGGGGTGTCATGTCTCTTAGGGAAAGCAGGAGCCTCTCTGGAGACCTTTAGCAGGGTCAGGGCCCCTCACCTTCCCCTCTTTTCCCAGAGCTGTCTTCCCAGCCCACCATCCCCATCGTGGGCATCATTGCTGGCCTGGTTCTCCTTGGAGCTGTGATCACTGGAGCTGTGGTCGCTGCCGTGATGTGGAGGAGGAAGAGCTCAGGTGGAGAAGGGGTGAAGGGTGGGGTCTGAGATTTCTTGTCTCACTGAGGGTTCCAAGCCCCAGCTAGAAATGTGCCCTGTCTCATTACTGGGAAGCACCATCCACAATCATGGGCCTACCCAGCCTGGGCCCTGTGTGCCAGCACTTACTCTTTTGTAAAGCACCTGTTAAAATGAAGGACAGATTTATCACCTTGATTACGGCAGTGATGGGACCTGATCCCAGCAGTCACAAGTCACAGGGGAAGGTCCCTGAGGACAGACCTCAGGAGGGCTATTGGTCCAGGACCCACACCTGCTTTCTTCATGTTTCCTGATCCCGCCCTGGGTCTGCAGTCACACATTTCTGGAAACTTCTCTGGGGTCCAAGACTAGGAGGTTCCTCTAGGACCTTAAGGCCCTGGCTCCTTTCTGGTATCTCACAGGACATTTTCTTCTCACAGATAGAAAAGGAGGGAGTTACACTCAGGCTGCAAGTAAGTATGAAGGAGGCTGATGCCTGAGGTCCTTGGGATATTGTGTTTGGGAGCCCATGGGGGAGCTCACCCACCCCACAATTCCTCCTCTAGCCACATCTTCTGTGGGATCTGACCAGGTTCTGTTTTTGTTCTACCCCAGGCAGTGACAGTGCCCAGGGCTCTGATGTGTCTCTCACAGCTTGTAAAGGTGAGAGCTTGGAGGACCTAATGTGTGTTGGGTGTTGGGCAGAACAGTGGACACAGCTGTGCTATGGGGTTTCTTTGCATTGGATGTATTGAGCATGCGATGGGCTGTTTAAGGTGTGACCCCTCACTGTGATGGATATGAATTTGTTCATGAATATTTTTTTCTATAGTGTGAGACAGCTGCCTTGTGTGGGACTGAGAGGCAAGAGTTGTTCCTGCCCTTCCCTTTGTGACTTGAAGAACCCTGACTTTGTTTCTGCAAAGGCACCTGCATGTGTCTGTGTTCGTGTAGGCATAATGTGAGGAGGTGGGGAGACCACCCCACCCCCATGTCCACCATGACCCTCTTCCCACGCTGACCTGTGCTCCCTCCCCAATCATCTTTCCTGTTCCAGAGAGGTGGGGCTGAGGTGTCTCCATCTCTGTCTCAACTTCATGGTGCACTGAGCTGTAACTTCTTCCTTCCCTATTAAAA\n'
-  #  allele3 = '>B*07:02:01:01\nGATCAGGACGAAGTCCCAGGTCCCGGACGGGGCTCTCAGGGTCTCAGGCTCCGAGGGCCGCGTCTGCAATGGGGAGGCGCAGCGTTGGGGATTCCCCACTCCCCTGAGTTTCACTTCTTCTCCCAACTTGTGTCGGGTCCTTCTTCCAGGATACTCGTGACGCGTCCCCACTTCCCACTCCCATTGGGTATTGGATATCTAGAGAAGCCAATCAGCGTCGCCGCGGTCCCAGTTCTAAAGTCCCCACGCACCCACCCGGACTCAGAGTCTCCTCAGACGCCGAGATGCTGGTCATGGCGCCCCGAACCGTCCTCCTGCTGCTCTCGGCGGCCCTGGCCCTGACCGAGACCTGGGCCGGTGAGTGCGGGTCGGGAGGGAAATGGCCTCTGCCGGGAGGAGCGAGGGGACCGCAGGCGGGGGCGCAGGACCTGAGGAGCCGCGCCGGGAGGAGGGTCGGGCGGGTCTCAGCCCCTCCTCACCCCCAGGCTCCCACTCCATGAGGTATTTCTACACCTCCGTGTCCCGGCCCGGCCGCGGGGAGCCCCGCTTCATCTCAGTGGGCTACGTGGACGACACCCAGTTCGTGAGGTTCGACAGCGACGCCGCGAGTCCGAGAGAGGAGCCGCGGGCGCCGTGGATAGAGCAGGAGGGGCCGGAGTATTGGGACCGGAACACACAGATCTACAAGGCCCAGGCACAGACTGACCGAGAGAGCCTGCGGAACCTGCGCGGCTACTACAACCAGAGCGAGGCCGGTGAGTGACCCCGGCCCGGGGCGCAGGTCACGACTCCCCATCCCCCACGTACGGCCCGGGTCGCCCCGAGTCTCCGGGTCCGAGATCCGCCTCCCTGAGGCCGCGGGACCCGCCCAGACCCTCGACCGGCGAGAGCCCCAGGCGCGTTTACCCGGTTTCATTTTCAGTTGAGGCCAAAATCCCCGCGGGTTGGTCGGGGCGGGGCGGGGCTCGGGGGACTGGGCTGACCGCGGGGCCGGGGCCAGGGTCTCACACCCTCCAGAGCATGTACGGCTGCGACGTGGGGCCGGACGGGCGCCTCCTCCGCGGGCATGACCAGTACGCCTACGACGGCAAGGATTACATCGCCCTGAACGAGGACCTGCGCTCCTGGACCGCCGCGGACACGGCGGCTCAGATCACCCAGCGCAAGTGGGAGGCGGCCCGTGAGGCGGAGCAGCGGAGAGCCTACCTGGAGGGCGAGTGCGTGGAGTGGCTCCGCAGATACCTGGAGAACGGGAAGGACAAGCTGGAGCGCGCTGGTACCAGGGGCAGTGGGGAGCCTTCCCCATCTCCTATAGGTCGCCGGGGATGGCCTCCCACGAGAAGAGGAGGAAAATGGGATCAGCGCTAGAATGTCGCCCTCCGTTGAATGGAGAATGGCATGAGTTTTCCTGAGTTTCCTCTGAGGGCCCCCTCTTCTCTCTAGACAATTAAGGAATGACGTCTCTGAGGAAATGGAGGGGAAGACAGTCCCTAGAATACTGATCAGGGGTCCCCTTTGACCCCTGCAGCAGCCTTGGGAACCGTGACTTTTCCTCTCAGGCCTTGTTCTCTGCCTCACACTCAGTGTGTTTGGGGCTCTGATTCCAGCACTTCTGAGTCACTTTACCTCCACTCAGATCAGGAGCAGAAGTCCCTGTTCCCCGCTCAGAGACTCGAACTTTCCAATGAATAGGAGATTATCCCAGGTGCCTGCGTCCAGGCTGGTGTCTGGGTTCTGTGCCCCTTCCCCACCCCAGGTGTCCTGTCCATTCTCAGGCTGGTCACATGGGTGGTCCTAGGGTGTCCCATGAAAGATGCAAAGCGCCTGAATTTTCTGACTCTTCCCATCAGACCCCCCAAAGACACACGTGACCCACCACCCCATCTCTGACCATGAGGCCACCCTGAGGTGCTGGGCCCTGGGTTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGCGAGGACCAAACTCAGGACACTGAGCTTGTGGAGACCAGACCAGCAGGAGATAGAACCTTCCAGAAGTGGGCAGCTGTGGTGGTGCCTTCTGGAGAAGAGCAGAGATACACATGCCATGTACAGCATGAGGGGCTGCCGAAGCCCCTCACCCTGAGATGGGGTAAGGAGGGGGATGAGGGGTCATATCTCTTCTCAGGGAAAGCAGGAGCCCTTCAGCAGGGTCAGGGCCCCTCATCTTCCCCTCCTTTCCCAGAGCCGTCTTCCCAGTCCACCGTCCCCATCGTGGGCATTGTTGCTGGCCTGGCTGTCCTAGCAGTTGTGGTCATCGGAGCTGTGGTCGCTGCTGTGATGTGTAGGAGGAAGAGTTCAGGTAGGGAAGGGGTGAGGGGTGGGGTCTGGGTTTTCTTGTCCCACTGGGGGTTTCAAGCCCCAGGTAGAAGTGTTCCCTGCCTCATTACTGGGAAGCAGCATGCACACAGGGGCTAACGCAGCCTGGGACCCTGTGTGCCAGCACTTACTCTTTTGTGCAGCACATGTGACAATGAAGGATGGATGTATCACCTTGATGGTTGTGGTGTTGGGGTCCTGATTCCAGCATTCATGAGTCAGGGGAAGGTCCCTGCTAAGGACAGACCTTAGGAGGGCAGTTGGTCCAGGACCCACACTTGCTTTCCTCGTGTTTCCTGATCCTGCCCTGGGTCTGTAGTCATACTTCTGGAAATTCCTTTTGGGTCCAAGACTAGGAGGTTCCTCTAAGATCTCATGGCCCTGCTTCCTCCCAGTGCCCTCACAGGACATTTTCTTCCCACAGGTGGAAAAGGAGGGAGCTACTCTCAGGCTGCGTGTAAGTGGTGGGGGTGGGAGTGTGGAGGAGCTCACCCACCCCATAATTCCTCCTGTCCCACGTCTCCTGCGGGCTCTGACCAGGTCCTGTTTTTGTTCTACTCCAGGCAGCGACAGTGCCCAGGGCTCTGATGTGTCTCTCACAGCTTGAAAAGGTGAGATTCTTGGGGTCTAGAGTGGGTGGGGTGGCGGGTCTGGGGGTGGGTGGGGCAGAGGGGAAAGGCCTGGGTAATGGGGATTCTTTGATTGGGATGTTTCGCGTGTGTGGTGGGCTGTTTAGAGTGTCATCGCTTACCATGACTAACCAGAATTTGTTCATGACTGTTGTTTTCTGTAGCCTGAGACAGCTGTCTTGTGAGGGACTGAGATGCAGGATTTCTTCACGCCTCCCCTTTGTGACTTCAAGAGCCTCTGGCATCTCTTTCTGCAAAGGCACCTGAATGTGTCTGCGTCCCTGTTAGCATAATGTGAGGAGGTGGAGAGACAGCCCACCCTTGTGTCCACTGTGACCCCTGTTCCCATGCTGACCTGTGTTTCCTCCCCAGTCATCTTTCTTGTTCCAGAGAGGTGGGGCTGGATGTCTCCATCTCTGTCTCAACTTTACGTGCACTGAGCTGCAACTTCTTACTTCCCTACTGAAAATAAGAATCTGAATATAAATTTGTTTTCTCAAATATTTGCTATGAGAGGTTGATGGATTAATTAAATAAGTCAATTCCTGGAATTTGAGAGAGCAAATAAAGACCTGAGAACCTTCCAGAATCTGCATGTTCGCTGTGCTGAGTCTGTTGCAGGTGGGGTGTGGAGAAGGCTGTGGGGGGCCGAGTGTGGATGGGGCCTGTGCCCATTTGGTGTTGAGTCCATCATGGGCTTTATGTGGTTAGTCCTCAGCTGGGTCACCTTCACTGCTCCATTGTCCTTGTCCCTTCAGTGGAAACTTGTCCAGTGGGAGCTGTGACCACAGAGGCTCACACATCGCCCAGGGCGGCCCCTGCACACGGGGGTCTCTGTGCATTCTGAGACAAATTTTCAGAGCCATTCACCTCCTGCTCTGCTTCTAGAGCTCCTTTTCTGCTCTGCTCTTCTGCCCTCTCTCCCTGCCCTGGTTCTAGTGATCTTGGTGCTGAATCCAATCCCAACTCATGAATCTGTAAAGCAGAGTCTAATTTAGACTTACATTTGTCTGTGAAATTGGACCCGTCATCAAGGACTGTTCTTTCCTGAAGAGAGAACCTGATTGTGTGCTGCAGTGTGCTGGGGCAGGGGGTGCGG\n'
-  #  allele4 = '>B*18:01:01:01\nGATCAGGACGAAGTCCCAGGCCCCGGGCGGGGCTCTCAGGGTCTCAGGCTCCGAGAGCCTTGTCTGCATTGGGGAGGCGCAGCATTGGGGATTCCCCACTCCCACGAGTTTCACTTCTTCTCCCAACCTATGTCGGGTCCTTCTTCCAGGATACTCGTGACGCGTCCCCATTTCCCACTCCCATTGGGTGTCGGGTGTCTAGAGAAGCCAATCAGTGTCGCCGGGGTCCCAGTTCTAAAGTCCCCACGCACCCACCCGGACTCAGAATCTCCTCAGACGCCGAGATGCGGGTCACGGCGCCCCGAACCCTCCTCCTGCTGCTCTGGGGGGCAGTGGCCCTGACCGAGACCTGGGCTGGTGAGTGCGGGGTCGGCAGGGAAATGGCCTCTGTGGGGAGGAGCGAGGGGACCGCAGGCGGGGGCGCAGGACCCGGGGAGCCGCGCCGGGAGGAGGGTCGGGCGGGTCTCAGCCCCTCCTTGCCCCAGGCTCCCACTCCATGAGGTATTTCCACACCTCCGTGTCCCGGCCCGGCCGCGGGGAGCCCCGCTTCATCTCAGTGGGCTACGTGGACGGCACCCAGTTCGTGAGGTTCGACAGCGACGCCGCGAGTCCGAGGACGGAGCCCCGGGCGCCGTGGATAGAGCAAGAGGGGCCGGAGTATTGGGACCGGAACACACAGATCTCCAAGACCAACACACAGACTTACCGAGAGAGCCTGCGGAACCTGCGCGGCTACTACAACCAGAGCGAGGCCGGTGAGTGACCCCGGCCCGGGGCGCAGGTCACGACTCCCCATCCCCCACGTACGGCCCGGGTCGCCCCGAGTCTCCGGGTCCGAGATCCGCCCCCCTGAGGCCGCGGGACCCGCCCAGACCCTCGACCGGCGAGAGCCCCAGGCGCGTTTACCCGGTTTCATTTTCAGTTGAGGCCAAAATCCCCGCGGGTTGGTCGGGGCGGGGCGGGGCTCGGGGGGACGGGGCTGACCGCGGGGCCGGGGCCAGGGTCTCACACCCTCCAGAGGATGTACGGCTGCGACGTGGGGCCGGACGGGCGCCTCCTCCGCGGGCATGACCAGTCCGCCTACGACGGCAAGGATTACATCGCCCTGAACGAGGACCTGAGCTCCTGGACCGCGGCGGACACCGCGGCTCAGATCACCCAGCGCAAGTGGGAGGCGGCCCGTGTGGCGGAGCAGCTGAGAGCCTACCTGGAGGGCACGTGCGTGGAGTGGCTCCGCAGACACCTGGAGAACGGGAAGGAGACGCTGCAGCGCGCGGGTACCAGGGGCAGTGGGGAGCCTTCCCCATCTCCTATAGGTCGCCGGGGATGGCCTCCCACGAGAAGAGGAGGAAAATGGGATCAGCGCTAGAATGTCGCCCTCCCTTGAATGGAGAATGGCATGAGTTTTCCTGAGTTTCCTCTGAGGGCCCCCTCTTCTCTCTAGGACAATTAAGGGATGACGTCTCTGAGGAAATGGAGGGGAAGACAGTCCCTAGAATACTGATCAGGGGTCCCCTTTGACCCCTGCAGCAGCCTTGGGAACCATGACTTTTCCTCTCAGGCCTTGTTCTCTGCCTCACACTCAGTGTGTTTGGGGCTCTGATTCCAGCACTTCTGAGTCACTTTACCTCCACTCAGATCAGGAGCAGAAGTCTCTGTTCCCCGCTCAGAGACTCGAACTTTCCAATGAATAGATTATCCCAGGTGCCTGCGTCCAGGCTGGTGTCTGGGTTCTGTGCCCCTTCCCCACCCCAGGTGTCCTGTCCATTCTCAGGCTGGTCACATGGGTGGTCCTAGGGTGTCCCATGAGAGATGCAAAGCGCCTGAATTTTCTGACTCTTCCCATCAGACCCCCCAAAGACACATGTGACCCACCACCCCATCTCTGACCATGAGGCCACCCTGAGGTGCTGGGCCCTGGGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGCGAGGACCAAACTCAGGACACCGAGCTTGTGGAGACCAGACCAGCAGGAGATAGAACCTTCCAGAAGTGGGCAGCTGTGGTGGTGCCTTCTGGAGAAGAGCAGAGATACACATGCCATGTACAGCATGAGGGGCTGCCGAAGCCCCTCACCCTGAGATGGGGTAAGGAGGGGGATGAGGGGTCATATCTCTTCTCAGGGAAAGCAGGAGCCCTTCTGGAGCCCTTCAGCAGGGTCAGGGCCCCTCATCTTCCCCTCCTTTCCCAGAGCCATCTTCCCAGTCCACCATCCCCATCGTGGGCATTGTTGCTGGCCTGGCTGTCCTAGCAGTTGTGGTCATCGGAGCTGTGGTCGCTACTGTGATGTGTAGGAGGAAGAGCTCAGGTAGGGAAGGGGTGAGGGGTGGGGTCTGGGTTTTCTTGTCCCACTGGGGGTTTCAAGCCCCAGGTAGAAGTGTTCCCTGCCTCATTACTGGGAAGCAGCATCCACACAGGGGCTAACACAGCCTGGGACCCTGTGTGCCAGCACTTACTCTTTTGTGCAGCACATGTGACAATGAAGGACGGATGTATCACCTTGATGGTTGTGGTGTTGGGGTCCTGATTCCAGCATTCATGAGTCAGGGGAAGGTCCCTGCTAAGGACAGACCTTAGGAGGGCAGTTGGTCCAGGACCCACACTTGCTTTCCTCGTGTTTCCTGATCCTGCCTTGGGTCTGTAGTCATACTTCTGGAAATTCCTTTTGGTTCCAAGACGAGGAGGTTCCTCTAAGATCTCATGGCCCTGCTTCCTCCCAGTCCCCTCACAGGACATTTTCTTCCCACAGGTGGAAAAGGAGGGAGCTACTCTCAGGCTGCGTGTAAGTGGTGGGGGTGGGAGTGTGGAGGAGCTCACCCACCCCATAATTCCTCCTGTCCCACGTCTCCTGCGGGCTCTGACCAGGTCCTGTTTTTGTTCTACTCCAGCCAGCGACAGTGCCCAGGGCTCTGATGTGTCTCTCACAGCTTGAAAAGGTGAGATTCTTGGGGTCTAGAGTGGGCGGGGGGGCGGGGAGGGGGCAGAGGGGAAAGGCCTGGGTAATGGAGATTCTTTGATTGGGATGTTTCGCGTGTGTGGTGGGCTGTTCAGAGTGTCATCACTTACCATGACTAACCAGAATTTGTTCATGACTGTTGTTTTCTGTAGCCTGAGACAGCTGTCTTGTGAGGGACCGAGATGCAGGATTTCTTCACGCCTCCCCTTTGTGACTTCAAGAGCCTCTGGCATCTCTTTCTGCAAAGGCACCTGAATGTGTCTGCGTCCCTGTTAGCATAATGTGAGGAGGTGGAGAGACAGCTCACCCCCGTGTCCACCGTGACCCCTGTTCCCATGCTGACCTGTGTTTCCTCCCCAGTCATCTTTCTTGTTCCAGAGAGGTGGGGCTGGATGTCTCCATCTCTGTCTCAACTTTATGTGCACTGAGCTGCAACTTCTTACTTCCCTACTGAAAATAAGAATCTGAATATAAATTTGTTTTCTCAAATATTTGCTATGAGAGGTTGATGGATTAATTAAATAAGTCAATTCCTGGAATTTGAGAGAGCAAATAAAGACCTGAGAACCTTCCAGAATCTGCATGTTCGCTGTGCTGAGTCTGTTGCAGGTGGGGTGTGGAGAAGGCTGTGGGGGGCCGAGTGTGGACGGGGCCTGTGCCCATTTGGTGTTGAGTCCATCATGGGCTTTATGTGGTTAGTCCTCAGCTGGGTCACCTTCACTGCTCCATTGTCCTTGTCCCTTCAGTGGAAACTTGTCCAGCGGGAGCTGTGACCACAGAGGCTCACACATCGCCCAGGGCGGCCCCTGCACACGGGGGTCTCTGTGCATTCTGAGACAAATTTTCAGAGCCATTCACCTCCTGCCCTGCTTCTAGAGCTCCTTTTCTGCTCTGCTCTCCTGCCCTCTCTCCCTGCCCTGGTTCTAGTGATCTTGGTGCTGAATCCAATCCCAACTCCTGAATCTGTAAAGCAGAGTCTAATTTAGACTTACATTTGTCTGTGAAATTGGACCCGTCATCAAGGACTGTTCTTTCCTGAAGAGAGAACCTGATTGTGTGCTGCAGTGTGCTGGGGCAGGGGGTGCGG\n'
-  #  allele5 = '>C*05:01:01:01\nTTATTTTGCTGGATGTAGTTTAATATTACCTGAGGTAAGGTAAGGCAAAGAGTGGGAGGCAGGGAGTCCAGTTCAGGGACGGGGATTCCAGGAGAAGTGAAGGGGAAGGGGCTGGGCGCAGCCTGGGGGTCTCTCCCTGGTTTCCACAGACAGATCCTTGGCCAGGACTCAGGCACACAGTGTGACAAAGATGCTTGGTGTAGGAGAAGAGGGATCAGGACGAAGTCCCAGGTCCCGGGCGGGGCTCTCAGGGTCTCAGGCTCCAAGGGCCGTGTCTGCACTGGGGAGGCGCCGCGTTGAGGATTCTCCACTCCCCTGAGTTTCACTTCTTCTTCCAACCTGCGTCGGGTCCTTCTTCCTGAATACTCATGACGCGTCCCCAATTCCCACTCCCATTGGGTGTCGGGTTCTAGAGAAGCCAATCAGCGTCTCCGCAGTCCCGGTTCTAAAGTCCCCAGTCACCCACCCGGACTCGGATTCTCCCCAGACGCCGAGATGCGGGTCATGGCGCCCCGAACCCTCATCCTGCTGCTCTCGGGAGCCCTGGCCCTGACCGAGACCTGGGCCTGTGAGTGCGAGGTTGGGAGGGAAACGGCCTCTGCGGAGAGGAGCGAGGGGCCCGCCCGGCGAGGGCGCAGGACCCGGGGAGCCGCGCAGGGAGGAGGGTCGGGCGGGTCTCAGCCCCTCCTCGCCCCCAGGCTCCCACTCCATGAGGTATTTCTACACCGCCGTGTCCCGGCCCGGCCGCGGAGAGCCCCGCTTCATCGCAGTGGGCTACGTGGACGACACGCAGTTCGTGCAGTTCGACAGCGACGCCGCGAGTCCAAGAGGGGAGCCGCGGGCGCCGTGGGTGGAGCAGGAGGGGCCGGAGTATTGGGACCGGGAGACACAGAAGTACAAGCGCCAGGCACAGACTGACCGAGTGAACCTGCGGAAACTGCGCGGCTACTACAACCAGAGCGAGGCCGGTGAGTGACCCCGGCCCGGGGCGCAGGTCACGACCCCTCCCCATCCCCCACGGACGGCCCGGGTCGCCCCGAGTCTCCCGGTCTGAGATCCACCCCGAGGCTGCGGAACCCGCCCAGACCCTCGACCGGAGAGAGCCCCAGTCACCTTTACCCGGTTTCATTTTCAGTTTAGGCCAAAATCCCCGCGGGTTGGTCGGGGCTGGGGCGGGGCTCGGGGGACGGGGCTGACCACGGGGGCGGGGCCAGGGTCTCACACCCTCCAGAGGATGTATGGCTGCGACCTGGGGCCCGACGGGCGCCTCCTCCGCGGGTATAACCAGTTCGCCTACGACGGCAAGGATTACATCGCCCTGAATGAGGACCTGCGCTCCTGGACCGCCGCGGACAAGGCGGCTCAGATCACCCAGCGCAAGTGGGAGGCGGCCCGTGAGGCGGAGCAGCGGAGAGCCTACCTGGAGGGCACGTGCGTGGAGTGGCTCCGCAGATACCTGGAGAACGGGAAGAAGACGCTGCAGCGCGCGGGTACCAGGGGCAGTGGGGAGCCTTCCCCATCTCCTGTAGATCTCCCGGGATGGCCTCCCACGAGGAGGGGAGGAAAATGGGATCAGCGCTGGAATATCGCCCTCCCTTGAATGGAGAATGGGATGAGTTTTCCTGAGTTTCCTCTGAGGGCCCCCTCTGCTCTCTAGGACAATTAAGGGATGAAGTCCTTGAGGAAATGGAGGGGAAGACAGTCCCTGGAATACTGATCAGGGGTCCCCTTTGACCACTTTGACCACTGCAGCAGCTGTGGTCAGGCTGCTGACCTTTCTCTCAGGCCTTGTTCTCTGCCTCACGCTCAATGTGTTTAAAGGTTTGATTCCAGCTTTTCTGAGTCCTTCGGCCTCCACTCAGGTCAGGACCAGAAGTCGCTGTTCCTCCCTCAGAGACTAGAACTTTCCAATGAATAGGAGATTATCCCAGGTGCCTGTGTCCAGGCTGGCGTCTGGGTTCTGTGCCCCCTTCCCCACCCCAGGTGTCCTGTCCATTCTCAGGATGGTCACATGGGCACTGTTGGAGTGTCGCAAGAGAGATACAAAGTGTCTGAATTTTCTGACTCTTCCCGTCAGAACACCCAAAGACACACGTGACCCACCATCCCGTCTCTGACCATGAGGCCACCCTGAGGTGCTGGGCCCTGGGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGCGAGGACCAAACTCAGGACACCGAGCTTGTGGAGACCAGGCCAGCAGGAGATGGAACCTTCCAGAAGTGGGCAGCTGTGGTGGTGCCTTCTGGAGAAGAGCAGAGATACACGTGCCATGTGCAGCACGAGGGGCTGCCAGAGCCCCTCACCCTGAGATGGGGTAAGGAGGGGGATGAGGGGTCATGTGTCTTCTCAGGGAAAGCAGAAGTCCTGGAGCCCTTCAGCCGGGTCAGGGCTGAGGCTTGGGGGTCAGGGCCCCTCACCTTCCCCTCCTTTCCCAGGGCCATCTTCCCAGCCCACCATCCCCATCGTGGGCATCGTTGCTGGCCTGGCTGTCCTGGCTGTCCTAGCTGTCCTAGGAGCTGTGATGGCTGTTGTGATGTGTAGGAGGAAGAGCTCAGGTAGGGAAGGGGTGAGGAGTGGGGTCTGGGTTTTCTTGTCCCACTGGGAGTTTCAAGCCCCAGGTAGAAGTGTGCCCCACCTCGTTACTGGAAGCACCATCCACACATGGGCCATCCCAGCCTGGGACCCTGTGTGCTAGCACTTACTCTGTTGTGAAGCACATGACAATGAAGGACAGATGTATCACCTTGATGATTATGGTGTTGGGGTCCTTGATTCCAGCATTCATGAGTCAGGGGAAGGTCCCTGCTAAGGACAGACCTTAGGAGGGCAGTTGCTCCAGAACCCACAGCTGCTTTCCCCGTGTTTCCTGATCCTGCCCTGGGTCTGCAGTCATAGTTCTGGAAACTTCTCTTGGGTCCAAGACTAGGAGGTTCCCCTAAGATCGCATGGCCCTGCCTCCTCCCTGTCCCCTCACAGGGCATTTTCTTCCCACAGGTGGAAAAGGAGGGAGCTGCTCTCAGGCTGCGTGTAAGTGATGGCGGTGGGCGTGTGGAGGAGCTCACCCACCCCATAATTCCTCTTGTCCCACATCTCCTGCGGGCTCTGACCAGGTCTTTTTTTTTGTTCTACCCCAGCCAGCAACAGTGCCCAGGGCTCTGATGAGTCTCTCATCGCTTGTAAAGGTGAGATTCTGGGGAGCTGAAGTGGTCGGGGGTGGGGCAGAGGGAAAAGGCCTAGGTAATGGGGATCCTTTGATTGGGACGTTTCGAATGTGTGGTGAGCTGTTCAGAGTGTCATCACTTACCATGACTGACCTGAATTTGTTCATGACTATTGTGTTCTGTAGCCTGAGACAGCTGCCTGTGTGGGACTGAGATGCAGGATTTCTTCACACCTTTCCTTTGTGACTTCAAGAGCCTCTGGCATCTCTTTCTGCAAAGGCATCTGAATGTGTCTGCGTTCCTGTTAGCATAATGTGAGGAGGTGGAGAGACAGCCCACCCCCGTGTCCACCGTGACCCCTGTCCCCACACTGACCTGTGTTCCCTCCCCGATCATCTTTCCTGTTCCAGAGAAGTGGGCTGGATGTCTCCATCTCTGTCTCAACTTTACGTGTACTGAGCTGCAACTTCTTACTTCCCTACTGAAAATAAGAATCTGAATATAAATTTGTTTTCTCAAATATTTGCTATGAGAGGTTGATGGATTAATTAAATAAGTCAATTCCTGGAAGTTGAGAGAGCAAATAAAGACCTGAGAACCTTCCAGAATCCGCATGTTCGCTGTGCTGAGTCTGTTGCAGGTGGGGGTGGGGAAGGCTGTGAGGAGACGAGTGTGGACGGGGCCTGTGCCTAGTTGCTGTTCAGTTCTTCATGGGCTTTATGTGGTCAGTCCTCAGCTGGGTCACCTTCACTGCTCCATTGTCCTTGTCCCTTCAGTGGAAACTTGTCCAGCGGGAGCTGTGACCACAGAGGCTCACACATCGCCCAGGGCAGCCCCTGCACACGGGAGTCCCTGTGCTTTCTGAGACAAATTTTCAGACCCATTCAGCTCCTGCCCTCCTTCTAGGGCTCCTCTTCTGCTTTGGTCTCCTGCCCTCTCTCCCTTCCCTGATTCCAGTAATCTTCGTGCTGACTCCAATCCCAACTCATGAATCTAAAGCAGAGCCTAATTTAGATTTATATTTGTTTGTAAAATTGGGTCCATAGTCTAGAATTGTTCCTTCCTGAAGAGAGAAACCTGATTGTGTGCTGCAGTGTGCGGGG\n'
-  #  allele6 = '>C*07:02:01:03\nTTATTTTGCTGGATGTAGTTTAATATTACCTGAGGTGAGGTAAGGTAAGGCAAAGGGTGGGAGGCAGGGAGTCCAGTTCAGGGACGGGGATTCCAGGAGGAGAAGTGAAGGGGAAGGGGCTGGGCGCAGCCTTGGGGTCTCTCCCTGGTTTCCACAGACAGATCCTTGTCCAGGACTCAGGCACACAGTGTGACAAAGATGCTTGGTGTAGGAGAAGAGGGATCAGGACGAAGTCCCAGGTCCCGGGCGGGGCTCTCAGGGTCTCAGGCTCCAAGGGCCGTGTCTGCATTGGGGAGGCGCCGCGTTGGGGATTCTCCACTCCCCTGAGTTTCACTTCTCCCAACCTGCGTCGGGTCCTTCTTCCTGAATACTCATGACGCGTCCCCAATTCCCACTCCCATTGGGTGTCGGGTTCTAGAGAAGCCAATCAGCGTCTCCGCAGTCCCGGTTCTAAAGTCCCCAGTCACCCACCCGGACTCACATTCTCCCCAGAGGCCGAGATGCGGGTCATGGCGCCCCGAGCCCTCCTCCTGCTGCTCTCGGGAGGCCTGGCCCTGACCGAGACCTGGGCCTGTGAGTGCGGGGTTGGGAGGGAAGCGGCCTCTGCGGAGAGGAGCGAGGGGCCCTCCCGGCGAGGGCGCAGGACCCGGGGAGCCGCGCAGGGAGGTGGGTCGGGCGGGTCTCAGCCCCTCCTCGCCCCCAGGCTCCCACTCCATGAGGTATTTCGACACCGCCGTGTCCCGGCCCGGCCGCGGAGAGCCCCGCTTCATCTCAGTGGGCTACGTGGACGACACGCAGTTCGTGCGGTTCGACAGCGACGCCGCGAGTCCGAGAGGGGAGCCGCGGGCGCCGTGGGTGGAGCAGGAGGGGCCGGAGTATTGGGACCGGGAGACACAGAAGTACAAGCGCCAGGCACAGGCTGACCGAGTGAGCCTGCGGAACCTGCGCGGCTACTACAACCAGAGCGAGGACGGTGAGTGACCCCGGCCCGGGGCGCAGGTCACGACCCCTCCCCATCCCCCACGGACGGCCCGGGTCGCCCAGAGTCTCCCCGTCTGAGATCCACCCCAAGGTGGATCTGCGGAACCCGCCCAGACCCTCGACCGGAGAGAGCCCCAGTCGCCTTTACCCGGTTTCATTTTCGGTTTAGGCCAAAATCCCCGCGGGTTGGTCGGGGCGGGGCGGGGCTCGGGGGACTGGGCTGACCGCGGGGGCGGGGCCAGGGTCTCACACCCTCCAGAGGATGTCTGGCTGCGACCTGGGGCCCGACGGGCGCCTCCTCCGCGGGTATGACCAGTCCGCCTACGACGGCAAGGATTACATCGCCCTGAACGAGGACCTGCGCTCCTGGACCGCCGCGGACACCGCGGCTCAGATCACCCAGCGCAAGTTGGAGGCGGCCCGTGCGGCGGAGCAGCTGAGAGCCTACCTGGAGGGCACGTGCGTGGAGTGGCTCCGCAGATACCTGGAGAACGGGAAGGAGACGCTGCAGCGCGCAGGTACCAGGGGCAGTGGGGAGCCTTCCCCATCTCCTATAGATCTCCCGGGATGGCCTCCCACGAGGAGGGGAGGAAAATGGGATCAGCACTGGAATATCGCCCTCCCTTGAATGGAGAATGGCATGAGTTTTCCTGAGTTTCCTCTGAGGGCCCCCTCTGCTCTCTAGGACAATTAAGGGATGAAGTCTCTGAGGAAATGGAGGGGAAGACAGTCCCTGGAATACTGATCAGGGGTCTCCTTTGACCACTTTGACCACTGCAGCAGCTGTGGTCAGGCTGCTGACCTTTCTCTCAGGCCTTGTTCTCTGCCTCACACTCAATGTGTCTGAAGGTTTGATTCCAGCTTTTCTGAGTCCTGCAGCCTCCACTCAGGTCAGGACCAGAAGTCGCTGTTCCTCCCTCAGAGACTAGAACTTTCCAATGAATAGGAGATTATCCCAGGTGCCTGTGTCCAGGCTGGCGTCTGGGTTCTCTGCCGCCTTCCCCACCCCAGGTGTCCTGTCCATTCTCAGGATGGTCACATGGGCGCTGCTGGAGTGTCCCAAGAGAGATGCAAAGTGTCTGAATTTTCTGACTCTTCCCGTCAGAACCCCCAAAGACACACGTGACCCACCACCCCCTCTCTGACCATGAGGCCACCCTGAGGTGCTGGGCCCTGGGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGGGAGGACCAGACCCAGGACACCGAGCTTGTGGAGACCAGGCCAGCAGGAGATGGAACCTTCCAGAAGTGGGCAGCTGTGGTGGTGCCTTCTGGACAAGAGCAGAGATACACGTGCCATATGCAGCACGAGGGGCTGCAAGAGCCCCTCACCCTGAGCTGGGGTAAGGAGGGGAATGGGGGGTCACATCTCTTATCAGAGAAAGCAGAAGTCCTTCTGGAGCCCTTCAGCCGGGTCAGGGCTGAGGCTTGGGGGTCAGGGCCCCTCACCTTCTCCTCCTTTCCCAGAGCCATCTTCCCAGCCCACCATCCCCATCATGGGCATCGTTGCTGGCCTGGCTGTCCTGGTTGTCCTAGCTGTCCTTGGAGCTGTGGTCACCGCTATGATGTGTAGGAGGAAGAGCTCAGGTAGGGAAGGGGTGAAGAGCGGGGTCTGGGTTTTCTTGTCCCACTGGGAGTTTCAAGCCCCAGGTAGAAGTGTGCCCCGCCTTGTTACTGGAAGCACCATCCACACATGGGCCATCCCAGCCTGGGACCCTGTGTGCCAGCACTTACTCTTTTGTGAAGCACATGTGACAATGAAGGACGGATGTATCACCTTGATGATTATGGTGTTGGGGTCCTGATTCCAGCATTCATGAGTCAGGGGAAGGTCCCTGCTAAGGACAGACCTTAGGAGGGCAGTTGGTCCAGAACCCACAACTGCTTTCCCCATGTTTCCTGATCCTGCCCTGGGTCTGCAGTCGTAGTTCTGGAAACTTCTCTTGGGTCCAAGACTAGGAGGTTCCCCTAAGATCACATGGCCCTGCCTCCTCCCAGTCCCCTCATAGGGCATTTTCTTCCCACAGGTGGAAAAGGAGGGAGCTGCTCTCAGGCTGCGTGTAAGTGATGGCGGCGGGCGTGTGGAGGAGCTCACCTACTCCATAATTCCTCTTGTCCCACATCTCCTGCGGGCTCTGACCAGGTCTTTTTTTTTGTTCTACCCCAGGCAGCAACAGTGCCCAGGGCTCTGATGAGTCTCTCATCACTTGTAAAGGTGAGATTCTGGGGAGCTGAAGTGGTCGGGGGTGGGGCAGAGGGAAAAGGCCTGGGTAATGGGGATTCTTTGATTGGGACGTTTCGAGTGTGTGGTGGGCCGTTCAGAGTGTCATCGCTTACCATGACTGACCTGAATTTGTTCATGACTATTGTGTTCTGTAGCCTGAGACAGCTGCCTGTGTGGGACTGAGATGCAGGATTTCTTCACACCTCTCCTTTGTGACTTCAAGAGCCTCTGGCATCTCTTTCTGCAAAGGCACCTGAATGTGTCTGCGTTCCTGTTAGCATAATGTGAGGAGGTGGAGAGACAGCCCACCCCCGTGTCCACCGTGACCCCTGTCCCCACACTGACCTGTGTTCCCTCCCCGATCATCTTTCCTGTTCCAGAGAGGTGGGGCTGGATGTCTCCATCTCTGTCTCAAATTCATGGTGCACTGAGCTGCAACTTCTTACTTCCCTAATGAAGTTAAGAACCTGAATATAAATTTGTGTTCTCAAATATTTGCTATGAAGCGTTGATGGATTAATTAAATAAGTCAATTCCTAGAAGTTGAGAGAGCAAATAAAGACCTGAGAACCTTCCAGAATTTGCATGTTCGCTGTGCTGAGTCTGTTGCAGGTGGGGGTGGGGAAGGCTGTGAGGAGCCGAGTGTGGACGGGGCCTGTGCCTAGTTGCTGTTCAGTTCTTCATGGGCTTTATGTGGTCAGTCCTCAGCTGGGTCACCTTCACTGCTCCATTGTCCTTGTCCCTTCAGTGGAAACTTGTCCAGCGGAAGCTGTGACCACAGAGGCTCACCCATCGCCCAGGGCAGCCCCTGCACACGGGAGTCCCTGTGCTTTCTGAGACAAATTTTCAGACCCATTCAGCTCCTGCCCTCCTTCTAGGGCTCCTCTTCTGCTTTGGTCTCCTGCCCTCTCTCCCTTCCCTGATTCCAGTGATCTTCGTGCTGACTCCAATCCCAACTCATGAATCTAAAGCAGAGCCTAATTTAGATTTGTATTTGTTTGTAAAATTGGGTCCATAGTCTAGAATTGTTCCTTCCTGAAGAGAGAAACCTGATCGTGTGCTGCAGTGTGCAGGG\n'
-  
-  # Example, 5 alleles, sample IHWG9321
-    allele1 = '>A*02:01:01:01\nCAGAAGCAGAGGGGTCAGGGCGAAGTCCCAGGGCCCCAGGCGTGGCTCTCAGGGTCTCAGGCCCCGAAGGCGGTGTATGGATTGGGGAGTCCCAGCCTTGGGGATTCCCCAACTCCGCAGTTTCTTTTCTCCCTCTCCCAACCTATGTAGGGTCCTTCTTCCTGGATACTCACGACGCGGACCCAGTTCTCACTCCCATTGGGTGTCGGGTTTCCAGAGAAGCCAATCAGTGTCGTCGCGGTCGCGGTTCTAAAGTCCGCACGCACCCACCGGGACTCAGATTCTCCCCAGACGCCGAGGATGGCCGTCATGGCGCCCCGAACCCTCGTCCTGCTACTCTCGGGGGCTCTGGCCCTGACCCAGACCTGGGCGGGTGAGTGCGGGGTCGGGAGGGAAACGGCCTCTGTGGGGAGAAGCAACGGGCCCGCCTGGCGGGGGCGCAGGACCCGGGAAGCCGCGCCGGGAGGAGGGTCGGGCGGGTCTCAGCCACTCCTCGTCCCCAGGCTCTCACTCCATGAGGTATTTCTTCACATCCGTGTCCCGGCCCGGCCGCGGGGAGCCCCGCTTCATCGCAGTGGGCTACGTGGACGACACGCAGTTCGTGCGGTTCGACAGCGACGCCGCGAGCCAGAGGATGGAGCCGCGGGCGCCGTGGATAGAGCAGGAGGGTCCGGAGTATTGGGACGGGGAGACACGGAAAGTGAAGGCCCACTCACAGACTCACCGAGTGGACCTGGGGACCCTGCGCGGCTACTACAACCAGAGCGAGGCCGGTGAGTGACCCCGGCCCGGGGCGCAGGTCACGACCTCTCATCCCCCACGGACGGGCCAGGTCGCCCACAGTCTCCGGGTCCGAGATCCGCCCCGAAGCCGCGGGACCCCGAGACCCTTGCCCCGGGAGAGGCCCAGGCGCCTTTACCCGGTTTCATTTTCAGTTTAGGCCAAAAATCCCCCCAGGTTGGTCGGGGCGGGGCGGGGCTCGGGGGACCGGGCTGACCGCGGGGTCCGGGCCAGGTTCTCACACCGTCCAGAGGATGTATGGCTGCGACGTGGGGTCGGACTGGCGCTTCCTCCGCGGGTACCACCAGTACGCCTACGACGGCAAGGATTACATCGCCCTGAAAGAGGACCTGCGCTCTTGGACCGCGGCGGACATGGCAGCTCAGACCACCAAGCACAAGTGGGAGGCGGCCCATGTGGCGGAGCAGTTGAGAGCCTACCTGGAGGGCACGTGCGTGGAGTGGCTCCGCAGATACCTGGAGAACGGGAAGGAGACGCTGCAGCGCACGGGTACCAGGGGCCACGGGGCGCCTCCCTGATCGCCTGTAGATCTCCCGGGCTGGCCTCCCACAAGGAGGGGAGACAATTGGGACCAACACTAGAATATCGCCCTCCCTCTGGTCCTGAGGGAGAGGAATCCTCCTGGGTTTCCAGATCCTGTACCAGAGAGTGACTCTGAGGTTCCGCCCTGCTCTCTGACACAATTAAGGGATAAAATCTCTGAAGGAATGACGGGAAGACGATCCCTCGAATACTGATGAGTGGTTCCCTTTGACACACACAGGCAGCAGCCTTGGGCCCGTGACTTTTCCTCTCAGGCCTTGTTCTCTGCTTCACACTCAATGTGTGTGGGGGTCTGAGTCCAGCACTTCTGAGTCCTTCAGCCTCCACTCAGGTCAGGACCAGAAGTCGCTGTTCCCTCTTCAGGGACTAGAATTTTCCACGGAATAGGAGATTATCCCAGGTGCCTGTGTCCAGGCTGGTGTCTGGGTTCTGTGCTCCCTTCCCCATCCCAGGTGTCCTGTCCATTCTCAAGATAGCCACATGTGTGCTGGAGGAGTGTCCCATGACAGATGCAAAATGCCTGAATGATCTGACTCTTCCTGACAGACGCCCCCAAAACGCATATGACTCACCACGCTGTCTCTGACCATGAAGCCACCCTGAGGTGCTGGGCCCTGAGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGGGAGGACCAGACCCAGGACACGGAGCTCGTGGAGACCAGGCCTGCAGGGGATGGAACCTTCCAGAAGTGGGCGGCTGTGGTGGTGCCTTCTGGACAGGAGCAGAGATACACCTGCCATGTGCAGCATGAGGGTTTGCCCAAGCCCCTCACCCTGAGATGGGGTAAGGAGGGAGACGGGGGTGTCATGTCTTTTAGGGAAAGCAGGAGCCTCTCTGACCTTTAGCAGGGTCAGGGCCCCTCACCTTCCCCTCTTTTCCCAGAGCCGTCTTCCCAGCCCACCATCCCCATCGTGGGCATCATTGCTGGCCTGGTTCTCTTTGGAGCTGTGATCACTGGAGCTGTGGTCGCTGCTGTGATGTGGAGGAGGAAGAGCTCAGGTGGGGAAGGGGTGAAGGGTGGGTCTGAGATTTCTTGTCTCACTGAGGGTTCCAAGACCCAGGTAGAAGTGTGCCCTGCCTCGTTACTGGGAAGCACCACCCACAATTATGGGCCTACCCAGCCTGGGCCCTGTGTGCCAGCACTTACTCTTTTGTAAAGCACCTGTTAAAATGAAGGACAGATTTATCACCTTGATTACAGCGGTGATGGGACCTGATCCCAGCAGTCACAAGTCACAGGGGAAGGTCCCTGAGGACCTTCAGGAGGGCGGTTGGTCCAGGACCCACACCTGCTTTCTTCATGTTTCCTGATCCCGCCCTGGGTCTGCAGTCACACATTTCTGGAAACTTCTCTGAGGTCCAAGACTTGGAGGTTCCTCTAGGACCTTAAGGCCCTGACTCCTTTCTGGTATCTCACAGGACATTTTCTTCCCACAGATAGAAAAGGAGGGAGCTACTCTCAGGCTGCAAGTAAGTATGAAGGAGGCTGATGCCTGAGGTCCTTGGGATATTGTGTTTGGGAGCCCATGGGGGAGCTCACCCACCCCACAATTCCTCCTCTAGCCACATCTTCTGTGGGATCTGACCAGGTTCTGTTTTTGTTCTACCCCAGGCAGTGACAGTGCCCAGGGCTCTGATGTGTCTCTCACAGCTTGTAAAGGTGAGAGCCTGGAGGGCCTGATGTGTGTTGGGTGTTGGGCGGAACAGTGGACACAGCTGTGCTATGGGGTTTCTTTCCATTGGATGTATTGAGCATGCGATGGGCTGTTTAAAGTGTGACCCCTCACTGTGACAGATACGAATTTGTTCATGAATATTTTTTTCTATAGTGTGAGACAGCTGCCTTGTGTGGGACTGAGAGGCAAGAGTTGTTCCTGCCCTTCCCTTTGTGACTTGAAGAACCCTGACTTTGTTTCTGCAAAGGCACCTGCATGTGTCTGTGTTCGTGTAGGCATAATGTGAGGAGGTGGGGAGACCACCCCACCCCCATGTCCACCATGACCCTCTTCCCACGCTGACCTGTGCTCCCTCCCCAATCATCTTTCCTGTTCCAGAGAGGTGGGGCTGAGGTGTCTCCATCTCTGTCTCAACTTCATGGTGCACTGAGCTGTAACTTCTTCCTTCCCTATTAAAA\n'
-    allele2 = '>B*44:02:01:01\nGATCAGGACGAAGTCCCAGGTCCCGGACGGGGCTCTCAGGGTCTCAGGCTCCGAGGGCCGCGTCTGCAATGGGGAGGCGCAGCGTTGGGGATTCCCCACTCCCACGAGTTTCACTTCTTCTCCCAACCTATGTCGGGTCCTTCTTCCAGGATACTCGTGACGCGTCCCCATTTCCCACTCCCATTGGGTGTCGGGTGTCTAGAGAAGCCAATCAGTGTCGCCGGGGTCCCAGTTCTAAAGTCCCCACGCACCCACCCGGACTCAGAATCTCCTCAGACGCCGAGATGCGGGTCACGGCGCCCCGAACCCTCCTCCTGCTGCTCTGGGGGGCAGTGGCCCTGACCGAGACCTGGGCCGGTGAGTGCGGGGTCGGGAGGGAAATGGCCTCTGTGGGGAGGAGAGAGGGGACCGCAGGCGGGGGCGCAGGACCCGGGGAGCCGCGCCGGGAGGAGGGTCGGGCGGGTCTCAGCCCCTCCTCGCCCCCAGGCTCCCACTCCATGAGGTATTTCTACACCGCCATGTCCCGGCCCGGCCGCGGGGAGCCCCGCTTCATCACCGTGGGCTACGTGGACGACACGCTGTTCGTGAGGTTCGACAGCGACGCCACGAGTCCGAGGAAGGAGCCGCGGGCGCCATGGATAGAGCAGGAGGGGCCGGAGTATTGGGACCGGGAGACACAGATCTCCAAGACCAACACACAGACTTACCGAGAGAACCTGCGCACCGCGCTCCGCTACTACAACCAGAGCGAGGCCGGTGAGTGACCCCGGCCCGGGGCGCAGGTCACGACTCCCCATCCCCCACGTACGGCCCGGGTCGCCCCGAGTCTCCGGGTCCGAGATCCGCCCCCGAGGCCGCGGGACCCGCCCAGACCCTCGACCGGCGAGAGCCCCAGGCGCGTTTACCCGGTTTCATTTTCAGTTGAGGCCAAAATCCCCGCGGGTTGGTCGGGGCGGGGCGGGGCTCGGGGGACGGGGCTGACCGCGGGGCCGGGGCCAGGGTCTCACATCATCCAGAGGATGTACGGCTGCGACGTGGGGCCGGACGGGCGCCTCCTCCGCGGGTATGACCAGGACGCCTACGACGGCAAGGATTACATCGCCCTGAACGAGGACCTGAGCTCCTGGACCGCGGCGGACACCGCGGCTCAGATCACCCAGCGCAAGTGGGAGGCGGCCCGTGTGGCGGAGCAGGACAGAGCCTACCTGGAGGGCCTGTGCGTGGAGTCGCTCCGCAGATACCTGGAGAACGGGAAGGAGACGCTGCAGCGCGCGGGTACCAGGGGCAGTGGGGAGCCTTCCCCATCTCCTATAGGTCGCCGGGGATGGCCTCCCACGAGAAGAGGAGGAAAATGGGATCAGCGCTAGAATGTCGCCCTCCCTTGAATGGAGAATGGCATGAGTTTTCCTGAGTTTCCTCTGAGGGCCCCCTCTTCTCTCTAGGACAATTAAGGGATGACGTCTCTGAGGAAATGGAGGGGAAGACAGTCCCTAGAATACTGATCAGGGGTCCCCTTTGACCCCTGCAGCAGCCTTGGGAACCGTGACTTTTCCTCTCAGGCCTTGTTCTCTGCCTCACACTCAGTGTGTTTGGGGCTCTGATTCCAGCACTTCTGAGTCACTTTACCTCCACTCAGATCAGGAGCAGAAGTCCCTGTTCCCCGCTCAGAGACTCGAACTTTCCAATGAATAGGAGATTATCCCAGGTGCCTGCGTCCAGGCTGGTGTCTGGGTTCTGTGCCCCTTCCCCACCCCAGGTGTCCTGTCCATTCTCAGGCTGGTCACATGGGTGGTCCTAGGGTGTCCCATGAGAGATGCAAAGCGCCTGAATTTTCTGACTCTTCCCATCAGACCCCCCAAAGACACATGTGACCCACCACCCCATCTCTGACCATGAGGTCACCCTGAGGTGCTGGGCCCTGGGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGCGAGGACCAAACTCAGGACACCGAGCTTGTGGAGACCAGACCAGCAGGAGATAGAACCTTCCAGAAGTGGGCAGCTGTGGTGGTGCCTTCTGGAGAAGAGCAGAGATACACATGCCATGTACAGCATGAGGGGCTGCCGAAGCCCCTCACCCTGAGATGGGGTAAGGAGGGGGATGAGGGGTCATATCTCTTCTCAGGGAAAGCAGGAGCCCTTCAGCAGGGTCAGGGCCCCTCATCTTCCCTTCCTTTCCCAGAGCCGTCTTCCCAGTCCACCGTCCCCATCGTGGGCATTGTTGCTGGCCTGGCTGTCCTAGCAGTTGTGGTCATCGGAGCTGTGGTCGCTGCTGTGATGTGTAGGAGGAAGAGCTCAGGTAGGGAAGGGGTGAGGGGTGGGGTCTGGGTTTTCTTGTCCCACTGGGGGTTTCAAGCCCCAGGTAGAAGTGTTCCCTGCCTCATTACTGGGAAGCAGCATCCACACAGGGGCTAACGCAGCCTGGGACCCTGTGTGCCAGCACTTACTCTTTTGTGCAGCACATGTGACAATGAAGGACGGATGTATCACCTTGGTGGTTGTGGTGTTGGGGTCCTGATTCCAGCATTCATGAGTCAGGGGAAGGTCCCTGCTAAGGACAGACCTTAGGAGGGCAGTTGGTCCAGGACCCACACTTGCTTTCCTCGTGTTTCCTGATCCTGCCTTGGGTCTGTAGTCATACTTCTGGAAATTCCTTTTGGGTCCAAGACGAGGAGGTTCCTCTAAGATCTCATGGCCCTGCTTCCTCCCAGTCCCCTCACAGGGCATTTTCTTCCCACAGGTGGAAAAGGAGGGAGCTACTCTCAGGCTGCGTGTAAGTGATGGGGGCGGGAGTGTGGAGGAGCTCACCCACCCCATAATTCCTCCTGTCCCACGTCTCCTGCGGGCTCTGACCAGGTCCTGTTTTTGTTCTACTCCAGGCAGCGACAGTGCCCAGGGCTCTGATGTGTCTCTCACAGCTTGAAAAGGTGAGATTCTTGGGGTCTAGAGTGGGTGGGGTGGCAGGTCTGGGGGTGGGTGGGGCAGTGGGGAAAGGCCTGGGTAATGGAGATTCTTTGATTGGGATGTTTCGCGTGTGTGGTGGGCTGTTTAGAGTGTCATCACTTACCATGACTAACCAGAATTTGTTCATGACTGTTGTTTTCTGTAGCCTGAGACAGCTGTCTTGTGAGGGACTGAGATGCAGGATTTCTTCACGCCTCCCCTTTGTGACTTCAAGAGCCTCTGGCATCTCTTTCTGCAAAGGCACCTGAATGTGTCTGCGTCCCTGTTAGCATAATGTGAGGAGGTGGAGAGACAGCCCACCCCCGTGTCCACCGTGACCCCTGTTCCCATGCTGACTTGTGTTTCCTCCCCAGTCATCTTTCCTGTTCCAGAGAGGTGGGGCTGGATGTCTCCATCTCTGTCTCAACTTTATGTGCACTGAGCTGCAACTTCTTACTTCCCTACTGAAAATAAGAATCTGAATATAAATTTGTTTTCTCAAATATTTGCTATGAGAGGTTGATGGATTAATTAAATAAGTCAATTCCTGGAATTTGAGAGAGCAAATAAAGACCTGAGAACCTTCCAGAATCTGCATGTTCGCTGTGCTGAGTCTGTTGCAGGTGGGGTGTGGAGAAGGCTGTGGGGGGCCGAGTGTGGACGGGGCCTGTGCCCATTTGGTGTTGAGTCCATCATGGGCTTTATGTGGTTAGTCTTCAGCTGGGTCACCTTCACTGCTCCATTGTCCTTGTCCCTTCAGTGGAAACTTGTCCAGTGGGAGCTGTGACCACAGAGGCTCACACATCGCCCTGGGCGGCCCCTGCACGCGGGGGTCTCTGTGCATTCTGAGACAAATTTTCAGAGCCATTCACCTCCTGCCCTGCTTCTAGAGCTCCTTTTCTGCTCTGCTCTTCTGCCCTCTCTCCCTGCCCTGGTTCTAGTGATCTTGGTGCTGAATCCAATCCCAACTCATGAATCTGTAAAGCAGAGTCTAATTTAGACTTACATTTGTCTGTGAAATTGGACCCATCATCAAGGACTGTTCTTTCCTGAAGAGAGAACCTGATTGTGTGCTGCAGTGTGCTGGGGCAGGGGGTGCGG\n'   
-    # without UTR end allele3 = '>B*49:01:01:02\nGATCAGGACGAAGTCCCAGGCCCCGGGCGGGGCTCTCAGGGTCTCAGGCTCCGAGGGCCGCGTCTGCAATGGGGAGGCGCAGCGTTGGGGATTCCCCACTCCCACGAGTTTCACTTCTTCTCCCAACCTATGTCGGGTCCTTCTTCCAGGATACTCGTGACGCGTCCCCATTTCCCACTCCCATTGGGTGTCGGGTGTCTAGAGAAGCCAATCAGCGTCGCCGTGGTCCCAGTTCTAAAGTCCCCACGCACCCACCCGGACTCAGAATCTCCTCAGACGCCGAGATGCGGGTCACGGCACCCCGAACCGTCCTCCTGCTGCTCTCGGCGGCCCTGGCCCTGACCGAGACCTGGGCCGGTGAGTGCGGGTCGGCAGGGAAATGGCCTCTGTGGGGAGGAGCGAGGGGACCGCAGGCGGGGGCGCAGGACCCGGGGAGCCGCGCCGGGAGGAGGGTCGGGCGGGTCTCAGCCCCTCCTCGCCCCCAGGCTCCCACTCCATGAGGTATTTCCACACCGCCATGTCCCGGCCCGGCCGCGGGGAGCCCCGCTTCATCACCGTGGGCTACGTGGACGACACGCTGTTCGTGAGGTTCGACAGCGACGCCACGAGTCCGAGGAAGGAGCCGCGGGCGCCATGGATAGAGCAGGAGGGGCCGGAGTATTGGGACCGGGAGACACAGATCTCCAAGACCAACACACAGACTTACCGAGAGAACCTGCGGATCGCGCTCCGCTACTACAACCAGAGCGAGGCCGGTGAGTGACCCCGGCCCGGGGCGCAGGTCACGACTCCCCATCCCCCACGTACGGCCCGGGTCGCCCCGAGTCTCCGGGTCCGAGATCCGCCCCCCTGAGGCCGCGGGACCCGCCCAGACCCTCGACCGGCGAGAGCCCCAGGCGCGTTTACCCGGTTTCATTTTCAGTTGAGGCCAAAATCCCCGCGGGTTGGTCGGGGCGGGGCGGGGCGGGGCTCGGGGGACGGGGCTGACCGCGGGGCCTGGGCCAGGGTCTCACACTTGGCAGAGGATGTATGGCTGCGACCTGGGGCCCGACGGGCGCCTCCTCCGCGGGTATAACCAGTTAGCCTACGACGGCAAGGATTACATCGCCCTGAACGAGGACCTGAGCTCCTGGACCGCGGCGGACACCGCGGCTCAGATCACCCAGCGCAAGTGGGAGGCGGCCCGTGAGGCGGAGCAGCTGAGAGCCTACCTGGAGGGCCTGTGCGTGGAGTGGCTCCGCAGATACCTGGAGAACGGGAAGGAGACGCTGCAGCGCGCGGGTACCAGGGGCAGTGGGGAGCCTTCCCCATCTCCTATAGGTCGCCGGGGATGGCCTCCCACGAGAAGAGGAGGAAAATGGGATCAGCGCTAGAATGTCGCCCTCCCTTGAATGGAGAATGGCATGAGTTTTCCTGAGTTTCCTCTGAGGGCCCCCTCTTCTCTCTAGGACAATTAAGGGATGACGTCTCTGAGGAAATGGAGGGGAAGACAGTCCCTAGAATACTGATCAGGGGTCCCCTTTGACCCCTGCAGCAGCCTTGGGAACCGTGACTTTTCCTCTCAGGCCTTGTTCTCTGCCTCACACTCAGTGTGTTTGGGGCTCTGATTCCAGCACTTCTGAGTCACTTTACCTCCACTCAGATCAGGAGCAGAAGTCCCTGTTCCCCACTCAGAGACTCGAACTTTCCAATGAATAGGAGATTATCCCAGGTGCCTGCGTCCAGGCTGGTGTCTGGGTTCTGTGCCCCTTCCCCACCCCAGGTGTCCTGTCCATTCTCAGGCTGGTCACATGGGTGGTCCTAGGGTGTCCCATGAGAGATGCAAAGCGCCTGAATTTTCTGACTCTTCCCATCAGACCCCCCAAAGACACATGTGACCCACCACCCCATCTCTGACCATGAGGCCACCCTGAGGTGCTGGGCCCTGGGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGCGAGGACCAAACTCAGGACACCGAGCTTGTGGAGACCAGACCAGCAGGAGATAGAACCTTCCAGAAGTGGGCAGCTGTGGTGGTGCCTTCTGGAGAAGAGCAGAGATACACATGCCATGTACAGCATGAGGGGCTGCCGAAGCCCCTCACCCTGAGATGGGGTAAGGAGGGGGATGAGGGGTCATATCTGTTCTCAGGGAAAGCAGGAGCCCTTCTGGAGCCCTTCAGCAGGGTCAGGGCCCCTCATCTTCCCCTCCTTTCCCAGAGCCATCTTCCCAGTCCACCATCCCCATCGTGGGCATTGTTGCTGGCCTGGCTGTCCTAGCAGTTGTGGTCATCGGAGCTGTGGTCGCTACTGTGATGTGTAGGAGGAAGAGCTCAGGTAGGGAAGGGGTGAGGGGTGGGGTCTGGGTTTTCTTGTCCCACTGGGGGTTTCAAGCCCCAGGTAGAAGTGTTCCCTGCCTCATTACTGGGAAGCAGCATCCACACAGGGGCTAACGCAGCCTGGGACCCTGTGTGCCAGCACTTACTCTTTTGTGCAGCACATGTGACAATGAAGGACGGATGTATCGCCTTGATGGTTGTGGTGTTGGGGTCCTGATTCCAGCATTCATGAGTCAGGGGAAGGTCCCTGCTAAGGACAGACCTTAGGAGGGCAGTTGGTCCAGGACCCACACTTGCTTTCCTCGTGTTTCCTGATCCTGCCTTGGGTCTGTAGTCATACTTCTGGAAATTCCTTTTGGTTCCAAGACGAGGAGGTTCCTCTAAGATCTCATGGCCCTGCTTCCTCCCAGTCCCCTCACAGGACATTTTCTTCCCACAGGTGGAAAAGGAGGGAGCTACTCTCAGGCTGCGTGTAAGTGGTGGGGGTGGGAGTGTGGAGGAGCTCACCCACCCCATAATTCCTCCTGTCCCACGTCTCCTGAGGGCTCTGACCAGGTCCTGTTTTTGTTCTACTCCAGCCAGCGACAGTGCCCAGGGCTCTGATGTGTCTCTCACAGCTTGAAAAGGTGAGATTCTTGGGGTCTAGAGTGGGTGGGGTGGCGGGTCTGGGGGTGGGTGGGGCAGTGGGGAAAGGCCTGGGTAATGGAGATTCTTTGATTGGGATGTTTCGCGTGTGTGGTGGGCTGTTCAGAGTGTCATCACTTACCATGACTAACCAGAATTTGTTCATGACTGTTGTTTTCTGTAGCCTGAGACAGCTGTCTTGTGAGGGACTGAGATGCAGGATTTCTTCACGCCTCCCCTTTGTGACTTCAAGAGCCTCTGGCATCTCTTTCTGCAAAGGCACCTGAATGTGTCTGCGTCCCTGTTAGCATAATGTGAGGAGGTGGAGAGACAGCCCACCCCCGTGTCCACTGTGACCCCT\n'
-    allele3 = '>B*49:01:01:02\nGATCAGGACGAAGTCCCAGGCCCCGGGCGGGGCTCTCAGGGTCTCAGGCTCCGAGGGCCGCGTCTGCAATGGGGAGGCGCAGCGTTGGGGATTCCCCACTCCCACGAGTTTCACTTCTTCTCCCAACCTATGTCGGGTCCTTCTTCCAGGATACTCGTGACGCGTCCCCATTTCCCACTCCCATTGGGTGTCGGGTGTCTAGAGAAGCCAATCAGCGTCGCCGTGGTCCCAGTTCTAAAGTCCCCACGCACCCACCCGGACTCAGAATCTCCTCAGACGCCGAGATGCGGGTCACGGCACCCCGAACCGTCCTCCTGCTGCTCTCGGCGGCCCTGGCCCTGACCGAGACCTGGGCCGGTGAGTGCGGGTCGGCAGGGAAATGGCCTCTGTGGGGAGGAGCGAGGGGACCGCAGGCGGGGGCGCAGGACCCGGGGAGCCGCGCCGGGAGGAGGGTCGGGCGGGTCTCAGCCCCTCCTCGCCCCCAGGCTCCCACTCCATGAGGTATTTCCACACCGCCATGTCCCGGCCCGGCCGCGGGGAGCCCCGCTTCATCACCGTGGGCTACGTGGACGACACGCTGTTCGTGAGGTTCGACAGCGACGCCACGAGTCCGAGGAAGGAGCCGCGGGCGCCATGGATAGAGCAGGAGGGGCCGGAGTATTGGGACCGGGAGACACAGATCTCCAAGACCAACACACAGACTTACCGAGAGAACCTGCGGATCGCGCTCCGCTACTACAACCAGAGCGAGGCCGGTGAGTGACCCCGGCCCGGGGCGCAGGTCACGACTCCCCATCCCCCACGTACGGCCCGGGTCGCCCCGAGTCTCCGGGTCCGAGATCCGCCCCCCTGAGGCCGCGGGACCCGCCCAGACCCTCGACCGGCGAGAGCCCCAGGCGCGTTTACCCGGTTTCATTTTCAGTTGAGGCCAAAATCCCCGCGGGTTGGTCGGGGCGGGGCGGGGCGGGGCTCGGGGGACGGGGCTGACCGCGGGGCCTGGGCCAGGGTCTCACACTTGGCAGAGGATGTATGGCTGCGACCTGGGGCCCGACGGGCGCCTCCTCCGCGGGTATAACCAGTTAGCCTACGACGGCAAGGATTACATCGCCCTGAACGAGGACCTGAGCTCCTGGACCGCGGCGGACACCGCGGCTCAGATCACCCAGCGCAAGTGGGAGGCGGCCCGTGAGGCGGAGCAGCTGAGAGCCTACCTGGAGGGCCTGTGCGTGGAGTGGCTCCGCAGATACCTGGAGAACGGGAAGGAGACGCTGCAGCGCGCGGGTACCAGGGGCAGTGGGGAGCCTTCCCCATCTCCTATAGGTCGCCGGGGATGGCCTCCCACGAGAAGAGGAGGAAAATGGGATCAGCGCTAGAATGTCGCCCTCCCTTGAATGGAGAATGGCATGAGTTTTCCTGAGTTTCCTCTGAGGGCCCCCTCTTCTCTCTAGGACAATTAAGGGATGACGTCTCTGAGGAAATGGAGGGGAAGACAGTCCCTAGAATACTGATCAGGGGTCCCCTTTGACCCCTGCAGCAGCCTTGGGAACCGTGACTTTTCCTCTCAGGCCTTGTTCTCTGCCTCACACTCAGTGTGTTTGGGGCTCTGATTCCAGCACTTCTGAGTCACTTTACCTCCACTCAGATCAGGAGCAGAAGTCCCTGTTCCCCACTCAGAGACTCGAACTTTCCAATGAATAGGAGATTATCCCAGGTGCCTGCGTCCAGGCTGGTGTCTGGGTTCTGTGCCCCTTCCCCACCCCAGGTGTCCTGTCCATTCTCAGGCTGGTCACATGGGTGGTCCTAGGGTGTCCCATGAGAGATGCAAAGCGCCTGAATTTTCTGACTCTTCCCATCAGACCCCCCAAAGACACATGTGACCCACCACCCCATCTCTGACCATGAGGCCACCCTGAGGTGCTGGGCCCTGGGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGCGAGGACCAAACTCAGGACACCGAGCTTGTGGAGACCAGACCAGCAGGAGATAGAACCTTCCAGAAGTGGGCAGCTGTGGTGGTGCCTTCTGGAGAAGAGCAGAGATACACATGCCATGTACAGCATGAGGGGCTGCCGAAGCCCCTCACCCTGAGATGGGGTAAGGAGGGGGATGAGGGGTCATATCTGTTCTCAGGGAAAGCAGGAGCCCTTCTGGAGCCCTTCAGCAGGGTCAGGGCCCCTCATCTTCCCCTCCTTTCCCAGAGCCATCTTCCCAGTCCACCATCCCCATCGTGGGCATTGTTGCTGGCCTGGCTGTCCTAGCAGTTGTGGTCATCGGAGCTGTGGTCGCTACTGTGATGTGTAGGAGGAAGAGCTCAGGTAGGGAAGGGGTGAGGGGTGGGGTCTGGGTTTTCTTGTCCCACTGGGGGTTTCAAGCCCCAGGTAGAAGTGTTCCCTGCCTCATTACTGGGAAGCAGCATCCACACAGGGGCTAACGCAGCCTGGGACCCTGTGTGCCAGCACTTACTCTTTTGTGCAGCACATGTGACAATGAAGGACGGATGTATCGCCTTGATGGTTGTGGTGTTGGGGTCCTGATTCCAGCATTCATGAGTCAGGGGAAGGTCCCTGCTAAGGACAGACCTTAGGAGGGCAGTTGGTCCAGGACCCACACTTGCTTTCCTCGTGTTTCCTGATCCTGCCTTGGGTCTGTAGTCATACTTCTGGAAATTCCTTTTGGTTCCAAGACGAGGAGGTTCCTCTAAGATCTCATGGCCCTGCTTCCTCCCAGTCCCCTCACAGGACATTTTCTTCCCACAGGTGGAAAAGGAGGGAGCTACTCTCAGGCTGCGTGTAAGTGGTGGGGGTGGGAGTGTGGAGGAGCTCACCCACCCCATAATTCCTCCTGTCCCACGTCTCCTGAGGGCTCTGACCAGGTCCTGTTTTTGTTCTACTCCAGCCAGCGACAGTGCCCAGGGCTCTGATGTGTCTCTCACAGCTTGAAAAGGTGAGATTCTTGGGGTCTAGAGTGGGTGGGGTGGCGGGTCTGGGGGTGGGTGGGGCAGTGGGGAAAGGCCTGGGTAATGGAGATTCTTTGATTGGGATGTTTCGCGTGTGTGGTGGGCTGTTCAGAGTGTCATCACTTACCATGACTAACCAGAATTTGTTCATGACTGTTGTTTTCTGTAGCCTGAGACAGCTGTCTTGTGAGGGACTGAGATGCAGGATTTCTTCACGCCTCCCCTTTGTGACTTCAAGAGCCTCTGGCATCTCTTTCTGCAAAGGCACCTGAATGTGTCTGCGTCCCTGTTAGCATAATGTGAGGAGGTGGAGAGACAGCCCACCCCCGTGTCCACTGTGACCCCTGTTCCCATGCTGACCTGTGTTTCCTCCCCAGTCATCTTTCTTGTTCCAGAGAGGTGGGGCTGGATGTCTCCATCTCTGTCTCAACTTTACGTGCACTGAGCTGCAACTTCTTACTTCCCTACTGAAAATAAGAATCTGAATATAAATTTGTTTTCTCAAATATTTGCTATGAGAGGTTGATGGATTAATTAAATAAGTCAATTCCTGGAATTTGAGAGAGCAAATAAAGACCTGAGAACCTTCCAGAATCTGCATGTTCGCTGTGCTGAGTCTGTTGCAGGTGGGGTGTGGAGAAGGCTGTGGGGGGCCGAGTGTGGATGGGGCCTGTGCCCATTTGGTGTTGAGTCCATCATGGGCTTTATGTGGTTAGTCGTCAGCTGGGTCACCTTCACTGCTCCATTGTCCTTGTCCCTTCAGTGGAAACTTGTCCAGTGGGAGCTGTGACCACAGAGGCTCACACATCGCCCAGGGCGGCCCCTGCACACGGGGGTCTCTGTGCATTCTGAGACAAATTTTCAGAGCCATTCACCTCCTGCCCTGCTTCTAGAGCTCCTTTTCTGCTCTGCTCTTCTGCCCTCTCTCCCTGCCCTGGTTCTAGTGATCTTGGTGCTGAATCCAATCCCAACTCATGAATCTGTAAAGCAGAGTCTAATTTAGACTTACATTTGTCTGTGAAATTGGACCCATCATCAAGGACTGTTCTTTCCTGAAGAGAGAACCTGATTGTGTGCTGCAGTGTGCTGGGGCAGGGGGTGCGG\n'
-    allele4 = '>C*05:01:01:02\nTTATTTTGCTGGATGTAGTTTAATATTACCTGAGGTAAGGTAAGGCAAAGAGTGGGAGGCAGGGAGTCCAGTTCAGGGACGGGGATTCCAGGAGAAGTGAAGGGGAAGGGGCTGGGCGCAGCCTGGGGGTCTCTCCCTGGTTTCCACAGACAGATCCTTGGCCAGGACTCAGGCACACAGTGTGACAAAGATGCTTGGTGTAGGAGAAGAGGGATCAGGACGAAGTCCCAGGTCCCGGGCGGGGCTCTCAGGGTCTCAGGCTCCAAGGGCCGTGTCTGCACTGGGGAGGCGCCGCGTTGAGGATTCTCCACTCCCCTGAGTTTCACTTCTTCTTCCAACCTGCGTCGGGTCCTTCTTCCTGAATACTCATGACGCGTCCCCAATTCCCACTCCCATTGGGTGTCGGGTTCTAGAGAAGCCAATCAGCGTCTCCGCAGTCCCGGTTCTAAAGTCCCCAGTCACCCACCCGGACTCGGATTCTCCCCAGACGCCGAGATGCGGGTCATGGCGCCCCGAACCCTCATCCTGCTGCTCTCGGGAGCCCTGGCCCTGACCGAGACCTGGGCCTGTGAGTGCGAGGTTGGGAGGGAAACGGCCTCTGCGGAGAGGAGCGAGGGGCCCGCCCGGCGAGGGCGCAGGACCCGGGGAGCCGCGCAGGGAGGAGGGTCGGGCGGGTCTCAGCCCCTCCTCGCCCCCAGGCTCCCACTCCATGAGGTATTTCTACACCGCCGTGTCCCGGCCCGGCCGCGGAGAGCCCCGCTTCATCGCAGTGGGCTACGTGGACGACACGCAGTTCGTGCAGTTCGACAGCGACGCCGCGAGTCCAAGAGGGGAGCCGCGGGCGCCGTGGGTGGAGCAGGAGGGGCCGGAGTATTGGGACCGGGAGACACAGAAGTACAAGCGCCAGGCACAGACTGACCGAGTGAACCTGCGGAAACTGCGCGGCTACTACAACCAGAGCGAGGCCGGTGAGTGACCCCGGCCCGGGGCGCAGGTCACGACCCCTCCCCATCCCCCACGGACGGCCCGGGTCGCCCCGAGTCTCCCGGTCTGAGATCCACCCCGAGGCTGCGGAACCCGCCCAGACCCTCGACCGGAGAGAGCCCCAGTCACCTTTACCCGGTTTCATTTTCAGTTTAGGCCAAAATCCCCGCGGGTTGGTCGGGGCTGGGGCGGGGCTCGGGGGACGGGGCTGACCACGGGGGCGGGGCCAGGGTCTCACACCCTCCAGAGGATGTATGGCTGCGACCTGGGGCCCGACGGGCGCCTCCTCCGCGGGTATAACCAGTTCGCCTACGACGGCAAGGATTACATCGCCCTGAATGAGGACCTGCGCTCCTGGACCGCCGCGGACAAGGCGGCTCAGATCACCCAGCGCAAGTGGGAGGCGGCCCGTGAGGCGGAGCAGCGGAGAGCCTACCTGGAGGGCACGTGCGTGGAGTGGCTCCGCAGATACCTGGAGAACGGGAAGAAGACGCTGCAGCGCGCGGGTACCAGGGGCAGTGGGGAGCCTTCCCCATCTCCTGTAGATCTCCCGGGATGGCCTCCCACGAGGAGGGGAGGAAAATGGGATCAGCGCTGGAATATCGCCCTCCCTTGAATGGAGAATGGGATGAGTTTTCCTGAGTTTCTTCTGAGGGCCCCCTCTGCTCTCTAGGACAATTAAGGGATGAAGTCCTTGAGGAAATGGAGGGGAAGACAGTCCCTGGAATACTGATCAGGGGTCCCCTTTGACCACTTTGACCACTGCAGCAGCTGTGGTCAGGCTGCTGACCTTTCTCTCAGGCCTTGTTCTCTGCCTCACGCTCAATGTGTTTAAAGGTTTGATTCCAGCTTTTCTGAGTCCTTCGGCCTCCACTCAGGTCAGGACCAGAAGTCGCTGTTCCTCCCTCAGAGACTAGAACTTTCCAATGAATAGGAGATTATCCCAGGTGCCTGTGTCCAGGCTGGCGTCTGGGTTCTGTGCCCCCTTCCCCACCCCAGGTGTCCTGTCCATTCTCAGGATGGTCACATGGGCACTGTTGGAGTGTCGCAAGAGAGATACAAAGTGTCTGAATTTTCTGACTCTTCCCGTCAGAACACCCAAAGACACACGTGACCCACCATCCCGTCTCTGACCATGAGGCCACCCTGAGGTGCTGGGCCCTGGGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGCGAGGACCAAACTCAGGACACCGAGCTTGTGGAGACCAGGCCAGCAGGAGATGGAACCTTCCAGAAGTGGGCAGCTGTGGTGGTGCCTTCTGGAGAAGAGCAGAGATACACGTGCCATGTGCAGCACGAGGGGCTGCCAGAGCCCCTCACCCTGAGATGGGGTAAGGAGGGGGATGAGGGGTCATGTGTCTTCTCAGGGAAAGCAGAAGTCCTGGAGCCCTTCAGCCGGGTCAGGGCTGAGGCTTGGGGGTCAGGGCCCCTCACCTTCCCCTCCTTTCCCAGGGCCATCTTCCCAGCCCACCATCCCCATCGTGGGCATCGTTGCTGGCCTGGCTGTCCTGGCTGTCCTAGCTGTCCTAGGAGCTGTGATGGCTGTTGTGATGTGTAGGAGGAAGAGCTCAGGTAGGGAAGGGGTGAGGAGTGGGGTCTGGGTTTTCTTGTCCCACTGGGAGTTTCAAGCCCCAGGTAGAAGTGTGCCCCACCTCGTTACTGGAAGCACCATCCACACATGGGCCATCCCAGCCTGGGACCCTGTGTGCTAGCACTTACTCTGTTGTGAAGCACATGACAATGAAGGACAGATGTATCACCTTGATGATTATGGTGTTGGGGTCCTTGATTCCAGCATTCATGAGTCAGGGGAAGGTCCCTGCTAAGGACAGACCTTAGGAGGGCAGTTGCTCCAGAACCCACAGCTGCTTTCCCCGTGTTTCCTGATCCTGCCCTGGGTCTGCAGTCATAGTTCTGGAAACTTCTCTTGGGTCCAAGACTAGGAGGTTCCCCTAAGATCGCATGGCCCTGCCTCCTCCCTGTCCCCTCACAGGGCATTTTCTTCCCACAGGTGGAAAAGGAGGGAGCTGCTCTCAGGCTGCGTGTAAGTGATGGCGGTGGGCGTGTGGAGGAGCTCACCCACCCCATAATTCCTCTTGTCCCACATCTCCTGCGGGCTCTGACCAGGTCTTTTTTTTTGTTCTACCCCAGCCAGCAACAGTGCCCAGGGCTCTGATGAGTCTCTCATCGCTTGTAAAGGTGAGATTCTGGGGAGCTGAAGTGGTCGGGGGTGGGGCAGAGGGAAAAGGCCTAGGTAATGGGGATCCTTTGATTGGGACGTTTCGAATGTGTGGTGAGCTGTTCAGAGTGTCATCACTTACCATGACTGACCTGAATTTGTTCATGACTATTGTGTTCTGTAGCCTGAGACAGCTGCCTGTGTGGGACTGAGATGCAGGATTTCTTCACACCTTTCCTTTGTGACTTCAAGAGCCTCTGGCATCTCTTTCTGCAAAGGCATCTGAATGTGTCTGCGTTCCTGTTAGCATAATGTGAGGAGGTGGAGAGACAGCCCACCCCCGTGTCCACCGTGACCCCTGTCCCCACACTGACCTGTGTTCCCTCCCCGATCATCTTTCCTGTTCCAGAGAAGTGGGCTGGATGTCTCCATCTCTGTCTCAACTTTACGTGTACTGAGCTGCAACTTCTTACTTCCCTACTGAAAATAAGAATCTGAATATAAATTTGTTTTCTCAAATATTTGCTATGAGAGGTTGATGGATTAATTAAATAAGTCAATTCCTGGAAGTTGAGAGAGCAAATAAAGACCTGAGAACCTTCCAGAATCCGCATGTTCGCTGTGCTGAGTCTGTTGCAGGTGGGGGTGGGGAAGGCTGTGAGGAGACGAGTGTGGACGGGGCCTGTGCCTAGTTGCTGTTCAGTTCTTCATGGGCTTTATGTGGTCAGTCCTCAGCTGGGTCACCTTCACTGCTCCATTGTCCTTGTCCCTTCAGTGGAAACTTGTCCAGCGGGAGCTGTGACCACAGAGGCTCACACATCGCCCAGGGCAGCCCCTGCACACGGGAGTCCCTGTGCTTTCTGAGACAAATTTTCAGACCCATTCAGCTCCTGCCCTCCTTCTAGGGCTCCTCTTCTGCTTTGGTCTCCTGCCCTCTCTCCCTTCCCTGATTCCAGTAATCTTCGTGCTGACTCCAATCCCAACTCATGAATCTAAAGCAGAGCCTAATTTAGATTTATATTTGTTTGTAAAATTGGGTCCATAGTCTAGAATTGTTCCTTCCTGAAGAGAGAAACCTGATTGTGTGCTGCAGTGTGCGGGG\n'
-    allele5 = '>C*07:01:01:01\nTTATTTTGCTGGATGTAGTTTAATATTACCTGAGGTGAGGTAAGGTAAGGCAAAGGGTGGGAGGCAGGGAGTCCAGTTCAGGGACGGGGATTCCAGGAGGAGAAGTGAAGGGGAAGGGGCTGGGCGCAGCCTTGGGGTCTCTCCCTGGTTTCCACAGACAGATCCTTGTCCAGGACTCAGGCACACAGTGTGACAAAGATGCTTGGTGTAGGAGAAGAGGGATCAGGACGAAGTCCCAGGTCCCGGGCGGGGCTCTCAGGGTCTCAGGCTCCAAGGGCCGTGTCTGCATTGGGGAGGCGCCGCGTTGGGGATTCTCCACTCCCCTGAGTTTCACTTCTCCCAACCTGCGTCGGGTCCTTCTTCCTGAATACTCATGACGCGTCCCCAATTCCCACTCCCATTGGGTGTCGGGTTCTAGAGAAGCCAATCAGCGTCTCCGCAGTCCCGGTTCTAAAGTCCCCAGTCACCCACCCGGACTCACATTCTCCCCAGAGGCCGAGATGCGGGTCATGGCGCCCCGAGCCCTCCTCCTGCTGCTCTCGGGAGGCCTGGCCCTGACCGAGACCTGGGCCTGTGAGTGCGGGGTTGGGAGGGAAGCGGCCTCTGCGGAGAGGAGCGAGGGGCCCGCCCGGCGAGGGCGCAGGACCCGGGGAGCCGCGCAGGGAGGTGGGTCGGGCGGGTCTCAGCCCCTCCTCGCCCCCAGGCTCCCACTCCATGAGGTATTTCGACACCGCCGTGTCCCGGCCCGGCCGCGGAGAGCCCCGCTTCATCTCAGTGGGCTACGTGGACGACACGCAGTTCGTGCGGTTCGACAGCGACGCCGCGAGTCCGAGAGGGGAGCCGCGGGCGCCGTGGGTGGAGCAGGAGGGGCCGGAGTATTGGGACCGGGAGACACAGAACTACAAGCGCCAGGCACAGGCTGACCGAGTGAGCCTGCGGAACCTGCGCGGCTACTACAACCAGAGCGAGGACGGTGAGTGACCCCGGCCCGGGGCGCAGGTCACGACCCCTCCCCATCCCCCACGGACGGCCCGGGTCGCCCCGAGTCTCCCCGTCTGAGATCCACCCCAAGGTGGATCTGCGGAACCCGCCCAGACCCTCGACCGGAGAGAGCCCCAGTCGCCTTTACCCGGTTTCATTTTCGGTTTAGGCCAAAATCCCCGCGGGTTGGTCGGGGCGGGGCGGGGCTCGGGGGACTGGGCTGACCGCGGGGGCGGGGCCAGGGTCTCACACCCTCCAGAGGATGTATGGCTGCGACCTGGGGCCCGACGGGCGCCTCCTCCGCGGGTATGACCAGTCCGCCTACGACGGCAAGGATTACATCGCCCTGAACGAGGACCTGCGCTCCTGGACCGCCGCGGACACCGCGGCTCAGATCACCCAGCGCAAGTTGGAGGCGGCCCGTGCGGCGGAGCAGCTGAGAGCCTACCTGGAGGGCACGTGCGTGGAGTGGCTCCGCAGATACCTGGAGAACGGGAAGGAGACGCTGCAGCGCGCAGGTACCAGGGGCAGTGGGGAGCCTTCCCCATCTCCTATAGATCTCCCGGGATGGCCTCCCACGAGGAGGGGAGGAAAATGGGATCAGCACTGGAATATCGCCCTCCCTTGAATGGAGAATGGCATGAGTTTTCCTGAGTTTCCTCTGAGGGCCCCCTCTGCTCTCTAGGACAATTAAGGGATGAAGTCTCTGAGGAAATGGAGGGGAAGACAGTCCCTGGAATACTGATCAGGGGTCTCCTTTGACCACTTTGACCACTGCAGCAGCTGTGGTCAGGCTGCTGACCTTTCTCTCAGGCCTTGTTCTCTGCCTCACACTCAATGTGTCTGAAGGTTTGATTCCAGCTTTTCTGAGTCCTGCAGCCTCCACTCAGGTCAGGACCAGAAGTCGCTGTTCCTCCCTCAGAGACTAGAACTTTCCAATGAATAGGAGATTATCCCAGGTGCCTGTGTCCAGGCTGGCGTCTGGGTTCTGTGCCGCCTTCCCCACCCCAGGTGTCCTGTCCATTCTCAGGATGGTCACATGGGCGCTGCTGGAGTGTCCCAAGAGAGATGCAAAGTGTCTGAATTTTCTGACTCTTCCCGTCAGAACCCCCAAAGACACACGTGACCCACCACCCCCTCTCTGACCATGAGGCCACCCTGAGGTGCTGGGCCCTGGGCTTCTACCCTGCGGAGATCACACTGACCTGGCAGCGGGATGGGGAGGACCAGACCCAGGACACCGAGCTTGTGGAGACCAGGCCAGCAGGAGATGGAACCTTCCAGAAGTGGGCAGCTGTGGTGGTGCCTTCTGGACAAGAGCAGAGATACACGTGCCATATGCAGCACGAGGGGCTGCAAGAGCCCCTCACCCTGAGCTGGGGTAAGGAGGGGAATGGGGGGTCACATCTCTTATCAGAGAAAGCAGAAGTCCTTCTGGAGCCCTTCAGCCGGGTCAGGGCTGAGGCTTGGGGGTCAGGGCCCCTCACCTTCTCCTCCTTTCCCAGAGCCATCTTCCCAGCCCACCATCCCCATCATGGGCATCGTTGCTGGCCTGGCTGTCCTGGTTGTCCTAGCTGTCCTTGGAGCTGTGGTCACCGCTATGATGTGTAGGAGGAAGAGCTCAGGTAGGGAAGGGGTGAAGAGCGGGGTCTGGGTTTTCTTGTCCCACTGGGAGTTTCAAGCCCCAGGTAGAAGTGTGCCCCGCCTTGTTACTGGAAGCACCATCCACACATGGGCCATCCCAGCCTGGGACCCTGTGTGCCAGCACTTACTCTTTTGTGAAGCACATGTGACAATGAAGGACGGATGTATCACCTTGATGATTATGGTGTTGGGGTCCTGATTCCAGCATTCATGAGTCAGGGGAAGGTCCCTGCTAAGGACAGACCTTAGGAGGGCAGTTGGTCCAGAACCCACAACTGCTTTCCCCATGTTTCCTGATCCTGCCCTGGGTCTGCAGTCGTAGTTCTGGAAACTTCTCTTGGGTCCAAGACTAGGAGGTTCCCCTAAGATCACATGGCCCTGCCTCCTCCCAGTCCCCTCATAGGGCATTTTCTTCCCACAGGTGGAAAAGGAGGGAGCTGCTCTCAGGCTGCGTGTAAGTGATGGCGGCGGGCGTGTGGAGGAGCTCACCTACTCCATAATTCCTCTTGTCCCACATCTCCTGCGGGCTCTGACCAGGTCTTTTTTTTTGTTCTACCCCAGGCAGCAACAGTGCCCAGGGCTCTGATGAGTCTCTCATCACTTGTAAAGGTGAGATTCTGGGGAGCTGAAGTGGTCGGGGGTGGGGCAGAGGGAAAAGGCCTGGGTAATGGGGATTCTTTGATTGGGACGTTTCGAGTGTGTGGTGGGCCGTTCAGAGTGTCATCACTTACCATGACTGACCTGAATTTGTTCATGACTATTGTGTTCTGTAGCCTGAGACAGCTGCCTGTGTGGGACTGAGATGCAGGATTTCTTCACACCTCTCCTTTGTGACTTCAAGAGCCTCTGGCATCTCTTTCTGCAAAGGCGTCTGAATGTGTCTGCGTTCCTGTTAGCATAATGTGAGGAGGTGGAGAGACAGCCCACCCCCGTGTCCACCGTGACCCCTGTCCCCACACTGACCTGTGTTCCCTCCCCGATCATCTTTCCTGTTCCAGAGAGGTGGGGCTGGATGTCTCCATCTCTGTCTCAAATTCATGGTGCACTGAGCTGCAACTTCTTACTTCCCTAATGAAGTTAAGAACCTGAATATAAATTTGTGTTCTCAAATATTTGCTATGAAGCGTTGATGGATTAATTAAATAAGTCAATTCCTAGAAGTTGAGAGAGCAAATAAAGACCTGAGAACCTTCCAGAATTTGCATGTTCGCTGTGCTGAGTCTGTTGCAGGTGGGGGTGGGGAAGGCTGTGAGGAGCCGAGTGTGGACGGGGCCTGTGCCTAGTTGCTGTTCAGTTCTTCATGGGCTTTATGTGGTCAGTCCTCAGCTGGGTCACCTTCACTGCTCCATTGTCCTTGTCCCTTCAGTGGAAACTTGTCCAGCGGAAGCTGTGACCACAGAGGCTCACCCATCGCCCAGGGCAGCCCCTGCACACGGGAGTCCCTGTGCTTTCTGAGACAAATTTTCAGACCCATTCAGCTCCTGCCCTCCTTCTAGGGCTCCTCTTCTGCTTTGGTCTCCTGCCCTCTCTCCCTTCCCTGATTCCAGTGATCTTCGTGCTGACTCCAATCCCAACTCATGAATCTAAAGCAGAGCCTAATTTAGATTTGTATTTGTTTGTAAAATTGGGTCCATAGTCTAGAATTGTTCCTTCCTGAAGAGAGAAACCTGATCGTGTGCTGCAGTGTGCGGGG\n'
-
-
-
-    # Loop trough each read pair
-    for key, value in paired_read_dict.items():
-        read_name = key
-        read1 = value[0][0] 
-        read2 = value[1][0]
-        qv_read1 = value[0][1]
-        qv_read2 = value[1][1]
-        
-        # Perform MSA for 5 alleles
-        if allele6 == None:
-            PerformMSA.create_input_for_clustal(read1, read2, allele1, allele2, allele3, allele4, allele5)
+    @staticmethod
+    def create_output(clustal_output):
+        """
+        Parses the output from clustal omega (fasta format). The names are made the same length by adding
+        spaces.
+
+        Args:
+            clustal_output (str): the alignment in fasta format
+        Returns:
+            seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment 
+        """
+        fasta_list = ParseInput.get_fasta_sequences(clustal_output)
+        if len(fasta_list) == 0:
+            raise RuntimeError ('Clustal omega gave no alignment!')
+
+        # Add spaces to id's (if needed) to make them al the same length
+        max_id_length = max([len(id) for id, seq in fasta_list])
+        seq_dict = {}
+        for id, seq in fasta_list:
+            seq_dict[id.ljust(max_id_length)] = [seq]
+
+        seq_list = sorted(seq_dict.items())
+
+        return seq_list
+
+    @staticmethod
+    def align_read_pair(read1_seq, read2_seq, alleles, threads = 40, profile = None, report = None):
+        """
+        Aligns one read pair: the clustal input is created, clustal omega is used and its output is parsed.
+        Clustal omega communicates through pipes only, so read pairs can be aligned at the same time.
+
+        Args:
+            read1_seq (str): sequence read 1
+            read2_seq (str): sequence read 2
+            alleles (list): contains allele names and sequences (fasta format), 5 or 6 alleles
+            threads (int): number of threads used by clustal omega
+            profile (str): name of the file with the allele alignment, default is None (alleles aligned per read pair)
+            report (RunReport): records the time per stage, default is None (not recorded)
+        Returns:
+            seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment 
+        """
+        if report == None:
+            report = RunReport()
+        with report.measure('create clustal input'):
+            if profile == None:
+                clustal_input = PerformMSA.create_input_for_clustal(read1_seq, read2_seq, alleles)
+            if profile != None:
+                clustal_input = PerformMSA.create_input_for_clustal(read1_seq, read2_seq)
+        with report.measure('clustal omega'):
+            clustal_output = PerformMSA.use_clustal(clustal_input, threads, profile)
+        with report.measure('parse clustal output'):
+            return PerformMSA.create_output(clustal_output)
+    
+    @staticmethod
+    def scan_output(output_file_name):
+        """
+        Scans an existing output file for the read pairs that are completely written, each read pair ends with
+        '$$$'. Used to resume an interrupted run.
+
+        Args:
+            output_file_name (str): name of output file
+        Returns:
+            read_names (set): names of the completely written read pairs
+            complete_size (int): size of the file up to the last complete read pair (or header), 0 if not even
+            the header is complete
+        """
+        read_names = set()
+        complete_size = 0
+        size = 0
+        record_start = None   # None while reading the header
+        read_name = None
+        with open(output_file_name, 'rb') as file_object:
+            for line in file_object:
+                size += len(line)
+                if line == b'$$$\n':
+                    if read_name != None:
+                        read_names.add(read_name)
+                    complete_size = size
+                    record_start = size
+                    read_name = None
+                elif record_start == size - len(line):   # first line of a read pair
+                    read_name = line.split(b'\t')[0].decode()
+
+        return read_names, complete_size
+
+    @staticmethod
+    def get_read_pair_count_line(read_pair_count = '?'):
+        """
+        Creates the header line with the number of read pairs. The number has a fixed width, so it can be filled in
+        at the end of the run without changing the size of the header. Until then it is '?'.
+
+        Args:
+            read_pair_count (int): number of read pairs, default is '?' (not counted yet)
+        Returns:
+            count_line (str): header line with the number of read pairs
+        """
+        return '{0:>{1}} paired-end reads in total\n'.format(read_pair_count, PerformMSA.read_pair_count_width)
+
+    @staticmethod
+    def write_read_pair_count(output_file_name, read_pair_count):
+        """
+        Fills in the number of read pairs in the header of an output file (text or binary format). The read pairs
+        are counted while they are read from the sam file, so the number is known at the end of the run.
+
+        Args:
+            output_file_name (str): name of output file
+            read_pair_count (int): number of read pairs
+        Returns:
+            -
+        """
+        if MsaReader.is_binary(output_file_name) == True:
+            msa_reader = MsaReader(output_file_name)
+            header = msa_reader.header.encode()
+            header_start = msa_reader.data_start - len(header)
+        else:
+            header = b''
+            with open(output_file_name, 'rb') as file_object:
+                for line in file_object:
+                    if line == b'$$$\n':
+                        break
+                    header += line
+            header_start = 0
+
+        count_line = re.search(b'^[ 0-9?]{%d} paired-end reads in total$' % PerformMSA.read_pair_count_width, header, re.M)
+        if count_line == None:
+            print ('Warning: the header of', output_file_name, 'has no field for the number of read pairs, it is not filled in', file=stderr)
+            return
+        with open(output_file_name, 'r+b') as file_object:
+            file_object.seek(header_start + count_line.start())
+            file_object.write(PerformMSA.get_read_pair_count_line(read_pair_count).encode())
+
+    @staticmethod
+    def get_output_rows(seq_list):
+        """
+        Puts the rows of the alignment in the order of the output file: first the reads, then the alleles.
+
+        Args:
+           seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment
+        Returns:
+            rows (list): names and aligned sequences, first 'Read1' and 'Read2', then the alleles
+        """
+        return [(name, sequence[0]) for name, sequence in seq_list[-2:] + seq_list[:-2]]
+
+    @staticmethod
+    def write_output(output_file_name, seq_list, read_name, read1, read2, qv_read1, qv_read2):
+        """
+        Writes the read information and alignment output into output file. This is done after
+        the alignment of each read pair. '$$$' is used as separator between the read pairs.
+
+        Args:
+           output_file_name (str): name of output file
+           seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment 
+           read_name (str): read name
+           read1 (str): sequence read 1
+           read2 (str): sequence read 2
+           qv_read1 (str): quality values read 1
+           qv_read2 (str): quality values read 2
+        Returns:
+            -
+        """
+
+        with open(output_file_name, 'a') as db_file:
+            db_file.write(read_name + '\t' + read1 + '\t' + qv_read1 + '\n')
+            db_file.write(read_name + '\t' + read2 + '\t' + qv_read2 + '\n')
+
+            # For 5 alleles
+            if len(seq_list) == 7: 
+                for name, sequence in seq_list[5:7]:
+                    db_file.write(name + '\t' + sequence[0] + '\n')
+          
+            # For 6 alleles
+            if len(seq_list) == 8: 
+                for name, sequence in seq_list[6:8]:
+                    db_file.write(name + '\t' + sequence[0] + '\n')
+
+            for name, sequence in seq_list[:-2]:
+                db_file.write(name + '\t' + sequence[0] + '\n')
+            db_file.write('$$$\n')
+
+class ClustalAligner():
+    """
+    This class aligns read pairs with clustal omega, together with all alleles or against the allele profile.
+    Clustal omega runs as a separate process, so threads are enough to align read pairs at the same time.
+
+    Args:
+        alleles (list): contains allele names and sequences (fasta format), 5 or 6 alleles
+        threads (int): number of threads per clustal omega process
+        profile (str): name of the file with the allele alignment, default is None (alleles aligned per read pair)
+        report (RunReport): records the time per stage, default is None (not recorded)
+    """
+    use_processes = False
+
+    def __init__(self, alleles, threads = 40, profile = None, report = None):
+        self.alleles = alleles
+        self.threads = threads
+        self.profile = profile
+        self.report = report
+
+    def align_read_pair(self, read1_seq, read2_seq):
+        """
+        Aligns one read pair with clustal omega.
+
+        Args:
+            read1_seq (str): sequence read 1
+            read2_seq (str): sequence read 2
+        Returns:
+            seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment 
+        """
+        return PerformMSA.align_read_pair(read1_seq, read2_seq, self.alleles, self.threads, self.profile, self.report)
+
+    def get_cache_options(self):
+        """
+        Describes everything apart from the reads and alleles that determines the alignment, used in the key of
+        the alignment cache. The number of threads does not change the alignment and is left out.
+
+        Args:
+            -
+        Returns:
+            cache_options (str): clustal omega version, command line and allele profile
+        """
+        cache_options = 'Clustal Omega version 1.2.4\n' + PerformMSA.get_clustal_command(0, profile=self.profile)
+        if self.profile != None:
+            with open(self.profile) as file_object:
+                cache_options += '\n' + file_object.read()
+
+        return cache_options
+
+class BandedAligner():
+    """
+    This class is a built-in aligner that needs no external program. The allele alignment is used as a fixed
+    reference and each read is placed into it with a semi-global dynamic programming alignment against the
+    alignment columns. The alignment is restricted to a band around the columns that are hit by the k-mers of
+    the read, and every row of the dynamic programming matrix is computed with a few NumPy operations.
+
+    A read nucleotide is scored against every allele in the column (a gap in the allele costs a gap penalty).
+    The allele with the most k-mer hits weighs as much as all alleles together, so a read is placed consistently
+    with its best matching allele and the other alleles decide between equally good placements. Skipping a column
+    (read deletion) only costs for the alleles without a gap in that column. Read insertions become new columns
+    with gaps for the alleles and the other read. The output has the same layout as the parsed clustal output.
+
+    Args:
+        allele_alignment (list): list of lists with allele names and aligned sequences
+        band (int): number of extra columns at both sides of the columns hit by the read k-mers
+        k (int): k-mer length used to find the position of the read in the allele alignment
+    """
+    use_processes = True
+    match_score = 2
+    mismatch_score = -3
+    gap_score = -5
+
+    def __init__(self, allele_alignment, band = 32, k = 11):
+        if len(set([len(seq) for allele, seq in allele_alignment])) != 1:
+            raise ValueError ('Aligned allele sequences have a different length!')
+        self.allele_alignment = allele_alignment
+        self.allele_count = len(allele_alignment)
+        self.alignment_length = len(allele_alignment[0][1])
+        self.band = band
+        self.k = k
+
+        # Nucleotide codes: A, C, G, T and 4 for all other characters (e.g. N)
+        self.nucleotide_codes = np.full(256, 4, dtype=np.intp)
+        for code, nucleotide in enumerate('ACGT'):
+            self.nucleotide_codes[ord(nucleotide)] = code
+            self.nucleotide_codes[ord(nucleotide.lower())] = code
+
+        # Score per allele, nucleotide code and alignment column (a gap penalty if the allele has a gap), and the
+        # costs of skipping a column per allele
+        allele_matrix = np.array([np.frombuffer(seq.upper().encode(), dtype=np.uint8) for allele, seq in allele_alignment])
+        allele_gaps = allele_matrix == ord('-')
+        self.allele_scores = np.zeros((self.allele_count, 5, self.alignment_length), dtype=np.int64)
+        for code, nucleotide in enumerate('ACGT'):
+            self.allele_scores[:, code] = np.where(allele_matrix == ord(nucleotide), self.match_score, self.mismatch_score)
+        for code in range(5):
+            self.allele_scores[:, code][allele_gaps] = self.gap_score
+        self.allele_skip_scores = np.where(allele_gaps, 0, self.gap_score).astype(np.int64)
+        self.column_scores = self.allele_scores.sum(axis=0)
+        self.skip_scores = self.allele_skip_scores.sum(axis=0)
+        self.insertion_score = 2 * self.gap_score * self.allele_count
+
+        # k-mer index with the positions in the (ungapped) alleles, and the alignment column of each allele position
+        self.allele_columns = []
+        self.kmer_index = {}
+        for allele_index, (allele, seq) in enumerate(allele_alignment):
+            self.allele_columns += [np.flatnonzero(allele_matrix[allele_index] != ord('-'))]
+            allele_seq = seq.replace('-', '').upper()
+            for pos in range(len(allele_seq) - k + 1):
+                kmer = allele_seq[pos:pos + k]
+                if kmer in self.kmer_index:
+                    self.kmer_index[kmer] += [(allele_index, pos)]
+                else:
+                    self.kmer_index[kmer] = [(allele_index, pos)]
+
+    def get_description(self):
+        """
+        Describes the aligner settings, used in the header of the msa output file.
+
+        Args:
+            -
+        Returns:
+            description (str): aligner settings
+        """
+        return 'built-in banded aligner, match {0}, mismatch {1}, gap {2}, band {3}, k-mer length {4}'.format(self.match_score, self.mismatch_score, self.gap_score, self.band, self.k)
+
+    def get_cache_options(self):
+        """
+        Describes everything apart from the reads and alleles that determines the alignment, used in the key of
+        the alignment cache.
+
+        Args:
+            -
+        Returns:
+            cache_options (str): aligner settings and allele alignment
+        """
+        cache_options = self.get_description()
+        for allele, seq in self.allele_alignment:
+            cache_options += '\n>' + allele + '\n' + seq
+
+        return cache_options
+
+    def align_read_pair(self, read1_seq, read2_seq):
+        """
+        Places both reads into the allele alignment. The insertions of both reads are merged, an insertion
+        column gets a gap for the alleles and for the read without nucleotide in that column.
+
+        Args:
+            read1_seq (str): sequence read 1
+            read2_seq (str): sequence read 2
+        Returns:
+            seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment 
+        """
+        read1_placed, read1_inserted, read1_columns = self.__align_read(read1_seq)
+        read2_placed, read2_inserted, read2_columns = self.__align_read(read2_seq)
+
+        # The number of columns inserted after each alignment column
+        insertion_lengths = {}
+        for column, nucleotides in list(read1_inserted.items()) + list(read2_inserted.items()):
+            insertion_lengths[column] = max(insertion_lengths.get(column, 0), len(nucleotides))
+
+        seq_dict = {}
+        seq_dict['Read1'] = self.__create_row(self.__create_read_row(read1_placed), read1_inserted, insertion_lengths)
+        seq_dict['Read2'] = self.__create_row(self.__create_read_row(read2_placed), read2_inserted, insertion_lengths)
+        for allele, seq in self.allele_alignment:
+            seq_dict[allele] = self.__create_row(seq, {}, insertion_lengths)
+
+        return BandedAligner.create_seq_list(seq_dict)
+
+    @staticmethod
+    def create_seq_list(seq_dict):
+        """
+        Creates the same data structure as PerformMSA.create_output: the names are made the same length by
+        adding spaces and the names and sequences are sorted.
+
+        Args:
+            seq_dict (dict): contains allele names and read type (Read1 and Read2) and its sequence in alignment
+        Returns:
+            seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment 
+        """
+        max_id_length = max([len(name) for name in seq_dict.keys()])
+        padded_seq_dict = {}
+        for name, seq in seq_dict.items():
+            padded_seq_dict[name + ' ' * (max_id_length - len(name))] = [seq]
+
+        return sorted(padded_seq_dict.items())
+
+    def __get_window(self, read_seq):
+        """
+        Determines the alignment columns (band) in which the read is aligned. The start and end column of the
+        read are estimated with each k-mer hit in the alleles, the median start and end column are used.
+
+        Args:
+            read_seq (str): read sequence
+        Returns:
+            window_start (int): first alignment column of the band
+            window_end (int): alignment column after the band
+            best_allele_index (int): index of the allele with the most k-mer hits
+        """
+        read_seq = read_seq.upper()
+        start_columns = []
+        end_columns = []
+        allele_hits = [0] * self.allele_count
+        for offset in range(len(read_seq) - self.k + 1):
+            for allele_index, pos in self.kmer_index.get(read_seq[offset:offset + self.k], []):
+                allele_hits[allele_index] += 1
+                columns = self.allele_columns[allele_index]
+                start_pos = min(max(pos - offset, 0), len(columns) - 1)
+                end_pos = min(max(pos - offset + len(read_seq) - 1, 0), len(columns) - 1)
+                start_columns += [int(columns[start_pos])]
+                end_columns += [int(columns[end_pos])]
+
+        best_allele_index = allele_hits.index(max(allele_hits))
+        if len(start_columns) == 0:   # no k-mer hits, the read is aligned against all columns
+            return 0, self.alignment_length, best_allele_index
+
+        start_columns.sort()
+        end_columns.sort()
+        window_start = max(0, start_columns[len(start_columns) // 2] - self.band)
+        window_end = min(self.alignment_length, end_columns[len(end_columns) // 2] + self.band + 1)
+        if window_end <= window_start:
+            return 0, self.alignment_length, best_allele_index
+
+        return window_start, window_end, best_allele_index
+
+    def __align_read(self, read_seq):
+        """
+        Aligns a read against the alignment columns within the band. The read is aligned completely, gaps in front
+        of and after the read are free. Row i of the score matrix contains the best scores after i read nucleotides
+        for each column; a row is computed from the previous row with vectorized operations, the skipped columns
+        (read deletions) are handled with a cumulative maximum.
+
+        Args:
+            read_seq (str): read sequence
+        Returns:
+            placed (dict): alignment column and read nucleotide, for read nucleotides placed in an alignment column
+            inserted (dict): alignment column (-1 for in front of the alignment) and the read nucleotides inserted
+            after that column
+            read_columns (list): alignment column per read nucleotide, -1 for inserted nucleotides
+        """
+        window_start, window_end, best_allele_index = self.__get_window(read_seq)
+        column_scores = self.column_scores[:, window_start:window_end] + self.allele_count * self.allele_scores[best_allele_index, :, window_start:window_end]
+        skip_scores = self.skip_scores[window_start:window_end] + self.allele_count * self.allele_skip_scores[best_allele_index, window_start:window_end]
+        width = window_end - window_start
+        skip_cumulative = np.zeros(width + 1, dtype=np.int64)
+        skip_cumulative[1:] = np.cumsum(skip_scores)
+        read_codes = self.nucleotide_codes[np.frombuffer(read_seq.encode(), dtype=np.uint8)]
+
+        # score_matrix[i][j]: best score with i read nucleotides aligned and j columns of the band used
+        score_matrix = np.zeros((len(read_seq) + 1, width + 1), dtype=np.int64)
+        for i in range(1, len(read_seq) + 1):
+            previous_row = score_matrix[i - 1]
+            best = previous_row + self.insertion_score
+            np.maximum(best[1:], previous_row[:-1] + column_scores[read_codes[i - 1]], out=best[1:])
+            score_matrix[i] = np.maximum.accumulate(best - skip_cumulative) + skip_cumulative
+
+        # Trace back from the best end column
+        placed = {}
+        inserted = {}
+        read_columns = [-1] * len(read_seq)
+        i = len(read_seq)
+        j = int(np.argmax(score_matrix[i]))
+        while i > 0:
+            score = score_matrix[i][j]
+            if j > 0 and score == score_matrix[i - 1][j - 1] + column_scores[read_codes[i - 1]][j - 1]:
+                placed[window_start + j - 1] = read_seq[i - 1]
+                read_columns[i - 1] = window_start + j - 1
+                i -= 1
+                j -= 1
+            elif score == score_matrix[i - 1][j] + self.insertion_score:
+                inserted[window_start + j - 1] = read_seq[i - 1] + inserted.get(window_start + j - 1, '')
+                i -= 1
+            else:
+                j -= 1
+
+        return placed, inserted, read_columns
+
+    def get_column_map(self, sequence, chunk_length = 500):
+        """
+        Places a long sequence (e.g. the sam reference) into the allele alignment. The sequence is aligned in
+        chunks to limit the size of the score matrix, the chunks must be placed in the same order as they occur
+        in the sequence, positions that do not follow this order get no column.
+
+        Args:
+            sequence (str): the sequence to place
+            chunk_length (int): length of the chunks that are aligned separately
+        Returns:
+            column_map (list): alignment column per sequence position, -1 if the position has no column
+        """
+        column_map = []
+        previous_column = -1
+        for chunk_start in range(0, len(sequence), chunk_length):
+            placed, inserted, read_columns = self.__align_read(sequence[chunk_start:chunk_start + chunk_length])
+            for column in read_columns:
+                # the start of a chunk can overlap the end of the previous chunk, these positions get no column
+                if column <= previous_column:
+                    column = -1
+                else:
+                    previous_column = column
+                column_map += [column]
+
+        return column_map
+
+    def __create_read_row(self, placed):
+        """
+        Creates the aligned read sequence without insertion columns.
+
+        Args:
+            placed (dict): alignment column and read nucleotide, for read nucleotides placed in an alignment column
+        Returns:
+            read_row (str): the read sequence in the allele alignment
+        """
+        read_row = ['-'] * self.alignment_length
+        for column, nucleotide in placed.items():
+            read_row[column] = nucleotide
+
+        return ''.join(read_row)
+
+    @staticmethod
+    def __create_row(row, inserted, insertion_lengths):
+        """
+        Adds the insertion columns to an aligned sequence. Inserted read nucleotides are placed at the left of
+        the insertion columns, the remaining positions are gaps.
+
+        Args:
+            row (str): aligned sequence without insertion columns
+            inserted (dict): alignment column and the nucleotides of this sequence inserted after that column
+            insertion_lengths (dict): alignment column and the number of columns inserted after that column
+        Returns:
+            row (str): aligned sequence including the insertion columns
+        """
+        for column in sorted(insertion_lengths.keys(), reverse=True):
+            insertion = inserted.get(column, '')
+            insertion += '-' * (insertion_lengths[column] - len(insertion))
+            row = row[:column + 1] + insertion + row[column + 1:]
+
+        return row
+
+class CigarProjection():
+    """
+    This class places reads into the fixed allele alignment with their position and CIGAR string from the sam
+    file, no alignment is needed for those reads. The sam reference positions are mapped onto the allele alignment
+    columns beforehand. A read is only placed if its placement is unambiguous: all aligned reference positions
+    have a column and inserted nucleotides exactly fill the alignment columns in which the reference has a gap.
+    Soft clipped reads, and insertions that do not fit, are ambiguous and need to be aligned.
+
+    Args:
+        allele_alignment (list): list of lists with allele names and aligned sequences
+        reference_maps (dict): reference name and alignment column per reference position (-1 for no column)
+    """
+    cigar_pattern = re.compile('([0-9]+)([MIDNSHP=X])')
+
+    def __init__(self, allele_alignment, reference_maps):
+        self.allele_alignment = allele_alignment
+        self.alignment_length = len(allele_alignment[0][1])
+        self.reference_maps = reference_maps
+        self.projected_count = 0
+        self.ambiguous_count = 0
+
+    @staticmethod
+    def create_reference_maps(references, allele_alignment, banded_aligner = None):
+        """
+        Maps each reference position onto the allele alignment columns. A reference that is identical to one of
+        the alleles uses the alignment row of that allele, other references are placed with the banded aligner.
+
+        Args:
+            references (list): list of lists with reference names and sequences
+            allele_alignment (list): list of lists with allele names and aligned sequences
+            banded_aligner (BandedAligner): aligner for references that are not one of the alleles
+        Returns:
+            reference_maps (dict): reference name and alignment column per reference position (-1 for no column)
+        """
+        reference_maps = {}
+        for reference_name, reference_seq in references:
+            reference_seq = reference_seq.upper()
+            for allele, seq in allele_alignment:
+                if seq.replace('-', '').upper() == reference_seq:
+                    reference_maps[reference_name] = [i for i, char in enumerate(seq) if char != '-']
+                    break
+            if reference_name not in reference_maps:
+                if banded_aligner == None:
+                    banded_aligner = BandedAligner(allele_alignment)
+                reference_maps[reference_name] = banded_aligner.get_column_map(reference_seq)
+
+        return reference_maps
+
+    def get_description(self):
+        """
+        Describes the projection, used in the header of the msa output file.
+
+        Args:
+            -
+        Returns:
+            description (str): reference names used for the projection
+        """
+        return 'CIGAR projection onto the allele alignment (references: {0})'.format(', '.join(sorted(self.reference_maps.keys())))
+
+    def project_read(self, read_seq, reference_name, position, cigar):
+        """
+        Places one read into the allele alignment with its reference position and CIGAR string.
+
+        Args:
+            read_seq (str): read sequence
+            reference_name (str): name of the reference the read is mapped to
+            position (int): 1-based reference position of the first aligned read nucleotide
+            cigar (str): CIGAR string
+        Returns:
+            read_row (str): the read sequence in the allele alignment, None if the placement is ambiguous
+        """
+        column_map = self.reference_maps.get(reference_name)
+        if column_map == None or position < 1 or cigar == '*':
+            return None
+
+        read_row = ['-'] * self.alignment_length
+        reference_pos = position - 1
+        read_pos = 0
+        previous_column = -1
+        for length, operation in self.cigar_pattern.findall(cigar):
+            length = int(length)
+            if operation in 'M=X':
+                for i in range(length):
+                    if reference_pos >= len(column_map) or column_map[reference_pos] <= previous_column:
+                        return None
+                    previous_column = column_map[reference_pos]
+                    read_row[previous_column] = read_seq[read_pos]
+                    reference_pos += 1
+                    read_pos += 1
+            elif operation in 'DN':
+                reference_pos += length
+            elif operation == 'I':
+                # inserted nucleotides must exactly fill the columns between both reference positions
+                if read_pos == 0 or reference_pos >= len(column_map):
+                    return None
+                next_column = column_map[reference_pos]
+                if next_column - previous_column - 1 != length:
+                    return None
+                for column in range(previous_column + 1, next_column):
+                    read_row[column] = read_seq[read_pos]
+                    read_pos += 1
+                previous_column = next_column - 1
+            elif operation == 'S':
+                return None
+
+        if read_pos != len(read_seq):
+            return None
+
+        return ''.join(read_row)
+
+    def project_read_pair(self, read_data):
+        """
+        Places both reads of a read pair into the allele alignment.
+
+        Args:
+            read_data (list): [read_seq, read_quality, reference_name, position, cigar] for read 1 and read 2
+        Returns:
+            seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment, None if
+            the placement of one of the reads is ambiguous
+        """
+        read_rows = []
+        for read_seq, read_quality, reference_name, position, cigar in read_data:
+            read_row = self.project_read(read_seq, reference_name, position, cigar)
+            if read_row == None:
+                self.ambiguous_count += 1
+                return None
+            read_rows += [read_row]
+
+        seq_dict = {'Read1': read_rows[0], 'Read2': read_rows[1]}
+        for allele, seq in self.allele_alignment:
+            seq_dict[allele] = seq
+        self.projected_count += 1
+
+        return BandedAligner.create_seq_list(seq_dict)
+
+class AlignmentCache():
+    """
+    This class stores alignments on disk (sqlite database), so identical read pairs are aligned only once. The
+    key is a hash of both reads, the ordered alleles and the aligner settings, the value is the parsed alignment
+    (seq_list). When the cache holds more than max_entries alignments, the least recently used ones are removed.
+    The cache is only used from the main thread.
+
+    Args:
+        cache_file (str): name of the sqlite database file, created if it does not exist
+        alleles (list): contains allele names and sequences (fasta format)
+        cache_options (str): aligner settings that determine the alignment
+        max_entries (int): maximum number of alignments in the cache
+        commit_interval (int): number of stored alignments after which they are written to disk
+    """
+    version = 1
+
+    def __init__(self, cache_file, alleles, cache_options, max_entries = 100000, commit_interval = 100):
+        if max_entries < 1:
+            raise ValueError ('The cache size must be at least 1!')
+        self.max_entries = max_entries
+        self.commit_interval = commit_interval
+        self.hits = 0
+        self.misses = 0
+        self.uncommitted = 0
+
+        key_prefix = hashlib.sha256()
+        key_prefix.update('HybridRead alignment cache {0}\n'.format(AlignmentCache.version).encode())
+        key_prefix.update(cache_options.encode() + b'\n')
+        for allele in alleles:
+            key_prefix.update(allele.encode() + b'\n')
+        self.key_prefix = key_prefix
+
+        self.connection = sqlite3.connect(cache_file)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS alignments (key TEXT PRIMARY KEY, seq_list TEXT NOT NULL, last_used INTEGER NOT NULL)')
+        self.connection.execute('CREATE INDEX IF NOT EXISTS alignments_last_used ON alignments (last_used)')
+        self.entries, last_used = self.connection.execute('SELECT COUNT(*), MAX(last_used) FROM alignments').fetchone()
+        self.last_used = last_used or 0
+
+    def get_key(self, read1_seq, read2_seq):
+        """
+        Creates the cache key of a read pair.
+
+        Args:
+            read1_seq (str): sequence read 1
+            read2_seq (str): sequence read 2
+        Returns:
+            key (str): hexadecimal hash of the reads, alleles and aligner settings
+        """
+        key = self.key_prefix.copy()
+        key.update(read1_seq.encode() + b'\n' + read2_seq.encode())
+
+        return key.hexdigest()
+
+    def get(self, key):
+        """
+        Looks up an alignment and marks it as most recently used. The hits and misses are counted.
+
+        Args:
+            key (str): cache key of the read pair
+        Returns:
+            seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment, None if
+            the read pair is not in the cache
+        """
+        row = self.connection.execute('SELECT seq_list FROM alignments WHERE key = ?', (key,)).fetchone()
+        if row == None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.last_used += 1
+        self.connection.execute('UPDATE alignments SET last_used = ? WHERE key = ?', (self.last_used, key))
+
+        return [(name, sequence) for name, sequence in json.loads(row[0])]
+
+    def put(self, key, seq_list):
+        """
+        Stores an alignment. The least recently used alignments are removed if the cache is full.
+
+        Args:
+            key (str): cache key of the read pair
+            seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment 
+        Returns:
+            -
+        """
+        self.last_used += 1
+        cursor = self.connection.execute('INSERT OR IGNORE INTO alignments (key, seq_list, last_used) VALUES (?, ?, ?)', (key, json.dumps(seq_list), self.last_used))
+        self.entries += cursor.rowcount
+        if self.entries > self.max_entries:
+            self.connection.execute('DELETE FROM alignments WHERE key IN (SELECT key FROM alignments ORDER BY last_used LIMIT ?)', (self.entries - self.max_entries,))
+            self.entries = self.max_entries
+
+        self.uncommitted += 1
+        if self.uncommitted >= self.commit_interval:
+            self.connection.commit()
+            self.uncommitted = 0
+
+    def close(self):
+        """
+        Writes the remaining alignments to disk and closes the cache.
+
+        Args:
+            -
+        Returns:
+            -
+        """
+        self.connection.commit()
+        self.connection.close()
+
+class ExactMatchClassifier():
+    """
+    This class classifies obvious non hybrid reads and zero reads before alignment. After the quality check of
+    SelectHybridReads.py (low quality nucleotides become 'N'), each read is searched in the alleles with a k-mer
+    index ('N' matches every nucleotide). A read pair is only classified if the result would be the same after
+    alignment: all exact matches of a read cover the same allele alignment columns, the read does not start in
+    front of any allele and the read pair meets the read length and 'N' requirements. If both reads exactly
+    match only the same allele, the read pair is a non hybrid read. If both reads match and one of them matches
+    multiple alleles, it is a zero read. All other read pairs are aligned.
+
+    Args:
+        allele_alignment (list): list of lists with allele names and aligned sequences
+        k (int): k-mer length of the index
+    """
+    # Requirement values of SelectHybridReads.py
+    minimum_q_score = MINIMUM_Q_SCORE
+    quality_offset = QUALITY_OFFSET
+    min_read_length = MIN_READ_LENGTH
+    N_quantity = N_QUANTITY
+    # Reads with a higher quality score are not expected, they are aligned
+    maximum_q_score = 40
+
+    def __init__(self, allele_alignment, k = 16):
+        self.k = k
+        max_id_length = max([len(allele) for allele, seq in allele_alignment] + [len('Read1')])
+        self.allele_names = [allele.ljust(max_id_length) for allele, seq in allele_alignment]
+        self.allele_seqs = []
+        self.allele_columns = []   # alignment column per allele position
+        self.kmer_index = {}
+        for allele_index, (allele, seq) in enumerate(allele_alignment):
+            columns = [i for i, char in enumerate(seq) if char != '-']
+            allele_seq = seq.replace('-', '').upper()
+            self.allele_seqs += [allele_seq]
+            self.allele_columns += [columns]
+            for pos in range(len(allele_seq) - k + 1):
+                self.kmer_index.setdefault(allele_seq[pos:pos + k], []).append((allele_index, pos))
+        self.non_hybrid_count = 0
+        self.zero_count = 0
+
+    def mask_read(self, read_seq, read_quality):
+        """
+        Replaces the nucleotides with a low quality value by 'N', like SelectHybridReads.py does.
+
+        Args:
+            read_seq (str): read sequence
+            read_quality (str): read quality values
+        Returns:
+            masked_seq (str): read sequence with 'N' for low quality nucleotides, None if a quality value is unknown
+        """
+        if len(read_quality) != len(read_seq):
+            return None
+
+        masked_seq = ''
+        for nucleotide, quality in zip(read_seq, read_quality):
+            q_score = ord(quality) - self.quality_offset
+            if q_score < 0 or q_score > self.maximum_q_score:
+                return None
+            if q_score < self.minimum_q_score:
+                masked_seq += 'N'
+            else:
+                masked_seq += nucleotide
+
+        return masked_seq
+
+    def get_zero_mismatch_alleles(self, masked_seq):
+        """
+        Finds the alleles that exactly match the read ('N' matches every nucleotide).
+
+        Args:
+            masked_seq (str): read sequence after the quality check
+        Returns:
+            allele_indexes (list): indexes of the exactly matching alleles, None if the read can not be classified
+            without alignment
+        """
+        kmer_start = None
+        for start in range(len(masked_seq) - self.k + 1):
+            if 'N' not in masked_seq[start:start + self.k]:
+                kmer_start = start
+                break
+        if kmer_start == None:
+            return None
+
+        read_length = len(masked_seq)
+        known_positions = [i for i, nucleotide in enumerate(masked_seq) if nucleotide != 'N']
+        matches = []
+        for allele_index, pos in self.kmer_index.get(masked_seq[kmer_start:kmer_start + self.k], []):
+            start = pos - kmer_start
+            allele_seq = self.allele_seqs[allele_index]
+            if start < 0 or start + read_length > len(allele_seq):
+                continue
+            if len(known_positions) == read_length:
+                match = allele_seq[start:start + read_length] == masked_seq
+            else:
+                match = all([allele_seq[start + i] == masked_seq[i] for i in known_positions])
+            if match == True:
+                matches += [(allele_index, start)]
+
+        if len(matches) == 0:
+            return []
+
+        # All matches must cover the same alignment columns, once per allele
+        allele_index, start = matches[0]
+        read_columns = self.allele_columns[allele_index][start:start + read_length]
+        allele_indexes = []
+        for allele_index, start in matches:
+            if allele_index in allele_indexes or self.allele_columns[allele_index][start:start + read_length] != read_columns:
+                return None
+            allele_indexes += [allele_index]
+
+        # Reads in front of an allele get a deletion correction in SelectHybridReads.py
+        for columns in self.allele_columns:
+            if columns[0] > read_columns[0]:
+                return None
+
+        return allele_indexes
+
+    def classify_read_pair(self, read_data):
+        """
+        Classifies a read pair without alignment, if possible.
+
+        Args:
+            read_data (list): [read_seq, read_quality, ...] for read 1 and read 2
+        Returns:
+            category (str): 'non_hybrid' or 'zero', None if the read pair needs to be aligned
+            result (str): allele match (non hybrid read) or note (zero read), None if the read pair needs to be aligned
+        """
+        zero_mismatch_alleles = []
+        for read in read_data:
+            masked_seq = self.mask_read(read[0], read[1])
+            if masked_seq == None or len(masked_seq) < self.min_read_length or masked_seq.count('N') > self.N_quantity:
+                return None, None
+            allele_indexes = self.get_zero_mismatch_alleles(masked_seq)
+            if allele_indexes == None or len(allele_indexes) == 0:
+                return None, None
+            zero_mismatch_alleles += [sorted([self.allele_names[allele_index] for allele_index in allele_indexes])]
+
+        zero_mismatch_allele_read1, zero_mismatch_allele_read2 = zero_mismatch_alleles
+        if len(zero_mismatch_allele_read1) == len(zero_mismatch_allele_read2) == 1:
+            if zero_mismatch_allele_read1 == zero_mismatch_allele_read2:
+                self.non_hybrid_count += 1
+                return 'non_hybrid', zero_mismatch_allele_read1[0]
+            return None, None
+
+        self.zero_count += 1
+        note = 'Note: Allele(s) {0} has/have 0 mismatches with read 1\tAllele(s) {1} has/have 0 mismatches with read 2'.format(zero_mismatch_allele_read1, zero_mismatch_allele_read2)
+
+        return 'zero', note
+
+    @staticmethod
+    def create_output(output_file_names):
+        """
+        Creates the prefiltered output files including header, existing files (resumed run) are kept.
+
+        Args:
+            output_file_names (dict): locus and name of its prefiltered output file
+        Returns:
+            -
+        """
+        for output_file_name in output_file_names.values():
+            if os.path.isfile(output_file_name) == False:
+                with open(output_file_name, 'w') as db_file:
+                    db_file.write('Category\tRead name\tAllele match or note\n')
+
+    def filter_read_pairs(self, read_pairs, output_writers, output_file_names, router):
+        """
+        Classifies the read pairs that do not need to be aligned and writes them into the prefiltered output file
+        of their locus. The output files are kept open by output_writers during the run.
+
+        Args:
+            read_pairs (iterable): read name and read data ([read_seq, read_quality, ...] for read 1 and 2) per read pair
+            output_writers (OutputWriters): the opened prefiltered output files
+            output_file_names (dict): locus and name of its prefiltered output file
+            router (LocusRouter): gives the locus of the read pairs
+        Yields:
+            read_name (str): read name of a read pair that needs to be aligned
+            read_data (list): [read_seq, read_quality, ...] for read 1 and read 2
+        """
+        for read_name, read_data in read_pairs:
+            category, result = self.classify_read_pair(read_data)
+            if category == None:
+                yield read_name, read_data
+                continue
+            output_writers.write(output_file_names[router.pop_locus(read_name)], category + '\t' + read_name + '\t' + result + '\n')
+
+    @staticmethod
+    def scan_output(output_file_name):
+        """
+        Scans an existing prefiltered output file for the classified read pairs, an incomplete last line (e.g. after
+        a crash) is removed. Used to resume an interrupted run.
+
+        Args:
+            output_file_name (str): name of the prefiltered output file
+        Returns:
+            read_names (set): names of the classified read pairs
+        """
+        read_names = set()
+        complete_size = 0
+        with open(output_file_name, 'rb') as file_object:
+            for line_number, line in enumerate(file_object):
+                if line.endswith(b'\n') == False:
+                    break
+                complete_size += len(line)
+                if line_number > 0:
+                    read_names.add(line.split(b'\t')[1].decode())
+        os.truncate(output_file_name, complete_size)
+
+        return read_names
+
+class LocusRouter():
+    """
+    This class decides to which locus (output file) a read pair belongs, when multiple loci are aligned in one run.
+    The locus is taken from the sam reference name of both reads if possible. Otherwise the k-mers of both reads
+    are compared with the alleles, the locus of the alleles with the most shared k-mers is used. Read pairs of
+    which the locus is not clear are not aligned. With one locus all read pairs belong to that locus. The routed
+    read pairs are counted per locus.
+
+    Args:
+        loci (list): loci of the run, e.g. ['HLA-A', 'HLA-B', 'HLA-C']
+        alleles (list): contains allele names and sequences (fasta format)
+        k (int): k-mer length
+    """
+    name_separators = re.compile('[*_:|.-]')
+
+    def __init__(self, loci, alleles, k = 16):
+        self.loci = loci
+        self.k = k
+        self.read_loci = {}   # read name and locus of the read pairs that are not written yet
+        self.read_pair_counts = dict([(locus, 0) for locus in loci])
+        self.unrouted_count = 0
+        self.kmer_index = {}
+        if len(loci) > 1:
+            for allele in alleles:
+                allele_name, allele_seq = allele[1:].split('\n', 1)
+                locus = self.get_reference_locus(allele_name.split()[0])
+                if locus == None:
+                    continue
+                allele_seq = allele_seq.replace('\n', '').upper()
+                for pos in range(len(allele_seq) - k + 1):
+                    self.kmer_index.setdefault(allele_seq[pos:pos + k], set()).add(locus)
+
+    def get_reference_locus(self, reference_name):
+        """
+        Takes the locus from a reference (or allele) name, the gene is the part before '*', '_', ':', '|', '.' or '-'.
+
+        Args:
+            reference_name (str): sam reference name or allele name
+        Returns:
+            locus (str): locus of the run, None if the name does not contain one of the loci
+        """
+        if reference_name.startswith('HLA-'):
+            reference_name = reference_name[4:]
+        gene = LocusRouter.name_separators.split(reference_name)[0]
+        for locus in self.loci:
+            if gene == locus.replace('HLA-', '', 1):
+                return locus
+
+        return None
+
+    def get_locus(self, read_data):
+        """
+        Decides to which locus a read pair belongs.
+
+        Args:
+            read_data (list): [read_seq, read_quality, reference_name, ...] for read 1 and read 2
+        Returns:
+            locus (str): locus of the read pair, None if it is not clear
+        """
+        if len(self.loci) == 1:
+            return self.loci[0]
+
+        reference_loci = set([self.get_reference_locus(read[2]) for read in read_data])
+        if len(reference_loci) == 1 and None not in reference_loci:
+            return reference_loci.pop()
+
+        kmer_counts = dict([(locus, 0) for locus in self.loci])
+        for read in read_data:
+            read_seq = read[0].upper()
+            for pos in range(len(read_seq) - self.k + 1):
+                for locus in self.kmer_index.get(read_seq[pos:pos + self.k], ()):
+                    kmer_counts[locus] += 1
+        kmer_counts = sorted(kmer_counts.items(), key=lambda kv: kv[1], reverse=True)
+        if kmer_counts[0][1] == 0 or kmer_counts[0][1] == kmer_counts[1][1]:
+            return None
+
+        return kmer_counts[0][0]
+
+    def route_read_pairs(self, read_pairs):
+        """
+        Decides the locus of each read pair and counts the read pairs per locus, read pairs without a clear locus
+        are counted and left out.
+
+        Args:
+            read_pairs (iterable): read name and read data ([read_seq, read_quality, ...] for read 1 and 2) per read pair
+        Yields:
+            read_name (str): read name
+            read_data (list): [read_seq, read_quality, ...] for read 1 and read 2
+        """
+        for read_name, read_data in read_pairs:
+            locus = self.get_locus(read_data)
+            if locus == None:
+                self.unrouted_count += 1
+                continue
+            self.read_loci[read_name] = locus
+            self.read_pair_counts[locus] += 1
+            yield read_name, read_data
+
+    def skip_read_pairs(self, read_pairs, read_names):
+        """
+        Leaves out the routed read pairs with the given read names (e.g. the read pairs that are already aligned
+        when a run is resumed), they are still counted.
+
+        Args:
+            read_pairs (iterable): read name and read data ([read_seq, read_quality, ...] for read 1 and 2) per read pair
+            read_names (set): names of the read pairs that are left out
+        Yields:
+            read_name (str): read name
+            read_data (list): [read_seq, read_quality, ...] for read 1 and read 2
+        """
+        for read_name, read_data in read_pairs:
+            if read_name in read_names:
+                self.pop_locus(read_name)
+                continue
+            yield read_name, read_data
+
+    def pop_locus(self, read_name):
+        """
+        Gives the locus of a routed read pair when it is written, afterwards the read pair is forgotten.
+
+        Args:
+            read_name (str): read name
+        Returns:
+            locus (str): locus of the read pair
+        """
+        return self.read_loci.pop(read_name)
+
+class AlignmentPool():
+    """
+    This class aligns multiple read pairs at the same time. The alignments are returned in the same order as
+    the read pairs were given, which keeps the msa output file deterministic. Clustal omega runs as a separate
+    process, so it is used from a pool of threads. The built-in aligner runs in python itself and is therefore
+    used from a pool of processes.
+
+    Read pairs that can be placed with CIGAR projection are not sent to the aligner. Neither are read pairs that
+    are in the alignment cache, or identical to a read pair that is already being aligned.
+
+    Args:
+        aligner (object): ClustalAligner or BandedAligner
+        workers (int): number of read pairs that are aligned at the same time
+        projection (CigarProjection): places read pairs without alignment, default is None (all pairs aligned)
+        cache (AlignmentCache): on-disk alignment cache, default is None (no cache)
+        report (RunReport): records the time per aligner call, default is None (not recorded)
+    """
+    worker_aligner = None
+
+    def __init__(self, aligner, workers = 1, projection = None, cache = None, report = None):
+        if workers < 1:
+            raise ValueError ('The number of workers must be at least 1!')
+        self.aligner = aligner
+        self.workers = workers
+        self.projection = projection
+        self.cache = cache
+        self.report = report
+        if report == None:
+            self.report = RunReport()
+
+    @staticmethod
+    def get_done_future(seq_list):
+        """
+        Wraps a result that is already available, so it is handled in order with the submitted alignments.
+
+        Args:
+            seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment 
+        Returns:
+            future (Future): finished future with seq_list and no aligner time as result
+        """
+        future = Future()
+        future.set_result((seq_list, None))
+
+        return future
+
+    @staticmethod
+    def init_worker(aligner):
+        """
+        Stores the aligner in a worker process, so it is not sent along with each read pair.
+
+        Args:
+            aligner (object): ClustalAligner or BandedAligner
+        Returns:
+            -
+        """
+        AlignmentPool.worker_aligner = aligner
+
+    @staticmethod
+    def align_in_worker(read1_seq, read2_seq):
+        """
+        Aligns one read pair with the aligner of the worker process.
+
+        Args:
+            read1_seq (str): sequence read 1
+            read2_seq (str): sequence read 2
+        Returns:
+            seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment 
+        """
+        return AlignmentPool.worker_aligner.align_read_pair(read1_seq, read2_seq)
+
+    @staticmethod
+    def align_timed(align_function, read1_seq, read2_seq):
+        """
+        Aligns one read pair and measures the time of the aligner call, in the thread or process of the pool.
+
+        Args:
+            align_function (function): function that aligns one read pair in the pool
+            read1_seq (str): sequence read 1
+            read2_seq (str): sequence read 2
+        Returns:
+            seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment
+            seconds (float): wall time of the aligner call
+        """
+        start = time.perf_counter()
+        seq_list = align_function(read1_seq, read2_seq)
+
+        return seq_list, time.perf_counter() - start
+
+    def add_latency(self, future):
+        """
+        Adds the time of a finished aligner call to the report.
+
+        Args:
+            future (Future): finished future of the aligner call
+        Returns:
+            -
+        """
+        if future.cancelled() == False and future.exception() == None:
+            self.report.add_latency(future.result()[1])
+
+    def create_executor(self):
+        """
+        Creates the pool of threads or processes, depending on the aligner.
+
+        Args:
+            -
+        Returns:
+            executor (Executor): pool that aligns the read pairs
+            align_function (function): function that aligns one read pair in the pool
+        """
+        if self.aligner.use_processes == True and self.workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers, initializer=AlignmentPool.init_worker, initargs=(self.aligner,))
+            return executor, AlignmentPool.align_in_worker
+
+        return ThreadPoolExecutor(max_workers=self.workers), self.aligner.align_read_pair
+
+    def align_read_pairs(self, read_pairs):
+        """
+        Aligns all read pairs and yields them in input order. At most twice the number of workers read pairs
+        are submitted ahead of the read pair that is yielded next, so the memory use does not grow with the
+        number of read pairs.
+
+        Args:
+            read_pairs (iterable): read name and read data ([read_seq, read_quality, ...] for read 1 and 2) per read pair
+        Yields:
+            read_name (str): read name
+            read_data (list): [read_seq, read_quality, ...] for read 1 and read 2
+            seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment 
+        """
+        in_flight = deque()
+        pending = {}   # cache key and future of the read pairs that are being aligned
+        executor, align_function = self.create_executor()
+        with executor:
+            for read_name, read_data in read_pairs:
+                seq_list = None
+                key = None
+                future = None
+                if self.projection != None:
+                    seq_list = self.projection.project_read_pair(read_data)
+                if seq_list == None and self.cache != None:
+                    key = self.cache.get_key(read_data[0][0], read_data[1][0])
+                    if key in pending:   # duplicate of a read pair that is being aligned
+                        self.cache.hits += 1
+                        future = pending[key]
+                        key = None
+                    else:
+                        seq_list = self.cache.get(key)
+                if seq_list != None:
+                    key = None
+                    future = AlignmentPool.get_done_future(seq_list)
+                if future == None:
+                    future = executor.submit(AlignmentPool.align_timed, align_function, read_data[0][0], read_data[1][0])
+                    future.add_done_callback(self.add_latency)
+                    if key != None:
+                        pending[key] = future
+                in_flight.append((read_name, read_data, future, key))
+                if len(in_flight) >= 2 * self.workers:
+                    yield self.get_result(in_flight.popleft(), pending)
+
+            while in_flight:
+                yield self.get_result(in_flight.popleft(), pending)
+
+    def get_result(self, in_flight_pair, pending):
+        """
+        Waits for the alignment of a read pair and stores new alignments in the cache.
+
+        Args:
+            in_flight_pair (tuple): read name, read data, future and cache key (None if not to be stored)
+            pending (dict): cache key and future of the read pairs that are being aligned
+        Returns:
+            read_name (str): read name
+            read_data (list): [read_seq, read_quality, ...] for read 1 and read 2
+            seq_list (list): contains allele names and read type (1 and 2) and its sequence in alignment 
+        """
+        read_name, read_data, future, key = in_flight_pair
+        seq_list = future.result()[0]
+        if key != None:
+            self.cache.put(key, seq_list)
+            del pending[key]
+
+        return read_name, read_data, seq_list
+
+class RunReport():
+    """
+    This class records where the time of a run goes. Per stage the wall time, CPU time of the thread and the
+    largest memory use (RSS) of the process at the end of the stage are recorded, the time of a stage does not
+    include the time of the stages it calls (e.g. reading the sam file while the next read pair is routed). Stages
+    in the aligner threads are recorded per thread, their time overlaps with the time the main thread waits for
+    the aligner. The time of each aligner call is kept for the latency percentiles. The CPU time of the process
+    and of its child processes (clustal omega) and their peak memory use are process-wide values, they are
+    reported once for the whole run.
+
+    The report is written as JSON file at the end of the run and as snapshot every interval seconds during the run.
+    Without report file nothing is recorded.
+
+    Args:
+        report_file (str): name of the JSON report file, default is None (no report)
+        interval (float): seconds between the snapshots of the report
+    """
+
+    def __init__(self, report_file = None, interval = 60):
+        self.report_file = report_file
+        self.interval = interval
+        self.stages = OrderedDict()
+        self.latencies = []
+        self.counters = OrderedDict()
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.start_time = time.perf_counter()
+        self.last_snapshot = self.start_time
+
+    @staticmethod
+    def get_usage():
+        """
+        Measures the wall time and CPU time of the current thread.
+
+        Args:
+            -
+        Returns:
+            usage (list): wall time and thread CPU time in seconds
+        """
+        return [time.perf_counter(), time.thread_time()]
+
+    @staticmethod
+    def get_process_rss_kb():
+        """
+        Reads the current memory use (RSS) of the whole process from /proc/self/statm.
+
+        Args:
+            -
+        Returns:
+            rss_kb (int): resident memory of the process in kB, None if /proc/self/statm can not be read
+        """
+        try:
+            with open('/proc/self/statm') as statm_file:
+                resident_pages = int(statm_file.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            return None
+
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') // 1024
+
+    @contextmanager
+    def measure(self, stage):
+        """
+        Records the time and memory use of a stage, the time of nested stages is subtracted.
+
+        Args:
+            stage (str): name of the stage
+        Yields:
+            -
+        """
+        if self.report_file == None:
+            yield
+            return
+        if hasattr(self.local, 'stack') == False:
+            self.local.stack = []
+        nested = [0.0, 0.0]   # time of the nested stages
+        self.local.stack.append(nested)
+        start = RunReport.get_usage()
+        try:
+            yield
+        finally:
+            end = RunReport.get_usage()
+            self.local.stack.pop()
+            total = [end[i] - start[i] for i in range(2)]
+            if len(self.local.stack) > 0:
+                for i in range(2):
+                    self.local.stack[-1][i] += total[i]
+            rss_kb = RunReport.get_process_rss_kb()
+            with self.lock:
+                if stage not in self.stages:
+                    self.stages[stage] = OrderedDict([('calls', 0), ('wall_seconds', 0.0), ('cpu_seconds', 0.0), ('max_process_rss_kb_at_end', None)])
+                stage_data = self.stages[stage]
+                stage_data['calls'] += 1
+                stage_data['wall_seconds'] += total[0] - nested[0]
+                stage_data['cpu_seconds'] += total[1] - nested[1]
+                if rss_kb != None and (stage_data['max_process_rss_kb_at_end'] == None or rss_kb > stage_data['max_process_rss_kb_at_end']):
+                    stage_data['max_process_rss_kb_at_end'] = rss_kb
+
+    def measure_iterable(self, stage, iterable):
+        """
+        Records the time of a stage that produces its items as a stream (generator).
+
+        Args:
+            stage (str): name of the stage
+            iterable (iterable): the items of the stage
+        Yields:
+            item (object): the items of the iterable
+        """
+        if self.report_file == None:
+            yield from iterable
+            return
+        iterator = iter(iterable)
+        while True:
+            with self.measure(stage):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def add_latency(self, seconds):
+        """
+        Adds the time of one aligner call.
+
+        Args:
+            seconds (float): wall time of the aligner call
+        Returns:
+            -
+        """
+        with self.lock:
+            self.latencies.append(seconds)
+
+    @staticmethod
+    def get_percentiles(values):
+        """
+        Calculates the percentiles (nearest rank) of the aligner call times.
+
+        Args:
+            values (list): times in seconds
+        Returns:
+            percentiles (OrderedDict): count, mean, p50, p90, p95, p99 and max
+        """
+        percentiles = OrderedDict([('count', len(values))])
+        if len(values) == 0:
+            return percentiles
+        values = sorted(values)
+        percentiles['mean'] = sum(values) / len(values)
+        for percentile in [50, 90, 95, 99]:
+            percentiles['p' + str(percentile)] = values[max(0, math.ceil(percentile / 100 * len(values)) - 1)]
+        percentiles['max'] = values[-1]
+
+        return percentiles
+
+    def get_report(self, complete):
+        """
+        Collects the report data. The CPU time and peak memory use of the run are process-wide, the child
+        process values include all finished clustal omega processes.
+
+        Args:
+            complete (bool): False for a snapshot during the run
+        Returns:
+            report (OrderedDict): totals, stages, aligner latency and counters
+        """
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        with self.lock:
+            report = OrderedDict()
+            report['complete'] = complete
+            report['wall_seconds'] = time.perf_counter() - self.start_time
+            report['process_cpu_seconds'] = usage.ru_utime + usage.ru_stime
+            report['child_processes_cpu_seconds'] = children.ru_utime + children.ru_stime
+            report['process_peak_rss_kb'] = usage.ru_maxrss
+            report['child_processes_peak_rss_kb'] = children.ru_maxrss
+            report['stages'] = OrderedDict((stage, OrderedDict(stage_data)) for stage, stage_data in self.stages.items())
+            report['aligner_latency_seconds'] = RunReport.get_percentiles(self.latencies)
+            report['counters'] = OrderedDict(self.counters)
+
+        return report
+
+    def write_report(self, complete = True):
+        """
+        Writes the report file, the previous snapshot is replaced at once.
+
+        Args:
+            complete (bool): False for a snapshot during the run
+        Returns:
+            -
+        """
+        if self.report_file == None:
+            return
+        with open(self.report_file + '.tmp', 'w') as db_file:
+            json.dump(self.get_report(complete), db_file, indent=2)
+        os.replace(self.report_file + '.tmp', self.report_file)
+        self.last_snapshot = time.perf_counter()
+
+    def write_snapshot(self):
+        """
+        Writes a snapshot of the report if the interval has passed since the last one.
+
+        Args:
+            -
+        Returns:
+            -
+        """
+        if self.report_file != None and time.perf_counter() - self.last_snapshot >= self.interval:
+            self.write_report(False)
+
+def parse_arguments(arguments):
+    """
+    Parses the command line arguments.
+
+    Args:
+        arguments (list): command line arguments, without the script name
+    Returns:
+        parsed_arguments (argparse.Namespace): the parsed command line arguments
+    """
+    parser = argparse.ArgumentParser(description='Multiple sequence alignment of read pairs and alleles with Clustal Omega.')
+    parser.add_argument('data_type', nargs='+', help="'HLA-A', 'HLA-B' and/or 'HLA-C', the read pairs of multiple loci are divided over their output files")
+    parser.add_argument('samfile', help='sam file with the paired-end reads')
+    parser.add_argument('--allele-fasta', required=True, help='fasta file with the allele sequences, e.g. the IMGT/HLA hla_gen.fasta')
+    parser.add_argument('--alleles', nargs='+', default=None, help='names of the 5 or 6 alleles of the sample, required if the allele fasta file contains more than 6 sequences (default: all sequences in the allele fasta file)')
+    parser.add_argument('--workers', type=int, default=1, help='number of read pairs aligned at the same time (default: 1)')
+    parser.add_argument('--threads', type=int, default=None, help='number of threads per clustal omega process (default: available CPUs divided by the workers)')
+    parser.add_argument('--scratch-dir', default=None, help='directory for the sorted files of reads without mate (default: system temp directory)')
+    parser.add_argument('--aligner', choices=['clustal', 'profile', 'builtin'], default='clustal', help="'clustal': align the alleles again for each read pair, 'profile': align the alleles once and the reads against this profile, 'builtin': place the reads into the allele alignment without external program (default: clustal)")
+    parser.add_argument('--allele-alignment', default=None, help='fasta file with the aligned alleles, used by the profile and builtin aligner (default: aligned once with clustal omega)')
+    parser.add_argument('--band', type=int, default=32, help='extra alignment columns at both sides of the read for the builtin aligner (default: 32)')
+    parser.add_argument('--cigar-projection', action='store_true', help='place reads into the allele alignment with their sam position and CIGAR string, ambiguous read pairs are aligned')
+    parser.add_argument('--reference', default=None, help='fasta file with the sam reference sequence(s), needed for CIGAR projection if the reference is not one of the alleles')
+    parser.add_argument('--cache', default=None, help='sqlite file in which the alignments are cached, identical read pairs are then aligned only once (default: no cache)')
+    parser.add_argument('--cache-size', type=int, default=100000, help='maximum number of alignments in the cache, the least recently used are removed (default: 100000)')
+    parser.add_argument('--max-unpaired', type=int, default=100000, help='maximum number of reads without mate kept in memory, more are sorted on disk (default: 100000)')
+    parser.add_argument('--fast-path', action='store_true', help='classify read pairs that exactly match the alleles without alignment (prefiltered_reads_HLA-X.txt)')
+    parser.add_argument('--resume', action='store_true', help='continue an interrupted run, read pairs in the output file are skipped and an incomplete last read pair is removed')
+    parser.add_argument('--binary-output', action='store_true', help='write the alignments in the binary format (msa_output_samfile_reads_HLA-X.msa) instead of text')
+    parser.add_argument('--codec', choices=['none', 'zlib', 'bz2', 'lzma'], default='zlib', help='block compression of the binary output (default: zlib)')
+    parser.add_argument('--delta-rows', action='store_true', help='binary output: store the allele rows once, read pairs only contain the gap columns inserted for their reads')
+    parser.add_argument('--report', default=None, help='JSON file with the time and memory use per stage, the process-wide totals and the aligner latency (default: no report)')
+    parser.add_argument('--report-interval', type=float, default=60, help='seconds between the snapshots of the report during the run (default: 60)')
+    parsed_arguments = parser.parse_args(arguments)
+    if parsed_arguments.delta_rows == True and parsed_arguments.binary_output == False:
+        parser.error('--delta-rows requires --binary-output')
+
+    if parsed_arguments.threads == None:
+        parsed_arguments.threads = max(1, (os.cpu_count() or 1) // max(1, parsed_arguments.workers))
+
+    return parsed_arguments
+
+def main():
+    """
+    This is the main function of the script which calls the methods. The number of alleles can be 5 or 6.
+
+    Args:
+       -
+    Returns:
+        -
+    """
+
+    arguments = parse_arguments(argv[1:])
+    loci = arguments.data_type # 'HLA-A', 'HLA-B' and/or 'HLA-C'
+    samfile = arguments.samfile
+
+    output_file_names = {}
+    prefiltered_file_names = {}
+    for data_type in loci:
+        output_file_names[data_type] = 'msa_output_samfile_reads_{0}.txt'.format(data_type)
+        if arguments.binary_output == True:
+            output_file_names[data_type] = 'msa_output_samfile_reads_{0}.msa'.format(data_type)
+        prefiltered_file_names[data_type] = 'prefiltered_reads_{0}.txt'.format(data_type)
+    profile = None
+    profile_created = False
+    report = RunReport(arguments.report, arguments.report_interval)
+
+    # Parse sam file, the read pairs are read as a stream
+    sam_reader = SamReader(samfile, arguments.max_unpaired, arguments.scratch_dir)
+
+    # Select the alleles (5 or 6) by name from the indexed allele fasta file
+    with report.measure('select alleles'):
+        allele_index = AlleleIndex(arguments.allele_fasta)
+        allele_names = arguments.alleles
+        if allele_names == None:
+            allele_names = allele_index.allele_names
+            if len(allele_names) > 6:
+                raise ValueError ('The allele fasta file contains {0} alleles, select the 5 or 6 alleles of the sample with --alleles!'.format(len(allele_names)))
+        if len(allele_names) != 5 and len(allele_names) != 6:
+            raise ValueError ('The number of alleles must be 5 or 6!')
+        alleles = allele_index.get_alleles(allele_names)
+        router = LocusRouter(loci, alleles)
+
+    # Align the alleles once, the read pairs are aligned against (or placed into) this profile
+    if arguments.aligner != 'clustal' or arguments.cigar_projection == True or arguments.fast_path == True:
+        with report.measure('allele alignment'):
+            profile = arguments.allele_alignment
+            if profile == None:
+                profile = allele_index.get_allele_alignment(alleles, arguments.threads)
+                profile_created = True
+            with open(profile) as file_object:
+                allele_alignment = ParseInput.get_fasta_sequences(file_object.read())
+
+    if arguments.aligner == 'builtin':
+        aligner = BandedAligner(allele_alignment, arguments.band)
+    if arguments.aligner == 'profile':
+        aligner = ClustalAligner(alleles, arguments.threads, profile, report)
+    if arguments.aligner == 'clustal':
+        aligner = ClustalAligner(alleles, arguments.threads, report=report)
+
+    # Map the sam reference(s) onto the allele alignment for the CIGAR projection
+    projection = None
+    if arguments.cigar_projection == True:
+        references = []
+        if arguments.reference != None:
+            with open(arguments.reference) as file_object:
+                references = ParseInput.get_fasta_sequences(file_object.read())
+        banded_aligner = None
+        if arguments.aligner == 'builtin':
+            banded_aligner = aligner
+        reference_maps = CigarProjection.create_reference_maps(references, allele_alignment, banded_aligner)
+        for allele, seq in allele_alignment:   # reads mapped to one of the alleles
+            if allele not in reference_maps:
+                reference_maps[allele] = [i for i, char in enumerate(seq) if char != '-']
+        projection = CigarProjection(allele_alignment, reference_maps)
+
+    # Resume an interrupted run, only complete read pairs are kept in the output files
+    completed_read_names = set()
+    if arguments.resume == True:
+        with report.measure('resume'):
+            for data_type in loci:
+                if os.path.isfile(output_file_names[data_type]) == True:
+                    if arguments.binary_output == True:
+                        read_names, complete_size = MsaReader(output_file_names[data_type]).scan()
+                    if arguments.binary_output == False:
+                        read_names, complete_size = PerformMSA.scan_output(output_file_names[data_type])
+                    completed_read_names |= read_names
+                    if complete_size == 0:
+                        os.remove(output_file_names[data_type])
+                    else:
+                        os.truncate(output_file_names[data_type], complete_size)
+                if os.path.isfile(prefiltered_file_names[data_type]) == True:
+                    completed_read_names |= ExactMatchClassifier.scan_output(prefiltered_file_names[data_type])
+            print ('Read pairs already aligned:', len(completed_read_names))
+    # The sam file is read once, all read pairs are counted while they are routed
+    read_pairs = report.measure_iterable('read sam file', sam_reader)
+    read_pairs = report.measure_iterable('route read pairs', router.route_read_pairs(read_pairs))
+    read_pairs = router.skip_read_pairs(read_pairs, completed_read_names)
+
+    # Create output files including header, the number of read pairs is filled in at the end of the run
+    for data_type in loci:
+        output_file_name = output_file_names[data_type]
+        prefiltered_file_name = prefiltered_file_names[data_type]
+        if os.path.isfile(output_file_name) == True:
+            continue
+        header = ''
+        if arguments.aligner == 'builtin':
+            header += 'Sequences aligned with the ' + aligner.get_description() + '\n'
+        if arguments.aligner != 'builtin':
+            header += 'Sequences aligned with Clustal Omega version 1.2.4 \n' 
+        if profile_created == True:
+            header += 'Allele profile created with: ' + PerformMSA.get_profile_command(arguments.threads) + '\n'
+        if profile != None:
+            header += 'Allele profile: ' + os.path.basename(profile) + '\n'
+        if arguments.aligner == 'profile':
+            header += 'Command line used: ' + PerformMSA.get_clustal_command(arguments.threads, profile=os.path.basename(profile)) + '\n'
+        if arguments.aligner == 'clustal':
+            header += 'Command line used: ' + PerformMSA.get_clustal_command(arguments.threads) + '\n'
+        if projection != None:
+            header += 'Unambiguous read pairs placed with ' + projection.get_description() + '\n'
+        if arguments.fast_path == True:
+            header += 'Exactly matching read pairs classified without alignment: ' + prefiltered_file_name + '\n'
+        header += 'Reads from sam file: ' + samfile + '\n' 
+        header += PerformMSA.get_read_pair_count_line()
+        if arguments.binary_output == True:
+            MsaWriter(output_file_name, header).close()
+        if arguments.binary_output == False:
+            with open(output_file_name, 'w') as db_file:
+                db_file.write(header + '$$$\n')
+
+    # Classify the exactly matching read pairs without alignment, the prefiltered output files are kept open
+    classifier = None
+    prefiltered_writers = None
+    if arguments.fast_path == True:
+        classifier = ExactMatchClassifier(allele_alignment)
+        ExactMatchClassifier.create_output(prefiltered_file_names)
+        prefiltered_writers = OutputWriters(list(prefiltered_file_names.values()))
+        read_pairs = report.measure_iterable('fast path', classifier.filter_read_pairs(read_pairs, prefiltered_writers, prefiltered_file_names, router))
+
+    # Loop trough each read pair, the read pairs are aligned by the workers in the alignment pool
+    cache = None
+    if arguments.cache != None:
+        cache = AlignmentCache(arguments.cache, alleles, aligner.get_cache_options(), arguments.cache_size)
+    alignment_pool = AlignmentPool(aligner, arguments.workers, projection, cache, report)
+    msa_writers = {}
+    if arguments.binary_output == True:
+        for data_type in loci:
+            msa_writers[data_type] = MsaWriter(output_file_names[data_type], codec=arguments.codec, delta_rows=arguments.delta_rows)
+    try:
+        for read_name, value, seq_list in report.measure_iterable('alignment pool', alignment_pool.align_read_pairs(read_pairs)):
+            read1 = value[0][0] 
+            read2 = value[1][0]
+            qv_read1 = value[0][1]
+            qv_read2 = value[1][1]
+
+            # Add read and alignment data to output file
+            with report.measure('write output'):
+                data_type = router.pop_locus(read_name)
+                if arguments.binary_output == True:
+                    msa_writers[data_type].write_record(read_name, read1, qv_read1, read2, qv_read2, PerformMSA.get_output_rows(seq_list))
+                if arguments.binary_output == False:
+                    PerformMSA.write_output(output_file_names[data_type], seq_list, read_name, read1, read2, qv_read1, qv_read2)
+            report.counters['read_pairs_written'] = report.counters.get('read_pairs_written', 0) + 1
+            report.write_snapshot()
+    finally:
+        with report.measure('write output'):
+            for msa_writer in msa_writers.values():
+                msa_writer.close()
+            if prefiltered_writers != None:
+                prefiltered_writers.close()
+        if cache != None:
+            cache.close()
+
+    # Fill in the number of read pairs per locus in the headers
+    with report.measure('write output'):
+        for data_type in loci:
+            PerformMSA.write_read_pair_count(output_file_names[data_type], router.read_pair_counts[data_type])
 
-        # Perform MSAa for 6 alleles
-        if allele6 != None:
-            PerformMSA.create_input_for_clustal(read1, read2, allele1, allele2, allele3, allele4, allele5, allele6)
+    if len(loci) > 1:
+        print ('Read pairs without clear locus (not aligned):', router.unrouted_count)
+    if classifier != None:
+        print ('Non hybrid read pairs classified without alignment:', classifier.non_hybrid_count)
+        print ('Zero read pairs classified without alignment:', classifier.zero_count)
+    if cache != None:
+        print ('Alignment cache hits:', cache.hits)
+        print ('Alignment cache misses:', cache.misses)
 
-        PerformMSA.use_clustal()
+    if projection != None:
+        print ('Read pairs placed with CIGAR projection:', projection.projected_count)
+        print ('Read pairs aligned (ambiguous projection):', projection.ambiguous_count)
 
-        # Create output data and add read and alignment data to output file
-        seq_list = PerformMSA.create_output()
-        PerformMSA.write_output(output_file_name, seq_list, read_name, read1, read2, qv_read1, qv_read2)
+    # Write the report with the time per stage and the counters of the run
+    if len(loci) > 1:
+        report.counters['unrouted_read_pairs'] = router.unrouted_count
+    if classifier != None:
+        report.counters['non_hybrid_read_pairs_classified'] = classifier.non_hybrid_count
+        report.counters['zero_read_pairs_classified'] = classifier.zero_count
+    if cache != None:
+        report.counters['cache_hits'] = cache.hits
+        report.counters['cache_misses'] = cache.misses
+    if projection != None:
+        report.counters['projected_read_pairs'] = projection.projected_count
+        report.counters['ambiguous_read_pairs'] = projection.ambiguous_count
+    report.write_report()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,674 @@
+"""
+17-10-'26
+
+Binary format for the msa output of AlignReads.py, which is the input of SelectHybridReads.py. The text format repeats
+every allele name and its aligned sequence as text for every read pair. In the binary format the read pairs are stored
+as length-prefixed records in blocks. Each block contains a table with the row names (allele names, 'Read1' and
+'Read2'), the records refer to the names by number. A block can be compressed with zlib, bz2 or lzma (standard library).
+
+The allele rows are (nearly) the same for all read pairs, they only differ by the gap columns that are inserted for
+the reads. With delta rows the allele rows are stored once per file (reference alignment, without the columns in
+which all alleles have a gap). A read pair then only contains the aligned span of each read (from its first to its
+last nucleotide) with the number of gaps in front of it, and the columns in which all alleles have a gap; read pairs
+with other allele rows are stored completely. The read rows are rebuilt to the full alignment width when the read
+pair is read, the allele rows when they are used.
+
+File layout:
+    magic (b'HybridReadMSA\\x01'), header length (uint32) and header text (the header lines of the text format)
+    blocks: block type (uint8), codec (uint8), data length (uint32), stored length (uint32), CRC32 of the data
+            (uint32), stored data
+    read pair block data (type 0): number of names (uint16), names, number of records (uint32), records
+    record: record length (uint32), record type (uint8), read name, read 1, quality values read 1, read 2,
+            quality values read 2, number of rows (uint16) and per row the name number (uint16) and the aligned
+            sequence. Record type 0 contains all rows, record type 1 (delta rows) only the read rows, each with
+            the number of gaps in front of the read (uint32) before its aligned span, followed by the number of gap
+            columns (uint32) and the gap columns (uint32)
+    reference alignment block data (type 1): number of rows (uint16) and per row the name and the aligned sequence
+All numbers are little-endian, texts are prefixed with their length (uint16 for names, uint32 for sequences).
+
+Use:
+    Command line: python3 MsaOutputFormat.py to-binary msa_output_samfile_reads_HLA-X.txt msa_output_samfile_reads_HLA-X.msa [--codec zlib] [--delta-rows]
+                  python3 MsaOutputFormat.py to-text msa_output_samfile_reads_HLA-X.msa msa_output_samfile_reads_HLA-X.txt
+
+"""
+
+from sys import argv
+from collections.abc import Sequence
+import argparse
+import bz2
+import lzma
+import os
+import struct
+import zlib
+
+MAGIC = b'HybridReadMSA\x01'
+READ_PAIR_BLOCK = 0
+REFERENCE_BLOCK = 1
+
+class AlignedRows(Sequence):
+    """
+    This class contains the rows (name and aligned sequence) of a read pair. The rows after the given rows are
+    rebuilt from the reference alignment each time they are used, by inserting the gap columns. A slice (step 1)
+    gives AlignedRows again, so its reference alignment rows are not rebuilt either.
+
+    Args:
+        rows (list): the given rows, [name, aligned sequence]
+        reference (list): reference alignment rows without the gap columns, (name, aligned sequence)
+        gap_columns (list): columns (ascending) in which the reference alignment rows have an inserted gap
+    """
+
+    def __init__(self, rows, reference = None, gap_columns = None):
+        self.rows = rows
+        self.reference = reference
+        if reference == None:
+            self.reference = []
+        self.gap_columns = gap_columns
+        if gap_columns == None:
+            self.gap_columns = []
+
+    def __len__(self):
+        return len(self.rows) + len(self.reference)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            stop = max(start, stop)
+            return AlignedRows(self.rows[start:stop], self.reference[max(start - len(self.rows), 0):max(stop - len(self.rows), 0)], self.gap_columns)
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError ('Row index out of range!')
+        if index < len(self.rows):
+            return self.rows[index]
+        name, sequence = self.reference[index - len(self.rows)]
+
+        return [name, AlignedRows.insert_gap_columns(sequence, self.gap_columns)]
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence) == False:
+            return NotImplemented
+        return list(self) == list(other)
+
+    def get_names(self):
+        """
+        Gets the row names, without rebuilding the reference alignment rows.
+
+        Args:
+            -
+        Returns:
+            names (list): names of the rows
+        """
+        return [row[0] for row in self.rows] + [name for name, sequence in self.reference]
+
+    def with_leading_rows(self, leading_rows):
+        """
+        Adds rows in front of the rows, the reference alignment rows are still rebuilt when they are used.
+
+        Args:
+            leading_rows (list): rows to add in front, e.g. the read information lines
+        Returns:
+            aligned_rows (AlignedRows): the rows with the leading rows
+        """
+        return AlignedRows(leading_rows + list(self.rows), self.reference, self.gap_columns)
+
+    @staticmethod
+    def insert_gap_columns(sequence, gap_columns):
+        """
+        Inserts gaps into an aligned sequence.
+
+        Args:
+            sequence (str): aligned sequence without the gap columns
+            gap_columns (list): columns (ascending) of the gaps in the final sequence
+        Returns:
+            sequence (str): aligned sequence with the gap columns
+        """
+        if len(gap_columns) == 0:
+            return sequence
+        pieces = []
+        start = 0
+        for i, column in enumerate(gap_columns):
+            pieces += [sequence[start:column - i], '-']
+            start = column - i
+        pieces += [sequence[start:]]
+
+        return ''.join(pieces)
+
+    @staticmethod
+    def remove_gap_columns(rows):
+        """
+        Removes the columns in which all rows have a gap.
+
+        Args:
+            rows (list): rows, name and aligned sequence
+        Returns:
+            gap_columns (list): columns in which all rows have a gap
+            rows (list): rows (name, aligned sequence) without the gap columns
+        """
+        sequences = [sequence for name, sequence in rows]
+        gap_columns = [i for i, column in enumerate(zip(*sequences)) if column.count('-') == len(column)]
+        if len(gap_columns) == 0:
+            return gap_columns, [(name, sequence) for name, sequence in rows]
+
+        stripped_rows = []
+        for name, sequence in rows:
+            pieces = []
+            start = 0
+            for column in gap_columns:
+                pieces += [sequence[start:column]]
+                start = column + 1
+            pieces += [sequence[start:]]
+            stripped_rows += [(name, ''.join(pieces))]
+
+        return gap_columns, stripped_rows
+
+class Codec:
+    """
+    This class compresses and decompresses the blocks with a codec from the standard library.
+
+    Args:
+        -
+    """
+    names = ['none', 'zlib', 'bz2', 'lzma']
+
+    @staticmethod
+    def compress(codec_number, data):
+        """
+        Compresses the data of a block.
+
+        Args:
+            codec_number (int): index of the codec in Codec.names
+            data (bytes): block data
+        Returns:
+            stored_data (bytes): compressed block data
+        """
+        if codec_number == 0:
+            return data
+        if codec_number == 1:
+            return zlib.compress(data, 6)
+        if codec_number == 2:
+            return bz2.compress(data)
+        if codec_number == 3:
+            return lzma.compress(data)
+        raise ValueError ('Unknown codec!')
+
+    @staticmethod
+    def decompress(codec_number, stored_data):
+        """
+        Decompresses the data of a block.
+
+        Args:
+            codec_number (int): index of the codec in Codec.names
+            stored_data (bytes): compressed block data
+        Returns:
+            data (bytes): block data
+        """
+        if codec_number == 0:
+            return stored_data
+        if codec_number == 1:
+            return zlib.decompress(stored_data)
+        if codec_number == 2:
+            return bz2.decompress(stored_data)
+        if codec_number == 3:
+            return lzma.decompress(stored_data)
+        raise ValueError ('Unknown codec!')
+
+class MsaWriter:
+    """
+    This class writes read pairs into a binary msa output file. The read pairs are collected in a block, the block is
+    written when it contains block_size read pairs and when the writer is closed. A new file starts with the header,
+    an existing file is extended with new blocks.
+
+    With delta rows the allele rows of the first read pair (without the gap columns) are written once as reference
+    alignment, for an existing file the reference alignment is taken from the file.
+
+    Args:
+        file_name (str): name of the binary msa output file
+        header (str): header lines of the text format, only used for a new file
+        codec (str): 'none', 'zlib', 'bz2' or 'lzma'
+        block_size (int): number of read pairs per block
+        delta_rows (bool): store the allele rows as gap columns in the reference alignment
+    """
+
+    def __init__(self, file_name, header = '', codec = 'zlib', block_size = 256, delta_rows = False):
+        if codec not in Codec.names:
+            raise ValueError ('Unknown codec, use none, zlib, bz2 or lzma!')
+        self.codec_number = Codec.names.index(codec)
+        self.block_size = block_size
+        self.delta_rows = delta_rows
+        self.reference = None
+        self.names = {}
+        self.records = []
+        if os.path.isfile(file_name) == False:
+            with open(file_name, 'wb') as db_file:
+                header = header.encode()
+                db_file.write(MAGIC + struct.pack('<I', len(header)) + header)
+        elif delta_rows == True:
+            self.reference = MsaReader(file_name).read_reference()
+        self.file_object = open(file_name, 'ab')
+
+    def write_record(self, read_name, read1, qv_read1, read2, qv_read2, rows):
+        """
+        Adds a read pair to the current block.
+
+        Args:
+            read_name (str): read name
+            read1 (str): sequence read 1
+            qv_read1 (str): quality values read 1
+            read2 (str): sequence read 2
+            qv_read2 (str): quality values read 2
+            rows (list): names and aligned sequences, first 'Read1' and 'Read2', then the alleles
+        Returns:
+            -
+        """
+        record_type = 0
+        if self.delta_rows == True:
+            gap_columns, allele_rows = AlignedRows.remove_gap_columns(rows[2:])
+            if self.reference == None:
+                self.reference = allele_rows
+                self.write_reference()
+            if allele_rows == self.reference:
+                record_type = 1
+                rows = rows[:2]
+
+        record = [struct.pack('<B', record_type), MsaWriter.pack_text(read_name, 'H')]
+        for text in (read1, qv_read1, read2, qv_read2):
+            record += [MsaWriter.pack_text(text, 'I')]
+        record += [struct.pack('<H', len(rows))]
+        for name, sequence in rows:
+            if name not in self.names:
+                self.names[name] = len(self.names)
+            record += [struct.pack('<H', self.names[name])]
+            if record_type == 1:
+                record += [struct.pack('<I', len(sequence) - len(sequence.lstrip('-')))]
+                sequence = sequence.strip('-')
+            record += [MsaWriter.pack_text(sequence, 'I')]
+        if record_type == 1:
+            record += [struct.pack('<I%dI' % len(gap_columns), len(gap_columns), *gap_columns)]
+        record = b''.join(record)
+        self.records += [struct.pack('<I', len(record)) + record]
+
+        if len(self.records) >= self.block_size:
+            self.write_block()
+
+    @staticmethod
+    def pack_text(text, length_format):
+        """
+        Encodes a text prefixed with its length.
+
+        Args:
+            text (str): the text
+            length_format (str): struct format of the length, 'H' (uint16) or 'I' (uint32)
+        Returns:
+            packed_text (bytes): length and text
+        """
+        text = text.encode()
+
+        return struct.pack('<' + length_format, len(text)) + text
+
+    def write_block(self):
+        """
+        Writes the collected read pairs as one block, together with the names they refer to.
+
+        Args:
+            -
+        Returns:
+            -
+        """
+        if len(self.records) == 0:
+            return
+
+        names = sorted(self.names.items(), key=lambda kv: kv[1])
+        data = [struct.pack('<H', len(names))] + [MsaWriter.pack_text(name, 'H') for name, name_number in names]
+        data += [struct.pack('<I', len(self.records))] + self.records
+        self.write_data(READ_PAIR_BLOCK, b''.join(data))
+        self.names = {}
+        self.records = []
+
+    def write_reference(self):
+        """
+        Writes the reference alignment (allele rows without gap columns) as a block.
+
+        Args:
+            -
+        Returns:
+            -
+        """
+        data = [struct.pack('<H', len(self.reference))]
+        for name, sequence in self.reference:
+            data += [MsaWriter.pack_text(name, 'H'), MsaWriter.pack_text(sequence, 'I')]
+        self.write_data(REFERENCE_BLOCK, b''.join(data))
+
+    def write_data(self, block_type, data):
+        """
+        Compresses the block data and writes the block.
+
+        Args:
+            block_type (int): READ_PAIR_BLOCK or REFERENCE_BLOCK
+            data (bytes): block data
+        Returns:
+            -
+        """
+        stored_data = Codec.compress(self.codec_number, data)
+        self.file_object.write(struct.pack('<BBIII', block_type, self.codec_number, len(data), len(stored_data), zlib.crc32(data)) + stored_data)
+        self.file_object.flush()
+
+    def close(self):
+        """
+        Writes the last block and closes the file.
+
+        Args:
+            -
+        Returns:
+            -
+        """
+        self.write_block()
+        self.file_object.close()
+
+class MsaReader:
+    """
+    This class reads a binary msa output file, block by block.
+
+    Args:
+        file_name (str): name of the binary msa output file
+    """
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+        with open(file_name, 'rb') as file_object:
+            self.header, self.data_start = MsaReader.read_header(file_object)
+
+    @staticmethod
+    def is_binary(file_name):
+        """
+        Checks whether a file is a binary msa output file.
+
+        Args:
+            file_name (str): name of the file
+        Returns:
+            is_binary (bool): True if the file starts with the binary format magic
+        """
+        with open(file_name, 'rb') as file_object:
+            return file_object.read(len(MAGIC)) == MAGIC
+
+    @staticmethod
+    def read_header(file_object):
+        """
+        Reads the magic and header of a binary msa output file.
+
+        Args:
+            file_object (file): binary file object at the start of the file
+        Returns:
+            header (str): header lines of the text format
+            data_start (int): file position of the first block
+        """
+        if file_object.read(len(MAGIC)) != MAGIC:
+            raise ValueError ('File is not a binary msa output file!')
+        header_length = struct.unpack('<I', file_object.read(4))[0]
+        header = file_object.read(header_length).decode()
+
+        return header, len(MAGIC) + 4 + header_length
+
+    def read_blocks(self):
+        """
+        Reads the blocks, a truncated last block (e.g. after a crash) is ignored.
+
+        Args:
+            -
+        Yields:
+            block_end (int): file position after the block
+            block_type (int): READ_PAIR_BLOCK or REFERENCE_BLOCK
+            data (bytes): the decompressed block data
+        """
+        with open(self.file_name, 'rb') as file_object:
+            file_object.seek(self.data_start)
+            block_end = self.data_start
+            while True:
+                block_header = file_object.read(14)
+                if len(block_header) < 14:
+                    return
+                block_type, codec_number, data_length, stored_length, crc = struct.unpack('<BBIII', block_header)
+                stored_data = file_object.read(stored_length)
+                if len(stored_data) < stored_length:
+                    return
+                data = Codec.decompress(codec_number, stored_data)
+                if len(data) != data_length or zlib.crc32(data) != crc:
+                    raise ValueError ('Block in binary msa output file is corrupt!')
+                block_end += 14 + stored_length
+                yield block_end, block_type, data
+
+    def read_reference(self):
+        """
+        Reads the reference alignment of the delta rows.
+
+        Args:
+            -
+        Returns:
+            reference (list): reference alignment rows (name, aligned sequence), None if the file has none
+        """
+        for block_end, block_type, data in self.read_blocks():
+            if block_type == REFERENCE_BLOCK:
+                return MsaReader.unpack_reference(data)
+
+        return None
+
+    @staticmethod
+    def unpack_reference(data):
+        """
+        Decodes the reference alignment block.
+
+        Args:
+            data (bytes): block data
+        Returns:
+            reference (list): reference alignment rows (name, aligned sequence)
+        """
+        reference = []
+        pos = 2
+        for i in range(struct.unpack_from('<H', data, 0)[0]):
+            name, pos = MsaReader.unpack_text(data, pos, 'H')
+            sequence, pos = MsaReader.unpack_text(data, pos, 'I')
+            reference += [(name, sequence)]
+
+        return reference
+
+    def __iter__(self):
+        """
+        Reads the read pairs.
+
+        Args:
+            -
+        Yields:
+            read_name (str): read name
+            read1 (str): sequence read 1
+            qv_read1 (str): quality values read 1
+            read2 (str): sequence read 2
+            qv_read2 (str): quality values read 2
+            rows (AlignedRows): names and aligned sequences, first 'Read1' and 'Read2', then the alleles
+        """
+        reference = None
+        for block_end, block_type, data in self.read_blocks():
+            if block_type == REFERENCE_BLOCK:
+                reference = MsaReader.unpack_reference(data)
+                continue
+            pos = 0
+            name_count = struct.unpack_from('<H', data, pos)[0]
+            pos += 2
+            names = []
+            for i in range(name_count):
+                name, pos = MsaReader.unpack_text(data, pos, 'H')
+                names += [name]
+            record_count = struct.unpack_from('<I', data, pos)[0]
+            pos += 4
+            for i in range(record_count):
+                record_type = struct.unpack_from('<B', data, pos + 4)[0]
+                pos += 5   # record length and type
+                read_name, pos = MsaReader.unpack_text(data, pos, 'H')
+                texts = []
+                for j in range(4):
+                    text, pos = MsaReader.unpack_text(data, pos, 'I')
+                    texts += [text]
+                row_count = struct.unpack_from('<H', data, pos)[0]
+                pos += 2
+                rows = []
+                starts = []
+                for j in range(row_count):
+                    name_number = struct.unpack_from('<H', data, pos)[0]
+                    pos += 2
+                    if record_type == 1:
+                        starts += [struct.unpack_from('<I', data, pos)[0]]
+                        pos += 4
+                    sequence, pos = MsaReader.unpack_text(data, pos, 'I')
+                    rows += [[names[name_number], sequence]]
+                if record_type == 0:
+                    rows = AlignedRows(rows)
+                if record_type == 1:
+                    gap_count = struct.unpack_from('<I', data, pos)[0]
+                    gap_columns = list(struct.unpack_from('<%dI' % gap_count, data, pos + 4))
+                    pos += 4 + 4 * gap_count
+                    width = len(reference[0][1]) + gap_count
+                    for row, start in zip(rows, starts):
+                        row[1] = ('-' * start + row[1]).ljust(width, '-')
+                    rows = AlignedRows(rows, reference, gap_columns)
+                yield read_name, texts[0], texts[1], texts[2], texts[3], rows
+
+    @staticmethod
+    def unpack_text(data, pos, length_format):
+        """
+        Decodes a text prefixed with its length.
+
+        Args:
+            data (bytes): block data
+            pos (int): position of the length
+            length_format (str): struct format of the length, 'H' (uint16) or 'I' (uint32)
+        Returns:
+            text (str): the text
+            pos (int): position after the text
+        """
+        length_format = '<' + length_format
+        length = struct.unpack_from(length_format, data, pos)[0]
+        pos += struct.calcsize(length_format)
+
+        return data[pos:pos + length].decode(), pos + length
+
+    def scan(self):
+        """
+        Scans the file for the read pairs that are completely written. Used to resume an interrupted run.
+
+        Args:
+            -
+        Returns:
+            read_names (set): names of the read pairs in complete blocks
+            complete_size (int): size of the file up to the last complete block
+        """
+        read_names = set()
+        complete_size = self.data_start
+        for block_end, block_type, data in self.read_blocks():
+            complete_size = block_end
+        for read_pair in self:
+            read_names.add(read_pair[0])
+
+        return read_names, complete_size
+
+class ConvertFormat:
+    """
+    This class converts msa output files between the text and binary format.
+
+    Args:
+        -
+    """
+
+    @staticmethod
+    def read_text_records(file_object):
+        """
+        Reads the read pairs one at a time from a text msa output file, line by line. A read pair is yielded when its
+        closing '$$$' is read, an incomplete last read pair is left out.
+
+        Args:
+            file_object (file): text msa output file, opened after the header
+        Yields:
+            lines (list): the tab separated lines of one read pair, as lists
+        """
+        lines = []
+        for line in file_object:
+            line = line.rstrip('\n')
+            if line == '$$$':
+                if len(lines) != 0:
+                    yield lines
+                lines = []
+            elif line != '':
+                lines += [line.split('\t')]
+
+    @staticmethod
+    def text_to_binary(text_file_name, binary_file_name, codec = 'zlib', delta_rows = False):
+        """
+        Converts a text msa output file into a binary msa output file. The text file is read one read pair at a time.
+
+        Args:
+            text_file_name (str): name of the text msa output file
+            binary_file_name (str): name of the new binary msa output file
+            codec (str): 'none', 'zlib', 'bz2' or 'lzma'
+            delta_rows (bool): store the allele rows as gap columns in the reference alignment
+        Returns:
+            -
+        """
+        if os.path.isfile(binary_file_name) == True:
+            os.remove(binary_file_name)
+
+        with open(text_file_name) as file_object:
+            header = ''
+            for line in file_object:
+                if line == '$$$\n':
+                    break
+                header += line
+            msa_writer = MsaWriter(binary_file_name, header, codec, delta_rows=delta_rows)
+            for lines in ConvertFormat.read_text_records(file_object):
+                rows = [(line[0], line[1]) for line in lines[2:]]
+                msa_writer.write_record(lines[0][0], lines[0][1], lines[0][2], lines[1][1], lines[1][2], rows)
+        msa_writer.close()
+
+    @staticmethod
+    def binary_to_text(binary_file_name, text_file_name):
+        """
+        Converts a binary msa output file into a text msa output file, as written by AlignReads.py.
+
+        Args:
+            binary_file_name (str): name of the binary msa output file
+            text_file_name (str): name of the new text msa output file
+        Returns:
+            -
+        """
+        msa_reader = MsaReader(binary_file_name)
+        with open(text_file_name, 'w') as db_file:
+            db_file.write(msa_reader.header + '$$$\n')
+            for read_name, read1, qv_read1, read2, qv_read2, rows in msa_reader:
+                db_file.write(read_name + '\t' + read1 + '\t' + qv_read1 + '\n')
+                db_file.write(read_name + '\t' + read2 + '\t' + qv_read2 + '\n')
+                for name, sequence in rows:
+                    db_file.write(name + '\t' + sequence + '\n')
+                db_file.write('$$$\n')
+
+def main():
+    """
+    This is the main function of the script, it converts an msa output file to the other format.
+
+    Args:
+       -
+    Returns:
+        -
+    """
+    parser = argparse.ArgumentParser(description='Converts msa output files of AlignReads.py between the text and binary format.')
+    parser.add_argument('direction', choices=['to-binary', 'to-text'], help="'to-binary': text to binary, 'to-text': binary to text")
+    parser.add_argument('input_file', help='msa output file to convert')
+    parser.add_argument('output_file', help='converted msa output file')
+    parser.add_argument('--codec', choices=Codec.names, default='zlib', help='block compression of the binary format (default: zlib)')
+    parser.add_argument('--delta-rows', action='store_true', help='store the allele rows once, read pairs only contain their gap columns')
+    arguments = parser.parse_args(argv[1:])
+
+    if arguments.direction == 'to-binary':
+        ConvertFormat.text_to_binary(arguments.input_file, arguments.output_file, arguments.codec, arguments.delta_rows)
+    if arguments.direction == 'to-text':
+        ConvertFormat.binary_to_text(arguments.input_file, arguments.output_file)
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,114 @@ This script categorizes reads in non hybrid reads, zero reads, hybrid reads with
 The reads are categorized based on mismatches (SNPs) and the number of switches. 
 Also metadata is generated and the file with 1 switch data contains the most extended information.
 
-Input required: output file with alignments from AlignReads.py
+Input required: output file with alignments from AlignReads.py, in the text or binary format (MsaOutputFormat.py)
+The input file is read as a stream, one read pair at a time, so the memory use does not grow with the input file.
+
+With --workers the read pairs are classified by multiple processes, in chunks of --chunk-size read pairs. The output
+files are written in input order and are the same as with one process.
+
+Use:
+    Command line: python3 SelectHybridReads.py msa_output_samfile_reads_HLA-X.txt [--workers N] [--chunk-size N]
+                  [--buffer-size N] [--flush-records N] [--flush-interval SECONDS] [--fsync]
+                  [--log-level quiet/summary/per-read/debug] [--trace trace.jsonl]
+
+The output files are kept open during the run and written with a large buffer (--buffer-size bytes). The buffers
+are written to the files every --flush-records lines or --flush-interval seconds, and the files are closed when the
+run ends, also after an error. With --fsync the files are also synced to disk at each flush.
+
+The messages are written to stdout depending on --log-level: 'quiet' (default) only warnings, 'summary' the read
+counts at the end, 'per-read' also the read name and category per read pair, 'debug' also the mismatch tables and
+1 switch data. With --trace a JSON line is written per read pair (trace.jsonl) with the category, the mismatches
+per allele and the 1 switch data.
+
+Read pairs that AlignReads.py classified without alignment (--fast-path) are read from prefiltered_reads_HLA-X.txt
+in the same directory as the input file, they are added to the non hybrid and zero read output files.
 
 """
 
 from sys import argv
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import io
+import itertools
+import json
+import logging
 import os
+import sys
+import time
+
+import numpy as np
+
+from MsaOutputFormat import AlignedRows, MsaReader
+
+# Requirement values of the read checks, also used by the fast path of AlignReads.py. Adjust requirement values here:
+MINIMUM_Q_SCORE = 18    # nucleotides with a lower quality score become 'N'
+QUALITY_OFFSET = 33     # quality character of quality score 0 (Phred+33)
+MIN_READ_LENGTH = 50    # minimum read length
+N_QUANTITY = 15         # maximum number of N's per read
+
+class ReadLog:
+    """
+    This class writes the messages of the analysis with a level: summary (read counts), per-read (read name and
+    category) and debug (mismatch tables and 1 switch data). A message is only formatted if its level is enabled.
+
+    Args:
+        -
+    """
+    QUIET = logging.WARNING
+    SUMMARY = logging.INFO
+    PER_READ = 15
+    DEBUG = logging.DEBUG
+    levels = {'quiet': QUIET, 'summary': SUMMARY, 'per-read': PER_READ, 'debug': DEBUG}
+    logger = logging.getLogger('SelectHybridReads')
+    handler = None
+
+    @staticmethod
+    def configure(level_name, stream):
+        """
+        Sets the level and the stream the messages are written to.
+
+        Args:
+            level_name (str): 'quiet', 'summary', 'per-read' or 'debug'
+            stream (file): stream for the messages, e.g. sys.stdout
+        Returns:
+            -
+        """
+        logging.addLevelName(ReadLog.PER_READ, 'PER_READ')
+        if ReadLog.handler != None:
+            ReadLog.logger.removeHandler(ReadLog.handler)
+        ReadLog.handler = logging.StreamHandler(stream)
+        ReadLog.handler.setFormatter(logging.Formatter('%(message)s'))
+        ReadLog.logger.addHandler(ReadLog.handler)
+        ReadLog.logger.setLevel(ReadLog.levels[level_name])
+        ReadLog.logger.propagate = False
+
+    @staticmethod
+    def is_enabled(level):
+        """
+        Checks whether messages of a level are written.
+
+        Args:
+            level (int): ReadLog.SUMMARY, ReadLog.PER_READ or ReadLog.DEBUG
+        Returns:
+            enabled (bool): True if the messages are written
+        """
+        return ReadLog.logger.isEnabledFor(level)
+
+    @staticmethod
+    def write(level, *values):
+        """
+        Writes a message, the values are separated by a space (like print).
+
+        Args:
+            level (int): ReadLog.SUMMARY, ReadLog.PER_READ or ReadLog.DEBUG
+            values (object): the values of the message
+        Returns:
+            -
+        """
+        if ReadLog.logger.isEnabledFor(level):
+            ReadLog.logger.log(level, ' '.join(str(value) for value in values))
 
 class ParseInput:
     """
@@ -33,22 +135,108 @@ class ParseInput:
             allele_names (list): contains all allele names (max. 6)
         """
 
-        all_data = []
-        input_file = input_file.split('$$$')
-        for per_read_pair_data in input_file[1:-1]:   # 1:-1
-            temp_collect_list = []
-            read_data = per_read_pair_data.split('\n')
-            for line in read_data:
-                line = line.split('\t')
-                if len(line) > 1:
-                    temp_collect_list += [line]
-            all_data += [temp_collect_list]
-        allele_names_list = all_data[0][4:]
+        all_data = list(ParseInput.read_records(io.StringIO(input_file)))
+        allele_names = ParseInput.get_allele_names(all_data[0])
+
+        return all_data, allele_names
+
+    @staticmethod
+    def read_records(file_object, buffer_size = 65536):
+        """
+        Reads the read pairs one at a time from the output file of AlignReads.py (text format). The file is read in
+        parts of buffer_size characters, a read pair is yielded as soon as its closing '$$$' is read.
+
+        Args:
+            file_object (file): opened output file of AlignReads.py
+            buffer_size (int): number of characters read at once
+        Yields:
+            read_pair_data (list): read information (read name and quality values), allele names and all alignments
+            for the reads and best matches, as lists of the tab separated lines
+        """
+        buffer = ''
+        header = True
+        while True:
+            chunk = file_object.read(buffer_size)
+            parts = (buffer + chunk).split('$$$')
+            buffer = parts[-1]   # not closed by '$$$' yet
+            for per_read_pair_data in parts[:-1]:
+                if header == True:   # the lines before the first '$$$'
+                    header = False
+                    continue
+                yield ParseInput.parse_record(per_read_pair_data)
+            if chunk == '':
+                return
 
+    @staticmethod
+    def parse_record(per_read_pair_data):
+        """
+        Splits the lines of one read pair.
+
+        Args:
+            per_read_pair_data (str): lines of one read pair, between two '$$$'
+        Returns:
+            read_pair_data (list): the tab separated lines, as lists
+        """
+        temp_collect_list = []
+        read_data = per_read_pair_data.split('\n')
+        for line in read_data:
+            line = line.split('\t')
+            if len(line) > 1:
+                temp_collect_list += [line]
+
+        return temp_collect_list
+
+    @staticmethod
+    def get_allele_names(read_pair_data):
+        """
+        Takes the allele names from the data of a read pair.
+
+        Args:
+            read_pair_data (list): read information, allele names and all alignments of one read pair
+        Returns:
+            allele_names (list): contains all allele names (max. 6)
+        """
         allele_names = []
-        for allele_name_line in allele_names_list:
+        for allele_name_line in read_pair_data[4:]:
             allele_names += [allele_name_line[0]]
 
+        return allele_names
+
+    @staticmethod
+    def read_file(input_file_name):
+        """
+        Reads the read pairs one at a time from the output file of AlignReads.py, in the text or binary format.
+
+        Args:
+            input_file_name (str): name of the output file of AlignReads.py
+        Yields:
+            read_pair_data (list): read information (read name and quality values), allele names and all alignments
+            for the reads and best matches
+        """
+        if MsaReader.is_binary(input_file_name) == True:
+            for read_name, read1, qv_read1, read2, qv_read2, rows in MsaReader(input_file_name):
+                yield rows.with_leading_rows([[read_name, read1, qv_read1], [read_name, read2, qv_read2]])
+        else:
+            with open(input_file_name) as file_object:
+                yield from ParseInput.read_records(file_object)
+
+    @staticmethod
+    def collect_all_binary_data(input_file_name):
+        """
+        Reads the read pairs from a binary output file of AlignReads.py (--binary-output), into the same data as
+        collect_all_data. Allele rows stored as delta rows are only rebuilt when they are used.
+
+        Args:
+            input_file_name (str): name of the binary output file of AlignReads.py
+        Returns:
+            all_data (list): list of lists, each list contains the read information (read name and quality values), allele
+            names and all alignments for the reads and best matches (HLA-A, B and C).
+            allele_names (list): contains all allele names (max. 6)
+        """
+
+        all_data = list(ParseInput.read_file(input_file_name))
+        allele_names = ParseInput.get_allele_names(all_data[0])
+
         return all_data, allele_names
 
     @staticmethod
@@ -86,6 +274,234 @@ class ParseInput:
         
         return (all_allele_combinations)
         
+class AlignmentRecord:
+    """
+    This class holds the alignment of one read pair record, encoded once. The aligned reads and alleles are stored as
+    one array (a row per sequence, read 1 and read 2 first), together with the facts that are derived from the
+    alignment: the gap positions, the read positions, the first and last nucleotide of each allele and per allele the
+    number of allele nucleotides in front of each alignment position (the allele coordinate). The mismatches of all
+    alleles with the read consensus are determined once and kept per read consensus. The arrays can not be
+    changed, the record is shared by the Read, ReadPair, CheckAlleleCombination and GetOneSwitchData
+    objects of the read pair. Allele rows that are stored as delta rows (AlignedRows) stay lazy, their array is made
+    from the encoded reference alignment by inserting the gap columns.
+
+    Args:
+        read_info (list): read information (read name and quality values), allele names and all alignments of the read pair
+    """
+    # Byte values of the gap, 'N' and padding characters in the encoded sequences
+    GAP = ord('-')
+    N = ord('N')
+    PADDING = 0
+    # Last encoded reference alignment of the delta rows, (reference, encoded reference)
+    encoded_reference = None
+
+    def __init__(self, read_info):
+        self.read_name = read_info[0][0]
+        self.read_seqs = [read_info[0][1], read_info[1][1]]
+        self.read_qvs = [read_info[0][2], read_info[1][2]]
+        self.read_aligned_seqs = [read_info[2][1], read_info[3][1]]
+        self.allele_data = read_info[4:]
+        if isinstance(self.allele_data, AlignedRows) == True:
+            self.allele_names = self.allele_data.get_names()
+        else:
+            self.allele_data = list(self.allele_data)
+            self.allele_names = [allele for allele, seq in self.allele_data]
+        self.allele_rows = dict((allele, i) for i, allele in enumerate(self.allele_names))
+
+        self.alignment_matrix = AlignmentRecord.stack_rows([AlignmentRecord.encode_rows(self.read_aligned_seqs), AlignmentRecord.encode_allele_rows(self.allele_data)])
+        self.allele_matrix = self.alignment_matrix[2:]
+        self.gap_matrix = self.alignment_matrix == AlignmentRecord.GAP
+        self.allele_starts, self.allele_ends = AlignmentRecord.get_row_bounds(self.allele_matrix)
+        self.allele_positions = AlignmentRecord.get_row_positions(self.allele_matrix)
+        self.read_spans = [AlignmentRecord.get_read_span(self.gap_matrix[i, :len(seq)]) for i, seq in enumerate(self.read_aligned_seqs)]
+        self.consensus_mismatches = {}
+
+        for array in (self.alignment_matrix, self.gap_matrix, self.allele_starts, self.allele_ends, self.allele_positions):
+            array.flags.writeable = False
+
+    @staticmethod
+    def encode_rows(sequences):
+        """
+        Encodes aligned sequences as one array with a row per sequence and one byte per character. Shorter sequences
+        are padded at the right.
+
+        Args:
+            sequences (list): aligned sequences (str)
+        Returns:
+            encoded_rows (numpy.ndarray): uint8 array with a row per sequence and a column per alignment position
+        """
+        alignment_length = max([len(seq) for seq in sequences], default = 0)
+        encoded_rows = np.full((len(sequences), alignment_length), AlignmentRecord.PADDING, dtype=np.uint8)
+        for i, seq in enumerate(sequences):
+            encoded_rows[i, :len(seq)] = np.frombuffer(seq.encode('ascii'), dtype=np.uint8)
+
+        return encoded_rows
+
+    @staticmethod
+    def encode_allele_rows(allele_data):
+        """
+        Encodes the aligned allele sequences. For delta rows (AlignedRows) the reference alignment is encoded once and
+        the gap columns are inserted into the array, the allele sequences are not rebuilt.
+
+        Args:
+            allele_data (list): list of lists with all allele names and aligned sequences, or AlignedRows
+        Returns:
+            encoded_rows (numpy.ndarray): uint8 array with a row per allele and a column per alignment position
+        """
+        if isinstance(allele_data, AlignedRows) == False or len(allele_data.reference) == 0:
+            return AlignmentRecord.encode_rows([seq for allele, seq in allele_data])
+
+        reference = allele_data.reference
+        if AlignmentRecord.encoded_reference == None or AlignmentRecord.encoded_reference[0] != reference:
+            AlignmentRecord.encoded_reference = (reference, AlignmentRecord.encode_rows([seq for allele, seq in reference]))
+        encoded_reference = AlignmentRecord.encoded_reference[1]
+        gap_columns = allele_data.gap_columns
+        if len(gap_columns) != 0:
+            encoded_reference = np.insert(encoded_reference, [column - i for i, column in enumerate(gap_columns)], AlignmentRecord.GAP, axis=1)
+
+        if len(allele_data.rows) == 0:
+            return encoded_reference
+
+        return AlignmentRecord.stack_rows([AlignmentRecord.encode_rows([seq for allele, seq in allele_data.rows]), encoded_reference])
+
+    @staticmethod
+    def stack_rows(encoded_row_lists):
+        """
+        Stacks arrays of encoded rows into one array, narrower arrays are padded at the right.
+
+        Args:
+            encoded_row_lists (list): arrays of encoded aligned sequences, a row per sequence
+        Returns:
+            encoded_rows (numpy.ndarray): uint8 array with the rows of all arrays
+        """
+        alignment_length = max([encoded_rows.shape[1] for encoded_rows in encoded_row_lists], default = 0)
+        stacked_rows = np.full((sum([len(encoded_rows) for encoded_rows in encoded_row_lists]), alignment_length), AlignmentRecord.PADDING, dtype=np.uint8)
+        row = 0
+        for encoded_rows in encoded_row_lists:
+            stacked_rows[row:row + len(encoded_rows), :encoded_rows.shape[1]] = encoded_rows
+            row += len(encoded_rows)
+
+        return stacked_rows
+
+    @staticmethod
+    def get_row_bounds(encoded_rows):
+        """
+        Gets the first nucleotide and the position after the last nucleotide of each row. Both are 0 for rows
+        without nucleotides.
+
+        Args:
+            encoded_rows (numpy.ndarray): encoded aligned sequences, a row per sequence
+        Returns:
+            row_starts (numpy.ndarray): position of the first nucleotide per row
+            row_ends (numpy.ndarray): position after the last nucleotide per row
+        """
+        if encoded_rows.shape[1] == 0:
+            return np.zeros(encoded_rows.shape[0], dtype=np.intp), np.zeros(encoded_rows.shape[0], dtype=np.intp)
+
+        nucleotides = (encoded_rows != AlignmentRecord.GAP) & (encoded_rows != AlignmentRecord.PADDING)
+        has_nucleotides = nucleotides.any(axis=1)
+        row_starts = np.where(has_nucleotides, nucleotides.argmax(axis=1), 0)
+        row_ends = np.where(has_nucleotides, encoded_rows.shape[1] - nucleotides[:, ::-1].argmax(axis=1), 0)
+
+        return row_starts, row_ends
+
+    @staticmethod
+    def get_row_positions(encoded_rows):
+        """
+        Counts for each row the nucleotides in front of each alignment position (a prefix sum), so the position of
+        column i in the sequence without gaps is row_positions[row, i]. The last column contains the number of
+        nucleotides of the row.
+
+        Args:
+            encoded_rows (numpy.ndarray): encoded aligned sequences, a row per sequence
+        Returns:
+            row_positions (numpy.ndarray): array with a row per sequence and a column per alignment position plus one
+        """
+        nucleotides = (encoded_rows != AlignmentRecord.GAP) & (encoded_rows != AlignmentRecord.PADDING)
+        row_positions = np.zeros((encoded_rows.shape[0], encoded_rows.shape[1] + 1), dtype=np.intp)
+        np.cumsum(nucleotides, axis=1, out=row_positions[:, 1:])
+
+        return row_positions
+
+    @staticmethod
+    def get_read_span(read_gaps):
+        """
+        Gets the read positions (based on the read in its alignment). The read starts at the first nucleotide after a
+        gap and ends at the last nucleotide, gaps in between are included.
+
+        Args:
+            read_gaps (numpy.ndarray): True for the gap positions of the aligned read
+        Returns:
+            read_span (tuple): first position of the read and the position after the last position of the read, None
+            if the read does not start after a gap
+        """
+        start_absolute_read_position = np.flatnonzero(read_gaps[:-1] & ~read_gaps[1:]) + 1
+        if len(start_absolute_read_position) == 0:
+            return None
+        read_span = (int(start_absolute_read_position[0]), int(np.flatnonzero(~read_gaps)[-1]) + 1)
+
+        return read_span
+
+    @staticmethod
+    def get_mismatch_rows(encoded_rows, read_consensus):
+        """
+        Determines the indicative mismatches of each row with the read consensus. A difference is indicative if the
+        read consensus has a nucleotide (not '*' or 'N') or if it has a deletion between the start and end of the
+        reads. Padding is no mismatch.
+
+        Args:
+            encoded_rows (numpy.ndarray): encoded aligned sequences, a row per sequence
+            read_consensus (str): contains read pair sequences combined, '*' indicates the gap between the reads
+        Returns:
+            mismatch_rows (numpy.ndarray): boolean array with a row per sequence and a column per position of the
+            read consensus that is covered by the rows, True for an indicative mismatch
+        """
+        read_consensus_wo_r = read_consensus.rstrip('-')
+        start_consensus = read_consensus_wo_r.count('-') # start read pos (absolute)
+        end_consensus = len(read_consensus_wo_r)  # end read pos (absolute)
+
+        length = min(len(read_consensus), encoded_rows.shape[1])
+        encoded_consensus = Read.encode_sequence(read_consensus[:length])
+        consensus_gaps = encoded_consensus == AlignmentRecord.GAP
+        within_reads = np.zeros(length, dtype=np.bool_)
+        within_reads[start_consensus:end_consensus] = True
+        indicative = (~consensus_gaps & (encoded_consensus != ord('*')) & (encoded_consensus != AlignmentRecord.N)) | (consensus_gaps & within_reads)
+
+        encoded_rows = encoded_rows[:, :length]
+        mismatch_rows = (encoded_rows != encoded_consensus) & (encoded_rows != AlignmentRecord.PADDING) & indicative
+
+        return mismatch_rows
+
+    def get_allele_mismatches(self, read_consensus):
+        """
+        Gets the indicative mismatches of all alleles with the read consensus (see get_mismatch_rows()). They are
+        determined for the first request of a read consensus, the allele combinations share them.
+
+        Args:
+            read_consensus (str): contains read pair sequences combined, '*' indicates the gap between the reads
+        Returns:
+            allele_mismatches (numpy.ndarray): boolean array with a row per allele, True for an indicative mismatch
+        """
+        if read_consensus not in self.consensus_mismatches:
+            allele_mismatches = AlignmentRecord.get_mismatch_rows(self.allele_matrix, read_consensus)
+            allele_mismatches.flags.writeable = False
+            self.consensus_mismatches[read_consensus] = allele_mismatches
+
+        return self.consensus_mismatches[read_consensus]
+
+    def get_allele_seq(self, allele_name):
+        """
+        Gets the aligned sequence of an allele.
+
+        Args:
+            allele_name (str): name of the allele
+        Returns:
+            allele_seq (str): aligned allele sequence
+        """
+        allele_seq = self.allele_data[self.allele_rows[allele_name]][1]
+
+        return allele_seq
+
 class Read:
     """
     This class processes single read data but some functions can also process single sequence data other than reads.
@@ -95,12 +511,39 @@ class Read:
         read_seq (str): sequence, not in alignment, from read, read consensus or turnover region
         read_aligned_seq (str): sequence in alignment, from read, read consensus or turnover region
         allele_data (list): list of lists with all allele names and aligned sequences
+        record (AlignmentRecord): encoded alignment of the read pair, default is None (allele_data is encoded when needed)
     """
-    def __init__(self, read_seq, read_aligned_seq, allele_data):
+    # Translation tables per (minimum_q_score, quality_offset), maps a quality character to 1 (high) or 0 (low)
+    quality_tables = {}
+
+    def __init__(self, read_seq, read_aligned_seq, allele_data, record = None):
         self.read_seq = read_seq
         self.read_length = len(read_seq)
         self.read_aligned_seq = read_aligned_seq
         self.allele_data = allele_data
+        self.record = record
+        self.read_span = None
+        self.allele_matrix = None
+        self.allele_bounds = None
+        self.allele_positions = None
+        self.relative_ranges = None
+
+    @classmethod
+    def from_record(cls, record, read_number):
+        """
+        Classmethod that creates the Read for read 1 or read 2 of a record. The read positions and the encoded alleles
+        are taken from the record.
+
+        Args:
+            record (AlignmentRecord): encoded alignment of the read pair
+            read_number (int): 1 for read 1, 2 for read 2
+        Returns:
+            read (Read): the read, sharing the data of the record
+        """
+        read = cls(record.read_seqs[read_number-1], record.read_aligned_seqs[read_number-1], record.allele_data, record)
+        read.read_span = record.read_spans[read_number-1]
+
+        return read
 
     def check_alignment(self): 
         """
@@ -125,60 +568,167 @@ class Read:
 
         return correct_alignment
     
-    def apply_qv(self, read_qv):
+    @staticmethod
+    def encode_sequence(sequence):
+        """
+        Encodes a (aligned) sequence as an array with one byte per character.
+
+        Args:
+            sequence (str): sequence, in alignment or not
+        Returns:
+            encoded_sequence (numpy.ndarray): uint8 array with the character values, can be changed
+        """
+        encoded_sequence = np.frombuffer(sequence.encode('ascii'), dtype=np.uint8).copy()
+
+        return encoded_sequence
+
+    @staticmethod
+    def get_quality_table(minimum_q_score, quality_offset):
+        """
+        Gets the byte translation table that maps a quality character to 1 if its quality score is at least minimum_q_score
+        and to 0 otherwise. The tables are kept per minimum_q_score and quality_offset.
+
+        Args:
+            minimum_q_score (int): minimum quality score of a nucleotide
+            quality_offset (int): value of the quality character with quality score 0 (33 for Phred+33, '!')
+        Returns:
+            quality_table (bytes): translation table for bytes.translate()
+        """
+        quality_table = Read.quality_tables.get((minimum_q_score, quality_offset))
+        if quality_table == None:
+            quality_table = bytes(int(value - quality_offset >= minimum_q_score) for value in range(256))
+            Read.quality_tables[(minimum_q_score, quality_offset)] = quality_table
+
+        return quality_table
+
+    def get_allele_matrix(self):
+        """
+        Gets the aligned allele sequences as one array, a row per allele. Shorter allele sequences are padded at the
+        right. The array of the record is used, without record the array is created once per Read.
+
+        Args:
+            -
+        Returns:
+            allele_matrix (numpy.ndarray): uint8 array with a row per allele and a column per alignment position
+        """
+        if self.record != None:
+            return self.record.allele_matrix
+        if self.allele_matrix is None:
+            self.allele_matrix = AlignmentRecord.encode_rows([seq for allele, seq in self.allele_data])
+
+        return self.allele_matrix
+
+    def get_allele_names(self):
+        """
+        Gets the allele names, in the order of the allele rows. The names of the record are used, so the allele
+        sequences are not rebuilt.
+
+        Args:
+            -
+        Returns:
+            allele_names (list): names of the alleles
+        """
+        if self.record != None:
+            return self.record.allele_names
+
+        return [allele for allele, seq in self.allele_data]
+
+    def get_allele_bounds(self):
+        """
+        Gets the first nucleotide and the position after the last nucleotide of each allele (both 0 if the allele has
+        no nucleotides).
+
+        Args:
+            -
+        Returns:
+            allele_starts (numpy.ndarray): position of the first nucleotide per allele
+            allele_ends (numpy.ndarray): position after the last nucleotide per allele
+        """
+        if self.record != None:
+            return self.record.allele_starts, self.record.allele_ends
+        if self.allele_bounds == None:
+            self.allele_bounds = AlignmentRecord.get_row_bounds(self.get_allele_matrix())
+
+        return self.allele_bounds
+
+    def get_allele_positions(self):
+        """
+        Gets for each allele the allele coordinate of each alignment position: the number of allele nucleotides in
+        front of the position.
+
+        Args:
+            -
+        Returns:
+            allele_positions (numpy.ndarray): array with a row per allele and a column per alignment position plus one
+        """
+        if self.record != None:
+            return self.record.allele_positions
+        if self.allele_positions is None:
+            self.allele_positions = AlignmentRecord.get_row_positions(self.get_allele_matrix())
+
+        return self.allele_positions
+
+    def check_read(self, read_qv, minimum_q_score = 18, quality_offset = 33):
+        """
+        Performs both read checks, apply_qv() and check_read_artefacts(), on the encoded read without creating the
+        string in between.
+
+        Args:
+            read_qv (str): read quality values
+            minimum_q_score (int): minimum quality score of a nucleotide, default is 18
+            quality_offset (int): value of the quality character with quality score 0, default is 33 (Phred+33)
+        Returns:
+            read_aligned_seq_fully_checked (str): the updated aligned read sequence after both checks
+        """
+        read_aligned_checked = self.__mask_low_quality(read_qv, minimum_q_score, quality_offset)
+
+        # the checks do not change the gaps, so the read positions of the record can be used
+        read_aligned_fully_checked = self.__mask_artefacts(read_aligned_checked, self.read_span)
+
+        return read_aligned_fully_checked.tobytes().decode('ascii')
+
+    def apply_qv(self, read_qv, minimum_q_score = 18, quality_offset = 33):
         """
         Checks nucleotide quality values, if lower than a given value (minimum_q_score), then the nucleotide is replaced by a 'N'
         
         Args:
             read_qv (str): read quality values
+            minimum_q_score (int): minimum quality score of a nucleotide, default is 18
+            quality_offset (int): value of the quality character with quality score 0, default is 33 (Phred+33)
         Returns:
             read_checked_aligned_seq (str): the updated aligned read sequence
         """
+        read_aligned_checked = self.__mask_low_quality(read_qv, minimum_q_score, quality_offset)
 
-        # Adjust here the minimum quality score 
-        minimum_q_score = 18
+        return read_aligned_checked.tobytes().decode('ascii')
 
-        quality_dict = {'!': 0, '"': 1, '#':2, '$':3, '%':4, '&':5, "'":6, '(':7, ')':8,\
-        '*':9, '+':10, ',':11,'-':12, '.':13, '/':14, '0':15, '1':16, '2':17, '3':18,\
-        '4':19, '5':20, '6':21, '7':22, '8':23, '9':24, ':':25, ';':26, '<':27, '=':28,\
-        '>':29, '?':30, '@':31, 'A':32, 'B':33, 'C':34, 'D':35, 'E':36, 'F':37, 'G':38, 'H':39, 'I':40}
-    
-        read_checked_seq = '' 
-        for i, qual in enumerate(read_qv):
-            q_score = quality_dict[qual]
-            nucleotide = self.read_seq[i]
-            if q_score < minimum_q_score:
-                read_checked_seq += 'N'
-            if q_score >= minimum_q_score:
-                read_checked_seq += nucleotide
-
-        # count the number of '-' in front of aligned read (left)
-        count_read_start = self.read_aligned_seq.lstrip('-')
-        count_read_start = len(self.read_aligned_seq) - len(count_read_start)
-
-        # remove '-' right from aligned read and count the number of '-' after the aligned read (right)
-        read_aligned_seq_wo_r = self.read_aligned_seq.rstrip('-')
-        count_read_end = len(self.read_aligned_seq) - len(read_aligned_seq_wo_r)
-
-        read_aligned_seq_checked = ''
-        read_start_seen = False   
-        gap_count = 0
-        for i, char in enumerate(read_aligned_seq_wo_r):
-            if char == '-':
-                read_aligned_seq_checked += char
-            if char != '-' and read_start_seen == False:
-                read_start_seen = True
-            if read_start_seen == True:
-                if char == '-':
-                    gap_count += 1
-                if char != '-':
-                    read_aligned_seq_checked += read_checked_seq[i-count_read_start-gap_count]
-
-        # add '-' at the right
-        read_aligned_seq_checked = read_aligned_seq_checked + '-' * count_read_end
-
-        return read_aligned_seq_checked
-    
+    def __mask_low_quality(self, read_qv, minimum_q_score, quality_offset):
+        """
+        Replaces the read nucleotides with a quality score lower than minimum_q_score by a 'N' and places the read
+        nucleotides in the alignment of the read.
+
+        Args:
+            read_qv (str): read quality values
+            minimum_q_score (int): minimum quality score of a nucleotide
+            quality_offset (int): value of the quality character with quality score 0
+        Returns:
+            read_aligned_checked (numpy.ndarray): the updated aligned read sequence (encoded)
+        """
+        quality_table = Read.get_quality_table(minimum_q_score, quality_offset)
+        high_quality = np.frombuffer(read_qv.encode('ascii').translate(quality_table), dtype=np.bool_)
+        read_nucleotides = Read.encode_sequence(self.read_seq[:len(read_qv)])
+        if len(read_nucleotides) != len(high_quality):
+            raise ValueError ('Read sequence is shorter than the quality values!')
+        read_checked = np.where(high_quality, read_nucleotides, AlignmentRecord.N)
+
+        # the nucleotides in the alignment are replaced by the checked read nucleotides, in order
+        read_aligned_checked = Read.encode_sequence(self.read_aligned_seq)
+        nucleotide_columns = np.flatnonzero(read_aligned_checked != AlignmentRecord.GAP)
+        if len(nucleotide_columns) > len(read_checked):
+            raise ValueError ('Aligned read contains more nucleotides than the quality values!')
+        read_aligned_checked[nucleotide_columns] = read_checked[:len(nucleotide_columns)]
+
+        return read_aligned_checked
 
     def check_read_artefacts(self, read_aligned_seq_checked):
         """" 
@@ -191,102 +741,62 @@ class Read:
         Returns:
             read_aligned_seq_fully_checked (str): the updated aligned read sequence after both checks
         """
+        read_aligned_fully_checked = self.__mask_artefacts(Read.encode_sequence(read_aligned_seq_checked), None)
 
-        # get the start of the read position (based on the read in its alignment) 
-        start_absolute_read_position = []
-        start_absolute_read_nucleotide = []
-        nr_of_switches = 0
-        nuc = read_aligned_seq_checked[0]
-        for i, char in enumerate(read_aligned_seq_checked):
-            if nuc == '-' and nuc != char:
-                nr_of_switches += 1
-                start_absolute_read_position += [i]
-                start_absolute_read_nucleotide += [char]
-            nuc = char
-    
-        # get all read positions (based on the read in its alignment)
-        absolute_read_position = []
-        absolute_read_nucleotide = []
-        for i, char in enumerate(read_aligned_seq_checked):
-            if i >= start_absolute_read_position[0] and i <= start_absolute_read_position[-1]:
-                absolute_read_position += [i]
-                absolute_read_nucleotide += [char]
-            if i >= start_absolute_read_position[-1]+1 and char != '-':
-                absolute_read_position += [i]
-                absolute_read_nucleotide += [char]
-       
-        mismatch_track = self.__create_mismatch_track(read_aligned_seq_checked, absolute_read_position, absolute_read_nucleotide)
-
-        # if a nucleotide in the read is considered as artefact (5 in mismatch track) then it is replaced by 'N'
-        read_aligned_seq_fully_checked = ''
-        for i, nuc in enumerate(read_aligned_seq_checked):
-            try:
-                mismatch_char = int(mismatch_track[i])
-            except:
-                mismatch_char = mismatch_track[i]
-            number_of_alleles = len(self.allele_data)
-            if number_of_alleles == 5:
-                if mismatch_char == 5:
-                    read_aligned_seq_fully_checked += 'N'
-                if mismatch_char != 5:
-                    read_aligned_seq_fully_checked += nuc
-            elif number_of_alleles == 6:
-                if mismatch_char == 6:
-                    read_aligned_seq_fully_checked += 'N'
-                if mismatch_char != 6:
-                    read_aligned_seq_fully_checked += nuc
-            else:
-                raise ValueError ('The number of alleles is incorrect!')
+        return read_aligned_fully_checked.tobytes().decode('ascii')
 
-        return read_aligned_seq_fully_checked
+    @staticmethod
+    def get_read_span(read_aligned):
+        """
+        Gets the read positions (based on the read in its alignment). The read starts at the first nucleotide after a
+        gap and ends at the last nucleotide, gaps in between are included.
 
-    def __create_mismatch_track(self, read_aligned_seq_checked, absolute_read_position, absolute_read_nucleotide):
+        Args:
+            read_aligned (numpy.ndarray): aligned read sequence (encoded)
+        Returns:
+            read_start (int): first position of the read
+            read_end (int): position after the last position of the read
         """
-        Checks for each read position if alleles have mismatches (substitution). If a mismatch is found, value 1 is added.
-        If the input data contains 6 alleles, then this number can be max. 6 for each read position.
-        
+        read_span = AlignmentRecord.get_read_span(read_aligned == AlignmentRecord.GAP)
+        if read_span == None:
+            raise IndexError ('Read does not start after a gap!')
+
+        return read_span
+
+    def __mask_artefacts(self, read_aligned_checked, read_span):
+        """
+        Counts for each read position the alleles with a mismatch (substitution). If all alleles have a mismatch, then
+        the read nucleotide is replaced by a 'N'.
+
         Args:
-            read_aligned_seq_checked (str): the updated aligned read sequence
-            absolute_read_position (list): contains all positions (int) of the read (based on its alignment)
-            absolute_read_nucleotide (list): contains all read nucleotides which corresponds to the absolute read positions
-        Returns:
-            mismatch_track (str): contains the number of mismatches for all alleles per position
-        """
-
-        # create a mismatch track string, for each mismatch in the allele '1' is added, up to 5  (where all alleles have mismatches)
-        mismatch_track = '-' * len(read_aligned_seq_checked)
-
-        for allele, seq in self.allele_data:
-            seq_string = seq
-            for i, chari in enumerate(seq_string):
-                if i in absolute_read_position:
-                    read_nuc = absolute_read_nucleotide[i-min(absolute_read_position)] 
-                    if chari != read_nuc and read_nuc != '-' and read_nuc != 'N' and chari != '-' and  mismatch_track[i] == '5':
-                        left_mismatch_track = mismatch_track[:i]
-                        right_mismatch_track = mismatch_track[i+1:]
-                        mismatch_track = left_mismatch_track + '6' + right_mismatch_track
-                    if chari != read_nuc and read_nuc != '-' and read_nuc != 'N' and chari != '-' and  mismatch_track[i] == '4':
-                        left_mismatch_track = mismatch_track[:i]
-                        right_mismatch_track = mismatch_track[i+1:]
-                        mismatch_track = left_mismatch_track + '5' + right_mismatch_track
-                    if chari != read_nuc and read_nuc != '-' and read_nuc != 'N' and chari != '-' and  mismatch_track[i] == '3':
-                        left_mismatch_track = mismatch_track[:i]
-                        right_mismatch_track = mismatch_track[i+1:]
-                        mismatch_track = left_mismatch_track + '4' + right_mismatch_track
-                    if chari != read_nuc and read_nuc != '-' and read_nuc != 'N' and chari != '-' and  mismatch_track[i] == '2':
-                        left_mismatch_track = mismatch_track[:i]
-                        right_mismatch_track = mismatch_track[i+1:]
-                        mismatch_track = left_mismatch_track + '3' + right_mismatch_track
-                    if chari != read_nuc and read_nuc != '-' and read_nuc != 'N' and chari != '-' and  mismatch_track[i] == '1':
-                        left_mismatch_track = mismatch_track[:i]
-                        right_mismatch_track = mismatch_track[i+1:]
-                        mismatch_track = left_mismatch_track + '2' + right_mismatch_track
-                    if chari != read_nuc and read_nuc != '-' and read_nuc != 'N' and chari != '-' and mismatch_track[i] == '-':
-                        left_mismatch_track = mismatch_track[:i]
-                        right_mismatch_track = mismatch_track[i+1:]
-                        mismatch_track = left_mismatch_track + '1' + right_mismatch_track
-
-        return mismatch_track
+            read_aligned_checked (numpy.ndarray): the updated aligned read sequence (encoded)
+            read_span (tuple): first position of the read and the position after the last position, None to determine
+            them from read_aligned_checked
+        Returns:
+            read_aligned_fully_checked (numpy.ndarray): the updated aligned read sequence after both checks (encoded)
+        """
+        if read_span == None:
+            read_span = Read.get_read_span(read_aligned_checked)
+        read_start, read_end = read_span
+
+        number_of_alleles = len(self.allele_data)
+        if number_of_alleles != 5 and number_of_alleles != 6:
+            raise ValueError ('The number of alleles is incorrect!')
+
+        allele_matrix = self.get_allele_matrix()
+        read_end = min(read_end, allele_matrix.shape[1])
+        read_nucleotides = read_aligned_checked[read_start:read_end]
+        allele_nucleotides = allele_matrix[:, read_start:read_end]
+
+        # number of alleles with a substitution per read position
+        substitutions = (allele_nucleotides != read_nucleotides) & (allele_nucleotides != AlignmentRecord.GAP) & (allele_nucleotides != AlignmentRecord.PADDING)
+        substitutions &= (read_nucleotides != AlignmentRecord.GAP) & (read_nucleotides != AlignmentRecord.N)
+        mismatch_track = substitutions.sum(axis=0)
+
+        read_aligned_fully_checked = read_aligned_checked.copy()
+        read_aligned_fully_checked[read_start:read_end][mismatch_track == number_of_alleles] = AlignmentRecord.N
+
+        return read_aligned_fully_checked
 
     def get_mismatches(self, read_aligned_fully_checked):
         """
@@ -298,99 +808,74 @@ class Read:
            mismatch_dict (dict): contains allele names and number of total mismatches
            extended_mismatch_dict (dict): contains allele names and number of substitutions, insertions and deletions
         """
-
-        # get the start of the read position (based on the read in its alignment) 
-        start_absolute_read_position = []
-        nr_of_switches = 0
-        nuc = read_aligned_fully_checked[0]
-        for i, char in enumerate(read_aligned_fully_checked):
-            if nuc == '-' and nuc != char:
-                nr_of_switches += 1
-                start_absolute_read_position += [i]
-            nuc = char
+        read_aligned = Read.encode_sequence(read_aligned_fully_checked)
+        read_start, read_end = Read.get_read_span(read_aligned)
 
         # If read is aligned in front of the allele, the mismatches are ignored (they will be extracted from deletions). 
-        deletion_correction_dict = self.__check_read_start(start_absolute_read_position, read_aligned_fully_checked)
-
-        absolute_read_position = []
-        absolute_read_nucleotide = []
-        for i, char in enumerate(read_aligned_fully_checked):
-            if i >= start_absolute_read_position[0] and i <= start_absolute_read_position[-1]:
-                absolute_read_position += [i]
-                absolute_read_nucleotide += [char]
-            if i >= start_absolute_read_position[-1]+1 and char != '-':
-                absolute_read_position += [i]
-                absolute_read_nucleotide += [char]
+        deletion_correction = self.__check_read_start(read_start, read_aligned)
+
+        # compare all alleles with the read positions at once
+        allele_matrix = self.get_allele_matrix()
+        read_end = min(read_end, allele_matrix.shape[1])
+        read_nucleotides = read_aligned[read_start:read_end]
+        allele_nucleotides = allele_matrix[:, read_start:read_end]
+
+        differences = (allele_nucleotides != read_nucleotides) & (allele_nucleotides != AlignmentRecord.PADDING)
+        allele_gaps = allele_nucleotides == AlignmentRecord.GAP
+        read_gaps = read_nucleotides == AlignmentRecord.GAP
+        read_nucleotide = ~read_gaps & (read_nucleotides != ord('*'))
+
+        substitutions = (differences & ~allele_gaps & (read_nucleotide & (read_nucleotides != AlignmentRecord.N))).sum(axis=1)
+        insertions = (differences & ~allele_gaps & read_gaps).sum(axis=1)
+        deletions = deletion_correction + (differences & allele_gaps & read_nucleotide).sum(axis=1)
+
+        # the total is only counted if the allele differs from the read at one or more positions
+        mismatches = np.where(differences.any(axis=1), substitutions + insertions + deletions, 0)
 
         extended_mismatch_dict = {}
         mismatch_dict = {}
-        for allele, seq_string in self.allele_data:
-            substitutions = 0
-            insertions = 0
-            deletions = int(deletion_correction_dict[allele])
-            mismatches = 0
-            for i, chari in enumerate(seq_string):
-                if i in absolute_read_position:
-                    read_nuc = absolute_read_nucleotide[i-min(absolute_read_position)]
-                    if chari != read_nuc:
-                        if read_nuc != '-' and read_nuc != '*' and read_nuc != 'N' and chari != '-': 
-                            substitutions += 1    
-                        if read_nuc == '-' and chari != '-':
-                            insertions += 1
-                        if read_nuc != '-' and read_nuc != '*' and chari == '-':
-                            deletions += 1
-                        mismatches = substitutions + insertions + deletions
-            mismatch_dict[allele] = [mismatches]
-            extended_mismatch_dict[allele] = [substitutions, insertions, deletions, mismatches]
+        allele_counts = zip(substitutions.tolist(), insertions.tolist(), deletions.tolist(), mismatches.tolist())
+        for allele, allele_count in zip(self.get_allele_names(), allele_counts):
+            mismatch_dict[allele] = [allele_count[3]]
+            extended_mismatch_dict[allele] = list(allele_count)
 
         return (mismatch_dict, extended_mismatch_dict)
-  
 
-
-    def __check_read_start(self, start_absolute_read_position, read_aligned_fully_checked):
+    def __check_read_start(self, read_start, read_aligned):
         """
         Checks if aligned read starts in front of allele (does not occur often). If so, then the number of nucleotides
-        which are aligned in front of the allele are counted and stored in a dictionary.  
+        which are aligned in front of the allele are counted for each allele.
        
         Args:
-            start_absolute_read_position (list): contains absolute start position of the read and the start positions after
-            insertions (if the read has any).
-            read_aligned_seq_fully_checked (str): the updated aligned read sequence after both checks
+            read_start (int): absolute start position of the read (based on the read in its alignment)
+            read_aligned (numpy.ndarray): the updated aligned read sequence after both checks (encoded)
         Returns:
-            deletion_correction_dict (dict): contains allele names and number of nucleotides which are aligned in front 
+            deletion_correction (numpy.ndarray): contains per allele the number of nucleotides which are aligned in front
             of the allele
         """
-
-        deletion_correction_dict = {} # if reads starts in front of allele
-        for allele, seq_string in self.allele_data: 
-            start_allele_post = 0
-            if seq_string.startswith('-'):
-                start_absolute_allele_position = []
-                nuc = seq_string[0]
-                nr_of_switches = 0
-                for i, char in enumerate(seq_string):
-                    if nuc == '-' and nuc != char:
-                        nr_of_switches += 1
-                        start_absolute_allele_position += [i]
-                    nuc = char
-                start_allele_post = start_absolute_allele_position[0]
-                if start_allele_post > start_absolute_read_position[0]:
-                    deletion_correction = start_absolute_read_position[0] - start_allele_post
-                    deletion_correction_dict[allele] = deletion_correction
-                else: 
-                    deletion_correction = 0
-                    deletion_correction_dict[allele] = deletion_correction
-            else: 
-                deletion_correction = 0
-                deletion_correction_dict[allele] = deletion_correction
-            count_read_insertion_for_deletion_correction = read_aligned_fully_checked[start_absolute_read_position[0]:start_allele_post]
-            read_inserts = count_read_insertion_for_deletion_correction.count('-')
-            deletion_correction_dict[allele] += read_inserts
-
-        return deletion_correction_dict
+        allele_matrix = self.get_allele_matrix()
+        allele_starts, allele_ends = self.get_allele_bounds()
+
+        # start of the allele, only if the allele starts with a gap
+        allele_start = np.zeros(allele_matrix.shape[0], dtype=np.intp)
+        if allele_matrix.shape[1] > 0:
+            starts_with_gap = allele_matrix[:, 0] == AlignmentRecord.GAP
+            if np.any(starts_with_gap & (allele_ends == 0)):
+                raise ValueError ('Allele sequence contains no nucleotides!')
+            allele_start = np.where(starts_with_gap, allele_starts, 0)
+
+        # number of read gaps in front of each allele start
+        read_gap_count = np.zeros(len(read_aligned) + 1, dtype=np.intp)
+        read_gap_count[1:] = np.cumsum(read_aligned == AlignmentRecord.GAP)
+        read_inserts = read_gap_count[np.minimum(allele_start, len(read_aligned))] - read_gap_count[read_start]
+
+        starts_in_front = allele_start > read_start
+        deletion_correction = np.where(starts_in_front, read_start - allele_start + read_inserts, 0)
+
+        return deletion_correction
    
     @classmethod
-    def classmethod_for_non_read(cls, aligned_sequence, allele_data):
+    def classmethod_for_non_read(cls, aligned_sequence, allele_data, record = None):
         """
         Classmethod that generates data for the read consensus and turnover region (both in alignment) as input for the constructor. 
         The sequence (read_seq) is created  without its alignment. 
@@ -398,6 +883,7 @@ class Read:
         Args:
             aligned_sequence (str): read consensus or turnover region sequence, in its alignment
             allele_data (list): list of lists with all allele names and aligned sequences
+            record (AlignmentRecord): encoded alignment of the read pair with the same alleles, default is None
         Returns:
             read_seq (str): sequence, not in alignment, read consensus or turnover region
             read_aligned_seq (str): sequence in alignment, read consensus or turnover region
@@ -405,7 +891,7 @@ class Read:
         """
         read_seq = aligned_sequence.lstrip('-').rstrip('-')
 
-        return cls(read_seq, aligned_sequence, allele_data)
+        return cls(read_seq, aligned_sequence, allele_data, record)
     
     def print_mismatches(self, read_type, extended_mismatch_dict):
         """
@@ -417,12 +903,15 @@ class Read:
         Returns:
            -
         """
-        print ('\n\nRead info', read_type)
-        print ('Length: \t\t', self.read_length)
+        if ReadLog.is_enabled(ReadLog.DEBUG) == False:
+            return
+
+        ReadLog.write(ReadLog.DEBUG, '\n\nRead info', read_type)
+        ReadLog.write(ReadLog.DEBUG, 'Length: \t\t', self.read_length)
         
-        print ('\nAllele\t\t\tSubstitutions\tInsertions\tDeletions\tTotal nr. or mismatches')
+        ReadLog.write(ReadLog.DEBUG, '\nAllele\t\t\tSubstitutions\tInsertions\tDeletions\tTotal nr. or mismatches')
         for allele, mismatches in extended_mismatch_dict.items():
-            print (allele, '\t\t', mismatches[0], '\t\t', mismatches[1], '\t\t', mismatches[2], '\t\t', mismatches[3])
+            ReadLog.write(ReadLog.DEBUG, allele, '\t\t', mismatches[0], '\t\t', mismatches[1], '\t\t', mismatches[2], '\t\t', mismatches[3])
 
     def get_relative_position(self):
         """
@@ -436,107 +925,97 @@ class Read:
         Returns:
             read_pos_dict (dict): contains allele names and all positions of the given sequence relative to the alleles
         """
-        read_pos_dict = {}
-        for allele, allele_seq in self.allele_data:
-            read_position = []
-            # remove '-' left and right from allele seq and give read the same length
-            allele_seq_wo_left = allele_seq.lstrip('-')
-            left_difference = len(allele_seq) - len(allele_seq_wo_left)
-            allele_seq_wo_right = allele_seq.rstrip('-')
-
-            read_seq_wo_rl = self.read_aligned_seq[left_difference:len(allele_seq_wo_right)]
-            allele_seq_wo_rl = allele_seq.strip('-')
-
-            # Remove '-' right from the read, example sequence read: '--------------CCCCC'
-            sequence_read = read_seq_wo_rl.rstrip('-')
-
-            read_start_seen = False
-            deletion_count_allele_to_read_start = 0
-            deletion_count_activated = False
-            #TODO: now the allele can have max. 2 gaps in front of read start
-
-            for i, char in enumerate(sequence_read):
-                if deletion_count_activated == True and char == '-' and read_start_seen ==  False:
-                    if allele_seq_wo_rl[i] == '-':  # if allele has gap in front of read start, for second gap
-                        deletion_count_allele_to_read_start += 1
-                if char == '-' and read_start_seen ==  False and deletion_count_activated == False:
-                    if allele_seq_wo_rl[i] == '-':  # if allele has gap in front of read start, for first gap
-                        deletion_count_allele_to_read_start += 1
-                        deletion_count_activated = True
-                if char != '-' and deletion_count_activated == False:
-                    read_start_seen = True
-
-            read_start_seen = False
-            pos = 0
-        
-            for i, char in enumerate(sequence_read):
-                if char != '-' and allele_seq_wo_rl[i] != '-' and read_start_seen == False:
-                    read_start_seen = True
-                    pos = i - deletion_count_allele_to_read_start
-                if char != '-' and allele_seq_wo_rl[i] != '-' and read_start_seen == True:
-                    read_position += [pos]
-                if char == '-' and allele_seq_wo_rl[i] != '-' and read_start_seen == True: # if read has deletion, allele position is taken into account
-                    read_position += [pos]
-                if len(read_position) != 0:
-                    pos = read_position[-1] + 1
-            read_pos_dict[allele] = read_position
+        read_pos_dict = dict((allele, list(read_range)) for allele, read_range in self.get_relative_ranges().items())
+
+        return read_pos_dict
+
+    def get_relative_ranges(self):
+        """
+        Determines the positions of get_relative_position() as a range per allele, so the first and last position can be
+        looked up directly. The positions are taken from the allele coordinates of the alignment positions: the
+        sequence covers the allele from its first nucleotide that is aligned with an allele nucleotide up to its last
+        nucleotide in front of the end of the allele. The ranges are determined once per Read.
+
+        Args:
+            -
+        Returns:
+            read_range_dict (dict): contains allele names and the range of positions of the given sequence relative to the alleles
+        """
+        if self.relative_ranges != None:
+            return self.relative_ranges
+
+        allele_matrix = self.get_allele_matrix()
+        allele_positions = self.get_allele_positions()
+        allele_starts, allele_ends = self.get_allele_bounds()
+
+        # sequence characters (not '-') in the columns of the alleles
+        alignment_length = allele_matrix.shape[1]
+        read_aligned = np.full(alignment_length, AlignmentRecord.PADDING, dtype=np.uint8)
+        read_aligned[:len(self.read_aligned_seq)] = Read.encode_sequence(self.read_aligned_seq[:alignment_length])
+        read_chars = (read_aligned != AlignmentRecord.GAP) & (read_aligned != AlignmentRecord.PADDING)
+        read_columns = np.flatnonzero(read_chars)
+
+        # first position where both the sequence and the allele have a nucleotide, last position of the sequence within the allele
+        read_and_allele = read_chars & (allele_matrix != AlignmentRecord.GAP) & (allele_matrix != AlignmentRecord.PADDING)
+        has_start = read_and_allele.any(axis=1) if alignment_length > 0 else np.zeros(len(allele_matrix), dtype=np.bool_)
+        read_starts = read_and_allele.argmax(axis=1) if alignment_length > 0 else np.zeros(len(allele_matrix), dtype=np.intp)
+        last_read_columns = np.searchsorted(read_columns, allele_ends)
+        read_ends = np.where(last_read_columns > 0, np.append(read_columns, 0)[last_read_columns - 1] + 1, 0)
+        read_ends = np.maximum(read_ends, read_starts)
+
+        start_positions = allele_positions[np.arange(len(allele_matrix)), read_starts].tolist()
+        end_positions = allele_positions[np.arange(len(allele_matrix)), read_ends].tolist()
+        allele_names = self.get_allele_names()
+        read_range_dict = {}
+        for i, allele in enumerate(allele_names):
+            if has_start[i] == True:
+                read_range_dict[allele] = range(start_positions[i], end_positions[i])
+            else:
+                read_range_dict[allele] = range(0)
 
         # get position if turnover region has a length of 0 and the allele has '-' as nucleotide
-        allele_name =  self.allele_data[0][0]
+        allele_name =  allele_names[0]
 
-        if 'K' in self.read_aligned_seq or 'Z' in self.read_aligned_seq and read_pos_dict[allele_name] == []:
-            read_pos_dict = self.__get_special_case_pos(read_pos_dict, allele_name)
+        if 'K' in self.read_aligned_seq or 'Z' in self.read_aligned_seq and len(read_range_dict[allele_name]) == 0:
+            read_range_dict = self.__get_special_case_pos(read_range_dict, allele_name, read_columns)
 
-        return read_pos_dict
+        self.relative_ranges = read_range_dict
+
+        return read_range_dict
 
 
-    def __get_special_case_pos(self, read_pos_dict, allele_name):
+    def __get_special_case_pos(self, read_range_dict, allele_name, read_columns):
         """
         If turnover region has a length of 0 (indicated by a 'K') or 1  (indicated by a 'Z') and the allele 
         has '-' as nucleotide. This function gets the correct position.
         
         Args:
-            read_pos_dict (dict): contains allele names and all positions of the given sequence relative to the alleles
+            read_range_dict (dict): contains allele names and the range of positions of the given sequence relative to the alleles
             allele_name (str): name of allele
+            read_columns (numpy.ndarray): alignment positions of the sequence characters (not '-')
         Returns:
-            read_pos_dict (dict): an updated version of original read_pos_dict
+            read_range_dict (dict): an updated version of original read_range_dict
         """
+        allele_positions = self.get_allele_positions()
+        allele_starts, allele_ends = self.get_allele_bounds()
 
-        read_start_seen = False
-        pos = 0
-        read_position = []
-        for allele, allele_seq in  self.allele_data:
-            
-            # remove '-' left and right from allele seq and give read the same length
-            allele_seq_wo_left = allele_seq.lstrip('-')
-            left_difference = len(allele_seq) - len(allele_seq_wo_left)
-            allele_seq_wo_right = allele_seq.rstrip('-')
-            sequence_seq_wo_rl = self.read_aligned_seq[left_difference:len(allele_seq_wo_right)]
-            allele_seq_wo_rl = allele_seq.strip('-')
-
-            # Remove '-' right from the read
-            sequence_read = sequence_seq_wo_rl.rstrip('-')
-
-            read_start_seen = False
-            deletion_count_allele_to_read_start = 0
-            for i, char in enumerate(sequence_read):
-                if char == '-' and read_start_seen ==  False:
-                    if allele_seq_wo_rl[i] == '-':
-                        deletion_count_allele_to_read_start += 1
-                if char != '-':
-                    read_start_seen = True
-
-            read_start_seen = False
-            pos = 0
-            for i, char in enumerate(sequence_read):
-                pos = i - deletion_count_allele_to_read_start
-                if char != '-' and read_start_seen == False:
-                    read_position = [pos]
-
-            del read_pos_dict[allele_name]
-            read_pos_dict[allele_name] = read_position
-
-        return (read_pos_dict)
+        read_position = range(0)
+        for i, allele in enumerate(self.get_allele_names()):
+            # first and last sequence character within the allele
+            first_read_column = np.searchsorted(read_columns, allele_starts[i])
+            last_read_column = np.searchsorted(read_columns, allele_ends[i]) - 1
+            if first_read_column <= last_read_column:
+                first_read_char = int(read_columns[first_read_column])
+                last_read_char = int(read_columns[last_read_column])
+
+                # the position of the last character, the allele gaps in front of the sequence are not counted
+                position = last_read_char - first_read_char + int(allele_positions[i, first_read_char])
+                read_position = range(position, position + 1)
+
+            del read_range_dict[allele_name]
+            read_range_dict[allele_name] = read_position
+
+        return read_range_dict
 
         
 class ReadPair():
@@ -557,6 +1036,20 @@ class ReadPair():
         self.read1_seq = read1_seq
         self.read2_seq = read2_seq
 
+    @classmethod
+    def from_record(cls, record, read1_aligned_checked, read2_aligned_checked):
+        """
+        Classmethod that creates the ReadPair for the checked reads of a record.
+
+        Args:
+            record (AlignmentRecord): encoded alignment of the read pair
+            read1_aligned_checked (str): sequence read 1, in alignement, after both checks
+            read2_aligned_checked (str): sequence read 2, in alignement, after both checks
+        Returns:
+            read_pair (ReadPair): the read pair
+        """
+        return cls(read1_aligned_checked, read2_aligned_checked, record.read_seqs[0], record.read_seqs[1])
+
     def check_read_pair(self, min_read_length, N_quantity):
         """
         Checks the minimum read length of the original reads and the number N's per aligned and checked read. Returns a 
@@ -608,40 +1101,22 @@ class ReadPair():
             raise ValueError ('Aligned reads have a different length!')
 
         
-        # replace '-' in front of and after read 1 with '*', but not in the read itself 
-        read1_seq_wo_l = read1_seq.lstrip('-')
-        length_left = len(read1_seq) - len(read1_seq_wo_l)
-        read1_seq_temp = length_left*'*' + read1_seq_wo_l
-        read1_seq_temp_wo_r = read1_seq_temp.rstrip('-')
-        length_right = len(read1_seq) - len(read1_seq_temp_wo_r)
-        read1_seq_temp = read1_seq_temp_wo_r + length_right*'*'
-
-        # replace '-' in front of and after read 2 with '*', but not in the read itself 
-        read2_seq_wo_l = read2_seq.lstrip('-')
-        length_left = len(read2_seq) - len(read2_seq_wo_l)
-        read2_seq_temp = length_left*'*' + read2_seq_wo_l
-        read2_seq_temp_wo_r = read2_seq_temp.rstrip('-')
-        length_right = len(read2_seq) - len(read2_seq_temp_wo_r)
-        read2_seq_temp = read2_seq_temp_wo_r + length_right*'*'
-
-        # Combine sequences read 1 and 2 (consensus)
-        read_consensus_temp = ''
-        for i in range(len(read1_seq)):
-            if read1_seq_temp[i] == '*' and read2_seq_temp[i] == '*':
-                read_consensus_temp += read1_seq_temp[i]
-            if read1_seq_temp[i] != '*' and read2_seq_temp[i] == '*':
-                read_consensus_temp += read1_seq_temp[i]
-            if read1_seq_temp[i] == '*' and read2_seq_temp[i] != '*':
-                read_consensus_temp += read2_seq_temp[i]
-            if read1_seq_temp[i] != '*' and read2_seq_temp[i] != '*':
-               if read1_seq_temp[i] == read2_seq_temp[i]:
-                   read_consensus_temp += read1_seq_temp[i]
-               if read1_seq_temp[i] == 'N' and read2_seq_temp[i] != 'N':
-                   read_consensus_temp += read2_seq_temp[i]
-               if read2_seq_temp[i] == 'N' and read1_seq_temp[i] != 'N':
-                   read_consensus_temp += read1_seq_temp[i]
-               if read1_seq_temp[i] != 'N' and read2_seq_temp[i] != 'N' and read1_seq_temp[i] != read2_seq_temp[i]:
-                   read_consensus_temp += 'N'
+        # replace '-' in front of and after the reads with '*', but not in the reads themselves
+        star = ord('*')
+        reads = np.vstack((Read.encode_sequence(read1_seq), Read.encode_sequence(read2_seq)))
+        read_starts, read_ends = AlignmentRecord.get_row_bounds(reads)
+        columns = np.arange(reads.shape[1])
+        outside_reads = (columns < read_starts[:, None]) | (columns >= read_ends[:, None])
+        read1_temp, read2_temp = np.where(outside_reads, star, reads)
+
+        # Combine sequences read 1 and 2 (consensus), different nucleotides become a 'N', a 'N' or '*' in one read
+        # is replaced by the nucleotide of the other read
+        read_consensus_array = np.where(read1_temp == read2_temp, read1_temp, AlignmentRecord.N)
+        read_consensus_array = np.where(read1_temp == star, read2_temp, read_consensus_array)
+        read_consensus_array = np.where(read2_temp == star, read1_temp, read_consensus_array)
+        read_consensus_array = np.where((read1_temp == AlignmentRecord.N) & (read2_temp != star), read2_temp, read_consensus_array)
+        read_consensus_array = np.where((read2_temp == AlignmentRecord.N) & (read1_temp != star), read1_temp, read_consensus_array)
+        read_consensus_temp = read_consensus_array.astype(np.uint8).tobytes().decode('ascii')
 
         # replace '*' in front of and after read consensus with '-', but not between the reads
         read_consensus = ''
@@ -659,30 +1134,36 @@ class CheckAlleleCombination():
     """
     This class processes each given allele combination. First an indicator string is created with indicative
     mismatches, then this string is checked and updated. Based on this string, the number of swicthes are
-    determined. Allele combinations that result 1 switch (perfect hybrid reads) are the main focus.
+    determined. Allele combinations that result 1 switch (perfect hybrid reads) are the main focus. The checks
+    and the switch count only use the positions of the informative mismatches ('X' and 'Y') of the indicator
+    string, compressed to runs of the same character.
 
     Args:
         read_consensus (str): contains read pair sequences combined, '*' indicates the gap between the reads
         allele_combo (list): allele names of given combination
         allele_data (list): list of lists with all allele names and aligned sequences
+        record (AlignmentRecord): encoded alignment of the read pair, default is None (allele_data is encoded when needed)
     """
 
     
-    def __init__(self, read_consensus, allele_combo, allele_data):
+    def __init__(self, read_consensus, allele_combo, allele_data, record = None):
         self.read_consensus = read_consensus
         self.allele_combo = allele_combo
         self.allele1 = allele_combo[0]
         self.allele2 = allele_combo[1]
         self.allele_data = allele_data
+        self.record = record
         self.indicator_string = ''
         self.number_of_artefacts = 0
+        self.informative_SNPs = {}
 
     def create_indicator_string(self):
         """
         Here, the indicator string is created based on the alleles of the given allele combination. The read 
         consensus is used as reference, mismatches for the first allele are indicated by a 'X' and mismatches for
-        the second allele are indicated by a 'Y'. The order does not matter. The indicator strings are first 
-        created separately and then they are combined. The allele_seq_list is needed in a later stage.
+        the second allele are indicated by a 'Y'. The order does not matter. The mismatches per allele are taken
+        from the record (determined once for all allele combinations) and then they are combined. The
+        allele_seq_list is needed in a later stage.
         
         Args:
             -
@@ -690,63 +1171,90 @@ class CheckAlleleCombination():
             allele_seq_list (list): contains allele sequences in alignment for given allele combination
         """
 
-        # Create a dict with only the given allele combination. The mismatch indicator string contains '-' for matches and 'X' or 'Y' for a mismatches.
-        turn_seq_list = []
+        # Get the alleles of the given allele combination. The mismatch indicator string contains '-' for matches and 'X' or 'Y' for a mismatches.
         allele_seq_list = []
-        mismatch_char = 'X'
-        start_consensus = self.read_consensus.rstrip('-').count('-') # start read pos (absolute)
-        end_consensus = len(self.read_consensus.rstrip('-'))  # end read pos (absolute)
+        allele_rows = []
+        if self.record != None:
+            allele_names = self.record.allele_names
+        else:
+            allele_names = [allele for allele, seq_string in self.allele_data]
+        for i, allele in enumerate(allele_names):
+            if allele in self.allele_combo:
+                allele_seq_list += [self.allele_data[i][1]]
+                allele_rows += [i]
 
-        for allele, seq_string in self.allele_data:
-            mismatches = 0
-            seq_string_temp = ''
-            turn_over_seq_temp = ''
+        # mismatches of all alleles with the read consensus, without record only the alleles of the combination
+        if self.record != None:
+            mismatch_rows = self.record.get_allele_mismatches(self.read_consensus)
+        else:
+            mismatch_rows = AlignmentRecord.get_mismatch_rows(AlignmentRecord.encode_rows(allele_seq_list[:2]), self.read_consensus)
+            allele_rows = [0, 1]
 
-            if allele in self.allele_combo:
-                allele_seq_list += [seq_string]
-            if allele in self.allele_combo:
-                for i, chari in enumerate(seq_string):
-                    if chari != self.read_consensus[i]:
-                        if self.read_consensus[i] != '-' and chari != '-' and self.read_consensus[i] != '*' and self.read_consensus[i] != 'N':
-                            mismatches += 1    
-                            turn_over_seq_temp += mismatch_char
-                        if self.read_consensus[i] == '-' and chari != '-':  
-                            if i < start_consensus or i >= end_consensus: # nucleotide in front of and after reads
-                                turn_over_seq_temp += '-'
-                            if i >= start_consensus and i < end_consensus:  # allele insertion
-                                turn_over_seq_temp += mismatch_char
-                        if self.read_consensus[i] != '-' and chari == '-' and self.read_consensus[i] != '*' and self.read_consensus[i] != 'N':   # allele deletion
-                            turn_over_seq_temp += mismatch_char
-                        if self.read_consensus[i] == '*' or self.read_consensus[i] == 'N':
-                            turn_over_seq_temp += '-'
-                    if chari == self.read_consensus[i]: 
-                        seq_string_temp += chari
-                        turn_over_seq_temp += '-'
-                mismatch_char = 'Y'
-                turn_seq_list += [[allele,turn_over_seq_temp]]
+        allele_mismatches = []
+        for i, seq_string in zip(allele_rows[:2], allele_seq_list):
+            allele_mismatches += [mismatch_rows[i, :len(seq_string)]]
 
         # Extract the mismatch indicator sequences for allele match 1 and 2
-        seq_allele_1 = turn_seq_list[0][1]
-        seq_allele_2 = turn_seq_list[1][1]
+        mismatches_allele_1 = allele_mismatches[0]
+        mismatches_allele_2 = allele_mismatches[1][:len(mismatches_allele_1)]
         if allele_seq_list[0] == allele_seq_list[1]:
             raise ValueError ('Aligned allele sequences (from allele combo) are identical!')
 
-        # Str with mismatch indicator sequences for allele match 1 and 2 combined
-        mismatch_indicator_combo_str = ''
-        for i in range(len(seq_allele_1)):
-            if seq_allele_1[i] == seq_allele_2[i] and seq_allele_1[i] != 'N':
-                mismatch_indicator_combo_str += seq_allele_1[i]
-            if seq_allele_1[i] != seq_allele_2[i]:
-                if seq_allele_1[i] == '-' and seq_allele_2[i] != '-':
-                    mismatch_indicator_combo_str += seq_allele_2[i]
-                if seq_allele_1[i] != '-' and seq_allele_2[i] == '-':
-                    mismatch_indicator_combo_str += seq_allele_1[i]
-                if seq_allele_1[i] != '-' and seq_allele_2[i] != '-': 
-                    mismatch_indicator_combo_str += 'M'
+        # Mismatch indicator sequences for allele match 1 ('X') and 2 ('Y') combined, 'M' for mutual mismatches
+        mismatch_indicator_combo = np.full(len(mismatches_allele_1), AlignmentRecord.GAP, dtype=np.uint8)
+        mismatch_indicator_combo[mismatches_allele_1] = ord('X')
+        mismatch_indicator_combo[mismatches_allele_2] = ord('Y')
+        mismatch_indicator_combo[mismatches_allele_1 & mismatches_allele_2] = ord('M')
+        mismatch_indicator_combo_str = mismatch_indicator_combo.tobytes().decode('ascii')
+
+        # informative mismatches of the indicator string, taken from the mismatches instead of the string
+        informative_positions = np.flatnonzero(mismatches_allele_1 ^ mismatches_allele_2)
+        number_of_mutual = int(np.count_nonzero(mismatches_allele_1 & mismatches_allele_2))
+        self.informative_SNPs[mismatch_indicator_combo_str] = (informative_positions, mismatch_indicator_combo[informative_positions], number_of_mutual)
         
         self.indicator_string = mismatch_indicator_combo_str
 
         return allele_seq_list
+
+    def get_informative_SNPs(self, indicator_string):
+        """
+        Gets the informative mismatches of an indicator string, these are the mismatches of one of the alleles ('X' or
+        'Y'). Mutual mismatches ('M') are only counted. The informative mismatches are determined once per indicator
+        string.
+
+        Args:
+            indicator_string (str): mismatch indicator string
+        Returns:
+            informative_positions (numpy.ndarray): absolute positions of the informative mismatches
+            informative_chars (numpy.ndarray): byte values of the informative mismatches
+            number_of_mutual (int): number of mutual mismatches
+        """
+        if indicator_string not in self.informative_SNPs:
+            indicator = np.frombuffer(indicator_string.encode('ascii'), dtype=np.uint8)
+            mutual = indicator == ord('M')
+            informative_positions = np.flatnonzero((indicator != AlignmentRecord.GAP) & ~mutual)
+            self.informative_SNPs[indicator_string] = (informative_positions, indicator[informative_positions], int(np.count_nonzero(mutual)))
+
+        return self.informative_SNPs[indicator_string]
+
+    @staticmethod
+    def get_runs(informative_chars):
+        """
+        Compresses the informative mismatches to runs of the same character, a new run starts at each switch from
+        'X' to 'Y' or vice versa.
+
+        Args:
+            informative_chars (numpy.ndarray): byte values of the informative mismatches
+        Returns:
+            run_starts (numpy.ndarray): index of the first informative mismatch of each run
+            run_lengths (numpy.ndarray): number of informative mismatches per run
+        """
+        new_run = np.ones(len(informative_chars), dtype=np.bool_)
+        new_run[1:] = informative_chars[1:] != informative_chars[:-1]
+        run_starts = np.flatnonzero(new_run)
+        run_lengths = np.diff(np.append(run_starts, len(informative_chars)))
+
+        return run_starts, run_lengths
     
     def check_indicative_SNPs(self):
         """
@@ -761,8 +1269,9 @@ class CheckAlleleCombination():
         """
 
         accept_combo = True
+        informative_positions, informative_chars, number_of_mutual = self.get_informative_SNPs(self.indicator_string)
         
-        if self.indicator_string.count('X') < 2 or self.indicator_string.count('Y') < 2:
+        if np.count_nonzero(informative_chars == ord('X')) < 2 or np.count_nonzero(informative_chars == ord('Y')) < 2:
             accept_combo = False
 
         return accept_combo
@@ -779,9 +1288,10 @@ class CheckAlleleCombination():
             contain more mutual mismatches.
         """
         accept_combo = True
+        informative_positions, informative_chars, number_of_mutual = self.get_informative_SNPs(self.indicator_string)
 
-        self.number_of_artefacts += self.indicator_string.count('M') 
-        if self.indicator_string.count('M') > 2:
+        self.number_of_artefacts += number_of_mutual
+        if number_of_mutual > 2:
             accept_combo = False
 
         return accept_combo
@@ -800,36 +1310,19 @@ class CheckAlleleCombination():
             number_of_artefacts (int): total number of artefacts (caused by mutual or alternately SNPs)
         """
 
-        # replace 'M' for '-'  if the alleles have a mutual mismatch, it is ignored and it is regarded as a read artefact
-        mismatch_indicator_string = self.indicator_string.replace('M', '-')
+        # if the alleles have a mutual mismatch, it is ignored and it is regarded as a read artefact
+        informative_positions, informative_chars, number_of_mutual = self.get_informative_SNPs(self.indicator_string)
 
-        # to check for XYX situations
-        only_mismatch_indicator_chars = mismatch_indicator_string.replace('-', '')
+        # to check for XYX situations, the position of each informative mismatch in its run
+        run_starts, run_lengths = CheckAlleleCombination.get_runs(informative_chars)
+        count_indicator_list = (np.arange(len(informative_chars)) - np.repeat(run_starts, run_lengths) + 1).tolist()
 
-        start_allele = only_mismatch_indicator_chars[0]
-        count_indicator_length = 0
-        count_indicator_list = []
-        for char in mismatch_indicator_string:
-            if char != '-' and char == start_allele:
-                count_indicator_length += 1
-            if char != '-' and char != start_allele:
-                count_indicator_length = 1
-            if char != '-':
-                count_indicator_list += [count_indicator_length]
-                start_allele = char
-
-        # The number of XYX situations, only a single char between two others
-        pcr_artefact = 0
+        # The number of XYX situations, only a single char between two others (a run of 1 that is not the last run)
+        pcr_artefact = int(np.count_nonzero(run_lengths[:-1] == 1))
         
         if count_indicator_list[1] == 1 and count_indicator_list[2] == 1 :  # if the indiactor string starts with a single X or Y
             pcr_artefact -= 1
 
-        for i, number in enumerate(count_indicator_list):
-            if i < len(count_indicator_list)-1:
-                next_number = count_indicator_list[i+1]
-                if number == 1 and next_number == 1:
-                    pcr_artefact += 1
-
         self.number_of_artefacts += pcr_artefact
         number_of_artefacts = self.number_of_artefacts
 
@@ -853,31 +1346,22 @@ class CheckAlleleCombination():
             mismatches.
         """
 
-        mismatch_indicator_string = self.indicator_string.replace('M', '-')
+        informative_positions, informative_chars, number_of_mutual = self.get_informative_SNPs(self.indicator_string)
 
-        indicator_combo_str_wo_artefacts = ''
-        only_mismatch_indicator_chars = mismatch_indicator_string.replace('-', '')
-        new_indicator_str = ''
+        # an informative mismatch is removed if it is a single char followed by a new run, the last one is always kept
+        count_indicator = np.array(count_indicator_list, dtype=np.intp)
+        single_SNPs = np.zeros(len(informative_chars), dtype=np.bool_)
+        checked_length = max(min(len(count_indicator) - 1, len(informative_chars)), 0)
+        single_SNPs[:checked_length] = (count_indicator[:checked_length] == 1) & (count_indicator[1:checked_length+1] == 1)
+        keep_SNPs = ~single_SNPs
+        final_positions = informative_positions[keep_SNPs]
+        final_chars = informative_chars[keep_SNPs]
 
-        for i, number in enumerate(count_indicator_list):
-            if i < len(count_indicator_list)-1:
-                next_number = count_indicator_list[i+1]
-                if number != 1 or next_number != 1:
-                    new_indicator_str += only_mismatch_indicator_chars[i]
-                if number == 1 and next_number == 1:
-                    new_indicator_str += '-'
-        
-        new_indicator_str += only_mismatch_indicator_chars[-1]
-        for i, char in enumerate(mismatch_indicator_string):
-            if char == '-':
-                indicator_combo_str_wo_artefacts += char
-            if char != '-':
-               if len(new_indicator_str) >= 1:
-                    replace_char = new_indicator_str[0]
-                    indicator_combo_str_wo_artefacts += replace_char
-                    new_indicator_str = new_indicator_str[1:]
-
-        final_indicator_string = indicator_combo_str_wo_artefacts
+        # the mutual mismatches and the removed mismatches become '-'
+        final_indicator = np.full(len(self.indicator_string), AlignmentRecord.GAP, dtype=np.uint8)
+        final_indicator[final_positions] = final_chars
+        final_indicator_string = final_indicator.tobytes().decode('ascii')
+        self.informative_SNPs[final_indicator_string] = (final_positions, final_chars, 0)
 
         return final_indicator_string
         
@@ -895,25 +1379,16 @@ class CheckAlleleCombination():
             end_turn_pos (int): absolute end position, in alignment, last nucleotide in turnover region
         """
 
-        end_turn_pos = 0
-        nr_of_switches = 0
-        only_mismatch_indicator_chars = final_indicator_string.replace('-', '')
-        switch_char = only_mismatch_indicator_chars[0]
-        start_char = only_mismatch_indicator_chars[0]
-        switch_seen = False
-        for i, char in enumerate(final_indicator_string):
-            if char != '-' and char != switch_char:
-                nr_of_switches += 1
-                switch_char = char
-            if char == start_char:
-                start_turn_pos = i + 1 # the first nucleotide after X or Y
-            if char != '-' and char != start_char and switch_seen == False:
-                end_turn_pos = i - 1  # the first nucleotide in front of X or Y
-                switch_seen = True
-
-        if nr_of_switches != 1:
-            start_turn_pos = None
-            end_turn_pos = None
+        informative_positions, informative_chars, number_of_mutual = self.get_informative_SNPs(final_indicator_string)
+        start_char = informative_chars[0]
+        nr_of_switches = int(np.count_nonzero(informative_chars[1:] != informative_chars[:-1]))
+
+        start_turn_pos = None
+        end_turn_pos = None
+        if nr_of_switches == 1:
+            first_run_length = int(np.count_nonzero(informative_chars == start_char))
+            start_turn_pos = int(informative_positions[first_run_length-1]) + 1 # the first nucleotide after X or Y
+            end_turn_pos = int(informative_positions[first_run_length]) - 1  # the first nucleotide in front of X or Y
 
         return (nr_of_switches, start_turn_pos, end_turn_pos)
     
@@ -927,9 +1402,9 @@ class CheckAlleleCombination():
         Returns:
             -
         """
-        print ('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~\n')
-        print ('Allele combination:\t\t ', self.allele1.strip(' '), 'and', self.allele2)
-        print ('Number of artefacts:\t\t ', self.number_of_artefacts, '\n')
+        ReadLog.write(ReadLog.DEBUG, '~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~\n')
+        ReadLog.write(ReadLog.DEBUG, 'Allele combination:\t\t ', self.allele1.strip(' '), 'and', self.allele2)
+        ReadLog.write(ReadLog.DEBUG, 'Number of artefacts:\t\t ', self.number_of_artefacts, '\n')
 
 class GetOneSwitchData(): 
     """
@@ -939,19 +1414,21 @@ class GetOneSwitchData():
     Args:
         allele1 (str): name allele 1
         allele2 (str): name allele 2
+        record (AlignmentRecord): encoded alignment of the read pair, default is None (allele data is searched)
     """    
 
-    def __init__(self, allele1, allele2):
+    def __init__(self, allele1, allele2, record = None):
         self.allele1 = allele1
         self.allele2 = allele2
+        self.record = record
          
     def get_read_position(self, read1_pos_dict, read2_pos_dict):
         """
         Parses and extracts the first and last value from the relative read 1 and read 2 positions for both alleles.
         
         Args:
-            read1_pos_dict (dict): contains allele names and all positions of read 1 relative to the alleles
-            read2_pos_dict (dict): contains allele names and all positions of read 2 relative to the alleles
+            read1_pos_dict (dict): contains allele names and all positions (list or range) of read 1 relative to the alleles
+            read2_pos_dict (dict): contains allele names and all positions (list or range) of read 2 relative to the alleles
             
         Returns:
             position_read1_allele1 (str): start and end position of read 1 relative to allele 1
@@ -1007,16 +1484,21 @@ class GetOneSwitchData():
         turn_over_region2_for_pos = self.__get_pos_TO_region(allele_seq_list[1], start_pos, end_pos)
  
         if start_pos == end_pos +1:
-            print ('Turnover sequence contains 0 nucleotides')
+            ReadLog.write(ReadLog.DEBUG, 'Turnover sequence contains 0 nucleotides')
 
         # Extract allele sequences
         seq_dict_allele1 = {}
         seq_dict_allele2 = {}
-        for allele, seq in allele_data:
-            if self.allele1 == allele:
-                seq_dict_allele1[allele] = seq
-            if self.allele2 == allele:
-                seq_dict_allele2[allele] = seq
+        if self.record != None:
+            for allele, seq_dict in ((self.allele1, seq_dict_allele1), (self.allele2, seq_dict_allele2)):
+                if allele in self.record.allele_rows:
+                    seq_dict[allele] = self.record.get_allele_seq(allele)
+        else:
+            for allele, seq in allele_data:
+                if self.allele1 == allele:
+                    seq_dict_allele1[allele] = seq
+                if self.allele2 == allele:
+                    seq_dict_allele2[allele] = seq
       
         seq_list_allele1 = sorted(seq_dict_allele1.items())
         seq_list_allele2 = sorted(seq_dict_allele2.items())
@@ -1039,42 +1521,23 @@ class GetOneSwitchData():
             turn_over_region_for_pos (str): the turnover region sequence in alignment from given allele
         """
 
-        turn_over_region_for_pos = ''
-        check_for_empty_char_string = ''
-        empty_string =  True
-        for i, char in enumerate(aligned_allele):
-            if start_pos == end_pos:    # for TO with length 1
-                empty_string = False
-                if i != start_pos:
-                    turn_over_region_for_pos += '-'
-                if i == start_pos:
+        allele_length = len(aligned_allele)
+        if start_pos == end_pos or start_pos == end_pos + 1:    # for TO with length 1 or 0
+            turn_over_region_for_pos = '-' * allele_length
+            if start_pos >= 0 and start_pos < allele_length:
+                char = 'K'
+                if start_pos == end_pos:
+                    char = aligned_allele[start_pos]
                     if char == '-':     # if allele has '-' as nucleotide
                         char = 'Z'
-                    turn_over_region_for_pos += char
-            if start_pos == end_pos + 1:    # for TO with length 0
-                empty_string = False
-                char = 'K'     
-                if i != start_pos:
-                    turn_over_region_for_pos += '-'
-                if i == start_pos:
-                    turn_over_region_for_pos += char
-            if start_pos != end_pos + 1 and start_pos != end_pos:  # for TO > length 1
-                if i < start_pos:
-                    turn_over_region_for_pos += '-'
-                    check_for_empty_char_string += '-'
-                if i > end_pos:
-                    turn_over_region_for_pos += '-'
-                    check_for_empty_char_string += '-'
-                if i >= start_pos and i <= end_pos:
-                    if char != '-':
-                        turn_over_region_for_pos += char
-                        empty_string = False
-                    if char == '-':
-                        turn_over_region_for_pos += char
-                        check_for_empty_char_string += 'Z'
-       
-        if empty_string == True:
-            turn_over_region_for_pos = check_for_empty_char_string
+                turn_over_region_for_pos = '-' * start_pos + char + '-' * (allele_length - start_pos - 1)
+        else:   # for TO > length 1
+            first_pos = min(start_pos, allele_length)
+            last_pos = max(min(end_pos + 1, allele_length), first_pos)
+            turn_over_region = aligned_allele[first_pos:last_pos]
+            if turn_over_region.strip('-') == '':
+                turn_over_region = 'Z' * len(turn_over_region)
+            turn_over_region_for_pos = '-' * first_pos + turn_over_region + '-' * (allele_length - last_pos)
 
         return (turn_over_region_for_pos)
        
@@ -1084,8 +1547,8 @@ class GetOneSwitchData():
         of 0 or 1 nucleotide, then the start and end position are equal, and just the start position is selected. 
         
         Args:
-            TO_allele1_dict (dict): contains allele name and turnover positions relative to allele 1
-            TO_allele2_dict (dict): contains allele name and turnover positions relative to allele 2
+            TO_allele1_dict (dict): contains allele name and turnover positions (list or range) relative to allele 1
+            TO_allele2_dict (dict): contains allele name and turnover positions (list or range) relative to allele 2
             turn_over_region1_for_pos (str): turnover region sequence in aligenment for allele 1
             turn_over_region2_for_pos (str): turnover region sequence in aligenment for allele 2
         Returns:
@@ -1139,16 +1602,18 @@ class GetOneSwitchData():
         Returns:
             -        
         """
+        if ReadLog.is_enabled(ReadLog.DEBUG) == False:
+            return
 
-        print ('Allele match:\t\t\t ', allele_name)
-        print ('Read 1 position:\t\t ', pos_read1_allele)
-        print ('Read 2 position:\t\t ', pos_read2_allele)
-        print ('Turnover sequence length:\t ', len(turn_over_region))
+        ReadLog.write(ReadLog.DEBUG, 'Allele match:\t\t\t ', allele_name)
+        ReadLog.write(ReadLog.DEBUG, 'Read 1 position:\t\t ', pos_read1_allele)
+        ReadLog.write(ReadLog.DEBUG, 'Read 2 position:\t\t ', pos_read2_allele)
+        ReadLog.write(ReadLog.DEBUG, 'Turnover sequence length:\t ', len(turn_over_region))
         if turn_over_region == '':
             turn_over_region = '-'
-        print ('Turnover sequence:\t\t ', turn_over_region)
-        print ('Turnover region position:\t ', pos_to_region)
-        print ('\n')
+        ReadLog.write(ReadLog.DEBUG, 'Turnover sequence:\t\t ', turn_over_region)
+        ReadLog.write(ReadLog.DEBUG, 'Turnover region position:\t ', pos_to_region)
+        ReadLog.write(ReadLog.DEBUG, '\n')
          
 class CreateOutput():
     """
@@ -1160,15 +1625,17 @@ class CreateOutput():
     Args:
         read_name (str) = name of read
     """
+    collected_lines = None   # list of output file name and line, in worker processes
+    writers = None   # OutputWriters that keeps the output files open
 
     def __init__(self, read_name):
         self.read_name = read_name
     
     @staticmethod
-    def prep_output_files(input_file_name):
+    def set_output_file_names(input_file_name):
         """
-        Creates all output files names and creates the files themselves including the headers.
-        
+        Creates all output files names.
+
         Args:
             input_file_name (str): Name of input file
         Returns:
@@ -1181,6 +1648,69 @@ class CreateOutput():
         CreateOutput.output_file_1_switch = 'hybrid_reads_1_switch_{0}.txt'.format(data_type)
         CreateOutput.output_file_overall = 'metadata_{0}.txt'.format(data_type)
 
+    @staticmethod
+    def write_line(output_file_name, line):
+        """
+        Adds a line to an output file. In a worker process the line is collected instead, the main process writes it.
+
+        Args:
+            output_file_name (str): Name of output file
+            line (str): line including newline
+        Returns:
+            -
+        """
+        if CreateOutput.collected_lines != None:
+            CreateOutput.collected_lines += [(output_file_name, line)]
+            return
+        if CreateOutput.writers != None:
+            CreateOutput.writers.write(output_file_name, line)
+            return
+
+        with open(output_file_name, 'a') as db_file:
+            db_file.write(line)
+
+    @staticmethod
+    def open_output_files(buffer_size, flush_records, flush_interval, use_fsync):
+        """
+        Keeps the output files of the read categories open, write_line then writes into their buffers.
+
+        Args:
+            buffer_size (int): buffer size per output file in bytes
+            flush_records (int): number of lines after which the buffers are written to the files
+            flush_interval (float): seconds after which the buffers are written to the files
+            use_fsync (bool): sync the files to disk at each flush
+        Returns:
+            -
+        """
+        output_file_names = [CreateOutput.output_file_non_hybrids, CreateOutput.output_file_zero_reads, CreateOutput.output_file_more_switches, CreateOutput.output_file_1_switch]
+        CreateOutput.writers = OutputWriters(output_file_names, buffer_size, flush_records, flush_interval, use_fsync)
+
+    @staticmethod
+    def close_output_files():
+        """
+        Writes the buffers and closes the output files that were kept open.
+
+        Args:
+            -
+        Returns:
+            -
+        """
+        if CreateOutput.writers != None:
+            CreateOutput.writers.close()
+            CreateOutput.writers = None
+
+    @staticmethod
+    def prep_output_files(input_file_name):
+        """
+        Creates all output files names and creates the files themselves including the headers.
+        
+        Args:
+            input_file_name (str): Name of input file
+        Returns:
+            -
+        """
+        CreateOutput.set_output_file_names(input_file_name)
+
         #create output file for non hybrid reads
         with open(CreateOutput.output_file_non_hybrids, 'w') as db_file:
             db_file.write('Read name\tAllele match\n') 
@@ -1212,16 +1742,14 @@ class CreateOutput():
         Returns:
             -    
         """
-        print ('Non hybrid read: ', self.read_name)
+        ReadLog.write(ReadLog.PER_READ, 'Non hybrid read: ', self.read_name)
         
         # Write read data into outfile
         if note == '':
-            with open(CreateOutput.output_file_non_hybrids, 'a') as db_file:
-                db_file.write(self.read_name + '\t' + allele_match + '\n') 
+            CreateOutput.write_line(CreateOutput.output_file_non_hybrids, self.read_name + '\t' + allele_match + '\n')
    
         if note != '':
-            with open(CreateOutput.output_file_non_hybrids, 'a') as db_file:
-                db_file.write(self.read_name + '\t' + allele_match + '\t' + note + '\n') 
+            CreateOutput.write_line(CreateOutput.output_file_non_hybrids, self.read_name + '\t' + allele_match + '\t' + note + '\n')
  
     def zero_reads(self, note):
         """
@@ -1233,11 +1761,10 @@ class CreateOutput():
         Returns:
             -
         """
-        print ('Read with 0 mismatches for multiple alleles:', self.read_name)
+        ReadLog.write(ReadLog.PER_READ, 'Read with 0 mismatches for multiple alleles:', self.read_name)
 
         # add reads that have 0 mismatches for multiple alleles
-        with open(CreateOutput.output_file_zero_reads, 'a') as db_file:
-            db_file.write(self.read_name + '\t' + note + '\n') 
+        CreateOutput.write_line(CreateOutput.output_file_zero_reads, self.read_name + '\t' + note + '\n')
     
     def hybrid_read_more_switches(self):
         """
@@ -1250,11 +1777,10 @@ class CreateOutput():
             -    
         """
 
-        print ('Read with more switches: ', self.read_name)
+        ReadLog.write(ReadLog.PER_READ, 'Read with more switches: ', self.read_name)
         
         # add hybrid reads with more switches  
-        with open(CreateOutput.output_file_more_switches, 'a') as db_file:
-            db_file.write(self.read_name + '\n') 
+        CreateOutput.write_line(CreateOutput.output_file_more_switches, self.read_name + '\n')
    
     def hybrid_read_1_switch(self, allele_name, pos_read1_allele, pos_read2_allele, allele_read1_mismatches, allele_read2_mismatches, allele_consensus_mismatches, turn_over_region, pos_to_region, read_artefacts):
         """
@@ -1278,9 +1804,39 @@ class CreateOutput():
             turn_over_region = '-'
 
         # add hybrid reads with one switch
-        with open(CreateOutput.output_file_1_switch, 'a') as db_file:
-            db_file.write(str(self.read_name) + '\t' + str(allele_name) + '\t' + str(pos_read1_allele) + '\t' + str(pos_read2_allele) + '\t' + str(allele_read1_mismatches)  + '\t' + str(allele_read2_mismatches)\
-              + '\t' + str(allele_consensus_mismatches) + '\t' + str(read_artefacts) + '\t' + str(pos_to_region) + '\t' + str(turn_over_region) + '\n') 
+        CreateOutput.write_line(CreateOutput.output_file_1_switch, str(self.read_name) + '\t' + str(allele_name) + '\t' + str(pos_read1_allele) + '\t' + str(pos_read2_allele) + '\t' + str(allele_read1_mismatches)  + '\t' + str(allele_read2_mismatches)\
+              + '\t' + str(allele_consensus_mismatches) + '\t' + str(read_artefacts) + '\t' + str(pos_to_region) + '\t' + str(turn_over_region) + '\n')
+
+    @staticmethod
+    def add_prefiltered_reads(prefiltered_file_name):
+        """
+        Adds the read pairs that were classified by AlignReads.py without alignment (non hybrid reads and zero
+        reads) to the output files.
+
+        Args:
+            prefiltered_file_name (str): name of the prefiltered output file of AlignReads.py
+        Returns:
+            non_hybrid_count (int): number of prefiltered non hybrid reads
+            zero_count (int): number of prefiltered zero reads
+        """
+        non_hybrid_count = 0
+        zero_count = 0
+        with open(prefiltered_file_name) as file_object:
+            next(file_object, None)   # header
+            for line in file_object:
+                line = line.rstrip('\n').split('\t', 2)
+                if len(line) < 3:
+                    continue
+                category, read_name, result = line
+                read_output = CreateOutput(read_name)
+                if category == 'non_hybrid':
+                    non_hybrid_count += 1
+                    read_output.non_hybrid_read(result, '')
+                if category == 'zero':
+                    zero_count += 1
+                    read_output.zero_reads(result)
+
+        return non_hybrid_count, zero_count
 
     @staticmethod
     def metadata(incorrect_aligned_reads, rejected_read_count, non_hybrid_count, zero_count, more_switches_count, one_switch_hybrid_count, total_nr_of_reads):
@@ -1310,6 +1866,425 @@ class CreateOutput():
 
 
 
+class OutputWriters():
+    """
+    This class keeps output files open and writes the lines into a large buffer per file, instead of opening and
+    closing a file for each line. The buffers are written to the files (flushed) after a number of lines or seconds,
+    and when the files are closed.
+
+    Args:
+        output_file_names (list): names of the output files, the files are opened for appending
+        buffer_size (int): buffer size per output file in bytes
+        flush_records (int): number of lines after which the buffers are flushed
+        flush_interval (float): seconds after which the buffers are flushed
+        use_fsync (bool): sync the files to disk at each flush
+    """
+
+    def __init__(self, output_file_names, buffer_size = 1048576, flush_records = 10000, flush_interval = 10.0, use_fsync = False):
+        self.flush_records = flush_records
+        self.flush_interval = flush_interval
+        self.use_fsync = use_fsync
+        self.records = 0
+        self.last_flush = time.monotonic()
+        self.output_files = {}
+        for output_file_name in output_file_names:
+            self.output_files[output_file_name] = open(output_file_name, 'a', buffering=buffer_size)
+
+    def write(self, output_file_name, line):
+        """
+        Writes a line into the buffer of an output file.
+
+        Args:
+            output_file_name (str): name of output file
+            line (str): line including newline
+        Returns:
+            -
+        """
+        self.output_files[output_file_name].write(line)
+        self.records += 1
+        if self.records >= self.flush_records or time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffers to the output files, and syncs the files to disk if use_fsync is True.
+
+        Args:
+            -
+        Returns:
+            -
+        """
+        for file_object in self.output_files.values():
+            file_object.flush()
+            if self.use_fsync == True:
+                os.fsync(file_object.fileno())
+        self.records = 0
+        self.last_flush = time.monotonic()
+
+    def close(self):
+        """
+        Flushes and closes the output files.
+
+        Args:
+            -
+        Returns:
+            -
+        """
+        try:
+            self.flush()
+        finally:
+            for file_object in self.output_files.values():
+                file_object.close()
+            self.output_files = {}
+
+def classify_read_pair(read_info, all_allele_combinations, trace = None):
+    """
+    Analyzes one read pair according to the sequence diagram: the read pair is categorized and its data is added to
+    the output file of the category.
+
+    Args:
+        read_info (list): read information (read name and quality values), allele names and all alignments of the read pair
+        all_allele_combinations (list): contains all possible allele name combinations
+        trace (dict): filled with the mismatches per allele and 1 switch data of the read pair, default is None (no trace)
+    Returns:
+        category (str): 'incorrect_aligned', 'rejected', 'non_hybrid', 'zero', 'one_switch' or 'more_switches'
+    """
+
+    # Encode the alignment of the read pair once, it is shared by all objects below
+    record = AlignmentRecord(read_info)
+    read_name = record.read_name
+    ReadLog.write(ReadLog.PER_READ, 'Read name :', read_name)
+    if trace != None:
+        trace['read'] = read_name
+    note = ''
+
+    # Get allele data
+    allele_data = record.allele_data
+
+    # Perform checks for read 1
+    R1_read = Read.from_record(record, 1)
+    check_alignment = R1_read.check_alignment()
+    if check_alignment == False:  # Check if alignement correct
+        return 'incorrect_aligned'
+    R1_alignment_after_second_check = R1_read.check_read(record.read_qvs[0], MINIMUM_Q_SCORE, QUALITY_OFFSET)
+
+    # Perform checks for read 2
+    R2_read = Read.from_record(record, 2)
+    R2_alignment_after_second_check = R2_read.check_read(record.read_qvs[1], MINIMUM_Q_SCORE, QUALITY_OFFSET)
+
+    # Check if read pair met the requirements
+    R1_and_R2 = ReadPair.from_record(record, R1_alignment_after_second_check, R2_alignment_after_second_check)
+
+    approve_reads = R1_and_R2.check_read_pair(MIN_READ_LENGTH, N_QUANTITY)
+    if approve_reads == True:
+        ReadLog.write(ReadLog.PER_READ, 'Paired-end read is accepted')
+    if approve_reads == False:
+        ReadLog.write(ReadLog.PER_READ, 'Paired-end read is rejected')
+        return 'rejected'
+
+    ###########
+    ###########  Mismatches per read
+    ###########
+    # Get mismatches per read for each allele
+    R1_mismatch_dict, R1_mismatch_dict_ex = R1_read.get_mismatches(R1_alignment_after_second_check)
+    R2_mismatch_dict, R2_mismatch_dict_ex = R2_read.get_mismatches(R2_alignment_after_second_check)
+
+    # Sort alleles, alleles with lowest nr of mismatches first
+    mismatch_dict_read1_sorted = sorted(R1_mismatch_dict.items(), key=lambda kv: kv[1])     
+    mismatch_dict_read2_sorted = sorted(R2_mismatch_dict.items(), key=lambda kv: kv[1])
+    if trace != None:
+        trace['mismatches_read1'] = dict((allele.strip(' '), mismatches[0]) for allele, mismatches in R1_mismatch_dict.items())
+        trace['mismatches_read2'] = dict((allele.strip(' '), mismatches[0]) for allele, mismatches in R2_mismatch_dict.items())
+
+    # Count number of alleles with 0 mismatches for read 1
+    zero_mismatch_count_read1 = 0
+    zero_mismatch_allele_read1 = []
+    for allele, mismatches in R1_mismatch_dict.items():
+        if mismatches[0] == 0:
+            zero_mismatch_count_read1 += 1
+            zero_mismatch_allele_read1 += [allele]
+
+    # Count number of alleles with 0 mismatches for read 2
+    zero_mismatch_count_read2 = 0
+    zero_mismatch_allele_read2 = []
+    for allele, mismatches in R2_mismatch_dict.items():
+        if mismatches[0] == 0:
+            zero_mismatch_count_read2 += 1
+            zero_mismatch_allele_read2 += [allele]
+
+    ### For non hybrid reads (perfect non hybrid)
+    non_hybrid = False
+    if zero_mismatch_count_read1 == zero_mismatch_count_read2 == 1:
+        # First check if reads are hybrid, if same allele has mismatches for both reads, then it is a non hybrid
+        if mismatch_dict_read1_sorted[0][1][0] == 0:
+            check_allel = mismatch_dict_read1_sorted[0][0]
+            if R2_mismatch_dict[check_allel][0] == 0:
+                allele_match =  mismatch_dict_read1_sorted[0][0]
+                if trace != None:
+                    trace['allele'] = allele_match.strip(' ')
+                read_output = CreateOutput(read_name)
+                read_output.non_hybrid_read(allele_match, note)
+                non_hybrid = True
+                return 'non_hybrid'
+
+    ### For zero reads (multiple alleles with 0 mismatches)
+    if zero_mismatch_count_read1 != 0 and zero_mismatch_count_read2 != 0:
+        if zero_mismatch_count_read1 > 1 or zero_mismatch_count_read2 > 1:
+            note = 'Note: Allele(s) {0} has/have 0 mismatches with read 1\tAllele(s) {1} has/have 0 mismatches with read 2'.format(zero_mismatch_allele_read1, zero_mismatch_allele_read2)
+            if trace != None:
+                trace['zero_mismatch_alleles_read1'] = [allele.strip(' ') for allele in zero_mismatch_allele_read1]
+                trace['zero_mismatch_alleles_read2'] = [allele.strip(' ') for allele in zero_mismatch_allele_read2]
+            read_output = CreateOutput(read_name)
+            read_output.zero_reads(note)
+            non_hybrid = True
+            return 'zero'
+
+    ###########
+    ###########  Mismatches read consensus
+    ###########
+
+    # Create read consensus
+    alignment_read_consensus = R1_and_R2.create_read_consensus()
+    consensus_read = Read.classmethod_for_non_read(alignment_read_consensus, allele_data, record)
+    mismatch_dict_read_con, mismatch_dict_read_con_ex = consensus_read.get_mismatches(alignment_read_consensus)
+    mismatch_dict_read_con_sorted = sorted(mismatch_dict_read_con.items(), key=lambda kv: kv[1])
+    if trace != None:
+        trace['mismatches_consensus'] = dict((allele.strip(' '), mismatches[0]) for allele, mismatches in mismatch_dict_read_con.items())
+
+    ### For non hybrid reads, if read consensus has 0 or 1 mismatches
+    if mismatch_dict_read_con_sorted[0][1][0] == 0 or mismatch_dict_read_con_sorted[0][1][0] == 1:
+        allele_match = mismatch_dict_read_con_sorted[0][0]
+        if mismatch_dict_read_con_sorted[0][1][0] == 1:
+            note = 'Read consensus has 1 mismatch'
+        if trace != None:
+            trace['allele'] = allele_match.strip(' ')
+        read_output = CreateOutput(read_name)
+        read_output.non_hybrid_read(allele_match, note)
+        return 'non_hybrid'
+
+    # Print all mismatch information
+    R1_read.print_mismatches('First read', R1_mismatch_dict_ex)
+    R2_read.print_mismatches('Second read', R2_mismatch_dict_ex)
+    consensus_read.print_mismatches('Read consensus', mismatch_dict_read_con_ex)
+
+
+    ###########
+    ###########  Determine number of switches for all allele combinations
+    ###########
+    more_switches = True
+    # Loop through all allele combinations
+    for allele_combo in all_allele_combinations:
+        allele1 = allele_combo[0]
+        allele2 = allele_combo[1]
+
+        per_allele_info = CheckAlleleCombination(alignment_read_consensus, allele_combo, allele_data, record)
+
+        # Create indicator string
+        allele_seq_list = per_allele_info.create_indicator_string()
+
+        # Apply first and second check, and update indicator string
+        check1 = per_allele_info.check_indicative_SNPs()
+        if check1 == True:
+            check2 = per_allele_info.check_mutual_SNPs()
+        else:
+            continue
+
+        if check2 == True:
+            count_indicator_list, number_of_artefacts = per_allele_info.check_alternately_SNPs()
+        else:
+            continue
+
+        if count_indicator_list != None:
+            final_indicator_string = per_allele_info.update_indicator_string(count_indicator_list)
+        else:
+            continue
+
+        # Check if updated indicator string has enough indicative SNPs
+        repeat_check1 = per_allele_info.check_indicative_SNPs()
+
+        if repeat_check1 == True:
+            nr_of_switches, start_turn_pos, end_turn_pos = per_allele_info.get_switches(final_indicator_string)
+
+        else:
+            continue
+
+        # Generate all data if allele combo resulted in a 1 switch indicator string
+        if nr_of_switches == 1:
+            more_switches = False
+
+            # Print 1 switch pre data
+            per_allele_info.print_1_switch_alleles()
+            read1_pos_dict = R1_read.get_relative_ranges()
+            read2_pos_dict = R2_read.get_relative_ranges()
+
+            # Get read positions
+            final_to_region = GetOneSwitchData(allele1, allele2, record)
+            pos_read1_allele1, pos_read2_allele1, pos_read1_allele2, pos_read2_allele2 = final_to_region.get_read_position(read1_pos_dict, read2_pos_dict)
+
+            # Get turnover region sequence and positions
+            turn_over_region1_for_pos, seq_list_allele1, turn_over_region2_for_pos, seq_list_allele2 = final_to_region.prep_for_turnover_position(start_turn_pos, end_turn_pos, allele_seq_list, allele_data)
+            TO1_seq = Read.classmethod_for_non_read(turn_over_region1_for_pos, seq_list_allele1)
+            TO2_seq = Read.classmethod_for_non_read(turn_over_region2_for_pos, seq_list_allele2)
+
+            TO_allele1_dict = TO1_seq.get_relative_ranges()
+            TO_allele2_dict = TO2_seq.get_relative_ranges()
+
+            pos_to_region1, pos_to_region2, turn_over_region1, turn_over_region2 = final_to_region.get_TO_position(TO_allele1_dict, TO_allele2_dict, turn_over_region1_for_pos, turn_over_region2_for_pos)
+
+            # Print 1 switch extended data              
+            GetOneSwitchData.print_TO_output(allele1, pos_read1_allele1, pos_read2_allele1, turn_over_region1, pos_to_region1)
+            GetOneSwitchData.print_TO_output(allele2, pos_read1_allele2, pos_read2_allele2, turn_over_region2, pos_to_region2)
+
+            # Parse 1 switch extended data and add it to output file
+            allele1_read1_mismatches = str(R1_mismatch_dict[allele1][0])
+            allele1_read2_mismatches = str(R2_mismatch_dict[allele1][0])
+            allele2_read1_mismatches = str(R1_mismatch_dict[allele2][0])
+            allele2_read2_mismatches = str(R2_mismatch_dict[allele2][0])
+            allele1_consensus_mismatches = str(mismatch_dict_read_con[allele1][0])
+            allele2_consensus_mismatches = str(mismatch_dict_read_con[allele2][0])
+
+            read_output = CreateOutput(read_name)
+            read_output.hybrid_read_1_switch(allele1, pos_read1_allele1, pos_read2_allele1, allele1_read1_mismatches, allele1_read2_mismatches, allele1_consensus_mismatches, turn_over_region1, pos_to_region1, number_of_artefacts)
+            read_output.hybrid_read_1_switch(allele2, pos_read1_allele2, pos_read2_allele2, allele2_read1_mismatches, allele2_read2_mismatches, allele2_consensus_mismatches, turn_over_region2, pos_to_region2, number_of_artefacts)
+            if trace != None:
+                trace.setdefault('one_switch', [])
+                trace['one_switch'] += [{'alleles': [allele1.strip(' '), allele2.strip(' ')], 'artefacts': number_of_artefacts,
+                                         'read1_position': [str(pos_read1_allele1), str(pos_read1_allele2)], 'read2_position': [str(pos_read2_allele1), str(pos_read2_allele2)],
+                                         'turnover_position': [str(pos_to_region1), str(pos_to_region2)], 'turnover_sequence': [turn_over_region1, turn_over_region2]}]
+
+    # If at least one the allele combinations resulted in indicator string with 1 switch
+    if more_switches == False:
+        ReadLog.write(ReadLog.PER_READ, 'Hybrid read with 1 switch: ', read_name)
+        return 'one_switch'
+
+    # If non of the allele combinations resulted in indicator string with 1 switch, then we found a
+    # hybrid read with more switches (too many mismatches).  
+    if more_switches == True:
+        read_output = CreateOutput(read_name)
+        read_output.hybrid_read_more_switches()
+        return 'more_switches'
+
+
+class ParallelClassification():
+    """
+    This class classifies the read pairs in worker processes. The read pairs are sent to the workers in chunks, each
+    worker analyzes the read pairs with classify_read_pair, but collects the lines for the output files and the
+    messages instead of writing them. The main process writes them in input order, so the output is the same as
+    when the read pairs are classified one by one.
+
+    Args:
+        -
+    """
+    allele_combinations = None
+    use_trace = False
+
+    @staticmethod
+    def init_worker(input_file_name, all_allele_combinations, log_level, use_trace):
+        """
+        Prepares a worker process: the output file names are set and output lines and messages are collected.
+
+        Args:
+            input_file_name (str): name of input file
+            all_allele_combinations (list): contains all possible allele name combinations
+            log_level (str): 'quiet', 'summary', 'per-read' or 'debug'
+            use_trace (bool): create the trace of each read pair
+        Returns:
+            -
+        """
+        CreateOutput.set_output_file_names(input_file_name)
+        CreateOutput.collected_lines = []
+        ReadLog.configure(log_level, io.StringIO())
+        ParallelClassification.allele_combinations = all_allele_combinations
+        ParallelClassification.use_trace = use_trace
+
+    @staticmethod
+    def classify_chunk(chunk):
+        """
+        Classifies a chunk of read pairs in a worker process.
+
+        Args:
+            chunk (list): read information of the read pairs
+        Returns:
+            results (list): category, output lines (output file name and line), messages and trace per read pair
+        """
+        results = []
+        for read_info in chunk:
+            CreateOutput.collected_lines = []
+            messages = io.StringIO()
+            ReadLog.handler.setStream(messages)
+            trace = None
+            if ParallelClassification.use_trace == True:
+                trace = {}
+            category = classify_read_pair(read_info, ParallelClassification.allele_combinations, trace)
+            results += [(category, CreateOutput.collected_lines, messages.getvalue(), trace)]
+
+        return results
+
+    @staticmethod
+    def classify_read_pairs(read_pairs, all_allele_combinations, input_file_name, workers, chunk_size, log_level, use_trace):
+        """
+        Classifies the read pairs in a pool of worker processes and yields the results in input order. At most
+        twice the number of workers chunks are sent ahead of the chunk that is yielded next, so the memory use
+        does not grow with the number of read pairs.
+
+        Args:
+            read_pairs (iterable): read information of the read pairs
+            all_allele_combinations (list): contains all possible allele name combinations
+            input_file_name (str): name of input file
+            workers (int): number of worker processes
+            chunk_size (int): number of read pairs sent to a worker at once
+            log_level (str): 'quiet', 'summary', 'per-read' or 'debug'
+            use_trace (bool): create the trace of each read pair
+        Yields:
+            category (str): 'incorrect_aligned', 'rejected', 'non_hybrid', 'zero', 'one_switch' or 'more_switches'
+            output_lines (list): output file name and line, for each line the read pair adds to the output files
+            messages (str): the messages written during the analysis of the read pair
+            trace (dict): mismatches per allele and 1 switch data of the read pair, None without trace
+        """
+        in_flight = deque()
+        if CreateOutput.writers != None:   # worker processes must not inherit unwritten buffers
+            CreateOutput.writers.flush()
+        with ProcessPoolExecutor(max_workers=workers, initializer=ParallelClassification.init_worker, initargs=(input_file_name, all_allele_combinations, log_level, use_trace)) as executor:
+            chunk = []
+            for read_info in read_pairs:
+                chunk += [read_info]
+                if len(chunk) == chunk_size:
+                    in_flight.append(executor.submit(ParallelClassification.classify_chunk, chunk))
+                    chunk = []
+                if len(in_flight) >= 2 * workers:
+                    yield from in_flight.popleft().result()
+            if len(chunk) > 0:
+                in_flight.append(executor.submit(ParallelClassification.classify_chunk, chunk))
+            while in_flight:
+                yield from in_flight.popleft().result()
+
+def parse_arguments(arguments):
+    """
+    Parses the command line arguments.
+
+    Args:
+        arguments (list): command line arguments without the script name
+    Returns:
+        parsed_arguments (Namespace): input file, workers, chunk size, output buffer settings, log level and trace file
+    """
+    parser = argparse.ArgumentParser(description='Categorizes the aligned read pairs of AlignReads.py in non hybrid reads, zero reads and hybrid reads.')
+    parser.add_argument('input_file', help='output file of AlignReads.py, e.g. msa_output_samfile_reads_HLA-A.txt (text) or .msa (binary)')
+    parser.add_argument('--workers', type=int, default=1, help='number of processes that classify the read pairs (default: 1)')
+    parser.add_argument('--chunk-size', type=int, default=64, help='number of read pairs sent to a worker process at once (default: 64)')
+    parser.add_argument('--buffer-size', type=int, default=1048576, help='buffer size per output file in bytes (default: 1048576)')
+    parser.add_argument('--flush-records', type=int, default=10000, help='number of output lines after which the buffers are written to the files (default: 10000)')
+    parser.add_argument('--flush-interval', type=float, default=10.0, help='seconds after which the buffers are written to the files (default: 10)')
+    parser.add_argument('--fsync', action='store_true', help='sync the output files to disk each time the buffers are written')
+    parser.add_argument('--log-level', choices=['quiet', 'summary', 'per-read', 'debug'], default='quiet', help="messages written to stdout: 'quiet' only warnings, 'summary' the read counts, 'per-read' also each read pair, 'debug' also the mismatch tables and 1 switch data (default: quiet)")
+    parser.add_argument('--trace', default=None, help='JSON lines file with the category, mismatches per allele and 1 switch data of each read pair (default: no trace)')
+    parsed_arguments = parser.parse_args(arguments)
+    if parsed_arguments.workers < 1 or parsed_arguments.chunk_size < 1:
+        parser.error('--workers and --chunk-size must be at least 1')
+    if parsed_arguments.buffer_size < 1 or parsed_arguments.flush_records < 1:
+        parser.error('--buffer-size and --flush-records must be at least 1')
+
+    return parsed_arguments
+
 def main():
     """
     This is the main function of the script and calls all methods according to the sequence diagram. All reads are monitored and counted. 
@@ -1321,244 +2296,81 @@ def main():
         -
     """
 
-    input_file = argv[1]
+    arguments = parse_arguments(argv[1:])
+    input_file = arguments.input_file
+    ReadLog.configure(arguments.log_level, sys.stdout)
 
     # Create all output files
     CreateOutput.prep_output_files(input_file)
   
-    # Parse input file
-    with open (input_file) as file_object:
-            input_file = file_object.read()
-    all_data, allele_data = ParseInput.collect_all_data(input_file)
+    # Parse input file (text or binary format) as a stream, the allele names are taken from the first read pair
+    all_data = ParseInput.read_file(input_file)
+    first_read_pair = next(all_data, None)
+    if first_read_pair == None:
+        raise ValueError ('The input file contains no read pairs!')
+    allele_data = ParseInput.get_allele_names(first_read_pair)
+    all_data = itertools.chain([first_read_pair], all_data)
     all_allele_combinations = ParseInput.get_allele_combinations(allele_data)
 
     # Track all reads
-    incorrect_aligned_reads = 0
-    rejected_read_count = 0
-    non_hybrid_count = 0
-    zero_count = 0
-    more_switches_count = 0
-    one_switch_hybrid_count = 0
+    read_counts = {'incorrect_aligned': 0, 'rejected': 0, 'non_hybrid': 0, 'zero': 0, 'more_switches': 0, 'one_switch': 0}
     read_counter = 1
 
-    # Loop through each read pair
-    for read_info in all_data:
-        print ('Number of analyzed reads :', read_counter, '\n')
-        read_counter += 1
-        print ('~~~~~~~~~~~~~~~~ Read analysis started ~~~~~~~~~~~~~~~~')
-        read_name = read_info[0][0]
-        print ('Read name :', read_name)
-        note = ''
-        read1_seq = read_info[0][1]
-        read1_qv = read_info[0][2]
-        read2_seq = read_info[1][1]
-        read2_qv = read_info[1][2]
-        read1_aligned_seq = read_info[2][1]
-        read2_aligned_seq = read_info[3][1]
-        
-        # Get allele data
-        allele_data = read_info[4:]
-       
-        # Perform checks for read 1
-        R1_read = Read(read1_seq, read1_aligned_seq, allele_data)
-        check_alignment = R1_read.check_alignment()
-        if check_alignment == False:  # Check if alignement correct
-            incorrect_aligned_reads += 1
-            continue        
-        R1_alignment_after_first_check = R1_read.apply_qv(read1_qv)
-        R1_alignment_after_second_check = R1_read.check_read_artefacts(R1_alignment_after_first_check)
-
-        # Perform checks for read 2
-        R2_read = Read(read2_seq, read2_aligned_seq, allele_data)
-        R2_alignment_after_first_check = R2_read.apply_qv(read2_qv)
-        R2_alignment_after_second_check = R2_read.check_read_artefacts(R2_alignment_after_first_check)
-
-        # Check if read pair met the requirements
-        R1_and_R2 = ReadPair(R1_alignment_after_second_check, R2_alignment_after_second_check, read1_seq, read2_seq)
-
-        # Adjust requirement values here:
-        min_read_length = 50
-        N_quantity = 15
-
-        approve_reads = R1_and_R2.check_read_pair(min_read_length, N_quantity)
-        if approve_reads == True:
-            print ('Paired-end read is accepted')
-        if approve_reads == False:
-            rejected_read_count += 1
-            print ('Paired-end read is rejected')
-            continue
+    # Keep the output files open, they are closed (and the buffers written) also after an error
+    CreateOutput.open_output_files(arguments.buffer_size, arguments.flush_records, arguments.flush_interval, arguments.fsync)
+    trace_file = None
+    if arguments.trace != None:
+        trace_file = open(arguments.trace, 'w', buffering=arguments.buffer_size)
+    try:
+        # Add read pairs classified without alignment by AlignReads.py
+        prefiltered_file_name = os.path.join(os.path.dirname(input_file), 'prefiltered_reads_{0}.txt'.format(input_file[-9:-4]))
+        if os.path.isfile(prefiltered_file_name) == True:
+            read_counts['non_hybrid'], read_counts['zero'] = CreateOutput.add_prefiltered_reads(prefiltered_file_name)
+
+        # Loop through each read pair
+        if arguments.workers == 1:
+            for read_info in all_data:
+                ReadLog.write(ReadLog.PER_READ, 'Number of analyzed reads :', read_counter, '\n')
+                read_counter += 1
+                ReadLog.write(ReadLog.PER_READ, '~~~~~~~~~~~~~~~~ Read analysis started ~~~~~~~~~~~~~~~~')
+                trace = None
+                if trace_file != None:
+                    trace = {}
+                category = classify_read_pair(read_info, all_allele_combinations, trace)
+                read_counts[category] += 1
+                if trace_file != None:
+                    trace['category'] = category
+                    trace_file.write(json.dumps(trace, separators=(',', ':')) + '\n')
+
+        # Loop through the read pairs classified by the worker processes, in input order
+        if arguments.workers > 1:
+            read_pairs = ParallelClassification.classify_read_pairs(all_data, all_allele_combinations, input_file, arguments.workers, arguments.chunk_size, arguments.log_level, trace_file != None)
+            for category, output_lines, messages, trace in read_pairs:
+                ReadLog.write(ReadLog.PER_READ, 'Number of analyzed reads :', read_counter, '\n')
+                read_counter += 1
+                ReadLog.write(ReadLog.PER_READ, '~~~~~~~~~~~~~~~~ Read analysis started ~~~~~~~~~~~~~~~~')
+                ReadLog.handler.stream.write(messages)
+                for output_file_name, line in output_lines:
+                    CreateOutput.write_line(output_file_name, line)
+                read_counts[category] += 1
+                if trace_file != None:
+                    trace['category'] = category
+                    trace_file.write(json.dumps(trace, separators=(',', ':')) + '\n')
+    finally:
+        CreateOutput.close_output_files()
+        if trace_file != None:
+            trace_file.close()
 
-        ###########
-        ###########  Mismatches per read
-        ###########
-        # Get mismatches per read for each allele
-        R1_mismatch_dict, R1_mismatch_dict_ex = R1_read.get_mismatches(R1_alignment_after_second_check)
-        R2_mismatch_dict, R2_mismatch_dict_ex = R2_read.get_mismatches(R2_alignment_after_second_check)
-        
-        # Sort alleles, alleles with lowest nr of mismatches first
-        mismatch_dict_read1_sorted = sorted(R1_mismatch_dict.items(), key=lambda kv: kv[1])     
-        mismatch_dict_read2_sorted = sorted(R2_mismatch_dict.items(), key=lambda kv: kv[1])
-
-        # Count number of alleles with 0 mismatches for read 1
-        zero_mismatch_count_read1 = 0
-        zero_mismatch_allele_read1 = []
-        for allele, mismatches in R1_mismatch_dict.items():
-            if mismatches[0] == 0:
-                zero_mismatch_count_read1 += 1
-                zero_mismatch_allele_read1 += [allele]
-
-        # Count number of alleles with 0 mismatches for read 2
-        zero_mismatch_count_read2 = 0
-        zero_mismatch_allele_read2 = []
-        for allele, mismatches in R2_mismatch_dict.items():
-            if mismatches[0] == 0:
-                zero_mismatch_count_read2 += 1
-                zero_mismatch_allele_read2 += [allele]
-
-        ### For non hybrid reads (perfect non hybrid)
-        non_hybrid = False
-        if zero_mismatch_count_read1 == zero_mismatch_count_read2 == 1:
-            # First check if reads are hybrid, if same allele has mismatches for both reads, then it is a non hybrid
-            if mismatch_dict_read1_sorted[0][1][0] == 0:
-                check_allel = mismatch_dict_read1_sorted[0][0]
-                if R2_mismatch_dict[check_allel][0] == 0:
-                    allele_match =  mismatch_dict_read1_sorted[0][0]
-                    non_hybrid_count += 1
-                    read_output = CreateOutput(read_name)
-                    read_output.non_hybrid_read(allele_match, note)
-                    non_hybrid = True
-                    continue
-
-        ### For zero reads (multiple alleles with 0 mismatches)
-        if zero_mismatch_count_read1 != 0 and zero_mismatch_count_read2 != 0:
-            if zero_mismatch_count_read1 > 1 or zero_mismatch_count_read2 > 1:
-                note = 'Note: Allele(s) {0} has/have 0 mismatches with read 1\tAllele(s) {1} has/have 0 mismatches with read 2'.format(zero_mismatch_allele_read1, zero_mismatch_allele_read2)
-                zero_count += 1
-                read_output = CreateOutput(read_name)
-                read_output.zero_reads(note)
-                non_hybrid = True
-                continue
-
-        ###########
-        ###########  Mismatches read consensus
-        ###########
-        
-        # Create read consensus
-        alignment_read_consensus = R1_and_R2.create_read_consensus()
-        consensus_read = Read.classmethod_for_non_read(alignment_read_consensus, allele_data)
-        mismatch_dict_read_con, mismatch_dict_read_con_ex = consensus_read.get_mismatches(alignment_read_consensus)
-        mismatch_dict_read_con_sorted = sorted(mismatch_dict_read_con.items(), key=lambda kv: kv[1])
-            
-        ### For non hybrid reads, if read consensus has 0 or 1 mismatches
-        if mismatch_dict_read_con_sorted[0][1][0] == 0 or mismatch_dict_read_con_sorted[0][1][0] == 1:
-            allele_match = mismatch_dict_read_con_sorted[0][0]
-            if mismatch_dict_read_con_sorted[0][1][0] == 1:
-                note = 'Read consensus has 1 mismatch'
-            non_hybrid_count += 1
-            read_output = CreateOutput(read_name)
-            read_output.non_hybrid_read(allele_match, note)
-            continue
-        
-        # Print all mismatch information
-        R1_read.print_mismatches('First read', R1_mismatch_dict_ex)
-        R2_read.print_mismatches('Second read', R2_mismatch_dict_ex)
-        consensus_read.print_mismatches('Read consensus', mismatch_dict_read_con_ex)
-
-
-        ###########
-        ###########  Determine number of switches for all allele combinations
-        ###########
-        more_switches = True
-        # Loop through all allele combinations
-        for allele_combo in all_allele_combinations:
-            allele1 = allele_combo[0]
-            allele2 = allele_combo[1]
-         
-            per_allele_info = CheckAlleleCombination(alignment_read_consensus, allele_combo, allele_data)
-
-            # Create indicator string
-            allele_seq_list = per_allele_info.create_indicator_string()
-
-            # Apply first and second check, and update indicator string
-            check1 = per_allele_info.check_indicative_SNPs()
-            if check1 == True:
-                check2 = per_allele_info.check_mutual_SNPs()
-            else:
-                continue
-                
-            if check2 == True:
-                count_indicator_list, number_of_artefacts = per_allele_info.check_alternately_SNPs()
-            else:
-                continue
-                
-            if count_indicator_list != None:
-                final_indicator_string = per_allele_info.update_indicator_string(count_indicator_list)
-            else:
-                continue
-            
-            # Check if updated indicator string has enough indicative SNPs
-            repeat_check1 = per_allele_info.check_indicative_SNPs()
-            
-            if repeat_check1 == True:
-                nr_of_switches, start_turn_pos, end_turn_pos = per_allele_info.get_switches(final_indicator_string)
-            
-            else:
-                continue
-
-            # Generate all data if allele combo resulted in a 1 switch indicator string
-            if nr_of_switches == 1:
-                more_switches = False
-
-                # Print 1 switch pre data
-                per_allele_info.print_1_switch_alleles()
-                read1_pos_dict = R1_read.get_relative_position()
-                read2_pos_dict = R2_read.get_relative_position()
-                
-                # Get read positions
-                final_to_region = GetOneSwitchData(allele1, allele2)
-                pos_read1_allele1, pos_read2_allele1, pos_read1_allele2, pos_read2_allele2 = final_to_region.get_read_position(read1_pos_dict, read2_pos_dict)
-               
-                # Get turnover region sequence and positions
-                turn_over_region1_for_pos, seq_list_allele1, turn_over_region2_for_pos, seq_list_allele2 = final_to_region.prep_for_turnover_position(start_turn_pos, end_turn_pos, allele_seq_list, allele_data)
-                TO1_seq = Read.classmethod_for_non_read(turn_over_region1_for_pos, seq_list_allele1)
-                TO2_seq = Read.classmethod_for_non_read(turn_over_region2_for_pos, seq_list_allele2)
-
-                TO_allele1_dict = TO1_seq.get_relative_position()
-                TO_allele2_dict = TO2_seq.get_relative_position()
-
-                pos_to_region1, pos_to_region2, turn_over_region1, turn_over_region2 = final_to_region.get_TO_position(TO_allele1_dict, TO_allele2_dict, turn_over_region1_for_pos, turn_over_region2_for_pos)
-                
-                # Print 1 switch extended data              
-                GetOneSwitchData.print_TO_output(allele1, pos_read1_allele1, pos_read2_allele1, turn_over_region1, pos_to_region1)
-                GetOneSwitchData.print_TO_output(allele2, pos_read1_allele2, pos_read2_allele2, turn_over_region2, pos_to_region2)
-                
-                # Parse 1 switch extended data and add it to output file
-                allele1_read1_mismatches = str(R1_mismatch_dict[allele1][0])
-                allele1_read2_mismatches = str(R2_mismatch_dict[allele1][0])
-                allele2_read1_mismatches = str(R1_mismatch_dict[allele2][0])
-                allele2_read2_mismatches = str(R2_mismatch_dict[allele2][0])
-                allele1_consensus_mismatches = str(mismatch_dict_read_con[allele1][0])
-                allele2_consensus_mismatches = str(mismatch_dict_read_con[allele2][0])
-
-                read_output = CreateOutput(read_name)
-                read_output.hybrid_read_1_switch(allele1, pos_read1_allele1, pos_read2_allele1, allele1_read1_mismatches, allele1_read2_mismatches, allele1_consensus_mismatches, turn_over_region1, pos_to_region1, number_of_artefacts)
-                read_output.hybrid_read_1_switch(allele2, pos_read1_allele2, pos_read2_allele2, allele2_read1_mismatches, allele2_read2_mismatches, allele2_consensus_mismatches, turn_over_region2, pos_to_region2, number_of_artefacts)
-
-        # If at least one the allele combinations resulted in indicator string with 1 switch
-        if more_switches == False:
-            print ('Hybrid read with 1 switch: ', read_name)
-            one_switch_hybrid_count += 1
-
-        # If non of the allele combinations resulted in indicator string with 1 switch, then we found a
-        # hybrid read with more switches (too many mismatches).  
-        if more_switches == True:
-            more_switches_count += 1
-            read_output = CreateOutput(read_name)
-            read_output.hybrid_read_more_switches()
-       
     # Output metadata
-    total_nr_of_reads = incorrect_aligned_reads + rejected_read_count + non_hybrid_count + zero_count + more_switches_count + one_switch_hybrid_count
-    CreateOutput.metadata(incorrect_aligned_reads, rejected_read_count, non_hybrid_count, zero_count, more_switches_count, one_switch_hybrid_count, total_nr_of_reads)
+    total_nr_of_reads = sum(read_counts.values())
+    CreateOutput.metadata(read_counts['incorrect_aligned'], read_counts['rejected'], read_counts['non_hybrid'], read_counts['zero'], read_counts['more_switches'], read_counts['one_switch'], total_nr_of_reads)
+    ReadLog.write(ReadLog.SUMMARY, 'Incorrect aligned reads:', read_counts['incorrect_aligned'])
+    ReadLog.write(ReadLog.SUMMARY, 'Rejected reads:', read_counts['rejected'])
+    ReadLog.write(ReadLog.SUMMARY, 'Non hybrid reads:', read_counts['non_hybrid'])
+    ReadLog.write(ReadLog.SUMMARY, 'Hybrid reads with more switches:', read_counts['more_switches'])
+    ReadLog.write(ReadLog.SUMMARY, 'Hybrid reads with 1 switch:', read_counts['one_switch'])
+    ReadLog.write(ReadLog.SUMMARY, 'Read with 0 mismatches for multiple alleles:', read_counts['zero'])
+    ReadLog.write(ReadLog.SUMMARY, 'Total nr. of reads:', total_nr_of_reads)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
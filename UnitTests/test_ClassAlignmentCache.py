@@ -0,0 +1,106 @@
+"""
+17-10-'26
+
+This script contains 4 unittests for the class AlignmentCache from AlignReads.py.
+The test can be ran with the bash command line: python3 test_ClassAlignmentCache.py
+"""
+
+import os
+import tempfile
+import unittest
+import AlignReads
+
+class TestAlignmentCache(unittest.TestCase):
+    """
+    This class contains unittests for the constructor and the methods get_key(), get(), put() and close().
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.temp_dir.name, 'alignment_cache.db')
+        self.alleles = ['>allele_A1', 'CCCC', '>allele_B1', 'CCTC']
+        self.seq_list = [('Read1    ', ['CC--']), ('Read2    ', ['--CC']), ('allele_A1', ['CCCC'])]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_constructor(self):
+        """
+        ValueError raised if the cache size is smaller than 1.
+        """
+
+        with self.assertRaises(ValueError):
+            AlignReads.AlignmentCache(self.cache_file, self.alleles, 'test', 0)
+
+    def test_get_key(self):
+        """
+        The key must depend on both reads, the alleles and the aligner settings.
+        """
+
+        Cache_test = AlignReads.AlignmentCache(self.cache_file, self.alleles, 'test')
+        key = Cache_test.get_key('CC', 'CC')
+        self.assertEqual(Cache_test.get_key('CC', 'CC'), key)
+        self.assertNotEqual(Cache_test.get_key('C', 'CCC'), key)
+        Cache_test.close()
+
+        # Test case 1, other alleles
+        Cache_test = AlignReads.AlignmentCache(self.cache_file, ['>allele_A1', 'CCCC'], 'test')
+        self.assertNotEqual(Cache_test.get_key('CC', 'CC'), key)
+        Cache_test.close()
+
+        # Test case 2, other aligner settings
+        Cache_test = AlignReads.AlignmentCache(self.cache_file, self.alleles, 'other settings')
+        self.assertNotEqual(Cache_test.get_key('CC', 'CC'), key)
+        Cache_test.close()
+
+    def test_get_put(self):
+        """
+        A stored alignment must be returned and counted as hit, also after the cache is closed and opened again.
+        An unknown key is counted as miss.
+        """
+
+        Cache_test = AlignReads.AlignmentCache(self.cache_file, self.alleles, 'test')
+        key = Cache_test.get_key('CC', 'CC')
+        self.assertEqual(Cache_test.get(key), None)
+        Cache_test.put(key, self.seq_list)
+        self.assertEqual(Cache_test.get(key), self.seq_list)
+        self.assertEqual([Cache_test.hits, Cache_test.misses], [1, 1])
+        Cache_test.close()
+
+        # Test case 1, opened again
+        Cache_test = AlignReads.AlignmentCache(self.cache_file, self.alleles, 'test')
+        self.assertEqual(Cache_test.entries, 1)
+        self.assertEqual(Cache_test.get(key), self.seq_list)
+        Cache_test.close()
+
+    def test_put_lru(self):
+        """
+        The least recently used alignments must be removed when the cache holds more than max_entries alignments,
+        a get() marks an alignment as used. The last used order must be kept after the cache is opened again.
+        """
+
+        Cache_test = AlignReads.AlignmentCache(self.cache_file, self.alleles, 'test', 2)
+        keys = [Cache_test.get_key('CC', read2_seq) for read2_seq in ['A', 'C', 'G', 'T']]
+
+        # Test case 1, first alignment used before the third is stored, the second is removed
+        Cache_test.put(keys[0], self.seq_list)
+        Cache_test.put(keys[1], self.seq_list)
+        Cache_test.get(keys[0])
+        Cache_test.put(keys[2], self.seq_list)
+        self.assertEqual(Cache_test.entries, 2)
+        self.assertEqual(Cache_test.get(keys[1]), None)
+        self.assertEqual(Cache_test.get(keys[2]), self.seq_list)
+        self.assertEqual(Cache_test.get(keys[0]), self.seq_list)
+        Cache_test.close()
+
+        # Test case 2, opened again, the third alignment is the least recently used
+        Cache_test = AlignReads.AlignmentCache(self.cache_file, self.alleles, 'test', 2)
+        Cache_test.put(keys[3], self.seq_list)
+        self.assertEqual(Cache_test.get(keys[2]), None)
+        self.assertEqual(Cache_test.get(keys[0]), self.seq_list)
+        self.assertEqual(Cache_test.get(keys[3]), self.seq_list)
+        Cache_test.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
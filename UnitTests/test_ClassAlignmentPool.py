@@ -0,0 +1,107 @@
+"""
+17-10-'26
+
+This script contains 3 unittests for the class AlignmentPool from AlignReads.py.
+The test can be ran with the bash command line: python3 test_ClassAlignmentPool.py
+"""
+
+import os
+import tempfile
+import time
+import unittest
+import AlignReads
+
+class DelayedAligner():
+    """
+    Replaces the alignment of ClustalAligner. A read pair with a shorter read 1 takes longer, so the alignments
+    finish in another order than they were submitted.
+    """
+    use_processes = False
+
+    def __init__(self):
+        self.aligned = []
+
+    def align_read_pair(self, read1_seq, read2_seq):
+        time.sleep(0.01 / len(read1_seq))
+        self.aligned.append(read1_seq)
+
+        return [('Read1', [read1_seq.ljust(6, '-')]), ('Read2', [read2_seq.ljust(6, '-')]), ('allele_A1', ['CCCCCC'])]
+
+class TestAlignmentPool(unittest.TestCase):
+    """
+    This class contains unittests for the constructor and the method align_read_pairs(), also with an alignment
+    cache.
+    """
+
+    def setUp(self):
+        self.read_pairs = [('read_' + str(i), [['C' * (i % 5 + 1), 'I' * (i % 5 + 1)], ['CC', 'II']]) for i in range(12)]
+
+    def test_constructor(self):
+        """
+        ValueError raised if the number of workers is smaller than 1.
+        """
+
+        with self.assertRaises(ValueError):
+            AlignReads.AlignmentPool(DelayedAligner(), 0)
+
+    def test_align_read_pairs(self):
+        """
+        The alignments must be returned in the order of the read pairs, also when several workers align at the
+        same time and the alignments finish in another order. The built-in aligner is used in worker processes.
+        The time of each aligner call is recorded.
+        """
+
+        #Test case 1: 1 worker
+        #Test case 2: 4 workers
+        for workers in [1, 4]:
+            aligner = DelayedAligner()
+            Pool_test = AlignReads.AlignmentPool(aligner, workers)
+            results = list(Pool_test.align_read_pairs(iter(self.read_pairs)))
+            self.assertEqual(len(aligner.aligned), 12)
+            self.assertEqual(len(Pool_test.report.latencies), 12)
+            self.assertEqual([read_name for read_name, read_data, seq_list in results], [read_name for read_name, read_data in self.read_pairs])
+            for (read_name, read_data, seq_list), (expected_name, expected_data) in zip(results, self.read_pairs):
+                self.assertEqual(read_data, expected_data)
+                self.assertEqual(seq_list[0], ('Read1', [expected_data[0][0].ljust(6, '-')]))
+
+        #Test case 3: built-in aligner in 2 worker processes
+        aligner = AlignReads.BandedAligner([['allele_A1','ACGTTGCA--TGACCTAGGATCCAGT'], ['allele_B1','ACGTAGCAGGTGACCTAGG--CCAGT']], band=4, k=5)
+        read_pairs = [('read_a', [['GCATGACC', 'IIIIIIII'], ['CCTAGGATCC', 'IIIIIIIIII']]), ('read_b', [['GCAGACC', 'IIIIIII'], ['TAGGATCC', 'IIIIIIII']])]
+        results = list(AlignReads.AlignmentPool(aligner, 2).align_read_pairs(iter(read_pairs)))
+        self.assertEqual([seq_list for read_name, read_data, seq_list in results], [aligner.align_read_pair('GCATGACC', 'CCTAGGATCC'), aligner.align_read_pair('GCAGACC', 'TAGGATCC')])
+
+    def test_align_read_pairs_cache(self):
+        """
+        Read pairs that are in the cache or identical to a read pair that is being aligned must not be aligned
+        again, their alignment is returned in order.
+        """
+
+        read_pairs = [('read_1', [['CCC', 'III'], ['CC', 'II']]),
+                      ('read_2', [['CCC', 'III'], ['CC', 'II']]),
+                      ('read_3', [['C', 'I'], ['CC', 'II']])]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = os.path.join(temp_dir, 'alignment_cache.db')
+
+            #Test case 1: duplicate read pair aligned once
+            aligner = DelayedAligner()
+            cache = AlignReads.AlignmentCache(cache_file, ['>allele_A1', 'CCCCCC'], 'test')
+            Pool_test = AlignReads.AlignmentPool(aligner, 2, cache=cache)
+            results = list(Pool_test.align_read_pairs(iter(read_pairs)))
+            self.assertEqual([read_name for read_name, read_data, seq_list in results], ['read_1', 'read_2', 'read_3'])
+            self.assertEqual(results[0][2], results[1][2])
+            self.assertEqual(sorted(aligner.aligned), ['C', 'CCC'])
+            self.assertEqual(cache.hits, 1)
+            cache.close()
+
+            #Test case 2: all read pairs in the cache
+            aligner = DelayedAligner()
+            cache = AlignReads.AlignmentCache(cache_file, ['>allele_A1', 'CCCCCC'], 'test')
+            Pool_test = AlignReads.AlignmentPool(aligner, 2, cache=cache)
+            self.assertEqual(list(Pool_test.align_read_pairs(iter(read_pairs))), results)
+            self.assertEqual(aligner.aligned, [])
+            cache.close()
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+17-10-'26
+
+This script contains 5 unittests for the class AlignmentRecord from SelectHybridReads.py.
+The test can be ran with the bash command line: python3 test_ClassAlignmentRecord.py
+"""
+
+import unittest
+from unittest import mock
+import MsaOutputFormat
+import SelectHybridReads
+
+class TestAlignmentRecord(unittest.TestCase):
+    """
+    This class contains unittests for the constructor (also with delta rows), get_row_bounds(), get_allele_mismatches() and the use of the record by the class Read.
+    """
+
+    def setUp(self):
+        self.read_info = [['read_1', 'CCCCC', 'IIII!'],
+                          ['read_1', 'CCCC', 'IIII'],
+                          ['Read1', '---CC--CCC---'],
+                          ['Read2', '-------CCCC--'],
+                          ['allele_A1', '---CT--CCC---'],
+                          ['allele_A2', '---CT--CCC---'],
+                          ['allele_B1', '---CT--CCC---'],
+                          ['allele_B2', '---CT--CCC---'],
+                          ['allele_C1', '---CT--CCC---'],
+                          ['allele_C2', '-----CCCCC---']]
+
+    def test_record(self):
+        """
+        The record must contain the read data, the allele data and the encoded alignment. The read positions run from
+        the first nucleotide after a gap to the last nucleotide. The arrays can not be changed.
+        """
+
+        record = SelectHybridReads.AlignmentRecord(self.read_info)
+        self.assertEqual(record.read_name, 'read_1')
+        self.assertEqual(record.read_seqs, ['CCCCC', 'CCCC'])
+        self.assertEqual(record.read_qvs, ['IIII!', 'IIII'])
+        self.assertEqual(record.read_aligned_seqs, ['---CC--CCC---', '-------CCCC--'])
+        self.assertEqual(record.allele_data, self.read_info[4:])
+        self.assertEqual(record.allele_rows['allele_C2'], 5)
+        self.assertEqual(record.get_allele_seq('allele_C2'), '-----CCCCC---')
+        self.assertEqual(record.alignment_matrix.shape, (8, 13))
+        self.assertEqual(record.allele_matrix[0].tobytes().decode(), '---CT--CCC---')
+        self.assertEqual(record.read_spans, [(3, 10), (7, 11)])
+        self.assertEqual(list(record.allele_starts), [3, 3, 3, 3, 3, 5])
+        self.assertEqual(list(record.allele_ends), [10, 10, 10, 10, 10, 10])
+        with self.assertRaises(ValueError):
+            record.alignment_matrix[0, 0] = ord('A')
+
+        #Test case 2: read starts at the first position, without gap in front of the read
+        self.read_info[2] = ['Read1', 'CCCCC--------']
+        record = SelectHybridReads.AlignmentRecord(self.read_info)
+        self.assertEqual(record.read_spans[0], None)
+
+    def test_record_delta_rows(self):
+        """
+        With delta rows the allele data must stay AlignedRows and the allele rows must not be rebuilt, the encoded
+        alignment is made from the reference alignment and the gap columns. Only the allele rows that are used are
+        rebuilt.
+        """
+
+        gap_columns, reference = MsaOutputFormat.AlignedRows.remove_gap_columns(self.read_info[4:])
+        self.assertEqual(gap_columns, [0, 1, 2, 10, 11, 12])
+        read_info = MsaOutputFormat.AlignedRows(self.read_info[:4], reference, gap_columns)
+        with mock.patch('MsaOutputFormat.AlignedRows.insert_gap_columns', wraps=MsaOutputFormat.AlignedRows.insert_gap_columns) as insert_gap_columns:
+            record = SelectHybridReads.AlignmentRecord(read_info)
+            self.assertEqual(insert_gap_columns.call_count, 0)
+            self.assertIsInstance(record.allele_data, MsaOutputFormat.AlignedRows)
+            self.assertEqual(record.allele_names, ['allele_A1', 'allele_A2', 'allele_B1', 'allele_B2', 'allele_C1', 'allele_C2'])
+            self.assertEqual(record.get_allele_seq('allele_C2'), '-----CCCCC---')
+            self.assertEqual(insert_gap_columns.call_count, 1)
+        self.assertEqual(record.alignment_matrix.tolist(), SelectHybridReads.AlignmentRecord(self.read_info).alignment_matrix.tolist())
+        self.assertEqual(record.allele_data, self.read_info[4:])
+
+    def test_get_row_bounds(self):
+        """
+        The first nucleotide and the position after the last nucleotide must be found for each row, padding is no
+        nucleotide. Rows without nucleotides get 0 for both.
+        """
+
+        encoded_rows = SelectHybridReads.AlignmentRecord.encode_rows(['--CC-C--', 'C-', '----', 'ACGTACGT'])
+        row_starts, row_ends = SelectHybridReads.AlignmentRecord.get_row_bounds(encoded_rows)
+        self.assertEqual(list(row_starts), [2, 0, 0, 0])
+        self.assertEqual(list(row_ends), [6, 1, 0, 8])
+
+    def test_get_allele_mismatches(self):
+        """
+        The indicative mismatches of all alleles with the read consensus must be found once per read consensus. Allele
+        differences at '*' and 'N' and at gaps outside the reads are no mismatches.
+        """
+
+        record = SelectHybridReads.AlignmentRecord(self.read_info)
+        allele_mismatches = record.get_allele_mismatches('---TN-*CCC---')
+        self.assertEqual(allele_mismatches.tolist()[0], [False]*3 + [True] + [False]*9)
+        self.assertEqual(allele_mismatches.tolist()[5], [False]*3 + [True, False, True] + [False]*7)
+        self.assertIs(record.get_allele_mismatches('---TN-*CCC---'), allele_mismatches)
+        with self.assertRaises(ValueError):
+            allele_mismatches[0, 0] = True
+
+    def test_read_from_record(self):
+        """
+        A Read created from the record must give the same results as a Read created from the sequences.
+        """
+
+        record = SelectHybridReads.AlignmentRecord(self.read_info)
+        allele_data = self.read_info[4:]
+        for read_number in (1, 2):
+            Read_record = SelectHybridReads.Read.from_record(record, read_number)
+            Read_test = SelectHybridReads.Read(self.read_info[read_number-1][1], self.read_info[read_number+1][1], allele_data)
+            read_qv = self.read_info[read_number-1][2]
+            read_checked = Read_test.check_read_artefacts(Read_test.apply_qv(read_qv))
+            self.assertEqual(Read_record.check_read(read_qv), read_checked)
+            self.assertEqual(Read_record.get_mismatches(read_checked), Read_test.get_mismatches(read_checked))
+        self.assertEqual(SelectHybridReads.Read.from_record(record, 1).check_read('IIII!'), '---CC--CCN---')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+17-10-'26
+
+This script contains 6 unittests for the class AlleleIndex from AlignReads.py.
+The test can be ran with the bash command line: python3 test_ClassAlleleIndex.py
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+import AlignReads
+
+class TestAlleleIndex(unittest.TestCase):
+    """
+    This class contains unittests for the constructor and the methods get_allele_name(), read_index(),
+    write_index(), get_alleles() and get_allele_alignment().
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.fasta_file = os.path.join(self.temp_dir.name, 'alleles.fasta')
+        self.fasta_data = ('>HLA:HLA00001 A*01:01:01:01 10 bp\nACGTA\nCGTAC\n'
+                           '>HLA:HLA00002 A*02:01:01:01 6 bp\nTTGGCC\n'
+                           '>B*07:02:01 description\nGGGG\nCC\n')
+        with open(self.fasta_file, 'w') as file_object:
+            file_object.write(self.fasta_data)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_get_allele_name(self):
+        """
+        The allele name is the second word of an IMGT/HLA header line, otherwise the first word.
+        """
+
+        self.assertEqual(AlignReads.AlleleIndex.get_allele_name('>HLA:HLA00001 A*01:01:01:01 3503 bp\n'), 'A*01:01:01:01')
+        self.assertEqual(AlignReads.AlleleIndex.get_allele_name('>B*07:02:01 description\n'), 'B*07:02:01')
+        self.assertEqual(AlignReads.AlleleIndex.get_allele_name('>allele_A1\n'), 'allele_A1')
+
+    def test_constructor(self):
+        """
+        The index must contain the position and size of each sequence and be written next to the fasta file.
+        ValueError raised if an allele occurs more than once.
+        """
+
+        # Test case 1, index created
+        Index_test = AlignReads.AlleleIndex(self.fasta_file)
+        self.assertEqual(Index_test.allele_names, ['A*01:01:01:01', 'A*02:01:01:01', 'B*07:02:01'])
+        self.assertEqual(Index_test.index['A*01:01:01:01'], (34, 12))
+        self.assertEqual(Index_test.index['B*07:02:01'], (110, 8))
+        self.assertEqual(os.path.isfile(self.fasta_file + '.idx'), True)
+
+        # Test case 2, allele twice in the fasta file
+        with open(self.fasta_file, 'a') as file_object:
+            file_object.write('>B*07:02:01\nGGGG\n')
+        with self.assertRaises(ValueError):
+            AlignReads.AlleleIndex(self.fasta_file)
+
+    def test_read_index(self):
+        """
+        The index file must be used if it belongs to the fasta file. The index is created again if the size or
+        modification time of the fasta file changed.
+        """
+
+        Index_test = AlignReads.AlleleIndex(self.fasta_file)
+        self.assertEqual(Index_test.read_index(), Index_test.index)
+
+        # Test case 1, valid index file is used instead of the fasta file
+        with open(self.fasta_file + '.idx') as file_object:
+            version_line = file_object.readline()
+        with open(self.fasta_file + '.idx', 'w') as file_object:
+            file_object.write(version_line + 'allele_X\t0\t4\n')
+        self.assertEqual(AlignReads.AlleleIndex(self.fasta_file).allele_names, ['allele_X'])
+
+        # Test case 2, fasta file changed, stale index file is created again
+        with open(self.fasta_file, 'w') as file_object:
+            file_object.write('>allele_A1\nCCCC\n')
+        Index_test = AlignReads.AlleleIndex(self.fasta_file)
+        self.assertEqual(Index_test.index, {'allele_A1': (11, 5)})
+        self.assertEqual(Index_test.read_index(), {'allele_A1': (11, 5)})
+
+    def test_write_index(self):
+        """
+        If the index file can not be written, a warning with the index file name must be given and the index
+        is kept in memory.
+        """
+
+        index_file = os.path.join(self.temp_dir.name, 'missing_dir', 'alleles.fasta.idx')
+        with mock.patch('AlignReads.stderr', new_callable=io.StringIO) as stderr:
+            Index_test = AlignReads.AlleleIndex(self.fasta_file, index_file)
+        self.assertIn('Warning: the allele index could not be written to ' + index_file, stderr.getvalue())
+        self.assertEqual(Index_test.allele_names, ['A*01:01:01:01', 'A*02:01:01:01', 'B*07:02:01'])
+
+    def test_get_alleles(self):
+        """
+        The sequences of the given alleles must be read in the given order, without line breaks. ValueError
+        raised if an allele is not in the fasta file.
+        """
+
+        Index_test = AlignReads.AlleleIndex(self.fasta_file)
+        self.assertEqual(Index_test.get_alleles(['B*07:02:01', 'A*01:01:01:01']), ['>B*07:02:01\nGGGGCC\n', '>A*01:01:01:01\nACGTACGTAC\n'])
+        with self.assertRaises(ValueError):
+            Index_test.get_alleles(['C*01:02:01'])
+
+    def test_get_allele_alignment(self):
+        """
+        An allele alignment that is in the cache directory must be used, named after the hash of the alleles.
+        """
+
+        Index_test = AlignReads.AlleleIndex(self.fasta_file)
+        alleles = Index_test.get_alleles(['A*01:01:01:01', 'A*02:01:01:01'])
+        profile_file_name = os.path.join(self.fasta_file + '.cache', hashlib.sha256(''.join(alleles).encode()).hexdigest() + '.fa')
+        os.makedirs(self.fasta_file + '.cache')
+        with open(profile_file_name, 'w') as file_object:
+            file_object.write('>A*01:01:01:01\nACGTACGTAC\n>A*02:01:01:01\n--TTGGCC--\n')
+        self.assertEqual(Index_test.get_allele_alignment(alleles), profile_file_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+17-10-'26
+
+This script contains 3 unittests for the class BamReader from AlignReads.py.
+The test can be ran with the bash command line: python3 test_ClassBamReader.py
+"""
+
+import io
+import struct
+import unittest
+import AlignReads
+
+def create_bam_record(read_name, flagstat, reference_id, position, cigar, read_seq, read_quality):
+    """
+    Encodes one bam record including its block size, position is 0-based and cigar a list of (length, operation).
+    """
+    nucleotide_codes = dict((nucleotide, code) for code, nucleotide in enumerate('=ACMGRSVTWYHKDBN'))
+    codes = [nucleotide_codes[nucleotide] for nucleotide in read_seq] + [0]
+    packed_seq = bytes([codes[i] << 4 | codes[i + 1] for i in range(0, len(read_seq), 2)])
+    record = struct.pack('<iiBBHHHiiii', reference_id, position, len(read_name) + 1, 60, 0, len(cigar), flagstat, len(read_seq), -1, -1, 0)
+    record += read_name.encode() + b'\x00'
+    record += b''.join([struct.pack('<I', length << 4 | 'MIDNSHP=X'.index(operation)) for length, operation in cigar])
+    record += packed_seq + read_quality
+
+    return struct.pack('<i', len(record)) + record
+
+def create_bam_data(header_text, references, records):
+    """
+    Encodes the decompressed data of a bam file: header text, references (name and length) and records.
+    """
+    bam_data = b'BAM\x01' + struct.pack('<i', len(header_text)) + header_text.encode()
+    bam_data += struct.pack('<i', len(references))
+    for reference_name, reference_length in references:
+        bam_data += struct.pack('<i', len(reference_name) + 1) + reference_name.encode() + b'\x00' + struct.pack('<i', reference_length)
+
+    return bam_data + b''.join(records)
+
+class TestBamReader(unittest.TestCase):
+    """
+    This class contains unittests for the constructor and the methods __iter__() and decode_record().
+    """
+
+    def setUp(self):
+        self.records = [create_bam_record('read_a', 0, 1, 2, [(4, 'M')], 'GTTG', bytes([40, 40, 30, 2])),
+                        create_bam_record('read_x', 4, -1, -1, [], 'AAAA', bytes([40] * 4)),
+                        create_bam_record('read_a', 16, 1, 8, [(2, 'M'), (1, 'I'), (2, 'M')], 'TGNAC', bytes([255] * 5))]
+        self.bam_data = create_bam_data('@HD\tVN:1.6\tSO:unsorted\n@SQ\tSN:ref_B\tLN:30\n@SQ\tSN:ref_A\tLN:26\n', [('ref_B', 30), ('ref_A', 26)], self.records)
+
+    def test_constructor(self):
+        """
+        The header and reference names must be read. ValueError raised if the data is not a bam file or truncated.
+        """
+
+        # Test case 1, bam header
+        Reader_test = AlignReads.BamReader(io.BytesIO(self.bam_data))
+        self.assertEqual(Reader_test.header, [('HD', {'VN': '1.6', 'SO': 'unsorted'}), ('SQ', {'SN': 'ref_B', 'LN': '30'}), ('SQ', {'SN': 'ref_A', 'LN': '26'})])
+        self.assertEqual(Reader_test.reference_names, ['ref_B', 'ref_A'])
+
+        # Test case 2, no bam file
+        with self.assertRaises(ValueError):
+            AlignReads.BamReader(io.BytesIO(b'@HD\tVN:1.6\n'))
+
+        # Test case 3, truncated header
+        with self.assertRaises(ValueError):
+            AlignReads.BamReader(io.BytesIO(self.bam_data[:20]))
+
+    def test_iter(self):
+        """
+        All records must be decoded, records that are not selected give None. ValueError raised if the last record
+        is truncated.
+        """
+
+        # Test case 1, complete bam data
+        Reader_test = AlignReads.BamReader(io.BytesIO(self.bam_data))
+        self.assertEqual(list(Reader_test), [('read_a', ['GTTG', 'II?#', 'ref_A', 3, '4M']),
+                                             (None, None),
+                                             ('read_a', ['TGNAC', '*', 'ref_A', 9, '2M1I2M'])])
+
+        # Test case 2, truncated record
+        Reader_test = AlignReads.BamReader(io.BytesIO(self.bam_data[:-3]))
+        with self.assertRaises(ValueError):
+            list(Reader_test)
+
+    def test_decode_record(self):
+        """
+        The record must give the same read data as a samfile line: sequence, quality characters (Phred+33),
+        reference name, 1-based position and CIGAR string. Unmapped reads give None.
+        """
+
+        reference_names = ['ref_B', 'ref_A']
+
+        # Test case 1, forward read
+        self.assertEqual(AlignReads.BamReader.decode_record(self.records[0][4:], reference_names), ('read_a', ['GTTG', 'II?#', 'ref_A', 3, '4M']))
+
+        # Test case 2, unmapped read
+        self.assertEqual(AlignReads.BamReader.decode_record(self.records[1][4:], reference_names), (None, None))
+
+        # Test case 3, reverse read with odd length, insertion and no quality values
+        self.assertEqual(AlignReads.BamReader.decode_record(self.records[2][4:], reference_names), ('read_a', ['TGNAC', '*', 'ref_A', 9, '2M1I2M']))
+
+        # Test case 4, no reference and no CIGAR string
+        record = create_bam_record('read_b', 0, -1, -1, [], 'AC', bytes([40, 40]))
+        self.assertEqual(AlignReads.BamReader.decode_record(record[4:], reference_names), ('read_b', ['AC', 'II', '*', 0, '*']))
+
+
+if __name__ == '__main__':
+    unittest.main()
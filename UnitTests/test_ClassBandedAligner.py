@@ -0,0 +1,87 @@
+"""
+17-10-'26
+
+This script contains 5 unittests for the class BandedAligner from AlignReads.py.
+The test can be ran with the bash command line: python3 test_ClassBandedAligner.py
+"""
+
+import unittest
+import AlignReads
+
+class TestBandedAligner(unittest.TestCase):
+    """
+    This class contains unittests for the constructor and the methods align_read_pair(), create_seq_list(),
+    get_description() and get_column_map().
+    """
+
+    def setUp(self):
+        self.allele_alignment = [['allele_A1','ACGTTGCA--TGACCTAGGATCCAGT'],
+                                 ['allele_B1','ACGTAGCAGGTGACCTAGG--CCAGT']]
+        self.Aligner_test = AlignReads.BandedAligner(self.allele_alignment, band=4, k=5)
+
+    def test_constructor(self):
+        """
+        ValueError raised if the aligned allele sequences have a different length.
+        """
+
+        with self.assertRaises(ValueError):
+            AlignReads.BandedAligner([['allele_A1','ACGT-'], ['allele_B1','ACGT']])
+
+    def test_align_read_pair(self):
+        """
+        The reads must be placed in the allele alignment, the alleles are not changed. Inserted read nucleotides
+        become new columns with a gap for the alleles and the other read. A read deletion is a gap in the read.
+        """
+
+        # Test case 1, reads without insertions or deletions, read 1 has a gap in the columns of the allele_B1 insertion
+        seq_list = self.Aligner_test.align_read_pair('GCATGACC', 'CCTAGGATCC')
+        self.assertEqual(seq_list, [('Read1    ', ['-----GCA--TGACC-----------']),
+                                    ('Read2    ', ['-------------CCTAGGATCC---']),
+                                    ('allele_A1', ['ACGTTGCA--TGACCTAGGATCCAGT']),
+                                    ('allele_B1', ['ACGTAGCAGGTGACCTAGG--CCAGT'])])
+
+        # Test case 2, insertion of 2 nucleotides in read 1
+        seq_list = self.Aligner_test.align_read_pair('GCATGATACC', 'CCTAGGATCC')
+        self.assertEqual(seq_list, [('Read1    ', ['-----GCA--TGATACC-----------']),
+                                    ('Read2    ', ['---------------CCTAGGATCC---']),
+                                    ('allele_A1', ['ACGTTGCA--TG--ACCTAGGATCCAGT']),
+                                    ('allele_B1', ['ACGTAGCAGGTG--ACCTAGG--CCAGT'])])
+
+        # Test case 3, deletion of 1 nucleotide in read 1
+        seq_list = self.Aligner_test.align_read_pair('GCAGACC', 'TAGGATCC')
+        self.assertEqual(seq_list[0], ('Read1    ', ['-----GCA---GACC-----------']))
+        self.assertEqual(seq_list[1], ('Read2    ', ['---------------TAGGATCC---']))
+
+    def test_create_seq_list(self):
+        """
+        The names must be made the same length by adding spaces and the names and sequences sorted.
+        """
+
+        seq_dict = {'Read2': 'C-C', 'allele_A1': 'CCC', 'Read1': 'CC-'}
+        self.assertEqual(AlignReads.BandedAligner.create_seq_list(seq_dict), [('Read1    ', ['CC-']),
+                                                                              ('Read2    ', ['C-C']),
+                                                                              ('allele_A1', ['CCC'])])
+
+    def test_get_description(self):
+        """
+        The description must contain the scores, the band and the k-mer length that were used.
+        """
+
+        self.assertEqual(self.Aligner_test.get_description(), 'built-in banded aligner, match 2, mismatch -3, gap -5, band 4, k-mer length 5')
+
+    def test_get_column_map(self):
+        """
+        Each position of the sequence must get its alignment column, also when the sequence is aligned in chunks.
+        """
+
+        column_map = [0,1,2,3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25]
+
+        # Test case 1, sequence of allele_A1 in 1 chunk
+        self.assertEqual(self.Aligner_test.get_column_map('ACGTTGCATGACCTAGGATCCAGT'), column_map)
+
+        # Test case 2, sequence of allele_A1 in 2 chunks
+        self.assertEqual(self.Aligner_test.get_column_map('ACGTTGCATGACCTAGGATCCAGT', 12), column_map)
+
+
+if __name__ == '__main__':
+    unittest.main()
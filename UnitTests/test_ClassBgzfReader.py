@@ -0,0 +1,86 @@
+"""
+17-10-'26
+
+This script contains 3 unittests for the class BgzfReader from AlignReads.py.
+The test can be ran with the bash command line: python3 test_ClassBgzfReader.py
+"""
+
+import gzip
+import io
+import struct
+import unittest
+import zlib
+import AlignReads
+
+def create_bgzf_block(data):
+    """
+    Compresses data into one BGZF block: a gzip member with the block size in the 'BC' extra field.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    block_size = 12 + 6 + len(compressed) + 8
+    header = b'\x1f\x8b\x08\x04' + b'\x00' * 4 + b'\x00\xff' + struct.pack('<H', 6) + b'BC' + struct.pack('<HH', 2, block_size - 1)
+
+    return header + compressed + struct.pack('<II', zlib.crc32(data), len(data))
+
+class TestBgzfReader(unittest.TestCase):
+    """
+    This class contains unittests for the methods is_bgzf(), read_block() and readinto().
+    """
+
+    def setUp(self):
+        self.bgzf_data = create_bgzf_block(b'first block\n') + create_bgzf_block(b'second block\n') + create_bgzf_block(b'')
+
+    def test_is_bgzf(self):
+        """
+        True for a BGZF file and False for a gzip file without block size, the file position is not changed.
+        """
+
+        # Test case 1, BGZF file
+        file_object = io.BytesIO(self.bgzf_data)
+        self.assertEqual(AlignReads.BgzfReader.is_bgzf(file_object), True)
+        self.assertEqual(file_object.tell(), 0)
+
+        # Test case 2, gzip file
+        file_object = io.BytesIO(gzip.compress(b'first block\n'))
+        self.assertEqual(AlignReads.BgzfReader.is_bgzf(file_object), False)
+        self.assertEqual(file_object.tell(), 0)
+
+    def test_read_block(self):
+        """
+        The blocks must be decompressed one by one, the end of the file gives an empty block. ValueError raised
+        if a block is truncated or corrupt.
+        """
+
+        # Test case 1, 2 blocks and the empty end of file block
+        Reader_test = AlignReads.BgzfReader(io.BytesIO(self.bgzf_data))
+        self.assertEqual(Reader_test.read_block(), b'first block\n')
+        self.assertEqual(Reader_test.read_block(), b'second block\n')
+        self.assertEqual(Reader_test.read_block(), b'')
+        self.assertEqual(Reader_test.read_block(), b'')
+
+        # Test case 2, truncated block
+        Reader_test = AlignReads.BgzfReader(io.BytesIO(self.bgzf_data[:8]))
+        with self.assertRaises(ValueError):
+            Reader_test.read_block()
+
+        # Test case 3, wrong checksum
+        block = bytearray(create_bgzf_block(b'first block\n'))
+        block[-8] ^= 1
+        Reader_test = AlignReads.BgzfReader(io.BytesIO(bytes(block)))
+        with self.assertRaises(ValueError):
+            Reader_test.read_block()
+
+    def test_readinto(self):
+        """
+        The decompressed data of all blocks must be read as one stream, also with an empty block in between.
+        """
+
+        bgzf_data = create_bgzf_block(b'first block\n') + create_bgzf_block(b'') + create_bgzf_block(b'second block\n')
+        stream = io.BufferedReader(AlignReads.BgzfReader(io.BytesIO(bgzf_data)), 8)
+        self.assertEqual(stream.readline(), b'first block\n')
+        self.assertEqual(stream.read(), b'second block\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 """
 30-07-'19
 
-This script contains 6 unittests for the class CheckAlleleCombination from SelectHybridReads.py.
+This script contains 7 unittests for the class CheckAlleleCombination from SelectHybridReads.py.
 The test can be ran with the bash command line: python3 test_ClassCheckAlleleCombination.py
 """
 
@@ -11,8 +11,8 @@ import SelectHybridReads
 
 class TestCheckAlleleCombination(unittest.TestCase):
     """
-    This class contains unittests for the methods create_indicator_string(), check_indicative_SNPs(), check_mutual_SNPs(),
-    check_alternately_SNPs(), update_indicator_string() and get_switches(). 
+    This class contains unittests for the methods create_indicator_string(), get_informative_SNPs(), get_runs(),
+    check_indicative_SNPs(), check_mutual_SNPs(), check_alternately_SNPs(), update_indicator_string() and get_switches(). 
     """
 
     def setUp(self):
@@ -59,6 +59,47 @@ class TestCheckAlleleCombination(unittest.TestCase):
         with self.assertRaises(ValueError):
             Allele_test.create_indicator_string()
 
+        #Test case 5: all allele combinations share the mismatches of the record
+        read_info = [['read_1', 'CCCCC', 'IIIII'], ['read_1', 'CCC', 'III'], ['Read1', '---CC--------'], ['Read2', '-------CCC---']] + self.allele_data
+        record = SelectHybridReads.AlignmentRecord(read_info)
+        for allele_combo in [['allele_A1', 'allele_A2'], ['allele_A2', 'allele_B2'], ['allele_B2', 'allele_C1']]:
+            Allele_test = SelectHybridReads.CheckAlleleCombination(self.read_consensus, allele_combo, self.allele_data)
+            Allele_record = SelectHybridReads.CheckAlleleCombination(self.read_consensus, allele_combo, self.allele_data, record)
+            self.assertEqual(Allele_record.create_indicator_string(), Allele_test.create_indicator_string())
+            self.assertEqual(Allele_record.indicator_string, Allele_test.indicator_string)
+        self.assertEqual(list(record.consensus_mismatches), [self.read_consensus])
+
+    def test_get_informative_SNPs(self):
+        """
+        The informative mismatches are the positions of the 'X' and 'Y' characters, the 'M' characters are only counted.
+        The informative mismatches are compressed to runs of the same character.
+        """
+
+        #Test case 1: informative mismatches and mutual mismatches
+        Allele_test = SelectHybridReads.CheckAlleleCombination(self.read_consensus, ['allele_A1', 'allele_A2'], self.allele_data)
+        informative_positions, informative_chars, number_of_mutual = Allele_test.get_informative_SNPs('--XXM-Y-XM-YY-')
+        self.assertEqual(informative_positions.tolist(), [2,3,6,8,11,12])
+        self.assertEqual(informative_chars.tobytes().decode(), 'XXYXYY')
+        self.assertEqual(number_of_mutual, 2)
+        run_starts, run_lengths = SelectHybridReads.CheckAlleleCombination.get_runs(informative_chars)
+        self.assertEqual(run_starts.tolist(), [0,2,3,4])
+        self.assertEqual(run_lengths.tolist(), [2,1,1,2])
+
+        #Test case 2: the informative mismatches of the created indicator string are the same as the ones of the string
+        Allele_test = SelectHybridReads.CheckAlleleCombination(self.read_consensus, ['allele_B2', 'allele_C1'], self.allele_data)
+        Allele_test.create_indicator_string()
+        Allele_string = SelectHybridReads.CheckAlleleCombination(self.read_consensus, ['allele_B2', 'allele_C1'], self.allele_data)
+        informative_created = Allele_test.get_informative_SNPs(Allele_test.indicator_string)
+        informative_string = Allele_string.get_informative_SNPs('--------MX---')
+        self.assertEqual(informative_created[0].tolist(), informative_string[0].tolist())
+        self.assertEqual(informative_created[1].tolist(), informative_string[1].tolist())
+        self.assertEqual(informative_created[2], informative_string[2])
+
+        #Test case 3: no informative mismatches
+        run_starts, run_lengths = SelectHybridReads.CheckAlleleCombination.get_runs(Allele_test.get_informative_SNPs('---M--')[1])
+        self.assertEqual(len(run_starts), 0)
+        self.assertEqual(len(run_lengths), 0)
+
     def test_check_indicative_SNPs(self):
         """
         A simple method to check whether the combined alleles have enough indicative mismatches or not.
@@ -0,0 +1,83 @@
+"""
+17-10-'26
+
+This script contains 3 unittests for the class CigarProjection from AlignReads.py.
+The test can be ran with the bash command line: python3 test_ClassCigarProjection.py
+"""
+
+import unittest
+import AlignReads
+
+class TestCigarProjection(unittest.TestCase):
+    """
+    This class contains unittests for the methods create_reference_maps(), project_read() and project_read_pair().
+    """
+
+    def setUp(self):
+        self.allele_alignment = [['allele_A1','ACGTTGCA--TGACCTAGGATCCAGT'],
+                                 ['allele_B1','ACGTAGCAGGTGACCTAGG--CCAGT']]
+        self.column_map_A1 = [0,1,2,3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25]
+        self.Projection_test = AlignReads.CigarProjection(self.allele_alignment, {'ref_A': self.column_map_A1})
+
+    def test_create_reference_maps(self):
+        """
+        A reference that is identical to an allele (also in lower case) must get the alignment columns of that
+        allele, other references are placed with the banded aligner.
+        """
+
+        references = [['ref_A','acgttgcatgacctaggatccagt'],
+                      ['ref_B','ACGTAGCAGGTGACCTAGGCCAGT'],
+                      ['ref_X','ACGTTGCATGACCTAGGATGCAGT']]
+        Aligner_test = AlignReads.BandedAligner(self.allele_alignment, band=4, k=5)
+        reference_maps = AlignReads.CigarProjection.create_reference_maps(references, self.allele_alignment, Aligner_test)
+        self.assertEqual(reference_maps, {'ref_A': self.column_map_A1,
+                                          'ref_B': [0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,21,22,23,24,25],
+                                          'ref_X': self.column_map_A1})
+
+    def test_project_read(self):
+        """
+        The read must be placed in the alignment columns of its reference positions. Inserted nucleotides are
+        placed if they exactly fill the columns in which the reference has a gap. None is returned if the
+        placement is ambiguous.
+        """
+
+        # Test case 1, only matches, the read spans the allele_B1 insertion
+        self.assertEqual(self.Projection_test.project_read('GCATGACC', 'ref_A', 6, '8M'), '-----GCA--TGACC-----------')
+
+        # Test case 2, deletion
+        self.assertEqual(self.Projection_test.project_read('GCAGACC', 'ref_A', 6, '3M1D4M'), '-----GCA---GACC-----------')
+
+        # Test case 3, insertion that fills the gap columns of the reference
+        self.assertEqual(self.Projection_test.project_read('GCAGGTGACC', 'ref_A', 6, '3M2I5M'), '-----GCAGGTGACC-----------')
+
+        # Test case 4, ambiguous: insertion that does not fit, soft clipping, unknown reference, no CIGAR string,
+        # read after the end of the reference and CIGAR string shorter than the read
+        self.assertEqual(self.Projection_test.project_read('GCAGTGACC', 'ref_A', 6, '3M1I5M'), None)
+        self.assertEqual(self.Projection_test.project_read('GCATGACC', 'ref_A', 6, '2S6M'), None)
+        self.assertEqual(self.Projection_test.project_read('GCATGACC', 'ref_Z', 6, '8M'), None)
+        self.assertEqual(self.Projection_test.project_read('GCATGACC', 'ref_A', 6, '*'), None)
+        self.assertEqual(self.Projection_test.project_read('GCATGACC', 'ref_A', 20, '8M'), None)
+        self.assertEqual(self.Projection_test.project_read('GCATGACC', 'ref_A', 6, '6M'), None)
+
+    def test_project_read_pair(self):
+        """
+        Both reads must be placed and the alleles added, as with an alignment. None is returned if one of the
+        reads is ambiguous. The placed and ambiguous read pairs are counted.
+        """
+
+        # Test case 1, both reads placed
+        read_data = [['GCATGACC', 'IIIIIIII', 'ref_A', 6, '8M'], ['CCTAGGATCC', 'IIIIIIIIII', 'ref_A', 12, '10M']]
+        self.assertEqual(self.Projection_test.project_read_pair(read_data), [('Read1    ', ['-----GCA--TGACC-----------']),
+                                                                             ('Read2    ', ['-------------CCTAGGATCC---']),
+                                                                             ('allele_A1', ['ACGTTGCA--TGACCTAGGATCCAGT']),
+                                                                             ('allele_B1', ['ACGTAGCAGGTGACCTAGG--CCAGT'])])
+
+        # Test case 2, read 2 soft clipped
+        read_data[1][4] = '2S8M'
+        self.assertEqual(self.Projection_test.project_read_pair(read_data), None)
+        self.assertEqual(self.Projection_test.projected_count, 1)
+        self.assertEqual(self.Projection_test.ambiguous_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
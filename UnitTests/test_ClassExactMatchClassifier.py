@@ -0,0 +1,138 @@
+"""
+17-10-'26
+
+This script contains 6 unittests for the class ExactMatchClassifier from AlignReads.py.
+The test can be ran with the bash command line: python3 test_ClassExactMatchClassifier.py
+"""
+
+import os
+import tempfile
+import unittest
+import AlignReads
+import SelectHybridReads
+
+class TestExactMatchClassifier(unittest.TestCase):
+    """
+    This class contains unittests for the methods mask_read(), get_zero_mismatch_alleles(), classify_read_pair(),
+    create_output(), filter_read_pairs() and scan_output().
+    """
+
+    def setUp(self):
+        # allele A*02:01 differs from A*01:01 at position 100 only
+        self.seq_A1 = 'TTTCCTCATGCAATTCAAAACCATGTCCGTAATGTAGGCGAAATAGTAAACCATTTTACGGAGGATACCAAATTCCTCCTTATTCAGGACCTAACCTGAGGTAAACCAGGTCTCTCCGCC'
+        self.seq_A2 = 'TTTCCTCATGCAATTCAAAACCATGTCCGTAATGTAGGCGAAATAGTAAACCATTTTACGGAGGATACCAAATTCCTCCTTATTCAGGACCTAACCTGAGTTAAACCAGGTCTCTCCGCC'
+        self.seq_B1 = 'CCCTTATAAAAGCTGTTGCACCTAGCCAAGTTCAACGGCAGCTGCAATGGAAATAGGCAATGACGGATATATATTAAAAAGTGTTTTAAGATACATTGAGGCCCGTTCGTGCTCCTCGCC'
+        allele_alignment = [['A*01:01', self.seq_A1], ['A*02:01', self.seq_A2], ['B*07:02', self.seq_B1]]
+        self.Classifier_test = AlignReads.ExactMatchClassifier(allele_alignment)
+
+    def get_read(self, read_seq):
+        return [read_seq, 'I' * len(read_seq)]
+
+    def test_requirement_values(self):
+        """
+        The requirement values must be the same as in SelectHybridReads.py.
+        """
+
+        self.assertEqual(self.Classifier_test.minimum_q_score, SelectHybridReads.MINIMUM_Q_SCORE)
+        self.assertEqual(self.Classifier_test.quality_offset, SelectHybridReads.QUALITY_OFFSET)
+        self.assertEqual(self.Classifier_test.min_read_length, SelectHybridReads.MIN_READ_LENGTH)
+        self.assertEqual(self.Classifier_test.N_quantity, SelectHybridReads.N_QUANTITY)
+
+    def test_mask_read(self):
+        """
+        Nucleotides with a quality score below the minimum (18, '3') must become 'N'. None is returned if a quality
+        value is unknown (higher than the maximum) or the quality string has another length.
+        """
+
+        self.assertEqual(self.Classifier_test.mask_read('ACGT', 'I3#I'), 'ACNT')
+        self.assertEqual(self.Classifier_test.mask_read('ACGT', 'IIIJ'), None)
+        self.assertEqual(self.Classifier_test.mask_read('ACGT', 'III'), None)
+
+    def test_get_zero_mismatch_alleles(self):
+        """
+        The alleles that exactly match the read must be found, 'N' matches every nucleotide. None is returned if
+        the read has no k-mer without 'N'.
+        """
+
+        # Test case 1, read matches both A alleles
+        self.assertEqual(self.Classifier_test.get_zero_mismatch_alleles(self.seq_A1[0:60]), [0, 1])
+
+        # Test case 2, read covers position 100
+        self.assertEqual(self.Classifier_test.get_zero_mismatch_alleles(self.seq_A2[60:120]), [1])
+
+        # Test case 3, 'N' at position 100
+        self.assertEqual(self.Classifier_test.get_zero_mismatch_alleles(self.seq_A1[60:100] + 'N' + self.seq_A1[101:120]), [0, 1])
+
+        # Test case 4, mismatch
+        self.assertEqual(self.Classifier_test.get_zero_mismatch_alleles(self.seq_A1[0:54] + 'A' + self.seq_A1[55:60]), [])
+
+        # Test case 5, no k-mer without 'N'
+        self.assertEqual(self.Classifier_test.get_zero_mismatch_alleles('ACGTACGTACNACGTACGTACN'), None)
+
+    def test_classify_read_pair(self):
+        """
+        A read pair of which both reads exactly match only the same allele is a non hybrid read. If both reads
+        match and one of them matches multiple alleles, it is a zero read. All other read pairs are aligned.
+        """
+
+        # Test case 1, non hybrid read
+        read_data = [self.get_read(self.seq_A1[60:120]), self.get_read(self.seq_A1[65:120])]
+        self.assertEqual(self.Classifier_test.classify_read_pair(read_data), ('non_hybrid', 'A*01:01'))
+
+        # Test case 2, zero read
+        read_data = [self.get_read(self.seq_A1[0:55]), self.get_read(self.seq_A1[60:120])]
+        self.assertEqual(self.Classifier_test.classify_read_pair(read_data), ('zero', "Note: Allele(s) ['A*01:01', 'A*02:01'] has/have 0 mismatches with read 1\tAllele(s) ['A*01:01'] has/have 0 mismatches with read 2"))
+
+        # Test case 3, reads match different alleles
+        read_data = [self.get_read(self.seq_A1[60:120]), self.get_read(self.seq_A2[62:120])]
+        self.assertEqual(self.Classifier_test.classify_read_pair(read_data), (None, None))
+
+        # Test case 4, read 1 shorter than the minimum read length
+        read_data = [self.get_read(self.seq_A1[0:49]), self.get_read(self.seq_A1[60:120])]
+        self.assertEqual(self.Classifier_test.classify_read_pair(read_data), (None, None))
+
+        # Test case 5, read 1 with a mismatch
+        read_data = [self.get_read(self.seq_A1[0:54] + 'A' + self.seq_A1[55:60]), self.get_read(self.seq_A1[60:120])]
+        self.assertEqual(self.Classifier_test.classify_read_pair(read_data), (None, None))
+
+        self.assertEqual([self.Classifier_test.non_hybrid_count, self.Classifier_test.zero_count], [1, 1])
+
+    def test_filter_read_pairs(self):
+        """
+        The classified read pairs must be written to the prefiltered output file of their locus, the other
+        read pairs are given in order.
+        """
+
+        read_pairs = [('read_a', [self.get_read(self.seq_A1[60:120]), self.get_read(self.seq_A2[62:120])]),
+                      ('read_b', [self.get_read(self.seq_B1[0:60]), self.get_read(self.seq_B1[50:110])]),
+                      ('read_c', [self.get_read(self.seq_A1[0:49]), self.get_read(self.seq_A1[60:120])])]
+        router = AlignReads.LocusRouter(['HLA-A'], [])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file_names = {'HLA-A': os.path.join(temp_dir, 'prefiltered_reads_HLA-A.txt')}
+            AlignReads.ExactMatchClassifier.create_output(output_file_names)
+            output_writers = SelectHybridReads.OutputWriters(list(output_file_names.values()))
+            remaining = list(self.Classifier_test.filter_read_pairs(router.route_read_pairs(iter(read_pairs)), output_writers, output_file_names, router))
+            output_writers.close()
+            self.assertEqual([read_name for read_name, read_data in remaining], ['read_a', 'read_c'])
+            with open(output_file_names['HLA-A']) as file_object:
+                self.assertEqual(file_object.read(), 'Category\tRead name\tAllele match or note\nnon_hybrid\tread_b\tB*07:02\n')
+
+    def test_scan_output(self):
+        """
+        The read names of the classified read pairs must be found in an existing prefiltered output file, which
+        is kept by create_output(). An incomplete last line is removed.
+        """
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file_name = os.path.join(temp_dir, 'prefiltered_reads_HLA-A.txt')
+            output_data = 'Category\tRead name\tAllele match or note\nnon_hybrid\tread_b\tB*07:02\n'
+            with open(output_file_name, 'w') as file_object:
+                file_object.write(output_data + 'zero\tread_d\tNote: All')
+            AlignReads.ExactMatchClassifier.create_output({'HLA-A': output_file_name})
+            self.assertEqual(AlignReads.ExactMatchClassifier.scan_output(output_file_name), {'read_b'})
+            with open(output_file_name) as file_object:
+                self.assertEqual(file_object.read(), output_data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -164,6 +164,22 @@ class TestGetOneSwitchData(unittest.TestCase):
         self.assertEqual(turn_over_region1, '')
         self.assertEqual(turn_over_region2, '')
 
+        #Test case 4: allele gaps in front of and inside the turnover region, the positions are the allele nucleotides in front of the region
+        Switch_test = SelectHybridReads.GetOneSwitchData(self.allele1, self.allele2)
+        allele_data = [['allele_A1','CC-C-CCGT--CCACC'],
+                       ['allele_A2','CC-C-CCGA--CCTCC'],
+                       ['allele_B1','CCCCCCCGTCCCCACC']]
+        allele_seq_list = ['CC-C-CCGT--CCACC', 'CC-C-CCGA--CCTCC']
+        turn_over_region1_for_pos, seq_list_allele1, turn_over_region2_for_pos, seq_list_allele2 = Switch_test.prep_for_turnover_position(7, 13, allele_seq_list, allele_data)
+        self.assertEqual(turn_over_region1_for_pos, '-------GT--CCA--')
+        TO_allele1_dict = SelectHybridReads.Read.classmethod_for_non_read(turn_over_region1_for_pos, seq_list_allele1).get_relative_ranges()
+        TO_allele2_dict = SelectHybridReads.Read.classmethod_for_non_read(turn_over_region2_for_pos, seq_list_allele2).get_relative_ranges()
+        position_to_region1, position_to_region2, turn_over_region1, turn_over_region2 = Switch_test.get_TO_position(TO_allele1_dict, TO_allele2_dict, turn_over_region1_for_pos, turn_over_region2_for_pos)
+        self.assertEqual(position_to_region1, '5-9')
+        self.assertEqual(position_to_region2, '5-9')
+        self.assertEqual(turn_over_region1, 'GTCCA')
+        self.assertEqual(turn_over_region2, 'GACCT')
+
 if __name__ == '__main__':
     unittest.main()
 
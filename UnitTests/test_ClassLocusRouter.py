@@ -0,0 +1,94 @@
+"""
+17-10-'26
+
+This script contains 5 unittests for the class LocusRouter from AlignReads.py.
+The test can be ran with the bash command line: python3 test_ClassLocusRouter.py
+"""
+
+import unittest
+import AlignReads
+
+class TestLocusRouter(unittest.TestCase):
+    """
+    This class contains unittests for the methods get_reference_locus(), get_locus(), route_read_pairs(),
+    skip_read_pairs() and pop_locus().
+    """
+
+    def setUp(self):
+        self.alleles = ['>A*01:01\nACGTACGGTT\n', '>B*07:02\nTTGCCAATGG\n', '>DRB1*01:01\nACGTACGGTT\n']
+        self.Router_test = AlignReads.LocusRouter(['HLA-A', 'HLA-B'], self.alleles, 5)
+        self.read_pairs = [('read_a', [['ACGTACG', 'IIIIIII', 'HLA-A*01:01', 1, '7M'], ['TACGGTT', 'IIIIIII', 'HLA-A*01:01', 4, '7M']]),
+                           ('read_b', [['TTGCCAA', 'IIIIIII', '*', 0, '*'], ['CAATGG', 'IIIIII', '*', 0, '*']]),
+                           ('read_x', [['CCCCCCC', 'IIIIIII', 'chr6', 1, '7M'], ['CCCCCC', 'IIIIII', 'chr6', 1, '6M']]),
+                           ('read_c', [['ACGTACG', 'IIIIIII', 'A_ref', 1, '7M'], ['GCCAATG', 'IIIIIII', 'B_ref', 3, '7M']])]
+
+    def test_get_reference_locus(self):
+        """
+        The locus must be taken from the gene in a reference or allele name. None if the gene is not one of the loci.
+        """
+
+        self.assertEqual(self.Router_test.get_reference_locus('HLA-A*02:01:01:01'), 'HLA-A')
+        self.assertEqual(self.Router_test.get_reference_locus('B*07:02'), 'HLA-B')
+        self.assertEqual(self.Router_test.get_reference_locus('HLA-B'), 'HLA-B')
+        self.assertEqual(self.Router_test.get_reference_locus('A_ref'), 'HLA-A')
+        self.assertEqual(self.Router_test.get_reference_locus('HLA-C*05:01'), None)
+        self.assertEqual(self.Router_test.get_reference_locus('DRB1*01:01'), None)
+        self.assertEqual(self.Router_test.get_reference_locus('chr6'), None)
+
+    def test_get_locus(self):
+        """
+        The locus must be taken from the reference names of both reads, otherwise from the k-mers of the alleles.
+        None if the locus is not clear. With one locus all read pairs belong to that locus.
+        """
+
+        # Test case 1, reference names
+        self.assertEqual(self.Router_test.get_locus(self.read_pairs[0][1]), 'HLA-A')
+
+        # Test case 2, no reference, k-mers of the HLA-B allele
+        self.assertEqual(self.Router_test.get_locus(self.read_pairs[1][1]), 'HLA-B')
+
+        # Test case 3, no shared k-mers, the DRB1 allele is not used
+        self.assertEqual(self.Router_test.get_locus(self.read_pairs[2][1]), None)
+
+        # Test case 4, references and k-mers of both loci
+        self.assertEqual(self.Router_test.get_locus(self.read_pairs[3][1]), None)
+
+        # Test case 5, one locus
+        Router_test = AlignReads.LocusRouter(['HLA-C'], self.alleles, 5)
+        self.assertEqual(Router_test.get_locus(self.read_pairs[2][1]), 'HLA-C')
+
+    def test_route_read_pairs(self):
+        """
+        The read pairs with a clear locus must be given and counted per locus, the other read pairs are counted
+        and left out.
+        """
+
+        routed = list(self.Router_test.route_read_pairs(iter(self.read_pairs)))
+        self.assertEqual([read_name for read_name, read_data in routed], ['read_a', 'read_b'])
+        self.assertEqual(self.Router_test.read_pair_counts, {'HLA-A': 1, 'HLA-B': 1})
+        self.assertEqual(self.Router_test.unrouted_count, 2)
+
+    def test_skip_read_pairs(self):
+        """
+        The read pairs with the given read names must be left out after they are routed, they are still counted
+        and their locus is forgotten.
+        """
+
+        routed = list(self.Router_test.skip_read_pairs(self.Router_test.route_read_pairs(iter(self.read_pairs)), {'read_a'}))
+        self.assertEqual([read_name for read_name, read_data in routed], ['read_b'])
+        self.assertEqual(self.Router_test.read_pair_counts, {'HLA-A': 1, 'HLA-B': 1})
+        self.assertEqual(self.Router_test.read_loci, {'read_b': 'HLA-B'})
+
+    def test_pop_locus(self):
+        """
+        The locus of a routed read pair must be given once.
+        """
+
+        list(self.Router_test.route_read_pairs(iter(self.read_pairs)))
+        self.assertEqual(self.Router_test.pop_locus('read_b'), 'HLA-B')
+        with self.assertRaises(KeyError):
+            self.Router_test.pop_locus('read_b')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+17-10-'26
+
+This script contains 2 unittests for the class OutputWriters from SelectHybridReads.py.
+The test can be ran with the bash command line: python3 test_ClassOutputWriters.py
+"""
+
+import os
+import tempfile
+import unittest
+import SelectHybridReads
+
+class TestOutputWriters(unittest.TestCase):
+    """
+    This class contains unittests for the methods write() and close().
+
+    """
+
+    def test_write(self):
+        """
+        The lines must be appended to the existing output files, in the order they were written. The lines are only
+        in the files after a flush: after flush_records lines or when the files are closed.
+        """
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_a = os.path.join(temp_dir, 'a.txt')
+            file_b = os.path.join(temp_dir, 'b.txt')
+            with open(file_a, 'w') as file_object:
+                file_object.write('Header a\n')
+
+            # Test case 1, flush after 3 lines
+            Writers_test = SelectHybridReads.OutputWriters([file_a, file_b], 1048576, 3, 1000.0)
+            Writers_test.write(file_a, 'line 1\n')
+            Writers_test.write(file_b, 'line 2\n')
+            with open(file_a) as file_object:
+                self.assertEqual(file_object.read(), 'Header a\n')
+            Writers_test.write(file_a, 'line 3\n')
+            with open(file_a) as file_object:
+                self.assertEqual(file_object.read(), 'Header a\nline 1\nline 3\n')
+
+            # Test case 2, remaining lines written when closed
+            Writers_test.write(file_b, 'line 4\n')
+            Writers_test.close()
+            with open(file_b) as file_object:
+                self.assertEqual(file_object.read(), 'line 2\nline 4\n')
+
+    def test_close(self):
+        """
+        The files must be closed and the lines written, also with fsync and when closed twice.
+        """
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_a = os.path.join(temp_dir, 'a.txt')
+            Writers_test = SelectHybridReads.OutputWriters([file_a], 1048576, 10000, 1000.0, True)
+            Writers_test.write(file_a, 'line 1\n')
+            Writers_test.close()
+            Writers_test.close()
+            with open(file_a) as file_object:
+                self.assertEqual(file_object.read(), 'line 1\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
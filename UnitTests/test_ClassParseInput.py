@@ -1,16 +1,20 @@
 """
 30-07-'19
 
-This script contains 2 unittests for the class ParseInput from SelectHybridReads.py.
+This script contains 4 unittests for the class ParseInput from SelectHybridReads.py.
 The test can be ran with the bash command line: python3 test_ClassParseInput.py
 """
 
+import io
+import os
+import tempfile
 import unittest
+import MsaOutputFormat
 import SelectHybridReads
 
 class TestParseInput(unittest.TestCase):
     """
-    This class contains unittests for the method collect_all_data() and get_allele_combinations().
+    This class contains unittests for the method collect_all_data(), read_records(), collect_all_binary_data() and get_allele_combinations().
 
     """
 
@@ -55,6 +59,83 @@ class TestParseInput(unittest.TestCase):
         self.assertEqual(allele_names, ['allele_a1', 'allele_a2', 'allele_b1', 'allele_b2', 'allele_c1', 'allele_c2'])
 
 
+    def test_read_records(self):
+        """
+        The read pairs must be read one at a time from a file object, also when the file is read in small parts
+        ('$$$' split over two parts). The read pairs must be the same as from collect_all_data.
+        """
+
+        Input_test = SelectHybridReads.ParseInput()
+        input_file = 'Header\nExtraInformation\n$$$\nReadName1\tCCCCCCCC\tIIIIIIII\nReadName1\tTTTTTTTT\tIIIIIIII\nRead1\t-----CCCCCCCC------\nRead2\t--------TTTTTTTT---\nallele_a1\t-CCCCCCCCCCCCCCC---\nallele_a2\t---CCCCCCCCCCCCCC--\nallele_b1\t--TTTTTTTTTTTT-----\nallele_b2\t----TTTTTTTTTTTTTTT\nallele_c1\tCCCCCCCCCTTTTTTTT--\n$$$\nReadName2\tCCCCTTTT\tIIII####\nReadName2\tTTTTCCCC\t####IIII\nRead1\t--CCCCTTTT---------\nRead2\t-----------TTTTCCCC\nallele_a1\t-CCCCCCCCCCCCCCC---\nallele_a2\t---CCCCCCCCCCCCCC--\nallele_b1\t--TTTTTTTTTTTT-----\nallele_b2\t----TTTTTTTTTTTTTTT\nallele_c1\tCCCCCCCCCTTTTTTTT--\n$$$\n'
+        all_data, allele_names = Input_test.collect_all_data(input_file)
+
+        # Test case 1, each buffer size
+        for buffer_size in [1, 2, 7, 100, 65536]:
+            read_pairs = Input_test.read_records(io.StringIO(input_file), buffer_size)
+            self.assertEqual(next(read_pairs), all_data[0])
+            self.assertEqual(list(read_pairs), all_data[1:])
+
+        # Test case 2, allele names from the first read pair
+        self.assertEqual(Input_test.get_allele_names(all_data[0]), ['allele_a1', 'allele_a2', 'allele_b1', 'allele_b2', 'allele_c1'])
+
+        # Test case 3, incomplete last read pair (no closing '$$$') and no read pairs
+        self.assertEqual(list(Input_test.read_records(io.StringIO(input_file[:-5]))), all_data[:1])
+        self.assertEqual(list(Input_test.read_records(io.StringIO('Header\n'))), [])
+
+    def test_collect_all_binary_data(self):
+        """
+        The binary output file of AlignReads.py must give the same data as the text output file, also when the allele
+        rows are stored once and the read rows only as their aligned span (delta rows). Converting the binary file
+        back to text must give the original text file. An incomplete last read pair of the text file is left out.
+        """
+
+        Input_test = SelectHybridReads.ParseInput()
+        input_file = 'Header\nExtraInformation\n$$$\nReadName1\tCCCCCCCC\tIIIIIIII\nReadName1\tTTTTTTTT\tIIIIIIII\nRead1\t-----CCCCCCCC------\nRead2\t--------TTTTTTTT---\nallele_a1\t-CCCCCCCCCCCCCCC---\nallele_a2\t---CCCCCCCCCCCCCC--\nallele_b1\t--TTTTTTTTTTTT-----\nallele_b2\t----TTTTTTTTTTTTTTT\nallele_c1\tCCCCCCCCCTTTTTTTT--\n$$$\nReadName2\tCCCCTTTT\tIIII####\nReadName2\tTTTTCCCC\t####IIII\nRead1\t--CCCCTTTT---------\nRead2\t-----------TTTTCCCC\nallele_a1\t-CCCCCCCCCCCCCCC---\nallele_a2\t---CCCCCCCCCCCCCC--\nallele_b1\t--TTTTTTTTTTTT-----\nallele_b2\t----TTTTTTTTTTTTTTT\nallele_c1\tCCCCCCCCCTTTTTTTT--\n$$$\n'
+        with tempfile.TemporaryDirectory() as temp_dir:
+            text_file_name = os.path.join(temp_dir, 'msa_output_samfile_reads_HLA-A.txt')
+            binary_file_name = os.path.join(temp_dir, 'msa_output_samfile_reads_HLA-A.msa')
+            with open(text_file_name, 'w') as file_object:
+                file_object.write(input_file)
+
+            # Test case 1, each codec
+            for codec in ['none', 'zlib', 'bz2', 'lzma']:
+                MsaOutputFormat.ConvertFormat.text_to_binary(text_file_name, binary_file_name, codec)
+                self.assertEqual(MsaOutputFormat.MsaReader.is_binary(binary_file_name), True)
+                self.assertEqual(Input_test.collect_all_binary_data(binary_file_name), Input_test.collect_all_data(input_file))
+
+            # Test case 2, back to text
+            MsaOutputFormat.ConvertFormat.binary_to_text(binary_file_name, text_file_name)
+            with open(text_file_name) as file_object:
+                self.assertEqual(file_object.read(), input_file)
+            self.assertEqual(MsaOutputFormat.MsaReader.is_binary(text_file_name), False)
+
+            # Test case 3, allele rows stored once (delta rows), the third read pair has an inserted gap column
+            delta_input_file = input_file + 'ReadName3\tCCCCTTTT\tIIIIIIII\nReadName3\tTTTTCCCC\tIIIIIIII\nRead1\t--CCCC-TTTT---------\nRead2\t---------A--TTTTCCCC\nallele_a1\t-CCCCC-CCCCCCCCCC---\nallele_a2\t---CCC-CCCCCCCCCCC--\nallele_b1\t--TTTT-TTTTTTTT-----\nallele_b2\t----TT-TTTTTTTTTTTTT\nallele_c1\tCCCCCC-CCCTTTTTTTT--\n$$$\n'
+            with open(text_file_name, 'w') as file_object:
+                file_object.write(delta_input_file)
+            MsaOutputFormat.ConvertFormat.text_to_binary(text_file_name, binary_file_name, 'zlib', delta_rows=True)
+            all_data, allele_names = Input_test.collect_all_binary_data(binary_file_name)
+            self.assertEqual(all_data[2].gap_columns, [6])
+            self.assertEqual((all_data, allele_names), Input_test.collect_all_data(delta_input_file))
+            MsaOutputFormat.ConvertFormat.binary_to_text(binary_file_name, text_file_name)
+            with open(text_file_name) as file_object:
+                self.assertEqual(file_object.read(), delta_input_file)
+
+            # Test case 4, delta rows only contain the aligned span of each read
+            MsaOutputFormat.ConvertFormat.text_to_binary(text_file_name, binary_file_name, 'none', delta_rows=True)
+            with open(binary_file_name, 'rb') as file_object:
+                binary_data = file_object.read()
+            self.assertIn(b'CCCC-TTTT', binary_data)
+            self.assertNotIn(b'--CCCC-TTTT---------', binary_data)
+            self.assertEqual(Input_test.collect_all_binary_data(binary_file_name), Input_test.collect_all_data(delta_input_file))
+
+            # Test case 5, incomplete last read pair (no closing '$$$') is left out
+            with open(text_file_name, 'w') as file_object:
+                file_object.write(input_file + 'ReadName3\tCCCCTTTT\tIIIIIIII\nReadName3\tTTTT')
+            MsaOutputFormat.ConvertFormat.text_to_binary(text_file_name, binary_file_name)
+            self.assertEqual(Input_test.collect_all_binary_data(binary_file_name), Input_test.collect_all_data(input_file))
+            self.assertEqual(MsaOutputFormat.MsaReader(binary_file_name).header, 'Header\nExtraInformation\n')
+
     def test_get_allele_combinations(self):
         """
         All combinations of the names of the alleles must be generated. Each combination should be present once, in which the
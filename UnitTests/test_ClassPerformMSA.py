@@ -0,0 +1,172 @@
+"""
+17-10-'26
+
+This script contains 6 unittests for the class PerformMSA from AlignReads.py.
+The test can be ran with the bash command line: python3 test_ClassPerformMSA.py
+"""
+
+import io
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+import AlignReads
+import MsaOutputFormat
+
+class TestPerformMSA(unittest.TestCase):
+    """
+    This class contains unittests for the methods get_clustal_command(), use_clustal(), create_output(),
+    align_read_pair(), scan_output() and write_read_pair_count().
+    """
+
+    def setUp(self):
+        self.header = 'Sam file: sam_file.sam\n         2 paired-end reads in total\n$$$\n'
+        self.seq_list = [('Read1    ', ['CC--']),
+                         ('Read2    ', ['--CC']),
+                         ('allele_A1', ['CCCC']),
+                         ('allele_A2', ['CCCC']),
+                         ('allele_B1', ['CCCC']),
+                         ('allele_B2', ['CCCC']),
+                         ('allele_C1', ['CCCC'])]
+
+    def test_get_clustal_command(self):
+        """
+        The clustal omega command line must read from stdin and write fasta to stdout. With a profile, the
+        reads are aligned against the allele alignment in the profile file (also if its name contains a space).
+        """
+
+        #Test case 1: no profile
+        self.assertEqual(AlignReads.PerformMSA.get_clustal_command(4), 'clustalo --infile - --outfmt fa --threads 4 --seqtype dna --output-order tree-order')
+
+        #Test case 2: profile
+        self.assertEqual(AlignReads.PerformMSA.get_clustal_command(4, 'allele_alignment.fa'), 'clustalo --infile - --outfmt fa --threads 4 --seqtype dna --output-order tree-order --profile1 allele_alignment.fa')
+
+        #Test case 3: profile with a space in the file name
+        self.assertEqual(AlignReads.PerformMSA.get_clustal_command(4, 'alleles dir/allele_alignment.fa'), "clustalo --infile - --outfmt fa --threads 4 --seqtype dna --output-order tree-order --profile1 'alleles dir/allele_alignment.fa'")
+
+    def test_use_clustal(self):
+        """
+        Clustal omega must be called with the command of get_clustal_command() and the input through a pipe.
+        RuntimeError raised if clustal omega fails.
+        """
+
+        clustal_input = AlignReads.PerformMSA.create_input_for_clustal('CC', 'GG')
+        self.assertEqual(clustal_input, '>Read1\nCC\n>Read2\nGG\n')
+
+        #Test case 1: profile with a space in the file name is one argument
+        completed_process = subprocess.CompletedProcess([], 0, '>Read1\nCC--\n', '')
+        with mock.patch('AlignReads.subprocess.run', return_value=completed_process) as run:
+            self.assertEqual(AlignReads.PerformMSA.use_clustal(clustal_input, 4, 'alleles dir/allele_alignment.fa'), '>Read1\nCC--\n')
+        self.assertEqual(run.call_args[0][0][-2:], ['--profile1', 'alleles dir/allele_alignment.fa'])
+        self.assertEqual(run.call_args[1]['input'], clustal_input)
+
+        #Test case 2: clustal omega fails
+        completed_process = subprocess.CompletedProcess([], 1, '', 'error')
+        with mock.patch('AlignReads.subprocess.run', return_value=completed_process):
+            with self.assertRaises(RuntimeError):
+                AlignReads.PerformMSA.use_clustal(clustal_input, 4)
+
+    def test_create_output(self):
+        """
+        The clustal output (fasta format) must be parsed, the names made the same length and sorted.
+        RuntimeError raised if the output contains no alignment.
+        """
+
+        clustal_output = '>allele_A1\nCCCC\nGG\n>Read2\n--CC\n--\n>Read1\nCC--\n--\n'
+        self.assertEqual(AlignReads.PerformMSA.create_output(clustal_output), [('Read1    ', ['CC----']),
+                                                                               ('Read2    ', ['--CC--']),
+                                                                               ('allele_A1', ['CCCCGG'])])
+        with self.assertRaises(RuntimeError):
+            AlignReads.PerformMSA.create_output('')
+
+    def test_align_read_pair(self):
+        """
+        The reads and alleles must be aligned together, with a profile only the reads are given to clustal omega.
+        """
+
+        clustal_output = '>allele_A1\nCCGG\n>Read1\nCC--\n>Read2\n--GG\n'
+        with mock.patch('AlignReads.PerformMSA.use_clustal', return_value=clustal_output) as use_clustal:
+            #Test case 1: reads and alleles
+            seq_list = AlignReads.PerformMSA.align_read_pair('CC', 'GG', ['>allele_A1\nCCGG\n'], 2)
+            self.assertEqual(seq_list, [('Read1    ', ['CC--']), ('Read2    ', ['--GG']), ('allele_A1', ['CCGG'])])
+            self.assertEqual(use_clustal.call_args[0], ('>Read1\nCC\n>Read2\nGG\n>allele_A1\nCCGG\n', 2, None))
+
+            #Test case 2: profile with the allele alignment
+            self.assertEqual(AlignReads.PerformMSA.align_read_pair('CC', 'GG', ['>allele_A1\nCCGG\n'], 2, 'allele_alignment.fa'), seq_list)
+            self.assertEqual(use_clustal.call_args[0], ('>Read1\nCC\n>Read2\nGG\n', 2, 'allele_alignment.fa'))
+
+    def test_scan_output(self):
+        """
+        The read names of the completely written read pairs must be found, and the size of the file up to the
+        last complete read pair. A read pair without '$$$' at the end is incomplete, as is a header without '$$$'.
+        """
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file_name = os.path.join(temp_dir, 'msa_output_samfile_reads_HLA-A.txt')
+
+            #Test case 1: only part of the header
+            with open(output_file_name, 'w') as db_file:
+                db_file.write(self.header[:20])
+            self.assertEqual(AlignReads.PerformMSA.scan_output(output_file_name), (set(), 0))
+
+            #Test case 2: only the header
+            with open(output_file_name, 'w') as db_file:
+                db_file.write(self.header)
+            self.assertEqual(AlignReads.PerformMSA.scan_output(output_file_name), (set(), len(self.header)))
+
+            #Test case 3: 2 complete read pairs
+            AlignReads.PerformMSA.write_output(output_file_name, self.seq_list, 'read_a', 'CC', 'CC', 'II', 'II')
+            AlignReads.PerformMSA.write_output(output_file_name, self.seq_list, 'read_b', 'CC', 'CC', 'II', 'II')
+            complete_size = os.path.getsize(output_file_name)
+            self.assertEqual(AlignReads.PerformMSA.scan_output(output_file_name), ({'read_a', 'read_b'}, complete_size))
+
+            #Test case 4: third read pair interrupted while it was written
+            with open(output_file_name, 'a') as db_file:
+                db_file.write('read_c\tCC\tII\nread_c\tCC\tII\nallele_B2\tCCCC\n')
+            self.assertEqual(AlignReads.PerformMSA.scan_output(output_file_name), ({'read_a', 'read_b'}, complete_size))
+
+
+    def test_write_read_pair_count(self):
+        """
+        The number of read pairs must be filled in in the header of a text or binary output file, the size of the
+        header does not change. A warning is given if the header has no field for the number.
+        """
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file_name = os.path.join(temp_dir, 'msa_output_samfile_reads_HLA-A.txt')
+            header = 'Reads from sam file: sam_file.sam\n' + AlignReads.PerformMSA.get_read_pair_count_line()
+            self.assertEqual(header, 'Reads from sam file: sam_file.sam\n           ? paired-end reads in total\n')
+
+            #Test case 1: text output file with 1 read pair
+            with open(output_file_name, 'w') as db_file:
+                db_file.write(header + '$$$\n')
+            AlignReads.PerformMSA.write_output(output_file_name, self.seq_list, 'read_a', 'CC', 'CC', 'II', 'II')
+            with open(output_file_name) as db_file:
+                output_data = db_file.read()
+            AlignReads.PerformMSA.write_read_pair_count(output_file_name, 1234)
+            with open(output_file_name) as db_file:
+                self.assertEqual(db_file.read(), output_data.replace('           ? paired', '        1234 paired'))
+
+            #Test case 2: binary output file
+            binary_file_name = os.path.join(temp_dir, 'msa_output_samfile_reads_HLA-A.msa')
+            msa_writer = MsaOutputFormat.MsaWriter(binary_file_name, header)
+            msa_writer.write_record('read_a', 'CC', 'II', 'CC', 'II', AlignReads.PerformMSA.get_output_rows(self.seq_list))
+            msa_writer.close()
+            AlignReads.PerformMSA.write_read_pair_count(binary_file_name, 1)
+            msa_reader = MsaOutputFormat.MsaReader(binary_file_name)
+            self.assertEqual(msa_reader.header, 'Reads from sam file: sam_file.sam\n           1 paired-end reads in total\n')
+            self.assertEqual([record[0] for record in msa_reader], ['read_a'])
+
+            #Test case 3: no field for the number of read pairs
+            with open(output_file_name, 'w') as db_file:
+                db_file.write('Reads from sam file: sam_file.sam\n$$$\n')
+            with mock.patch('AlignReads.stderr', new_callable=io.StringIO) as stderr:
+                AlignReads.PerformMSA.write_read_pair_count(output_file_name, 1)
+            self.assertIn('has no field for the number of read pairs', stderr.getvalue())
+            with open(output_file_name) as db_file:
+                self.assertEqual(db_file.read(), 'Reads from sam file: sam_file.sam\n$$$\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 """
 22-07-'19
 
-This script contains 6 unittests for the class Read from SelectHybridReads.py.
+This script contains 7 unittests for the class Read from SelectHybridReads.py.
 The test can be ran with the bash command line: python3 test_ClassRead.py
 """
 
@@ -10,8 +10,8 @@ import SelectHybridReads
 
 class TestRead(unittest.TestCase):
     """
-    This class contains unittests for the methods check_alignment(), apply_qv(), check_read_artefacts(),
-    get_mismatches(), classmethod_for_non_read() and get_relative_position().
+    This class contains unittests for the methods check_alignment(), apply_qv(), check_read_artefacts(), check_read(),
+    get_mismatches(), classmethod_for_non_read() and get_relative_position() with get_relative_ranges().
     """
 
     def setUp(self):
@@ -78,6 +78,16 @@ class TestRead(unittest.TestCase):
         Read_test = SelectHybridReads.Read(self.read_seq, self.read_aligned_seq, allele_data)
         read1_qv = 'I!!I!'
         self.assertEqual(Read_test.apply_qv(read1_qv), '---CN--NCN---')
+
+        #Test case 4: quality values higher than 'I'
+        Read_test = SelectHybridReads.Read(self.read_seq, self.read_aligned_seq, allele_data)
+        read1_qv = 'JK~!I'
+        self.assertEqual(Read_test.apply_qv(read1_qv), '---CC--CNC---')
+
+        #Test case 5: other minimum quality score and quality offset (Phred+64)
+        Read_test = SelectHybridReads.Read(self.read_seq, self.read_aligned_seq, allele_data)
+        read1_qv = '@RSh~'
+        self.assertEqual(Read_test.apply_qv(read1_qv, 19, 64), '---NN--CCC---')
         
     def test_check_read_artefacts(self):
         """
@@ -121,6 +131,22 @@ class TestRead(unittest.TestCase):
         with self.assertRaises(ValueError):
             Read_test.check_read_artefacts(Read_alignment_after_first_check)
             
+    def test_check_read(self):
+        """
+        Both checks in one step should give the same aligned read as apply_qv() followed by check_read_artefacts().
+        """
+
+        #Test case 1: low quality value and all alleles have 1 mismatch
+        Read_test = SelectHybridReads.Read(self.read_seq, self.read_aligned_seq, self.allele_data2)
+        read1_qv = 'IIII!'
+        self.assertEqual(Read_test.check_read(read1_qv), '---CN--CCN---')
+        self.assertEqual(Read_test.check_read(read1_qv), Read_test.check_read_artefacts(Read_test.apply_qv(read1_qv)))
+
+        #Test case 2: low quality value at the position of the mismatch
+        Read_test = SelectHybridReads.Read(self.read_seq, self.read_aligned_seq, self.allele_data2)
+        read1_qv = 'I!III'
+        self.assertEqual(Read_test.check_read(read1_qv), '---CN--CCC---')
+
     def test_get_mismatches(self):
         """
         Substitutions, insertions and deletions are mismatches. 
@@ -187,6 +213,30 @@ class TestRead(unittest.TestCase):
                                                   'allele_C1': [0,0,0,0],
                                                   'allele_C2': [0,2,5,7]})
 
+        #Test case 4: read consensus with '*' and 'N' characters, these are no substitutions
+        allele_data  = [['allele_A1','---CC--CCC---'],
+                        ['allele_A2','---CT--CCC---'],
+                        ['allele_B1','----C--CCC---'],
+                        ['allele_B2','---CC--CC----'],
+                        ['allele_C1','-----CCCCC---'],  # check for private method __check_read_start()
+                        ['allele_C2','---CCCCCCC---']]
+
+        Read_consensus = '---C*--N*C---'
+        Read_test = SelectHybridReads.Read(self.read_seq, self.read_aligned_seq, allele_data)
+        R_mismatch_dict, R_mismatch_dict_ex = Read_test.get_mismatches(Read_consensus)
+        self.assertDictEqual(R_mismatch_dict, {'allele_A1': [0],
+                                               'allele_A2': [0],
+                                               'allele_B1': [0],
+                                               'allele_B2': [1],
+                                               'allele_C1': [1],
+                                               'allele_C2': [2]})
+        self.assertDictEqual(R_mismatch_dict_ex, {'allele_A1': [0,0,0,0],
+                                                  'allele_A2': [0,0,0,0],
+                                                  'allele_B1': [0,0,0,0],
+                                                  'allele_B2': [0,0,1,1],
+                                                  'allele_C1': [0,2,-1,1],
+                                                  'allele_C2': [0,2,0,2]})
+
     def test_classmethod_for_non_read(cls):
         """
         The input for the read consensus and turnover region are in alignment. The class' constructor requires the sequence
@@ -256,5 +306,29 @@ class TestRead(unittest.TestCase):
                                                                  'allele_C1': [],
                                                                  'allele_C2': [0,1,2]})
 
+        #Test case 4: more than 2 allele gaps in front of the read start, gap in read and allele after the read start
+        #and read continues after the end of the allele
+        read_aligned_seq = '-----CC-CC---'
+        allele_data = [['allele_A1','CC---CC-CC---'],
+                       ['allele_A2','-CCCCCCC-----'],
+                       ['allele_B1','---------CCCC'],
+                       ['allele_B2','CC---CC-CC---'],
+                       ['allele_C1','CC---CC-CC---'],
+                       ['allele_C2','CC---CC-CC---']]
+        Read_test = SelectHybridReads.Read('CCCC', read_aligned_seq, allele_data)
+        self.assertDictEqual(Read_test.get_relative_position(), {'allele_A1': [2,3,4,5],
+                                                                 'allele_A2': [4,5],
+                                                                 'allele_B1': [0],
+                                                                 'allele_B2': [2,3,4,5],
+                                                                 'allele_C1': [2,3,4,5],
+                                                                 'allele_C2': [2,3,4,5]})
+
+        #Test case 5: turnover region with allele gaps in front of and inside the region, the positions of
+        #get_relative_ranges() start after the 3 allele nucleotides in front of the region
+        allele_data = [['allele_A1','CC-C-CCC--CCC']]
+        TO_test = SelectHybridReads.Read.classmethod_for_non_read('-----CCC--C--', allele_data)
+        self.assertDictEqual(TO_test.get_relative_ranges(), {'allele_A1': range(3,7)})
+        self.assertDictEqual(TO_test.get_relative_position(), {'allele_A1': [3,4,5,6]})
+
 if __name__ == '__main__':
     unittest.main()
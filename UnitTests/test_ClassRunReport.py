@@ -0,0 +1,118 @@
+"""
+17-10-'26
+
+This script contains 5 unittests for the class RunReport from AlignReads.py.
+The test can be ran with the bash command line: python3 test_ClassRunReport.py
+"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+import AlignReads
+
+class TestRunReport(unittest.TestCase):
+    """
+    This class contains unittests for the methods measure(), measure_iterable(), get_percentiles(), get_report()
+    and write_report().
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.report_file = os.path.join(self.temp_dir.name, 'report.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_measure(self):
+        """
+        The calls and time of a stage must be recorded, the time of nested stages is not included. Per stage the
+        largest memory use of the process at the end of the stage is recorded. Without report file nothing is
+        recorded.
+        """
+
+        # Test case 1, nested stage
+        Report_test = AlignReads.RunReport(self.report_file)
+        with Report_test.measure('outer'):
+            with Report_test.measure('inner'):
+                time.sleep(0.05)
+        with Report_test.measure('inner'):
+            pass
+        self.assertEqual(list(Report_test.stages.keys()), ['inner', 'outer'])
+        self.assertEqual(list(Report_test.stages['outer'].keys()), ['calls', 'wall_seconds', 'cpu_seconds', 'max_process_rss_kb_at_end'])
+        self.assertEqual(Report_test.stages['inner']['calls'], 2)
+        self.assertGreaterEqual(Report_test.stages['inner']['wall_seconds'], 0.05)
+        self.assertLess(Report_test.stages['outer']['wall_seconds'], 0.05)
+        if os.path.isfile('/proc/self/statm') == True:
+            self.assertGreater(Report_test.stages['outer']['max_process_rss_kb_at_end'], 0)
+
+        # Test case 2, no report file
+        Report_test = AlignReads.RunReport()
+        with Report_test.measure('outer'):
+            pass
+        self.assertEqual(Report_test.stages, {})
+
+    def test_measure_iterable(self):
+        """
+        The items must be given unchanged, the time to produce them is recorded as one call per item (and one for
+        the end of the iterable).
+        """
+
+        Report_test = AlignReads.RunReport(self.report_file)
+        self.assertEqual(list(Report_test.measure_iterable('read sam file', iter([1, 2, 3]))), [1, 2, 3])
+        self.assertEqual(Report_test.stages['read sam file']['calls'], 4)
+
+    def test_get_percentiles(self):
+        """
+        The nearest rank percentiles must be calculated. Without values only the count is given.
+        """
+
+        values = [float(value) for value in range(100, 0, -1)]
+        self.assertEqual(dict(AlignReads.RunReport.get_percentiles(values)), {'count': 100, 'mean': 50.5, 'p50': 50.0, 'p90': 90.0, 'p95': 95.0, 'p99': 99.0, 'max': 100.0})
+        self.assertEqual(dict(AlignReads.RunReport.get_percentiles([2.0, 1.0, 3.0])), {'count': 3, 'mean': 2.0, 'p50': 2.0, 'p90': 3.0, 'p95': 3.0, 'p99': 3.0, 'max': 3.0})
+        self.assertEqual(dict(AlignReads.RunReport.get_percentiles([])), {'count': 0})
+
+    def test_get_report(self):
+        """
+        The report must contain the process-wide totals, the stages, the aligner latency and the counters.
+        """
+
+        Report_test = AlignReads.RunReport(self.report_file)
+        with Report_test.measure('write output'):
+            pass
+        Report_test.add_latency(0.5)
+        Report_test.counters['read_pairs_written'] = 1
+        report = Report_test.get_report(False)
+        self.assertEqual(list(report.keys()), ['complete', 'wall_seconds', 'process_cpu_seconds', 'child_processes_cpu_seconds', 'process_peak_rss_kb',
+                                               'child_processes_peak_rss_kb', 'stages', 'aligner_latency_seconds', 'counters'])
+        self.assertEqual(report['complete'], False)
+        self.assertEqual(list(report['stages'].keys()), ['write output'])
+        self.assertEqual(report['aligner_latency_seconds']['p50'], 0.5)
+        self.assertEqual(report['counters'], {'read_pairs_written': 1})
+
+    def test_write_report(self):
+        """
+        The report must be written as JSON file. A snapshot is only written after the interval.
+        """
+
+        # Test case 1, snapshot before the interval
+        Report_test = AlignReads.RunReport(self.report_file, 1000)
+        Report_test.write_snapshot()
+        self.assertEqual(os.path.isfile(self.report_file), False)
+
+        # Test case 2, snapshot after the interval
+        Report_test = AlignReads.RunReport(self.report_file, 0)
+        Report_test.write_snapshot()
+        with open(self.report_file) as file_object:
+            self.assertEqual(json.load(file_object)['complete'], False)
+
+        # Test case 3, report at the end of the run
+        Report_test.write_report()
+        with open(self.report_file) as file_object:
+            self.assertEqual(json.load(file_object)['complete'], True)
+        self.assertEqual(os.listdir(self.temp_dir.name), ['report.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
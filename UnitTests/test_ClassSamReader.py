@@ -0,0 +1,131 @@
+"""
+17-10-'26
+
+This script contains 5 unittests for the class SamReader from AlignReads.py.
+The test can be ran with the bash command line: python3 test_ClassSamReader.py
+"""
+
+import gzip
+import os
+import tempfile
+import unittest
+import AlignReads
+from test_ClassBamReader import create_bam_data, create_bam_record
+from test_ClassBgzfReader import create_bgzf_block
+
+class TestSamReader(unittest.TestCase):
+    """
+    This class contains unittests for the constructor and the methods __iter__(), read_reads(), write_run() and
+    read_run().
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.samfile = os.path.join(self.temp_dir.name, 'sam_file.sam')
+        # read_x is unmapped and read_s has no mate, the mates of read_b and read_c are far apart
+        sam_lines = ['@HD\tVN:1.6\tSO:coordinate',
+                     '@SQ\tSN:ref_A\tLN:26',
+                     'read_c\t0\tref_A\t1\t60\t4M\t=\t13\t0\tACGT\tIIII',
+                     'read_a\t0\tref_A\t3\t60\t4M\t=\t9\t0\tGTTG\tIIII',
+                     'read_x\t4\t*\t0\t0\t*\t*\t0\t0\tAAAA\tIIII',
+                     'read_b\t16\tref_A\t5\t60\t4M\t=\t11\t0\tTGCA\tIIII',
+                     'read_a\t16\tref_A\t9\t60\t4M\t=\t3\t0\tTGAC\tIIII',
+                     'read_s\t0\tref_A\t9\t60\t4M\t=\t3\t0\tTGAC\tIIII',
+                     'read_c\t16\tref_A\t13\t60\t4M\t=\t1\t0\tCTAG\tIIII',
+                     'read_b\t0\tref_A\t11\t60\t4M\t=\t5\t0\tACCT\tIIII']
+        self.sam_data = ('\n'.join(sam_lines) + '\n').encode()
+        with open(self.samfile, 'wb') as file_object:
+            file_object.write(self.sam_data)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_constructor(self):
+        """
+        ValueError raised if the maximum number of unpaired reads is smaller than 1.
+        """
+
+        with self.assertRaises(ValueError):
+            AlignReads.SamReader(self.samfile, 0)
+
+    def test_iter(self):
+        """
+        A read pair must be given as soon as both reads are found, in the order of the samfile. Unmapped reads and
+        reads without mate are ignored. The header lines are parsed.
+        """
+
+        Reader_test = AlignReads.SamReader(self.samfile, 100, self.temp_dir.name)
+        read_pairs = list(Reader_test)
+        self.assertEqual([read_name for read_name, read_data in read_pairs], ['read_a', 'read_c', 'read_b'])
+        self.assertEqual(read_pairs[0][1], [['GTTG', 'IIII', 'ref_A', 3, '4M'], ['TGAC', 'IIII', 'ref_A', 9, '4M']])
+        self.assertEqual(read_pairs[1][1], [['ACGT', 'IIII', 'ref_A', 1, '4M'], ['CTAG', 'IIII', 'ref_A', 13, '4M']])
+        self.assertEqual(Reader_test.header, [('HD', {'VN': '1.6', 'SO': 'coordinate'}), ('SQ', {'SN': 'ref_A', 'LN': '26'})])
+        self.assertEqual(os.listdir(self.temp_dir.name), ['sam_file.sam'])
+
+    def test_iter_spilled(self):
+        """
+        With 1 unpaired read in memory, the older unpaired reads must be written to run files. The read pairs of
+        the runs are given after the end of the samfile, sorted by read name and with the reads in samfile order.
+        The run files are removed afterwards.
+        """
+
+        Reader_test = iter(AlignReads.SamReader(self.samfile, 1, self.temp_dir.name))
+        read_name, read_data = next(Reader_test)
+        self.assertEqual(read_name, 'read_a')
+        self.assertEqual(read_data, [['GTTG', 'IIII', 'ref_A', 3, '4M'], ['TGAC', 'IIII', 'ref_A', 9, '4M']])
+        run_dirs = [name for name in os.listdir(self.temp_dir.name) if name.startswith('sam_runs_')]
+        self.assertEqual(len(run_dirs), 1)
+
+        read_pairs = list(Reader_test)
+        self.assertEqual([read_name for read_name, read_data in read_pairs], ['read_b', 'read_c'])
+        self.assertEqual(read_pairs[0][1], [['TGCA', 'IIII', 'ref_A', 5, '4M'], ['ACCT', 'IIII', 'ref_A', 11, '4M']])
+        self.assertEqual(read_pairs[1][1], [['ACGT', 'IIII', 'ref_A', 1, '4M'], ['CTAG', 'IIII', 'ref_A', 13, '4M']])
+        self.assertEqual(os.listdir(self.temp_dir.name), ['sam_file.sam'])
+
+    def test_read_reads(self):
+        """
+        A gzip compressed samfile, a BGZF compressed samfile and a bam file must give the same reads as the samfile.
+        The bam records are decoded once, while the file is read.
+        """
+
+        sam_reads = list(AlignReads.SamReader(self.samfile).read_reads())
+        self.assertEqual([read_name for read_number, read_name, read_data in sam_reads], ['read_c', 'read_a', 'read_b', 'read_a', 'read_s', 'read_c', 'read_b'])
+        compressed_file = os.path.join(self.temp_dir.name, 'sam_file.sam.gz')
+
+        # Test case 1, gzip compressed samfile
+        with open(compressed_file, 'wb') as file_object:
+            file_object.write(gzip.compress(self.sam_data))
+        self.assertEqual(list(AlignReads.SamReader(compressed_file).read_reads()), sam_reads)
+
+        # Test case 2, BGZF compressed samfile in 2 blocks
+        with open(compressed_file, 'wb') as file_object:
+            file_object.write(create_bgzf_block(self.sam_data[:100]) + create_bgzf_block(self.sam_data[100:]) + create_bgzf_block(b''))
+        self.assertEqual(list(AlignReads.SamReader(compressed_file).read_reads()), sam_reads)
+
+        # Test case 3, bam file, the read numbers are the record numbers
+        records = []
+        for line in self.sam_data.decode().split('\n')[2:-1]:
+            line = line.split('\t')
+            records += [create_bam_record(line[0], int(line[1]), 0 if line[2] == 'ref_A' else -1, int(line[3]) - 1, [(4, 'M')] if line[5] == '4M' else [], line[9], bytes([40] * 4))]
+        bam_data = create_bam_data('@HD\tVN:1.6\tSO:coordinate\n@SQ\tSN:ref_A\tLN:26\n', [('ref_A', 26)], records)
+        bam_file = os.path.join(self.temp_dir.name, 'sam_file.bam')
+        with open(bam_file, 'wb') as file_object:
+            file_object.write(create_bgzf_block(bam_data[:50]) + create_bgzf_block(bam_data[50:]) + create_bgzf_block(b''))
+        Reader_test = AlignReads.SamReader(bam_file)
+        self.assertEqual(list(Reader_test.read_reads()), [(read_number - 2, read_name, read_data) for read_number, read_name, read_data in sam_reads])
+        self.assertEqual(Reader_test.header, [('HD', {'VN': '1.6', 'SO': 'coordinate'}), ('SQ', {'SN': 'ref_A', 'LN': '26'})])
+
+    def test_write_run(self):
+        """
+        The unpaired reads must be written sorted by read name and read number, and read back unchanged.
+        """
+
+        spilled = [('read_b', 5, ['TGCA', 'IIII', 'ref_A', 5, '4M']),
+                   ('read_a', 7, ['TGAC', 'IIII', 'ref_A', 9, '4M']),
+                   ('read_a', 3, ['GTTG', 'IIII', 'ref_A', 3, '4M'])]
+        run_file = AlignReads.SamReader.write_run(spilled, self.temp_dir.name, 0)
+        self.assertEqual(list(AlignReads.SamReader.read_run(run_file)), [spilled[2], spilled[1], spilled[0]])
+
+
+if __name__ == '__main__':
+    unittest.main()